@@ -0,0 +1,114 @@
+"""
+Hub Tool Call Overhead Benchmark
+对比 Hub 工具调用的两条路径的单次调用开销：
+
+- by_name:      旧的 Hub 代理路径，call_tool_async(显示名称)，每次调用都做名称解析（解析索引命中）
+- by_name_cold: 同上，但每次调用前使解析索引失效，模拟服务/工具频繁变更时的解析开销（完整 list_tools）
+- resolved:     新的 Hub 代理路径，call_resolved_tool_async 直接携带注册时解析好的
+                (service_global_name, 规范工具名称)
+
+各路径执行同一个本地 stdio 工具（a + b），与 resolved 的差值即为名称解析带来的额外开销。
+
+用法:
+    python example/benchmark/hub_call_overhead.py [--calls 500] [--warmup 20]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+from mcpstore import MCPStore
+from mcpstore.core.bridge import get_async_bridge
+
+SERVER_CODE = textwrap.dedent(
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("bench")
+
+    @mcp.tool()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    mcp.run()
+    """
+)
+
+
+async def _measure(call, calls: int) -> list:
+    samples = []
+    for i in range(calls):
+        started = time.perf_counter()
+        await call({"a": i, "b": 1})
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def _summary(samples: list) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return f"mean={statistics.mean(samples):.3f}ms p50={statistics.median(samples):.3f}ms p95={p95:.3f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hub tool call overhead benchmark")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    options = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="mcpstore_hub_bench_"))
+    server_path = workdir / "bench_server.py"
+    server_path.write_text(SERVER_CODE, encoding="utf-8")
+    mcp_json = workdir / "mcp.json"
+    mcp_json.write_text('{"mcpServers": {}}', encoding="utf-8")
+
+    store = MCPStore.setup_store(mcpjson_path=str(mcp_json), debug=False)
+    ctx = store.for_store()
+    ctx.add_service({"mcpServers": {"bench": {"command": sys.executable, "args": [str(server_path)]}}})
+    ctx.wait_service("bench", timeout=30)
+    tool = next(t for t in ctx.list_tools() if t.tool_original_name == "add")
+
+    # Hub 注册的代理函数内部调用的就是这两个入口
+    context = ctx._context if hasattr(ctx, "_context") else ctx
+
+    async def by_name(args):
+        return await context.call_tool_async(tool.name, args)
+
+    async def by_name_cold(args):
+        store.tool_resolution_index.invalidate_all()
+        return await context.call_tool_async(tool.name, args)
+
+    async def resolved(args):
+        return await context.call_resolved_tool_async(
+            tool.name, tool.service_global_name, tool.tool_original_name, args, service_name=tool.service_name
+        )
+
+    async def run():
+        paths = {"by_name": by_name, "by_name_cold": by_name_cold, "resolved": resolved}
+        for call in paths.values():
+            await _measure(call, options.warmup)
+        # 交替测量两轮，减小连接池/缓存预热顺序带来的偏差
+        results = {name: [] for name in paths}
+        for _ in range(2):
+            for name, call in paths.items():
+                results[name] += await _measure(call, options.calls // 2)
+        return results
+
+    results = get_async_bridge().run(run(), op_name="bench.hub_call_overhead")
+
+    print(f"tool={tool.name} calls={options.calls}")
+    for name, samples in results.items():
+        print(f"  {name:<12} {_summary(samples)}")
+    baseline = statistics.mean(results["resolved"])
+    for name in ("by_name", "by_name_cold"):
+        print(f"  {name} overhead per call vs resolved: {statistics.mean(results[name]) - baseline:+.3f}ms")
+
+    ctx.delete_service("bench")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
 # src/mcpstore/adapters/autogen_adapter.py
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING, Callable, Any
+from typing import List, TYPE_CHECKING, Callable, Any, Dict
 
-from .common import create_args_schema, build_sync_executor, attach_signature_from_schema
+from .common import (
+    create_args_schema,
+    build_sync_executor,
+    attach_signature_from_schema,
+    get_adapter_tool_cache,
+    get_schema_cache_stats,
+)
 
 if TYPE_CHECKING:
     from ..core.context.base_context import MCPStoreContext
@@ -20,6 +26,10 @@ class AutoGenAdapter:
     """
     def __init__(self, context: 'MCPStoreContext'):
         self._context = context
+        self._tool_cache = get_adapter_tool_cache(context, "autogen")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {"tools": self._tool_cache.stats(), "schemas": get_schema_cache_stats()}
 
     def list_tools(self) -> List[Callable[..., Any]]:
         return self._context._run_async_via_bridge(self.list_tools_async(), op_name="autogen_adapter.list_tools")
@@ -28,8 +38,12 @@ class AutoGenAdapter:
         tools: List[Callable[..., Any]] = []
         mcp_tools: List['ToolInfo'] = await self._context.list_tools_async()
         for t in mcp_tools:
-            args_schema = create_args_schema(t)
-            fn = build_sync_executor(self._context, t.name, args_schema)
-            attach_signature_from_schema(fn, args_schema)
-            tools.append(fn)
+            tools.append(self._tool_cache.get_or_build(t, self._build_tool))
+        self._tool_cache.prune(t.name for t in mcp_tools)
         return tools
+
+    def _build_tool(self, t: 'ToolInfo') -> Callable[..., Any]:
+        args_schema = create_args_schema(t)
+        fn = build_sync_executor(self._context, t.name, args_schema)
+        attach_signature_from_schema(fn, args_schema)
+        return fn
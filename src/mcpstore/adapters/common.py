@@ -5,19 +5,29 @@
 提供所有适配器共享的工具函数，避免代码重复：
 - is_nullable: 检查 JSON Schema 属性是否可为 null
 - process_tool_args: 统一处理工具参数转换
-- create_args_schema: 创建 Pydantic 参数模型
+- create_args_schema: 创建 Pydantic 参数模型（按 schema 哈希进程级缓存）
 - call_tool_response_helper: 统一处理工具调用结果
+- AdapterToolCache: 适配器级框架工具对象缓存
+- run_tool_calls_concurrently / iter_tool_calls_as_completed: 并发批量执行工具调用
 """
 from __future__ import annotations
 
+import hashlib
 import inspect
 import json
 import keyword
+import threading
 import warnings
-from typing import TYPE_CHECKING, Callable, Any, Type, List, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING, Callable, Any, Type, List, Dict, Optional, Tuple,
+    AsyncIterator, Awaitable, Hashable, Sequence,
+)
 
 from pydantic import BaseModel, create_model, Field, ConfigDict
 
+from ..core.utils.fan_out import FanOutConfig, fan_out_as_completed
+
 if TYPE_CHECKING:
     from ..core.context.base_context import MCPStoreContext
     from ..core.models.tool import ToolInfo
@@ -29,11 +39,20 @@ __all__ = [
     'process_tool_args',
     'enhance_description',
     'create_args_schema',
+    'schema_hash',
+    'get_schema_cache_stats',
+    'clear_schema_cache',
     'call_tool_response_helper',
     # 执行器构建
     'build_sync_executor',
     'build_async_executor',
     'attach_signature_from_schema',
+    # 工具对象缓存
+    'AdapterToolCache',
+    'get_adapter_tool_cache',
+    # 并发批量执行
+    'run_tool_calls_concurrently',
+    'iter_tool_calls_as_completed',
     # 数据类
     'ToolCallView',
 ]
@@ -281,18 +300,112 @@ def enhance_description(tool_info: 'ToolInfo') -> str:
     return tool_info.description or ""
 
 
+# ============================================================================
+# 参数模型缓存
+# ============================================================================
+
+class _SchemaModelCache:
+    """
+    进程级有界 LRU：(模型名, schema 哈希) -> Pydantic 模型类。
+
+    create_model 的开销远高于一次 JSON 序列化与字典查找；相同 schema 的工具
+    （包括不同 Agent 视图、不同适配器中的同一工具）复用同一个模型类。
+    """
+
+    def __init__(self, max_size: int = 2048):
+        self._max_size = max(1, int(max_size))
+        self._models: "OrderedDict[Tuple[str, str], Type[BaseModel]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[Type[BaseModel]]:
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                self._misses += 1
+                return None
+            self._models.move_to_end(key)
+            self._hits += 1
+            return model
+
+    def put(self, key: Tuple[str, str], model: Type[BaseModel]) -> Type[BaseModel]:
+        with self._lock:
+            # 并发构建同一 schema 时保留先写入的模型，保证返回的类唯一
+            existing = self._models.get(key)
+            if existing is not None:
+                return existing
+            self._models[key] = model
+            while len(self._models) > self._max_size:
+                self._models.popitem(last=False)
+                self._evictions += 1
+            return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._models),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            }
+
+
+_schema_model_cache = _SchemaModelCache()
+
+
+def schema_hash(schema: Optional[Dict[str, Any]]) -> str:
+    """计算 JSON Schema 的稳定哈希（键排序后的 JSON 的 SHA-1）。"""
+    payload = json.dumps(schema or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_schema_cache_stats() -> Dict[str, Any]:
+    """参数模型缓存统计（size / hits / misses / evictions / hit_rate）。"""
+    return _schema_model_cache.stats()
+
+
+def clear_schema_cache() -> None:
+    """清空参数模型缓存。"""
+    _schema_model_cache.clear()
+
+
 def create_args_schema(tool_info: 'ToolInfo') -> Type[BaseModel]:
     """
     从 ToolInfo 创建 Pydantic 参数模型。
 
+    相同工具名与 inputSchema 的模型在进程内复用，见 _SchemaModelCache。
+
     Args:
         tool_info: 工具信息对象
 
     Returns:
         Type[BaseModel]: Pydantic 模型类
     """
-    props = tool_info.inputSchema.get("properties", {})
-    required = tool_info.inputSchema.get("required", [])
+    key = (_model_name(tool_info), schema_hash(tool_info.inputSchema))
+    model = _schema_model_cache.get(key)
+    if model is None:
+        model = _schema_model_cache.put(key, _build_args_schema(tool_info))
+    return model
+
+
+def _model_name(tool_info: 'ToolInfo') -> str:
+    return f"{tool_info.name.capitalize().replace('_', '')}Input"
+
+
+def _build_args_schema(tool_info: 'ToolInfo') -> Type[BaseModel]:
+    """构建 Pydantic 参数模型（未缓存）。"""
+    input_schema = tool_info.inputSchema or {}
+    props = input_schema.get("properties", {})
+    required = input_schema.get("required", [])
 
     fields: Dict[str, Tuple[type, Any]] = {}
     has_invalid_field = False
@@ -352,11 +465,11 @@ def create_args_schema(tool_info: 'ToolInfo') -> Type[BaseModel]:
             fields[original_name] = (field_type, Field(**field_kwargs))
 
     # 检查是否允许额外属性
-    additional_properties = tool_info.inputSchema.get("additionalProperties", False)
+    additional_properties = input_schema.get("additionalProperties", False)
     allow_extra = bool(additional_properties)
 
     # 构建模型
-    model_name = f"{tool_info.name.capitalize().replace('_', '')}Input"
+    model_name = _model_name(tool_info)
 
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
@@ -454,3 +567,182 @@ def attach_signature_from_schema(fn: Callable[..., Any], args_schema: Type[BaseM
     schema_props = args_schema.model_json_schema().get('properties', {})
     params = [inspect.Parameter(k, inspect.Parameter.KEYWORD_ONLY) for k in schema_props.keys()]
     fn.__signature__ = inspect.Signature(parameters=params)  # type: ignore
+
+
+# ============================================================================
+# 框架工具对象缓存
+# ============================================================================
+
+class AdapterToolCache:
+    """
+    适配器级缓存：工具名 -> 已转换的框架工具对象。
+
+    工具列表来自物化快照，未失效时每次返回同一批 ToolInfo 实例，此时命中只需一次
+    字典查找与 is 比较；ToolInfo 被重建后按指纹（描述、schema 哈希、服务名、extra）
+    比较，内容未变则继续复用。每轮 prune() 移除本轮未出现的工具，缓存大小不超过工具数。
+
+    缓存对象在所有调用方之间共享：OpenAI / LangChain 适配器每次列出时返回浅拷贝，
+    其余适配器直接返回缓存对象，调用方应将其视为只读。
+    """
+
+    def __init__(self, name: str = "adapter"):
+        self._name = name
+        # 工具名 -> (来源 ToolInfo, 指纹, 框架对象)
+        self._entries: Dict[str, Tuple[Any, Tuple, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def fingerprint(tool_info: 'ToolInfo', extra: Tuple = ()) -> Tuple:
+        return (
+            tool_info.description,
+            schema_hash(tool_info.inputSchema),
+            getattr(tool_info, "service_global_name", None),
+            getattr(tool_info, "tool_original_name", None),
+            getattr(tool_info, "service_name", None),
+            extra,
+        )
+
+    def lookup(self, tool_info: 'ToolInfo', extra: Tuple = ()) -> Any:
+        """返回缓存的框架对象；不存在或工具内容已变化时返回 None（计为未命中）。"""
+        name = tool_info.name
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] is tool_info and entry[1][-1] == extra:
+            self._hits += 1
+            return entry[2]
+        if entry is not None and entry[1] == self.fingerprint(tool_info, extra):
+            with self._lock:
+                self._entries[name] = (tool_info, entry[1], entry[2])
+                self._hits += 1
+            return entry[2]
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def store(self, tool_info: 'ToolInfo', obj: Any, extra: Tuple = ()) -> Any:
+        with self._lock:
+            self._entries[tool_info.name] = (tool_info, self.fingerprint(tool_info, extra), obj)
+        return obj
+
+    def get_or_build(self, tool_info: 'ToolInfo', build: Callable[['ToolInfo'], Any], extra: Tuple = ()) -> Any:
+        """返回缓存的框架对象；不存在或工具内容变化时调用 build(tool_info) 重建。"""
+        obj = self.lookup(tool_info, extra)
+        if obj is None:
+            obj = self.store(tool_info, build(tool_info), extra)
+        return obj
+
+    def prune(self, names: Any) -> int:
+        """只保留 names 中的工具，返回移除数量。"""
+        keep = set(names)
+        with self._lock:
+            stale = [n for n in self._entries if n not in keep]
+            for n in stale:
+                del self._entries[n]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "name": self._name,
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / lookups) if lookups else 0.0,
+        }
+
+
+def get_adapter_tool_cache(context: 'MCPStoreContext', key: str) -> AdapterToolCache:
+    """
+    获取挂在上下文上的适配器缓存。
+
+    适配器对象通常由 for_langchain() / for_openai() 等按需创建，缓存放在（长期存在的）
+    上下文上，重复创建适配器时仍可复用已转换的工具对象。
+    """
+    caches = getattr(context, "_adapter_tool_caches", None)
+    if caches is None:
+        caches = {}
+        try:
+            context._adapter_tool_caches = caches
+        except Exception:
+            return AdapterToolCache(key)
+    cache = caches.get(key)
+    if cache is None:
+        cache = caches.setdefault(key, AdapterToolCache(key))
+    return cache
+
+
+# ============================================================================
+# 并发批量执行
+# ============================================================================
+
+async def iter_tool_calls_as_completed(
+    calls: Sequence[Any],
+    execute: Callable[[Any], Awaitable[Any]],
+    *,
+    max_concurrency: int = 8,
+    key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+    per_key_limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_error: Optional[Callable[[Any, BaseException], Any]] = None,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    并发执行一批相互独立的工具调用，按完成顺序产出 (输入下标, 结果)。
+
+    Args:
+        calls: 工具调用列表（元素类型由 execute 决定）
+        execute: 执行单个调用的协程函数
+        max_concurrency: 全局并发上限
+        key: 调用的分组键（通常为服务名），配合 per_key_limit 限制同一服务的并发；
+             返回 None 的调用只受全局上限约束
+        per_key_limit: 同一分组键的并发上限，None 表示不限制
+        timeout: 单个调用的执行超时（秒，不含排队等待时间），None 表示不限制
+        on_error: execute 抛出异常（含超时）时生成结果的函数 on_error(call, exc)；
+                  None 时异常原样抛出给迭代方
+
+    提前结束迭代（break / aclose）时会取消尚未完成的调用。
+    调度、限流与超时由 core.utils.fan_out.fan_out_as_completed 实现。
+    """
+    config = FanOutConfig(
+        max_concurrency=max_concurrency,
+        group_limits={},
+        default_group_limit=per_key_limit,
+        timeout=timeout,
+    )
+    results = fan_out_as_completed(
+        calls,
+        execute,
+        config=config,
+        group=key if per_key_limit else None,
+        label="tool_calls",
+    )
+    try:
+        async for result in results:
+            if result.ok:
+                yield result.index, result.value
+            elif on_error is None:
+                raise result.error
+            else:
+                yield result.index, on_error(result.item, result.error)
+    finally:
+        await results.aclose()
+
+
+async def run_tool_calls_concurrently(
+    calls: Sequence[Any],
+    execute: Callable[[Any], Awaitable[Any]],
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    并发执行一批工具调用，结果按输入顺序返回。
+
+    参数同 iter_tool_calls_as_completed。
+    """
+    results: List[Any] = [None] * len(calls)
+    async for index, result in iter_tool_calls_as_completed(calls, execute, **kwargs):
+        results[index] = result
+    return results
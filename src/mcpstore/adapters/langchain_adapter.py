@@ -15,9 +15,12 @@ from pydantic import BaseModel
 
 # 导入公共函数
 from .common import (
+    AdapterToolCache,
     call_tool_response_helper,
     create_args_schema,
     enhance_description,
+    get_adapter_tool_cache,
+    get_schema_cache_stats,
     process_tool_args,
 )
 from ..core.bridge import get_bridge_executor
@@ -39,6 +42,21 @@ class LangChainAdapter:
         self._bridge_executor = get_bridge_executor()
         # 工具输出格式偏好
         self._response_format = response_format if response_format in ("text", "content_and_artifact") else "text"
+        # 已转换的 StructuredTool 缓存（挂在上下文上，按输出格式区分）
+        self._tool_cache = self._create_tool_cache()
+
+    def _create_tool_cache(self) -> AdapterToolCache:
+        return get_adapter_tool_cache(self._context, f"langchain:{self._response_format}")
+
+    def get_cache_stats(self) -> dict:
+        """工具对象缓存与参数模型缓存的命中统计。"""
+        return {"tools": self._tool_cache.stats(), "schemas": get_schema_cache_stats()}
+
+    @staticmethod
+    def _fresh(lc_tool: StructuredTool) -> StructuredTool:
+        """缓存对象的浅拷贝：调用方修改 name/description/return_direct/callbacks 等字段不会影响缓存
+        和其他调用方（args_schema 与执行函数仍共享，应视为只读）。"""
+        return lc_tool.model_copy()
 
     @staticmethod
     def _serialize_unknown(obj):
@@ -205,44 +223,51 @@ class LangChainAdapter:
 
         langchain_tools = []
         for tool_info in mcp_tools_info:
-            # 使用公共函数
-            enhanced_description = enhance_description(tool_info)
-            args_schema = create_args_schema(tool_info)
-
-            # 创建同步和异步函数
-            sync_func = self._create_tool_function(tool_info.name, args_schema)
-            async_coroutine = await self._create_tool_coroutine(tool_info.name, args_schema)
-
-            # 根据原始 schema 确定参数数量
-            schema_properties = tool_info.inputSchema.get("properties", {})
-            original_param_count = len(schema_properties)
-
-            # 读取工具覆盖配置（如 return_direct）
+            # 读取工具覆盖配置（如 return_direct），作为缓存指纹的一部分
             try:
                 return_direct_flag = self._context._get_tool_override(
                     tool_info.service_name, tool_info.name, "return_direct", False
                 )
             except Exception:
                 return_direct_flag = False
+            extra = (bool(return_direct_flag),)
 
-            # 创建 LangChain StructuredTool
-            lc_tool = StructuredTool(
-                name=tool_info.name,
-                description=enhanced_description,
-                func=sync_func,
-                coroutine=async_coroutine,
-                args_schema=args_schema,
-            )
+            lc_tool = self._tool_cache.lookup(tool_info, extra)
+            if lc_tool is None:
+                lc_tool = self._tool_cache.store(
+                    tool_info, await self._build_tool(tool_info, bool(return_direct_flag)), extra
+                )
+            langchain_tools.append(self._fresh(lc_tool))
 
-            # 设置 return_direct
-            try:
-                setattr(lc_tool, 'return_direct', bool(return_direct_flag))
-            except Exception:
-                pass
+        self._tool_cache.prune(t.name for t in mcp_tools_info)
+        return langchain_tools
 
-            langchain_tools.append(lc_tool)
+    async def _build_tool(self, tool_info, return_direct: bool) -> StructuredTool:
+        """将单个 ToolInfo 转换为 LangChain StructuredTool。"""
+        # 使用公共函数
+        enhanced_description = enhance_description(tool_info)
+        args_schema = create_args_schema(tool_info)
+
+        # 创建同步和异步函数
+        sync_func = self._create_tool_function(tool_info.name, args_schema)
+        async_coroutine = await self._create_tool_coroutine(tool_info.name, args_schema)
+
+        # 创建 LangChain StructuredTool
+        lc_tool = StructuredTool(
+            name=tool_info.name,
+            description=enhanced_description,
+            func=sync_func,
+            coroutine=async_coroutine,
+            args_schema=args_schema,
+        )
 
-        return langchain_tools
+        # 设置 return_direct
+        try:
+            setattr(lc_tool, 'return_direct', return_direct)
+        except Exception:
+            pass
+
+        return lc_tool
 
 
 class SessionAwareLangChainAdapter(LangChainAdapter):
@@ -268,10 +293,15 @@ class SessionAwareLangChainAdapter(LangChainAdapter):
             session: 工具将绑定到的会话对象
             response_format: 同 LangChainAdapter（"text" 或 "content_and_artifact"）
         """
-        super().__init__(context, response_format=response_format)
+        # 先设置会话：父类初始化时按会话创建工具缓存
         self._session = session
+        super().__init__(context, response_format=response_format)
         logger.debug(f"Initialized session-aware adapter for session '{session.session_id}'")
 
+    def _create_tool_cache(self) -> AdapterToolCache:
+        # 工具函数绑定到本适配器的会话对象，缓存随适配器实例存在，不挂到上下文
+        return AdapterToolCache(f"langchain:{self._response_format}:session:{self._session.session_id}")
+
     def _create_tool_function(self, tool_name: str, args_schema: Type[BaseModel]):
         """
         创建会话绑定的工具函数。
@@ -372,28 +402,34 @@ class SessionAwareLangChainAdapter(LangChainAdapter):
         langchain_tools = []
 
         for tool_info in mcpstore_tools:
-            # 使用公共函数
-            args_schema = create_args_schema(tool_info)
-            enhanced_description = enhance_description(tool_info)
-
-            # 创建会话绑定函数
-            sync_func = self._create_tool_function(tool_info.name, args_schema)
-            async_coroutine = self._create_async_tool_function(tool_info.name, args_schema)
-
-            # 创建带会话绑定的 LangChain 工具
-            langchain_tools.append(
-                StructuredTool(
-                    name=tool_info.name,
-                    description=enhanced_description + f" [Session: {self._session.session_id}]",
-                    func=sync_func,
-                    coroutine=async_coroutine,
-                    args_schema=args_schema,
-                )
-            )
+            lc_tool = self._tool_cache.lookup(tool_info)
+            if lc_tool is None:
+                lc_tool = self._tool_cache.store(tool_info, self._build_session_tool(tool_info))
+            langchain_tools.append(self._fresh(lc_tool))
 
+        self._tool_cache.prune(t.name for t in mcpstore_tools)
         logger.debug(f"Created {len(langchain_tools)} session-bound tools")
         return langchain_tools
 
+    def _build_session_tool(self, tool_info) -> StructuredTool:
+        """将单个 ToolInfo 转换为会话绑定的 StructuredTool。"""
+        # 使用公共函数
+        args_schema = create_args_schema(tool_info)
+        enhanced_description = enhance_description(tool_info)
+
+        # 创建会话绑定函数
+        sync_func = self._create_tool_function(tool_info.name, args_schema)
+        async_coroutine = self._create_async_tool_function(tool_info.name, args_schema)
+
+        # 创建带会话绑定的 LangChain 工具
+        return StructuredTool(
+            name=tool_info.name,
+            description=enhanced_description + f" [Session: {self._session.session_id}]",
+            func=sync_func,
+            coroutine=async_coroutine,
+            args_schema=args_schema,
+        )
+
     def list_tools(self) -> List[Tool]:
         """
         创建会话绑定的 LangChain 工具（同步版本）。
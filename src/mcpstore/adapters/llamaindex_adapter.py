@@ -1,9 +1,15 @@
 # src/mcpstore/adapters/llamaindex_adapter.py
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import Any, Dict, List, TYPE_CHECKING
 
-from .common import enhance_description, create_args_schema, build_sync_executor
+from .common import (
+    enhance_description,
+    create_args_schema,
+    build_sync_executor,
+    get_adapter_tool_cache,
+    get_schema_cache_stats,
+)
 
 # TYPE_CHECKING to avoid runtime circular imports
 if TYPE_CHECKING:
@@ -19,6 +25,10 @@ class LlamaIndexAdapter:
     """
     def __init__(self, context: 'MCPStoreContext'):
         self._context = context
+        self._tool_cache = get_adapter_tool_cache(context, "llamaindex")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {"tools": self._tool_cache.stats(), "schemas": get_schema_cache_stats()}
 
     def list_tools(self) -> List[object]:
         return self._context._run_async_via_bridge(self.list_tools_async(), op_name="llamaindex_adapter.list_tools")
@@ -31,11 +41,14 @@ class LlamaIndexAdapter:
 
         mcp_tools: List['ToolInfo'] = await self._context.list_tools_async()
         tools: List[object] = []
-        for t in mcp_tools:
+        def _build_tool(t: 'ToolInfo') -> object:
             args_schema = create_args_schema(t)
             sync_fn = build_sync_executor(self._context, t.name, args_schema)
             desc = enhance_description(t)
             # LlamaIndex primarily accepts sync functions; name/description can be set via from_defaults
-            li_tool = FunctionTool.from_defaults(fn=sync_fn, name=t.name, description=desc)
-            tools.append(li_tool)
+            return FunctionTool.from_defaults(fn=sync_fn, name=t.name, description=desc)
+
+        for t in mcp_tools:
+            tools.append(self._tool_cache.get_or_build(t, _build_tool))
+        self._tool_cache.prune(t.name for t in mcp_tools)
         return tools
@@ -7,8 +7,9 @@ OpenAI 适配器模块
 """
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 # 导入公共函数
 from .common import (
@@ -16,7 +17,11 @@ from .common import (
     create_args_schema,
     build_sync_executor,
     build_async_executor,
+    get_adapter_tool_cache,
+    get_schema_cache_stats,
     is_nullable,
+    iter_tool_calls_as_completed,
+    run_tool_calls_concurrently,
 )
 
 if TYPE_CHECKING:
@@ -32,6 +37,22 @@ class OpenAIAdapter:
 
     def __init__(self, context: 'MCPStoreContext'):
         self._context = context
+        # 已转换的 function 定义与可调用执行器缓存（挂在上下文上）
+        self._format_cache = get_adapter_tool_cache(context, "openai:format")
+        self._callable_cache = get_adapter_tool_cache(context, "openai:callable")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """工具对象缓存与参数模型缓存的命中统计。"""
+        return {
+            "format": self._format_cache.stats(),
+            "callable": self._callable_cache.stats(),
+            "schemas": get_schema_cache_stats(),
+        }
+
+    @staticmethod
+    def _fresh(openai_tool: Dict[str, Any]) -> Dict[str, Any]:
+        """缓存对象的浅拷贝：调用方修改顶层字段不会影响缓存（parameters 仍共享，应视为只读）。"""
+        return {"type": openai_tool["type"], "function": dict(openai_tool["function"])}
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """获取所有 MCPStore 工具并转换为 OpenAI function 格式（同步版本）。"""
@@ -45,9 +66,10 @@ class OpenAIAdapter:
         openai_tools = []
 
         for tool_info in mcp_tools_info:
-            openai_tool = self._convert_to_openai_format(tool_info)
-            openai_tools.append(openai_tool)
+            openai_tool = self._format_cache.get_or_build(tool_info, self._convert_to_openai_format)
+            openai_tools.append(self._fresh(openai_tool))
 
+        self._format_cache.prune(t.name for t in mcp_tools_info)
         return openai_tools
 
     def _convert_to_openai_format(self, tool_info: 'ToolInfo') -> Dict[str, Any]:
@@ -182,26 +204,33 @@ class OpenAIAdapter:
         callable_tools = []
 
         for tool_info in mcp_tools_info:
-            # 转换为 OpenAI 格式
-            openai_tool = self._convert_to_openai_format(tool_info)
-
-            # 使用公共函数创建参数 schema
-            args_schema = create_args_schema(tool_info)
-
-            # 使用公共函数创建可调用函数
-            sync_executor = build_sync_executor(self._context, tool_info.name, args_schema)
-            async_executor = build_async_executor(self._context, tool_info.name, args_schema)
-
+            openai_tool, args_schema, sync_executor, async_executor = self._callable_cache.get_or_build(
+                tool_info, self._build_callable
+            )
             callable_tools.append({
-                "tool": openai_tool,
+                "tool": self._fresh(openai_tool),
                 "callable": sync_executor,
                 "async_callable": async_executor,
                 "name": tool_info.name,
                 "schema": args_schema
             })
 
+        self._callable_cache.prune(t.name for t in mcp_tools_info)
         return callable_tools
 
+    def _build_callable(self, tool_info: 'ToolInfo'):
+        """构建 (OpenAI 格式, 参数模型, 同步执行器, 异步执行器)。"""
+        # 转换为 OpenAI 格式
+        openai_tool = self._format_cache.get_or_build(tool_info, self._convert_to_openai_format)
+
+        # 使用公共函数创建参数 schema
+        args_schema = create_args_schema(tool_info)
+
+        # 使用公共函数创建可调用函数
+        sync_executor = build_sync_executor(self._context, tool_info.name, args_schema)
+        async_executor = build_async_executor(self._context, tool_info.name, args_schema)
+        return openai_tool, args_schema, sync_executor, async_executor
+
     def create_tool_registry(self) -> Dict[str, Any]:
         """
         创建工具注册表，便于按名称执行工具。
@@ -247,7 +276,7 @@ class OpenAIAdapter:
         """执行工具调用（异步版本）。"""
         tool_name = None
         try:
-            tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
+            tool_name = self._tool_call_name(tool_call)
             arguments = tool_call.get("arguments") or tool_call.get("function", {}).get("arguments", {})
 
             if not tool_name:
@@ -280,27 +309,100 @@ class OpenAIAdapter:
             error_msg = f"Tool '{tool_name}' execution failed: {str(e)}"
             return error_msg
 
-    def batch_execute_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[str]:
+    @staticmethod
+    def _tool_call_name(tool_call: Dict[str, Any]) -> Optional[str]:
+        return tool_call.get("name") or tool_call.get("function", {}).get("name")
+
+    def batch_execute_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        per_service_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
         """
         批量执行多个工具调用。
 
         Args:
             tool_calls: OpenAI 工具调用格式列表
+            max_concurrency: 全局并发上限
+            per_service_limit: 同一服务的并发上限，None 表示不限制
+            timeout: 单个调用的超时（秒），None 表示不限制
 
         Returns:
-            List[str]: 工具执行结果列表
+            List[str]: 工具执行结果列表（与输入顺序一致）
         """
         return self._context._run_async_via_bridge(
-            self.batch_execute_tool_calls_async(tool_calls), op_name="openai_adapter.batch_execute_tool_calls"
+            self.batch_execute_tool_calls_async(
+                tool_calls,
+                max_concurrency=max_concurrency,
+                per_service_limit=per_service_limit,
+                timeout=timeout,
+            ),
+            op_name="openai_adapter.batch_execute_tool_calls",
         )
 
-    async def batch_execute_tool_calls_async(self, tool_calls: List[Dict[str, Any]]) -> List[str]:
-        """批量执行工具调用（异步版本）。"""
-        results = []
-        for tool_call in tool_calls:
+    async def batch_execute_tool_calls_async(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        per_service_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
+        """
+        批量执行工具调用（异步版本）。
+
+        LLM 返回的并行工具调用彼此独立，并发执行；结果按输入顺序返回。
+        """
+        kwargs = await self._batch_options(tool_calls, max_concurrency, per_service_limit, timeout)
+        return await run_tool_calls_concurrently(tool_calls, self.execute_tool_call_async, **kwargs)
+
+    async def stream_tool_calls_async(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        *,
+        max_concurrency: int = 8,
+        per_service_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        并发执行工具调用，按完成顺序产出 (输入下标, 结果)。
+
+        参数同 batch_execute_tool_calls_async。
+        """
+        kwargs = await self._batch_options(tool_calls, max_concurrency, per_service_limit, timeout)
+        async for index, result in iter_tool_calls_as_completed(
+            tool_calls, self.execute_tool_call_async, **kwargs
+        ):
+            yield index, result
+
+    async def _batch_options(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        max_concurrency: int,
+        per_service_limit: Optional[int],
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        def _on_error(tool_call: Dict[str, Any], exc: BaseException) -> str:
+            if isinstance(exc, asyncio.TimeoutError):
+                return f"Tool '{self._tool_call_name(tool_call)}' execution failed: timed out after {timeout}s"
+            return f"Error executing tool call: {str(exc)}"
+
+        options: Dict[str, Any] = {
+            "max_concurrency": max_concurrency,
+            "timeout": timeout,
+            "on_error": _on_error,
+        }
+        if per_service_limit:
+            # 工具名 -> 服务名（读取物化快照，无 IO）
+            services: Dict[str, str] = {}
             try:
-                result = await self.execute_tool_call_async(tool_call)
-                results.append(result)
-            except Exception as e:
-                results.append(f"Error executing tool call: {str(e)}")
-        return results
+                for tool_info in await self._context.list_tools_async(filter="all"):
+                    services[tool_info.name] = tool_info.service_global_name
+            except Exception:
+                pass
+            options["key"] = lambda tool_call: services.get(self._tool_call_name(tool_call))
+            options["per_key_limit"] = per_service_limit
+        return options
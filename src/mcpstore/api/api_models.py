@@ -152,6 +152,8 @@ class ServiceLifecycleConfig(BaseModel):
     # 租约与生命周期
     lease_ttl: Optional[float] = Field(default=None, ge=1.0, le=3600.0, description="租约 TTL（秒）")
     lease_renew_interval: Optional[float] = Field(default=None, ge=0.5, le=3600.0, description="租约续约间隔（秒）")
+    scheduler_workers: Optional[int] = Field(default=None, ge=1, le=10000, description="健康检查并发探测上限")
+    scheduler_jitter: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="健康检查周期抖动比例")
     initialization_timeout: Optional[float] = Field(default=None, ge=1.0, le=7200.0, description="初始化硬超时（秒）")
     termination_timeout: Optional[float] = Field(default=None, ge=1.0, le=3600.0, description="终止超时（秒）")
     shutdown_timeout: Optional[float] = Field(default=None, ge=1.0, le=3600.0, description="优雅关闭超时（秒）")
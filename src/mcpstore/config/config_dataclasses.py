@@ -71,6 +71,10 @@ class ServiceLifecycleConfig:
     lease_ttl: float = _health_defaults.lease_ttl
     lease_renew_interval: float = _health_defaults.lease_renew_interval
 
+    # 健康检查调度
+    scheduler_workers: int = _health_defaults.scheduler_workers
+    scheduler_jitter: float = _health_defaults.scheduler_jitter
+
     # 重启与日志
     restart_delay_seconds: float = 5.0
     max_restart_attempts: int = 3
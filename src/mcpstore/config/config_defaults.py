@@ -56,6 +56,9 @@ class HealthCheckConfigDefaults:
     # 租约
     lease_ttl: float = 60.0
     lease_renew_interval: float = 20.0
+    # 集中调度：探测并发上限与周期抖动比例（避免大量服务同步 ping）
+    scheduler_workers: int = 64
+    scheduler_jitter: float = 0.1
 
 
 @dataclass
@@ -253,6 +256,8 @@ def get_all_defaults() -> Dict[str, Dict[str, Any]]:
             "reconnect_hard_timeout": health_check.reconnect_hard_timeout,
             "lease_ttl": health_check.lease_ttl,
             "lease_renew_interval": health_check.lease_renew_interval,
+            "scheduler_workers": health_check.scheduler_workers,
+            "scheduler_jitter": health_check.scheduler_jitter,
         },
         "content_update": {
             "tools_update_interval": content_update.tools_update_interval,
@@ -146,6 +146,8 @@ half_open_success_rate_threshold = {health["half_open_success_rate_threshold"]}
 reconnect_hard_timeout = {health["reconnect_hard_timeout"]}
 lease_ttl = {health["lease_ttl"]}
 lease_renew_interval = {health["lease_renew_interval"]}
+scheduler_workers = {health["scheduler_workers"]}
+scheduler_jitter = {health["scheduler_jitter"]}
 
 [content_update]
 # 内容更新配置
@@ -300,6 +302,8 @@ class ConfigValidator:
         "health_check.reconnect_hard_timeout": {"min": 1.0, "max": 7200.0, "type": float},
         "health_check.lease_ttl": {"min": 1.0, "max": 3600.0, "type": float},
         "health_check.lease_renew_interval": {"min": 0.5, "max": 3600.0, "type": float},
+        "health_check.scheduler_workers": {"min": 1, "max": 10000, "type": int},
+        "health_check.scheduler_jitter": {"min": 0.0, "max": 1.0, "type": float},
 
         # Content update configuration
         "content_update.tools_update_interval": {"min": 10.0, "max": 86400.0, "type": float},
@@ -963,6 +967,8 @@ class MCPStoreConfig:
                 "reconnect_hard_timeout": await self._get_config_value("health_check.reconnect_hard_timeout", _health_defaults.reconnect_hard_timeout),
                 "lease_ttl": await self._get_config_value("health_check.lease_ttl", _health_defaults.lease_ttl),
                 "lease_renew_interval": await self._get_config_value("health_check.lease_renew_interval", _health_defaults.lease_renew_interval),
+                "scheduler_workers": await self._get_config_value("health_check.scheduler_workers", _health_defaults.scheduler_workers),
+                "scheduler_jitter": await self._get_config_value("health_check.scheduler_jitter", _health_defaults.scheduler_jitter),
                 "initialization_timeout": await self._get_config_value("health_check.startup_hard_timeout", _health_defaults.startup_hard_timeout),
                 "termination_timeout": _service_defaults.termination_timeout,
                 "shutdown_timeout": _service_defaults.shutdown_timeout,
@@ -997,6 +1003,8 @@ class MCPStoreConfig:
             reconnect_hard_timeout=await self._get_config_value("health_check.reconnect_hard_timeout", _health_defaults.reconnect_hard_timeout),
             lease_ttl=await self._get_config_value("health_check.lease_ttl", _health_defaults.lease_ttl),
             lease_renew_interval=await self._get_config_value("health_check.lease_renew_interval", _health_defaults.lease_renew_interval),
+            scheduler_workers=await self._get_config_value("health_check.scheduler_workers", _health_defaults.scheduler_workers),
+            scheduler_jitter=await self._get_config_value("health_check.scheduler_jitter", _health_defaults.scheduler_jitter),
             initialization_timeout=await self._get_config_value("health_check.startup_hard_timeout", _health_defaults.startup_hard_timeout),
             termination_timeout=_service_defaults.termination_timeout,
             shutdown_timeout=_service_defaults.shutdown_timeout,
@@ -1245,6 +1253,8 @@ class MCPStoreConfig:
                     "reconnect_hard_timeout": await self._get_config_value("health_check.reconnect_hard_timeout", _health_defaults.reconnect_hard_timeout),
                     "lease_ttl": await self._get_config_value("health_check.lease_ttl", _health_defaults.lease_ttl),
                     "lease_renew_interval": await self._get_config_value("health_check.lease_renew_interval", _health_defaults.lease_renew_interval),
+                    "scheduler_workers": await self._get_config_value("health_check.scheduler_workers", _health_defaults.scheduler_workers),
+                    "scheduler_jitter": await self._get_config_value("health_check.scheduler_jitter", _health_defaults.scheduler_jitter),
                 }
             elif section == "monitoring":
                 section_config = {
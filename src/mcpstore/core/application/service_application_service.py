@@ -605,28 +605,29 @@ class ServiceApplicationService:
         等待服务状态收敛
         
         状态收敛定义: 状态不再是 STARTUP
+        由 registry.service_readiness 的状态迁移通知驱动，不再按 100ms 轮询。
         """
         logger.debug(f"[WAIT_STATE] Waiting for {service_name} (timeout={timeout}s)")
-        
-        start_time = asyncio.get_event_loop().time()
-        check_interval = 0.1  # 100ms
-        
-        while True:
-            # 检查超时
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
-                logger.warning(f"[WAIT_STATE] Timeout for {service_name}")
-                break
-            
-            # 检查状态
-            state = self._registry._service_state_service.get_service_state(agent_id, service_name)
+
+        try:
+            global_name = await self._registry._resolve_global_name_async(agent_id, service_name)
+        except Exception:
+            global_name = None
+
+        async def _check() -> Optional[ServiceConnectionState]:
+            state = await self._registry.get_service_state_async(agent_id, service_name)
             if state and state != ServiceConnectionState.STARTUP:
-                logger.debug(f"[WAIT_STATE] Converged: {service_name} -> {state.value}")
-                return state.value
-            
-            # 等待一段时间再检查
-            await asyncio.sleep(check_interval)
-        
+                return state
+            return None
+
+        try:
+            # 无法解析全局名时按任意服务的变更唤醒
+            state = await self._registry.service_readiness.wait_until(global_name, _check, timeout)
+            logger.debug(f"[WAIT_STATE] Converged: {service_name} -> {state.value}")
+            return state.value
+        except asyncio.TimeoutError:
+            logger.warning(f"[WAIT_STATE] Timeout for {service_name}")
+
         # 超时，返回当前状态
-        state = self._registry._service_state_service.get_service_state(agent_id, service_name)
+        state = await self._registry.get_service_state_async(agent_id, service_name)
         return state.value if state else "unknown"
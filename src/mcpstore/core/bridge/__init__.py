@@ -11,6 +11,8 @@ from .async_orchestrated_bridge import (
 )
 from .unified_executor import (
     BridgeExecutionStats,
+    LatencyHistogram,
+    LatencyRecorder,
     UnifiedBridgeExecutor,
     get_bridge_executor,
     get_bridge_execution_stats,
@@ -22,6 +24,8 @@ __all__ = [
     "get_async_bridge",
     "close_async_bridge",
     "BridgeExecutionStats",
+    "LatencyHistogram",
+    "LatencyRecorder",
     "UnifiedBridgeExecutor",
     "get_bridge_executor",
     "get_bridge_execution_stats",
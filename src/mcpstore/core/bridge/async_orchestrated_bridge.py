@@ -94,6 +94,37 @@ class AsyncOrchestratedBridge:
         finally:
             self._unregister_call(call_id)
 
+    def submit(
+        self,
+        coro: asyncio.coroutines.Coroutine[Any, Any, Any],
+        *,
+        timeout: Optional[float] = None,
+        op_name: str = "unknown",
+    ) -> Future[Any]:
+        """
+        将协程投递到稳定事件循环，立即返回 concurrent Future（不阻塞、不占用线程）。
+
+        调用方可在同步侧 ``future.result()``，或在其他事件循环中
+        ``await asyncio.wrap_future(future)``。超时在 AOB 循环内执行，
+        超时后抛出 TimeoutError。
+        """
+        if timeout is None:
+            timeout = self._default_timeout
+
+        loop = self._ensure_loop()
+        call_id = self._register_call(op_name)
+
+        async def runner():
+            try:
+                return await asyncio.wait_for(coro, timeout=timeout)
+            except asyncio.TimeoutError as exc:
+                logger.error("[AOB] %s timed out after %.1fs", op_name, timeout)
+                raise TimeoutError(f"{op_name} timed out after {timeout}s") from exc
+
+        future = asyncio.run_coroutine_threadsafe(runner(), loop)
+        future.add_done_callback(lambda _: self._unregister_call(call_id))
+        return future
+
     def create_background_task(
         self,
         coro: asyncio.coroutines.Coroutine[Any, Any, Any],
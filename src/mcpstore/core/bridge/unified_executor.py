@@ -1,14 +1,43 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import threading
+import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from typing import Any, Coroutine, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 from .async_orchestrated_bridge import get_async_bridge
 
+# 跨循环调用延迟直方图的桶上界（毫秒），最后一个桶为 +inf
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass(frozen=True)
+class LatencyHistogram:
+    bounds_ms: Tuple[float, ...]
+    counts: Tuple[int, ...]  # len(bounds_ms) + 1，最后一个为溢出桶
+    count: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """按桶上界估算分位数（毫秒）；落在溢出桶时返回 max_ms。"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds_ms[i] if i < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
 
 @dataclass(frozen=True)
 class BridgeExecutionStats:
@@ -18,6 +47,37 @@ class BridgeExecutionStats:
     async_same_loop_direct_await_calls: int
     async_thread_handoff_calls: int
     per_operation: Dict[str, int]
+    per_operation_latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+
+class LatencyRecorder:
+    """Mutable latency histogram over LATENCY_BUCKETS_MS; snapshot() returns a LatencyHistogram.
+
+    Not thread-safe: callers serialize observe() (bridge lock, single event loop).
+    """
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def snapshot(self) -> LatencyHistogram:
+        return LatencyHistogram(
+            bounds_ms=LATENCY_BUCKETS_MS,
+            counts=tuple(self.counts),
+            count=self.count,
+            total_ms=self.total_ms,
+            max_ms=self.max_ms,
+        )
 
 
 class UnifiedBridgeExecutor:
@@ -30,6 +90,7 @@ class UnifiedBridgeExecutor:
         self._async_same_loop_direct_await_calls = 0
         self._async_thread_handoff_calls = 0
         self._per_operation: Dict[str, int] = defaultdict(int)
+        self._per_operation_latency: Dict[str, LatencyRecorder] = defaultdict(LatencyRecorder)
 
     def run_sync(self, coro: Coroutine[Any, Any, Any], *, op_name: str, timeout: Optional[float] = None) -> Any:
         bridge_loop = getattr(self._bridge, "_loop", None)
@@ -49,12 +110,15 @@ class UnifiedBridgeExecutor:
 
         self._record_sync(op_name=op_name, used_thread_handoff=running_in_loop)
 
-        if running_in_loop:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._bridge.run, coro, timeout=timeout, op_name=op_name)
-                return future.result()
-
-        return self._bridge.run(coro, timeout=timeout, op_name=op_name)
+        started = time.perf_counter()
+        try:
+            if running_in_loop:
+                # 调用方线程本就需要阻塞等待结果：直接投递到 AOB 循环并等待 Future，
+                # 无需为每次调用创建线程池
+                return self._bridge.submit(coro, timeout=timeout, op_name=op_name).result()
+            return self._bridge.run(coro, timeout=timeout, op_name=op_name)
+        finally:
+            self._record_latency(op_name, started)
 
     async def execute(self, coro: Coroutine[Any, Any, Any], *, op_name: str, timeout: Optional[float] = None) -> Any:
         effective_timeout = timeout
@@ -77,8 +141,14 @@ class UnifiedBridgeExecutor:
             self._record_async(op_name=op_name, same_loop_direct_await=False, used_thread_handoff=False)
             return self._bridge.run(coro, timeout=effective_timeout, op_name=op_name)
 
+        # 跨循环：投递到 AOB 循环并以 wrap_future 等待，等待期间不占用任何线程
         self._record_async(op_name=op_name, same_loop_direct_await=False, used_thread_handoff=True)
-        return await asyncio.to_thread(self._bridge.run, coro, timeout=effective_timeout, op_name=op_name)
+        started = time.perf_counter()
+        try:
+            future = self._bridge.submit(coro, timeout=effective_timeout, op_name=op_name)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._record_latency(op_name, started)
 
     def get_stats(self) -> BridgeExecutionStats:
         with self._lock:
@@ -89,6 +159,9 @@ class UnifiedBridgeExecutor:
                 async_same_loop_direct_await_calls=self._async_same_loop_direct_await_calls,
                 async_thread_handoff_calls=self._async_thread_handoff_calls,
                 per_operation=dict(self._per_operation),
+                per_operation_latency={
+                    op: recorder.snapshot() for op, recorder in self._per_operation_latency.items()
+                },
             )
 
     def reset_stats(self) -> None:
@@ -99,6 +172,7 @@ class UnifiedBridgeExecutor:
             self._async_same_loop_direct_await_calls = 0
             self._async_thread_handoff_calls = 0
             self._per_operation.clear()
+            self._per_operation_latency.clear()
 
     def _record_sync(self, *, op_name: str, used_thread_handoff: bool) -> None:
         with self._lock:
@@ -107,6 +181,11 @@ class UnifiedBridgeExecutor:
                 self._sync_thread_handoff_calls += 1
             self._per_operation[op_name] += 1
 
+    def _record_latency(self, op_name: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._per_operation_latency[op_name].observe(elapsed_ms)
+
     def _record_async(self, *, op_name: str, same_loop_direct_await: bool, used_thread_handoff: bool) -> None:
         with self._lock:
             self._async_calls += 1
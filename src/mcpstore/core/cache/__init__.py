@@ -8,9 +8,11 @@
 """
 
 from .cache_layer_manager import CacheLayerManager
+from .catalog_manager import CatalogConfig, ServiceCatalogManager
 from .models import (
     ServiceEntity,
     ToolEntity,
+    ServiceCatalogEntity,
     AgentEntity,
     StoreConfig,
     ServiceRelationItem,
@@ -32,11 +34,14 @@ __all__ = [
     "NamingService",
     "ServiceEntityManager",
     "ToolEntityManager",
+    "ServiceCatalogManager",
+    "CatalogConfig",
     "RelationshipManager",
     "StateManager",
     # 实体层模型
     "ServiceEntity",
     "ToolEntity",
+    "ServiceCatalogEntity",
     "AgentEntity",
     "StoreConfig",
     # 关系层模型
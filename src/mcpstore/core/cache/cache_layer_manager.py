@@ -10,9 +10,22 @@
 import asyncio
 import copy
 import logging
+import threading
 import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any, Dict, Optional, List, TYPE_CHECKING
 
+from .write_batch import (
+    DURABILITY_WRITE_BEHIND,
+    TOMBSTONE,
+    WriteBatch,
+    WriteBatchConfig,
+    WriteBatchStats,
+    split_ops,
+)
+
 if TYPE_CHECKING:
     from key_value.aio.protocols import AsyncKeyValue
 
@@ -52,6 +65,16 @@ class CacheLayerManager:
         self._last_scan_log: Dict[str, float] = {}
         self._last_state_snapshot: Dict[str, Any] = {}
         self._event_types: set[str] = set()
+        # 写入批处理（默认关闭，见 configure_write_batching / batch）
+        self._write_batch_config = WriteBatchConfig()
+        self._write_batch_stats = WriteBatchStats()
+        self._current_batch: ContextVar[Optional[WriteBatch]] = ContextVar(
+            f"cache_write_batch_{id(self)}", default=None
+        )
+        # 已提交但尚未落盘的批次（write_behind），读取时作为覆盖层
+        self._inflight_writes: List[Dict[str, Dict[str, Any]]] = []
+        self._inflight_lock = threading.Lock()
+        self._last_flush: Optional[Any] = None
         logger.debug(f"[CACHE] [INIT] Initializing CacheLayerManager, namespace: {namespace}")
 
     async def _await_in_bridge(self, coro, op_name: str):
@@ -144,6 +167,221 @@ class CacheLayerManager:
             self._last_state_snapshot[key] = copy.deepcopy(value)
             return True
         return False
+
+    # ==================== 写入批处理 ====================
+
+    def configure_write_batching(self, config: Optional[WriteBatchConfig]) -> None:
+        """配置写入批处理（features.cache_write_batching）"""
+        self._write_batch_config = config or WriteBatchConfig()
+        logger.debug(f"[CACHE] [BATCH] write batching configured: {self._write_batch_config}")
+
+    @property
+    def write_batch_config(self) -> WriteBatchConfig:
+        return self._write_batch_config
+
+    @asynccontextmanager
+    async def batch(self, durability: Optional[str] = None):
+        """
+        写入批处理作用域
+
+        作用域内的 put_*/delete_*（实体/关系/状态层）按 (collection, key) 合并，
+        退出时通过 put_many/delete_many 提交；作用域内的读取能看到尚未提交的写入。
+        未启用批处理或已处于批处理作用域内时，本作用域不做任何处理。
+
+        Args:
+            durability: "flush"（退出时等待提交）或 "write_behind"（后台提交），默认取配置
+        """
+        config = self._write_batch_config
+        if not config.enabled or self._current_batch.get() is not None:
+            yield
+            return
+
+        batch = WriteBatch(durability or config.durability, config.max_batch_size)
+        token = self._current_batch.set(batch)
+        self._write_batch_stats.batches += 1
+        body_failed = False
+        try:
+            yield
+        except BaseException:
+            body_failed = True
+            raise
+        finally:
+            self._current_batch.reset(token)
+            batch.closed = True
+            pending = batch.drain()
+            if pending:
+                # 即使作用域内出错也提交已暂存的写入，与逐条写入的副作用保持一致
+                try:
+                    await self._commit_pending(pending, batch.durability)
+                except Exception as e:
+                    if not body_failed:
+                        raise
+                    logger.error(f"[CACHE] [BATCH] flush after failed batch scope failed: {e}")
+
+    async def drain_writes(self) -> None:
+        """等待所有后台提交完成"""
+        last = self._last_flush
+        if last is None:
+            return
+        try:
+            await self._await_flush(last)
+        except Exception:
+            # 后台提交错误已在完成回调中记录
+            pass
+
+    def get_write_batch_stats(self) -> Dict[str, Any]:
+        stats = self._write_batch_stats
+        with self._inflight_lock:
+            inflight = sum(len(entries) for pending in self._inflight_writes for entries in pending.values())
+        return {
+            "enabled": self._write_batch_config.enabled,
+            "durability": self._write_batch_config.durability,
+            "batches": stats.batches,
+            "writes": stats.writes,
+            "coalesced": stats.coalesced,
+            "coalesce_rate": stats.coalesce_rate,
+            "flushes": stats.flushes,
+            "keys_flushed": stats.keys_flushed,
+            "flush_errors": stats.flush_errors,
+            "inflight_keys": inflight,
+        }
+
+    async def _stage_write(self, collection: str, key: str, value: Any) -> bool:
+        """
+        在当前批处理作用域中暂存写入
+
+        Returns:
+            True 表示已暂存（调用方不应再直接写入）；False 表示调用方应直接写入
+        """
+        batch = self._current_batch.get()
+        if batch is None or batch.closed:
+            # 直接写入前，先等待覆盖同一键的后台提交完成，避免旧值覆盖新值
+            if self._inflight_writes and self._inflight_contains(collection, key):
+                await self.drain_writes()
+            return False
+
+        stats = self._write_batch_stats
+        stats.writes += 1
+        # 暂存副本：调用方在 put 之后修改原对象，不应影响待提交数据和其它读取
+        if value is not TOMBSTONE:
+            value = copy.deepcopy(value)
+        if batch.stage(collection, key, value):
+            stats.coalesced += 1
+        if batch.is_full():
+            await self._commit_pending(batch.drain(), batch.durability)
+        return True
+
+    def _lookup_staged(self, collection: str, key: str):
+        """读取尚未落盘的写入：(是否命中, 值)；命中删除时值为 None"""
+        found, value = False, None
+        batch = self._current_batch.get()
+        if batch is not None and not batch.closed:
+            found, value = batch.lookup(collection, key)
+        if not found and self._inflight_writes:
+            with self._inflight_lock:
+                for pending in reversed(self._inflight_writes):
+                    entries = pending.get(collection)
+                    if entries is not None and key in entries:
+                        found, value = True, entries[key]
+                        break
+        if not found:
+            return False, None
+        return True, (None if value is TOMBSTONE else copy.deepcopy(value))
+
+    def _overlay_many(self, collection: str, keys: List[str], results) -> List[Optional[Dict[str, Any]]]:
+        results = list(results)
+        if self._current_batch.get() is None and not self._inflight_writes:
+            return results
+        for i, key in enumerate(keys):
+            found, value = self._lookup_staged(collection, key)
+            if found and i < len(results):
+                results[i] = value
+        return results
+
+    def _overlay_all(self, collection: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        batch = self._current_batch.get()
+        if (batch is None or batch.closed) and not self._inflight_writes:
+            return data
+        layers: List[Dict[str, Any]] = []
+        with self._inflight_lock:
+            layers.extend(pending.get(collection, {}) for pending in self._inflight_writes)
+        if batch is not None and not batch.closed:
+            layers.append(dict(batch.items(collection)))
+        merged = dict(data)
+        for entries in layers:
+            for key, value in entries.items():
+                if value is TOMBSTONE:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = copy.deepcopy(value)
+        return merged
+
+    def _inflight_contains(self, collection: str, key: str) -> bool:
+        with self._inflight_lock:
+            return any(key in pending.get(collection, {}) for pending in self._inflight_writes)
+
+    async def _commit_pending(self, pending: Dict[str, Dict[str, Any]], durability: str) -> None:
+        future = self._submit_flush(pending)
+        if durability != DURABILITY_WRITE_BEHIND:
+            await self._await_flush(future)
+
+    def _submit_flush(self, pending: Dict[str, Dict[str, Any]]):
+        """按提交顺序串行落盘（后一个批次等待前一个批次完成）"""
+        with self._inflight_lock:
+            self._inflight_writes.append(pending)
+        previous = self._last_flush
+
+        async def _run():
+            if previous is not None:
+                try:
+                    await self._await_flush(previous)
+                except Exception:
+                    pass
+            await self._write_pending(pending)
+
+        if self._bridge is not None:
+            future = self._bridge.submit(_run(), op_name="cache.flush_write_batch")
+        else:
+            future = asyncio.ensure_future(_run())
+        self._last_flush = future
+
+        def _done(fut):
+            with self._inflight_lock:
+                self._inflight_writes = [p for p in self._inflight_writes if p is not pending]
+            if fut.cancelled():
+                return
+            error = fut.exception()
+            if error is not None:
+                self._write_batch_stats.flush_errors += 1
+                logger.error(f"[CACHE] [BATCH] write batch flush failed: {error}")
+
+        future.add_done_callback(_done)
+        return future
+
+    @staticmethod
+    async def _await_flush(future) -> None:
+        if isinstance(future, Future):
+            await asyncio.wrap_future(future)
+        else:
+            await future
+
+    async def _write_pending(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        keys_flushed = 0
+        for collection, put_keys, put_values, delete_keys in split_ops(pending):
+            try:
+                if put_keys:
+                    await self._kv_store.put_many(put_keys, put_values, collection=collection)
+                if delete_keys:
+                    await self._kv_store.delete_many(delete_keys, collection=collection)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to flush write batch: collection={collection}, "
+                    f"puts={len(put_keys)}, deletes={len(delete_keys)}, error={e}"
+                ) from e
+            keys_flushed += len(put_keys) + len(delete_keys)
+        self._write_batch_stats.flushes += 1
+        self._write_batch_stats.keys_flushed += keys_flushed
+        logger.debug(f"[CACHE] [BATCH] flushed {keys_flushed} keys in {len(pending)} collections")
     
     # ==================== 实体层操作 ====================
     
@@ -172,6 +410,8 @@ class CacheLayerManager:
             )
         
         collection = self._get_entity_collection(entity_type)
+        if await self._stage_write(collection, key, value):
+            return
         logger.debug(
             f"[CACHE] put_entity: collection={collection}, key={key}, "
             f"entity_type={entity_type}, kv_store instance={id(self._kv_store)}"
@@ -225,6 +465,9 @@ class CacheLayerManager:
             raise RuntimeError("entity_type 'client_configs' is deprecated, please use 'clients'")
 
         collection = self._get_entity_collection(entity_type)
+        found, staged = self._lookup_staged(collection, key)
+        if found:
+            return staged
         logger.debug(
             f"[CACHE] [ENTITY] [GET] collection={collection}, key={key}, "
             f"entity_type={entity_type}"
@@ -257,6 +500,8 @@ class CacheLayerManager:
             RuntimeError: 如果 pykv 操作失败
         """
         collection = self._get_entity_collection(entity_type)
+        if await self._stage_write(collection, key, TOMBSTONE):
+            return
         logger.debug(
             f"[CACHE] delete_entity: collection={collection}, key={key}, "
             f"entity_type={entity_type}"
@@ -308,7 +553,7 @@ class CacheLayerManager:
                 self._kv_store.get_many(keys, collection=collection),
                 f"cache.get_many_entities.{entity_type}"
             )
-            return results
+            return self._overlay_many(collection, keys, results)
         except Exception as e:
             logger.error(
                 f"[CACHE] [ERROR] Failed to get many entities: collection={collection}, "
@@ -430,7 +675,8 @@ class CacheLayerManager:
             return entities
 
         try:
-            return await self._await_in_bridge(_read(), f"cache.get_all_entities_async.{entity_type}")
+            entities = await self._await_in_bridge(_read(), f"cache.get_all_entities_async.{entity_type}")
+            return self._overlay_all(self._get_entity_collection(entity_type), entities)
         except Exception as e:
             logger.error(f"[CACHE] [ERROR] Failed to get all entities asynchronously: entity_type={entity_type}, error={e}")
             raise RuntimeError(f"Failed to get all entities asynchronously: entity_type={entity_type}, error={e}") from e
@@ -462,6 +708,8 @@ class CacheLayerManager:
             )
         
         collection = self._get_relation_collection(relation_type)
+        if await self._stage_write(collection, key, value):
+            return
         logger.debug(
             f"[CACHE] put_relation: collection={collection}, key={key}, "
             f"relation_type={relation_type}"
@@ -619,6 +867,9 @@ class CacheLayerManager:
             RuntimeError: 如果 pykv 操作失败
         """
         collection = self._get_relation_collection(relation_type)
+        found, staged = self._lookup_staged(collection, key)
+        if found:
+            return staged
         # 使用与扫描相同的时间窗口机制，限制高频关系读取日志的刷屏
         log_key = f"relation_read:{relation_type}:{key}"
         if self._should_log_scan(log_key):
@@ -642,6 +893,50 @@ class CacheLayerManager:
                 f"Failed to get relation: collection={collection}, key={key}, error={e}"
             ) from e
     
+    async def get_many_relations(
+        self,
+        relation_type: str,
+        keys: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        批量获取关系（单次后端往返）
+        
+        Args:
+            relation_type: 关系类型
+            keys: 关系的唯一标识列表
+            
+        Returns:
+            关系数据列表，与 keys 顺序一致，不存在的关系返回 None
+            
+        Raises:
+            RuntimeError: 如果 pykv 操作失败
+        """
+        if not keys:
+            return []
+        collection = self._get_relation_collection(relation_type)
+        log_key = f"relation_read_many:{relation_type}"
+        if self._should_log_scan(log_key):
+            logger.debug(
+                f"[CACHE] [RELATION] [GET_MANY] collection={collection}, "
+                f"keys_count={len(keys)}, relation_type={relation_type}"
+            )
+        
+        try:
+            results = await self._await_in_bridge(
+                self._kv_store.get_many(keys, collection=collection),
+                f"cache.get_many_relations.{relation_type}"
+            )
+            return self._overlay_many(collection, keys, results)
+        except Exception as e:
+            logger.error(
+                f"[CACHE] [ERROR] Failed to get many relations: collection={collection}, "
+                f"keys_count={len(keys)}, error={e}"
+            )
+            raise RuntimeError(
+                f"Failed to get many relations: collection={collection}, "
+                f"keys_count={len(keys)}, error={e}"
+            ) from e
+    
     async def delete_relation(self, relation_type: str, key: str) -> None:
         """
         从关系层删除关系
@@ -654,6 +949,8 @@ class CacheLayerManager:
             RuntimeError: 如果 pykv 操作失败
         """
         collection = self._get_relation_collection(relation_type)
+        if await self._stage_write(collection, key, TOMBSTONE):
+            return
         logger.debug(
             f"[CACHE] delete_relation: collection={collection}, key={key}, "
             f"relation_type={relation_type}"
@@ -673,6 +970,107 @@ class CacheLayerManager:
                 f"Failed to delete relation: collection={collection}, key={key}, error={e}"
             ) from e
 
+    async def put_many_relations(
+        self,
+        relation_type: str,
+        keys: List[str],
+        values: List[Dict[str, Any]]
+    ) -> None:
+        """
+        批量存储关系（单次后端往返）
+
+        Args:
+            relation_type: 关系类型
+            keys: 关系的唯一标识列表
+            values: 关系数据列表，与 keys 一一对应
+
+        Raises:
+            ValueError: 如果 keys/values 长度不一致或 value 不是字典类型
+            RuntimeError: 如果 pykv 操作失败
+        """
+        if len(keys) != len(values):
+            raise ValueError(
+                f"keys and values must have the same length: {len(keys)} != {len(values)}. "
+                f"relation_type={relation_type}"
+            )
+        for key, value in zip(keys, values):
+            if not isinstance(value, dict):
+                raise ValueError(
+                    f"Relation value must be a dict type, actual type: {type(value).__name__}. "
+                    f"relation_type={relation_type}, key={key}"
+                )
+        if not keys:
+            return
+
+        collection = self._get_relation_collection(relation_type)
+        direct_keys: List[str] = []
+        direct_values: List[Dict[str, Any]] = []
+        for key, value in zip(keys, values):
+            if not await self._stage_write(collection, key, value):
+                direct_keys.append(key)
+                direct_values.append(value)
+        if not direct_keys:
+            return
+        logger.debug(
+            f"[CACHE] put_many_relations: collection={collection}, "
+            f"keys_count={len(direct_keys)}, relation_type={relation_type}"
+        )
+
+        try:
+            await self._await_in_bridge(
+                self._kv_store.put_many(direct_keys, direct_values, collection=collection),
+                f"cache.put_many_relations.{relation_type}"
+            )
+        except Exception as e:
+            logger.error(
+                f"[CACHE] [ERROR] Failed to store many relations: collection={collection}, "
+                f"keys_count={len(direct_keys)}, error={e}"
+            )
+            raise RuntimeError(
+                f"Failed to store many relations: collection={collection}, "
+                f"keys_count={len(direct_keys)}, error={e}"
+            ) from e
+
+    async def delete_many_relations(self, relation_type: str, keys: List[str]) -> None:
+        """
+        批量删除关系（单次后端往返）
+
+        Args:
+            relation_type: 关系类型
+            keys: 关系的唯一标识列表
+
+        Raises:
+            RuntimeError: 如果 pykv 操作失败
+        """
+        if not keys:
+            return
+        collection = self._get_relation_collection(relation_type)
+        direct_keys = [
+            key for key in keys
+            if not await self._stage_write(collection, key, TOMBSTONE)
+        ]
+        if not direct_keys:
+            return
+        logger.debug(
+            f"[CACHE] delete_many_relations: collection={collection}, "
+            f"keys_count={len(direct_keys)}, relation_type={relation_type}"
+        )
+
+        try:
+            await self._await_in_bridge(
+                self._kv_store.delete_many(direct_keys, collection=collection),
+                f"cache.delete_many_relations.{relation_type}"
+            )
+        except Exception as e:
+            logger.error(
+                f"[CACHE] [ERROR] Failed to delete many relations: collection={collection}, "
+                f"keys_count={len(direct_keys)}, error={e}"
+            )
+            raise RuntimeError(
+                f"Failed to delete many relations: collection={collection}, "
+                f"keys_count={len(direct_keys)}, error={e}"
+            ) from e
+
     async def get_all_relations_async(self, relation_type: str) -> Dict[str, Dict[str, Any]]:
         """
         异步获取指定类型的所有关系
@@ -698,7 +1096,8 @@ class CacheLayerManager:
             return relations
 
         try:
-            return await self._await_in_bridge(_read(), f"cache.get_all_relations_async.{relation_type}")
+            relations = await self._await_in_bridge(_read(), f"cache.get_all_relations_async.{relation_type}")
+            return self._overlay_all(collection, relations)
         except Exception as e:
             logger.error(f"[CACHE] [ERROR] Failed to get all relations asynchronously: relation_type={relation_type}, error={e}")
             raise RuntimeError(f"Failed to get all relations asynchronously: relation_type={relation_type}, error={e}") from e
@@ -730,6 +1129,8 @@ class CacheLayerManager:
             )
         
         collection = self._get_state_collection(state_type)
+        if await self._stage_write(collection, key, value):
+            return
         logger.debug(
             f"[CACHE] [STATE] [PUT] collection={collection}, key={key}, "
             f"state_type={state_type}"
@@ -780,6 +1181,9 @@ class CacheLayerManager:
             RuntimeError: 如果 pykv 操作失败
         """
         collection = self._get_state_collection(state_type)
+        found, staged = self._lookup_staged(collection, key)
+        if found:
+            return staged
         state_key = f"{state_type}:{key}"
         log_key = f"state_read:{state_key}"
         log_state = self._should_log_scan(log_key)
@@ -809,6 +1213,50 @@ class CacheLayerManager:
                 f"Failed to get state: collection={collection}, key={key}, error={e}"
             ) from e
 
+    async def get_many_states(
+        self,
+        state_type: str,
+        keys: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        批量获取状态（单次后端往返）
+        
+        Args:
+            state_type: 状态类型
+            keys: 状态的唯一标识列表
+            
+        Returns:
+            状态数据列表，与 keys 顺序一致，不存在的状态返回 None
+            
+        Raises:
+            RuntimeError: 如果 pykv 操作失败
+        """
+        if not keys:
+            return []
+        collection = self._get_state_collection(state_type)
+        log_key = f"state_read_many:{state_type}"
+        if self._should_log_scan(log_key):
+            logger.debug(
+                f"[CACHE] [STATE] [GET_MANY] collection={collection}, "
+                f"keys_count={len(keys)}, state_type={state_type}"
+            )
+
+        try:
+            results = await self._await_in_bridge(
+                self._kv_store.get_many(keys, collection=collection),
+                f"cache.get_many_states.{state_type}"
+            )
+            return self._overlay_many(collection, keys, results)
+        except Exception as e:
+            logger.error(
+                f"[CACHE] [ERROR] Failed to get many states: collection={collection}, "
+                f"keys_count={len(keys)}, error={e}"
+            )
+            raise RuntimeError(
+                f"Failed to get many states: collection={collection}, "
+                f"keys_count={len(keys)}, error={e}"
+            ) from e
+
     async def get_all_states_async(self, state_type: str) -> Dict[str, Dict[str, Any]]:
         """
         异步获取指定类型的所有状态
@@ -834,7 +1282,8 @@ class CacheLayerManager:
             return states
 
         try:
-            return await self._await_in_bridge(_read(), f"cache.get_all_states_async.{state_type}")
+            states = await self._await_in_bridge(_read(), f"cache.get_all_states_async.{state_type}")
+            return self._overlay_all(collection, states)
         except Exception as e:
             logger.error(f"[CACHE] [ERROR] Failed to get all states asynchronously: state_type={state_type}, error={e}")
             raise RuntimeError(f"Failed to get all states asynchronously: state_type={state_type}, error={e}") from e
@@ -851,6 +1300,8 @@ class CacheLayerManager:
             RuntimeError: 如果 pykv 操作失败
         """
         collection = self._get_state_collection(state_type)
+        if await self._stage_write(collection, key, TOMBSTONE):
+            return
         logger.debug(
             f"[CACHE] delete_state: collection={collection}, key={key}, "
             f"state_type={state_type}"
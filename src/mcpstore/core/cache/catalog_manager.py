@@ -0,0 +1,158 @@
+"""
+服务目录管理器
+
+负责管理服务 resources / resource templates / prompts 目录实体的读写。
+目录在服务连接时由 CacheManager 写入，收到 list_changed 通知或超过有效期时刷新；
+list_resources / list_prompts 直接读取实体层，无需再连接服务。
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from .models import ServiceCatalogEntity
+
+if TYPE_CHECKING:
+    from .cache_layer_manager import CacheLayerManager
+
+logger = logging.getLogger(__name__)
+
+CATALOG_ENTITY_TYPE = "service_catalogs"
+
+
+@dataclass
+class CatalogConfig:
+    """服务目录刷新设置（features.catalog）"""
+    # 没有存活池化客户端（收不到 list_changed 通知）时目录的有效期（秒），<= 0 表示不按时间刷新
+    ttl: float = 300.0
+    # 有存活池化客户端时的有效期上限，防止通知丢失或服务端不发送通知
+    subscribed_ttl: float = 3600.0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "CatalogConfig":
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+    def is_stale(self, updated_time: float, subscribed: bool, now: Optional[float] = None) -> bool:
+        """自 updated_time 起是否已超过有效期（subscribed: 是否有存活的池化客户端在接收通知）"""
+        ttl = self.subscribed_ttl if subscribed else self.ttl
+        if not ttl or ttl <= 0:
+            return False
+        return (time.time() if now is None else now) - updated_time >= ttl
+
+
+class ServiceCatalogManager:
+    """
+    服务目录管理器
+
+    每个服务一条目录实体，键为服务全局名称。
+    """
+
+    def __init__(self, cache_layer: 'CacheLayerManager'):
+        """
+        初始化服务目录管理器
+
+        Args:
+            cache_layer: 缓存层管理器
+        """
+        self._cache_layer = cache_layer
+        self._change_listeners: List[Callable[[str], None]] = []
+        logger.debug("[SERVICE_CATALOG] Initializing ServiceCatalogManager")
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        注册目录变更监听器
+
+        监听器在目录写入 / 删除后以服务全局名称同步调用，只应做轻量的失效处理。
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def _notify_change(self, service_global_name: str) -> None:
+        for listener in self._change_listeners:
+            try:
+                listener(service_global_name)
+            except Exception as e:
+                logger.debug(f"[SERVICE_CATALOG] Change listener failed: {e}")
+
+    async def put_catalog(
+        self,
+        service_global_name: str,
+        service_original_name: str,
+        source_agent: str,
+        resources: Optional[List[Dict[str, Any]]] = None,
+        resource_templates: Optional[List[Dict[str, Any]]] = None,
+        prompts: Optional[List[Dict[str, Any]]] = None,
+    ) -> ServiceCatalogEntity:
+        """
+        写入（覆盖）服务目录
+
+        Raises:
+            ValueError: 如果参数无效
+        """
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+
+        entity = ServiceCatalogEntity(
+            service_global_name=service_global_name,
+            service_original_name=service_original_name or service_global_name,
+            source_agent=source_agent,
+            resources=list(resources or []),
+            resource_templates=list(resource_templates or []),
+            prompts=list(prompts or []),
+            updated_time=int(time.time()),
+        )
+        await self._cache_layer.put_entity(CATALOG_ENTITY_TYPE, service_global_name, entity.to_dict())
+        logger.debug(
+            f"[SERVICE_CATALOG] Stored catalog: service_global_name={service_global_name}, "
+            f"resources={len(entity.resources)}, templates={len(entity.resource_templates)}, "
+            f"prompts={len(entity.prompts)}"
+        )
+        self._notify_change(service_global_name)
+        return entity
+
+    async def get_catalog(self, service_global_name: str) -> Optional[ServiceCatalogEntity]:
+        """获取服务目录，不存在时返回 None"""
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+        data = await self._cache_layer.get_entity(CATALOG_ENTITY_TYPE, service_global_name)
+        return self._parse(service_global_name, data)
+
+    async def get_catalogs(self, service_global_names: List[str]) -> Dict[str, Optional[ServiceCatalogEntity]]:
+        """批量获取服务目录（一次批量读取），不存在的服务映射为 None"""
+        names = [name for name in service_global_names if name]
+        if not names:
+            return {}
+        items = await self._cache_layer.get_many_entities(CATALOG_ENTITY_TYPE, names)
+        return {name: self._parse(name, data) for name, data in zip(names, items)}
+
+    async def delete_catalog(self, service_global_name: str) -> None:
+        """删除服务目录"""
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+        await self._cache_layer.delete_entity(CATALOG_ENTITY_TYPE, service_global_name)
+        logger.debug(f"[SERVICE_CATALOG] Deleted catalog: service_global_name={service_global_name}")
+        self._notify_change(service_global_name)
+
+    @staticmethod
+    def _parse(service_global_name: str, data: Optional[Dict[str, Any]]) -> Optional[ServiceCatalogEntity]:
+        if data is None:
+            return None
+        try:
+            return ServiceCatalogEntity.from_dict(data)
+        except Exception as e:
+            logger.warning(
+                f"[SERVICE_CATALOG] Failed to parse catalog entity: "
+                f"service_global_name={service_global_name}, error={e}"
+            )
+            return None
+
+
+__all__ = [
+    "CATALOG_ENTITY_TYPE",
+    "CatalogConfig",
+    "ServiceCatalogManager",
+]
@@ -111,6 +111,53 @@ class ToolEntity:
         )
 
 
+@dataclass
+class ServiceCatalogEntity:
+    """
+    服务目录实体
+
+    存储在实体层的服务 resources / resource templates / prompts 列表（每个服务一条），
+    连接时写入，收到 list_changed 通知时刷新。
+    """
+    service_global_name: str
+    service_original_name: str
+    source_agent: str
+    resources: List[Dict[str, Any]] = field(default_factory=list)
+    resource_templates: List[Dict[str, Any]] = field(default_factory=list)
+    prompts: List[Dict[str, Any]] = field(default_factory=list)
+    updated_time: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ServiceCatalogEntity':
+        """从字典创建"""
+        if not isinstance(data, dict):
+            raise ValueError(f"Data must be a dictionary type, actual type: {type(data).__name__}")
+
+        required_fields = [
+            "service_global_name",
+            "service_original_name",
+            "source_agent",
+        ]
+
+        for field_name in required_fields:
+            if field_name not in data:
+                raise ValueError(f"Missing required field: {field_name}")
+
+        return cls(
+            service_global_name=data["service_global_name"],
+            service_original_name=data["service_original_name"],
+            source_agent=data["source_agent"],
+            resources=list(data.get("resources") or []),
+            resource_templates=list(data.get("resource_templates") or []),
+            prompts=list(data.get("prompts") or []),
+            updated_time=data.get("updated_time", 0),
+        )
+
+
 @dataclass
 class AgentEntity:
     """
@@ -0,0 +1,451 @@
+"""
+关系存储布局
+
+RelationshipManager 通过 RelationStore 读写 Agent-Service / Service-Tool 关系，
+存储布局由 features.relation_layout 选择：
+
+- "document"（默认）：每个所有者（agent_id / service_global_name）一个 JSON 文档，
+  成员保存在列表字段中（"services" / "tools"），任何修改都重写整个文档。
+- "indexed"：拆分为索引文档和成员文档
+    {relation_type}_index[owner]             所有者元数据 + 有序成员名列表 "members"
+    {relation_type}_members["owner/member"]  单个关系项
+  成员判断、单项读取是一次按键读取；更新已有成员只写该成员文档；
+  只有增删成员时才重写成员名列表。
+
+两种布局在内存中都解析为 RelationView（按全局名称索引的有序字典），不再线性扫描列表。
+
+迁移：indexed 布局在首次访问某个所有者时，若索引不存在但旧文档存在，会就地转换；
+migrate_relation_layout() 可一次性双向迁移全部关系。
+同一后端上的多个进程应使用相同的布局。
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache_layer_manager import CacheLayerManager
+
+logger = logging.getLogger(__name__)
+
+LAYOUT_DOCUMENT = "document"
+LAYOUT_INDEXED = "indexed"
+RELATION_LAYOUTS = (LAYOUT_DOCUMENT, LAYOUT_INDEXED)
+
+# relation_type -> (文档中的成员列表字段, 成员全局名称字段)
+RELATION_MEMBER_FIELDS: Dict[str, Tuple[str, str]] = {
+    "agent_services": ("services", "service_global_name"),
+    "service_tools": ("tools", "tool_global_name"),
+}
+
+
+def validate_layout(layout: Optional[str]) -> str:
+    layout = layout or LAYOUT_DOCUMENT
+    if layout not in RELATION_LAYOUTS:
+        raise ValueError(
+            f"Invalid relation_layout: {layout}. Valid values: {list(RELATION_LAYOUTS)}"
+        )
+    return layout
+
+
+def index_relation_type(relation_type: str) -> str:
+    return f"{relation_type}_index"
+
+
+def members_relation_type(relation_type: str) -> str:
+    return f"{relation_type}_members"
+
+
+def member_key(owner: str, member: str) -> str:
+    return f"{owner}/{member}"
+
+
+def relation_collections(relation_type: str) -> List[str]:
+    """一种关系在两种布局下涉及的全部关系类型（用于后端迁移）"""
+    return [relation_type, index_relation_type(relation_type), members_relation_type(relation_type)]
+
+
+@dataclass
+class RelationView:
+    """一个所有者的关系（与布局无关的内存表示）"""
+    relation_type: str
+    owner: str
+    # 所有者元数据（service_tools: service_global_name / service_original_name / source_agent）
+    meta: Dict[str, Any] = field(default_factory=dict)
+    # 成员全局名称 -> 关系项字典，保持插入顺序
+    members: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_document(cls, relation_type: str, owner: str, document: Dict[str, Any]) -> "RelationView":
+        list_field, name_field = RELATION_MEMBER_FIELDS[relation_type]
+        items = document.get(list_field, [])
+        if not isinstance(items, list):
+            raise ValueError(f"{list_field} must be a list type, actual type: {type(items).__name__}")
+        view = cls(
+            relation_type=relation_type,
+            owner=owner,
+            meta={k: v for k, v in document.items() if k != list_field},
+        )
+        for item in items:
+            if isinstance(item, dict) and item.get(name_field):
+                view.members[item[name_field]] = item
+        return view
+
+    def to_document(self) -> Dict[str, Any]:
+        list_field, _ = RELATION_MEMBER_FIELDS[self.relation_type]
+        document = dict(self.meta)
+        document[list_field] = list(self.members.values())
+        return document
+
+    def to_index(self) -> Dict[str, Any]:
+        index = dict(self.meta)
+        index["members"] = list(self.members)
+        return index
+
+
+class DocumentRelationStore:
+    """文档布局：整个关系作为一个文档读写"""
+
+    layout = LAYOUT_DOCUMENT
+
+    def __init__(self, cache_layer: 'CacheLayerManager'):
+        self._cache_layer = cache_layer
+
+    async def load(self, relation_type: str, owner: str) -> Optional[RelationView]:
+        document = await self._cache_layer.get_relation(relation_type, owner)
+        if document is None:
+            return None
+        return RelationView.from_document(relation_type, owner, document)
+
+    async def load_many(self, relation_type: str, owners: List[str]) -> List[Optional[RelationView]]:
+        documents = await self._cache_layer.get_many_relations(relation_type, owners)
+        return [
+            RelationView.from_document(relation_type, owner, document) if document is not None else None
+            for owner, document in zip(owners, documents)
+        ]
+
+    async def load_all(self, relation_type: str) -> Dict[str, RelationView]:
+        documents = await self._cache_layer.get_all_relations_async(relation_type)
+        return {
+            owner: RelationView.from_document(relation_type, owner, document)
+            for owner, document in documents.items()
+        }
+
+    async def get_member(self, relation_type: str, owner: str, member: str) -> Optional[Dict[str, Any]]:
+        view = await self.load(relation_type, owner)
+        return view.members.get(member) if view is not None else None
+
+    async def upsert_member(
+        self,
+        relation_type: str,
+        owner: str,
+        member: str,
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+        meta: Dict[str, Any]
+    ) -> bool:
+        """写入单个成员，build(existing) 生成新的关系项；返回是否新增"""
+        view = await self.load(relation_type, owner)
+        if view is None:
+            view = RelationView(relation_type=relation_type, owner=owner, meta=dict(meta))
+        existing = view.members.get(member)
+        view.members[member] = build(existing)
+        await self._cache_layer.put_relation(relation_type, owner, view.to_document())
+        return existing is None
+
+    async def upsert_members(
+        self,
+        relation_type: str,
+        owner: str,
+        items: Dict[str, Dict[str, Any]],
+        meta: Dict[str, Any],
+        replace: bool = False
+    ) -> int:
+        """批量写入成员（replace=True 时替换整个成员集合）；返回新增数量"""
+        view = None if replace else await self.load(relation_type, owner)
+        if view is None:
+            view = RelationView(relation_type=relation_type, owner=owner, meta=dict(meta))
+        added = sum(1 for name in items if name not in view.members)
+        view.members.update(items)
+        await self._cache_layer.put_relation(relation_type, owner, view.to_document())
+        return added
+
+    async def remove_member(self, relation_type: str, owner: str, member: str) -> Optional[bool]:
+        """移除成员：None 表示所有者不存在，False 表示成员不存在；成员清空时删除整个关系"""
+        view = await self.load(relation_type, owner)
+        if view is None:
+            return None
+        if view.members.pop(member, None) is None:
+            return False
+        if view.members:
+            await self._cache_layer.put_relation(relation_type, owner, view.to_document())
+        else:
+            await self._cache_layer.delete_relation(relation_type, owner)
+        return True
+
+    async def delete(self, relation_type: str, owner: str) -> None:
+        await self._cache_layer.delete_relation(relation_type, owner)
+
+
+class IndexedRelationStore:
+    """索引布局：索引文档 + 每个成员一个文档，支持部分更新"""
+
+    layout = LAYOUT_INDEXED
+
+    def __init__(self, cache_layer: 'CacheLayerManager'):
+        self._cache_layer = cache_layer
+        # 已确认无需从文档布局迁移的所有者（每个进程每个所有者最多检查一次旧文档）
+        self._legacy_checked: Set[Tuple[str, str]] = set()
+
+    async def load(self, relation_type: str, owner: str) -> Optional[RelationView]:
+        index = await self._load_index(relation_type, owner)
+        if index is None:
+            return None
+        return (await self._read_members(relation_type, [(owner, index)]))[0]
+
+    async def load_many(self, relation_type: str, owners: List[str]) -> List[Optional[RelationView]]:
+        indexes = await self._cache_layer.get_many_relations(index_relation_type(relation_type), owners)
+        found: List[Tuple[str, Dict[str, Any]]] = []
+        for owner, index in zip(owners, indexes):
+            if index is not None:
+                self._legacy_checked.add((relation_type, owner))
+                found.append((owner, index))
+        views = {view.owner: view for view in await self._read_members(relation_type, found)}
+
+        results: List[Optional[RelationView]] = []
+        for owner in owners:
+            view = views.get(owner)
+            if view is None:
+                view = await self._migrate_owner(relation_type, owner)
+            results.append(view)
+        return results
+
+    async def load_all(self, relation_type: str) -> Dict[str, RelationView]:
+        indexes = await self._cache_layer.get_all_relations_async(index_relation_type(relation_type))
+        views = {
+            view.owner: view
+            for view in await self._read_members(relation_type, list(indexes.items()))
+        }
+        # 尚未迁移的旧文档也计入结果
+        legacy = await self._cache_layer.get_all_relations_async(relation_type)
+        for owner in legacy:
+            if owner not in views:
+                self._legacy_checked.discard((relation_type, owner))
+                view = await self._migrate_owner(relation_type, owner)
+                if view is not None:
+                    views[owner] = view
+        return views
+
+    async def get_member(self, relation_type: str, owner: str, member: str) -> Optional[Dict[str, Any]]:
+        item = await self._cache_layer.get_relation(
+            members_relation_type(relation_type), member_key(owner, member)
+        )
+        if item is None:
+            view = await self._migrate_owner(relation_type, owner)
+            if view is not None:
+                item = view.members.get(member)
+        return item
+
+    async def upsert_member(
+        self,
+        relation_type: str,
+        owner: str,
+        member: str,
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+        meta: Dict[str, Any]
+    ) -> bool:
+        """写入单个成员；已有成员只写成员文档，新成员额外追加到索引"""
+        existing = await self.get_member(relation_type, owner, member)
+        await self._cache_layer.put_relation(
+            members_relation_type(relation_type), member_key(owner, member), build(existing)
+        )
+        if existing is not None:
+            return False
+
+        index = await self._load_index(relation_type, owner)
+        if index is None:
+            index = dict(meta)
+            index["members"] = []
+        if member not in index["members"]:
+            index["members"].append(member)
+            await self._cache_layer.put_relation(index_relation_type(relation_type), owner, index)
+        return True
+
+    async def upsert_members(
+        self,
+        relation_type: str,
+        owner: str,
+        items: Dict[str, Dict[str, Any]],
+        meta: Dict[str, Any],
+        replace: bool = False
+    ) -> int:
+        """批量写入成员（replace=True 时替换整个成员集合）；返回新增数量"""
+        index = await self._load_index(relation_type, owner)
+        old_members: List[str] = list(index.get("members", [])) if index is not None else []
+        old_set = set(old_members)
+
+        if replace or index is None:
+            new_index = dict(meta)
+            new_index["members"] = list(items)
+        else:
+            new_index = dict(index)
+            new_index["members"] = old_members + [name for name in items if name not in old_set]
+        removed = [name for name in old_members if name not in items] if replace else []
+        added = sum(1 for name in items if name not in old_set)
+
+        await self._cache_layer.put_many_relations(
+            members_relation_type(relation_type),
+            [member_key(owner, name) for name in items],
+            list(items.values())
+        )
+        if new_index != index:
+            await self._cache_layer.put_relation(index_relation_type(relation_type), owner, new_index)
+        if removed:
+            await self._cache_layer.delete_many_relations(
+                members_relation_type(relation_type),
+                [member_key(owner, name) for name in removed]
+            )
+        return added
+
+    async def remove_member(self, relation_type: str, owner: str, member: str) -> Optional[bool]:
+        """移除成员：None 表示所有者不存在，False 表示成员不存在；成员清空时删除整个关系"""
+        index = await self._load_index(relation_type, owner)
+        if index is None:
+            return None
+        members = list(index.get("members", []))
+        if member not in members:
+            return False
+        members.remove(member)
+        if members:
+            index["members"] = members
+            await self._cache_layer.put_relation(index_relation_type(relation_type), owner, index)
+        else:
+            await self._cache_layer.delete_relation(index_relation_type(relation_type), owner)
+        await self._cache_layer.delete_relation(
+            members_relation_type(relation_type), member_key(owner, member)
+        )
+        return True
+
+    async def delete(self, relation_type: str, owner: str) -> None:
+        index = await self._load_index(relation_type, owner)
+        if index is None:
+            return
+        await self._cache_layer.delete_relation(index_relation_type(relation_type), owner)
+        await self._cache_layer.delete_many_relations(
+            members_relation_type(relation_type),
+            [member_key(owner, name) for name in index.get("members", [])]
+        )
+
+    async def write_view(self, view: RelationView) -> None:
+        """整体写入一个关系（先写成员，再写索引）"""
+        await self._cache_layer.put_many_relations(
+            members_relation_type(view.relation_type),
+            [member_key(view.owner, name) for name in view.members],
+            list(view.members.values())
+        )
+        await self._cache_layer.put_relation(
+            index_relation_type(view.relation_type), view.owner, view.to_index()
+        )
+
+    async def _load_index(self, relation_type: str, owner: str) -> Optional[Dict[str, Any]]:
+        index = await self._cache_layer.get_relation(index_relation_type(relation_type), owner)
+        if index is not None:
+            self._legacy_checked.add((relation_type, owner))
+            return index
+        view = await self._migrate_owner(relation_type, owner)
+        return view.to_index() if view is not None else None
+
+    async def _read_members(
+        self,
+        relation_type: str,
+        indexes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[RelationView]:
+        """一次批量读取多个所有者的全部成员"""
+        keys: List[str] = []
+        for owner, index in indexes:
+            keys.extend(member_key(owner, name) for name in index.get("members", []))
+        items = await self._cache_layer.get_many_relations(members_relation_type(relation_type), keys)
+        by_key = dict(zip(keys, items))
+
+        views: List[RelationView] = []
+        for owner, index in indexes:
+            view = RelationView(
+                relation_type=relation_type,
+                owner=owner,
+                meta={k: v for k, v in index.items() if k != "members"},
+            )
+            for name in index.get("members", []):
+                item = by_key.get(member_key(owner, name))
+                if item is not None:
+                    view.members[name] = item
+            views.append(view)
+        return views
+
+    async def _migrate_owner(self, relation_type: str, owner: str) -> Optional[RelationView]:
+        """把一个所有者的旧文档转换为索引布局（每个进程每个所有者最多检查一次）"""
+        check_key = (relation_type, owner)
+        if check_key in self._legacy_checked:
+            return None
+        self._legacy_checked.add(check_key)
+
+        document = await self._cache_layer.get_relation(relation_type, owner)
+        if document is None:
+            return None
+        view = RelationView.from_document(relation_type, owner, document)
+        await self.write_view(view)
+        await self._cache_layer.delete_relation(relation_type, owner)
+        logger.info(
+            f"[RELATIONSHIP] Migrated relation to indexed layout: "
+            f"relation_type={relation_type}, owner={owner}, members={len(view.members)}"
+        )
+        return view
+
+
+def create_relation_store(cache_layer: 'CacheLayerManager', layout: Optional[str] = None):
+    if validate_layout(layout) == LAYOUT_INDEXED:
+        return IndexedRelationStore(cache_layer)
+    return DocumentRelationStore(cache_layer)
+
+
+async def migrate_relation_layout(cache_layer: 'CacheLayerManager', layout: str) -> Dict[str, int]:
+    """
+    把全部关系迁移到指定布局
+
+    Returns:
+        relation_type -> 迁移的所有者数量
+    """
+    layout = validate_layout(layout)
+    indexed = IndexedRelationStore(cache_layer)
+    migrated: Dict[str, int] = {}
+    async with cache_layer.batch(durability="flush"):
+        for relation_type in RELATION_MEMBER_FIELDS:
+            count = 0
+            if layout == LAYOUT_INDEXED:
+                documents = await cache_layer.get_all_relations_async(relation_type)
+                for owner in documents:
+                    if await indexed._migrate_owner(relation_type, owner) is not None:
+                        count += 1
+            else:
+                indexes = await cache_layer.get_all_relations_async(index_relation_type(relation_type))
+                for owner in indexes:
+                    view = await indexed.load(relation_type, owner)
+                    if view is None:
+                        continue
+                    await cache_layer.put_relation(relation_type, owner, view.to_document())
+                    await indexed.delete(relation_type, owner)
+                    count += 1
+            migrated[relation_type] = count
+    logger.info(f"[RELATIONSHIP] Migrated relations to {layout} layout: {migrated}")
+    return migrated
+
+
+__all__ = [
+    "LAYOUT_DOCUMENT",
+    "LAYOUT_INDEXED",
+    "RELATION_LAYOUTS",
+    "RelationView",
+    "DocumentRelationStore",
+    "IndexedRelationStore",
+    "create_relation_store",
+    "migrate_relation_layout",
+    "relation_collections",
+]
@@ -8,14 +8,17 @@
 
 import logging
 import time
-from typing import Any, Dict, List, TYPE_CHECKING, Set
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Set, Tuple
 
 from .models import (
-    AgentServiceRelation,
     ServiceRelationItem,
-    ServiceToolRelation,
     ToolRelationItem
 )
+from .relation_store import (
+    create_relation_store,
+    migrate_relation_layout,
+    validate_layout,
+)
 
 if TYPE_CHECKING:
     from .cache_layer_manager import CacheLayerManager
@@ -30,23 +33,77 @@ class RelationshipManager:
     管理实体间的关系映射，包括：
     - Agent-Service 关系（key 是 agent_id）
     - Service-Tool 关系（key 是 service_global_name）
+
+    存储布局见 relation_store（"document" / "indexed"）。
     """
     
-    def __init__(self, cache_layer: 'CacheLayerManager'):
+    def __init__(self, cache_layer: 'CacheLayerManager', layout: Optional[str] = None):
         """
         初始化关系管理器
         
         Args:
             cache_layer: 缓存层管理器实例
+            layout: 关系存储布局（features.relation_layout），默认 "document"
         """
         self._cache_layer = cache_layer
+        self._store = create_relation_store(cache_layer, layout)
         # 仅记录一次的调试日志（例如每个服务第一次读取关系）
         self._service_tools_logged_once: Set[str] = set()
         # 用于统计某个服务关系缺失的次数，便于做聚合日志
         self._service_relation_missing_counts: Dict[str, int] = {}
         # 记录上一次每个服务的工具数量，仅在数量变化时输出调试日志
         self._last_service_tool_counts: Dict[str, int] = {}
+        # 关系变更监听器：(agent_id, service_global_name) -> None，用于失效派生索引
+        self._change_listeners: List[Callable[[Optional[str], Optional[str]], None]] = []
         logger.debug("[RELATIONSHIP] Initializing RelationshipManager")
+
+    def add_change_listener(self, listener: Callable[[Optional[str], Optional[str]], None]) -> None:
+        """
+        注册关系变更监听器
+
+        监听器在 Agent-Service / Service-Tool 关系写入后同步调用，
+        只应做轻量的失效处理，不应执行 IO。
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def _notify_change(self, agent_id: Optional[str], service_global_name: Optional[str]) -> None:
+        for listener in self._change_listeners:
+            try:
+                listener(agent_id, service_global_name)
+            except Exception as e:
+                logger.debug(f"[RELATIONSHIP] Change listener failed: {e}")
+
+    # ==================== 存储布局 ====================
+
+    @property
+    def layout(self) -> str:
+        return self._store.layout
+
+    def configure_layout(self, layout: Optional[str]) -> None:
+        """
+        切换关系存储布局（features.relation_layout）
+
+        切换到 "indexed" 后旧文档在首次访问时按需转换；
+        切换回 "document" 前应先调用 migrate_layout("document")。
+        """
+        layout = validate_layout(layout)
+        if layout != self._store.layout:
+            self._store = create_relation_store(self._cache_layer, layout)
+            logger.info(f"[RELATIONSHIP] Relation layout set to {layout}")
+
+    async def migrate_layout(self, layout: Optional[str] = None) -> Dict[str, int]:
+        """
+        把后端中的全部关系一次性迁移到指定布局（默认当前布局），并切换到该布局
+
+        Returns:
+            relation_type -> 迁移的所有者数量
+        """
+        layout = validate_layout(layout or self._store.layout)
+        migrated = await migrate_relation_layout(self._cache_layer, layout)
+        self._store = create_relation_store(self._cache_layer, layout)
+        self._notify_change(None, None)
+        return migrated
     
     # ==================== Agent-Service 关系管理 ====================
     
@@ -96,65 +153,38 @@ class RelationshipManager:
             f"service_global_name={service_global_name}, client_id={client_id}"
         )
         
-        # 获取现有关系
-        relation_data = await self._cache_layer.get_relation(
-            "agent_services",
-            agent_id
-        )
-        
-        if relation_data is None:
-            # 创建新关系
-            relation = AgentServiceRelation(services=[])
-        else:
-            # 解析现有关系
-            relation = AgentServiceRelation.from_dict(relation_data)
-        
-        # 检查服务是否已存在（基于全局名称判断）
-        for i, service in enumerate(relation.services):
-            if service.service_global_name == service_global_name:
-                # 全局名称相同，认为是同一个关系，更新配置
-                relation.services[i] = ServiceRelationItem(
-                    service_original_name=service_original_name,
-                    service_global_name=service_global_name,
-                    client_id=client_id,
-                    established_time=service.established_time,
-                    last_access=int(time.time())
-                )
-                
-                await self._cache_layer.put_relation(
-                    "agent_services",
-                    agent_id,
-                    relation.to_dict()
-                )
-                
-                logger.info(
-                    f"[RELATIONSHIP] Updated Agent-Service relation: agent_id={agent_id}, "
-                    f"service_global_name={service_global_name}"
-                )
-                return
-        
-        # 添加新服务
         current_time = int(time.time())
-        new_service = ServiceRelationItem(
-            service_original_name=service_original_name,
-            service_global_name=service_global_name,
-            client_id=client_id,
-            established_time=current_time,
-            last_access=current_time
-        )
-        relation.services.append(new_service)
         
-        # 保存关系
-        await self._cache_layer.put_relation(
+        def _build(existing: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            # 全局名称相同视为同一关系：更新配置，保留建立时间
+            return ServiceRelationItem(
+                service_original_name=service_original_name,
+                service_global_name=service_global_name,
+                client_id=client_id,
+                established_time=existing.get("established_time", current_time) if existing else current_time,
+                last_access=current_time
+            ).to_dict()
+        
+        created = await self._store.upsert_member(
             "agent_services",
             agent_id,
-            relation.to_dict()
+            service_global_name,
+            _build,
+            meta={}
         )
         
-        logger.info(
-            f"[RELATIONSHIP] Successfully added Agent-Service relation: agent_id={agent_id}, "
-            f"service_global_name={service_global_name}"
-        )
+        self._notify_change(agent_id, service_global_name)
+        
+        if created:
+            logger.info(
+                f"[RELATIONSHIP] Successfully added Agent-Service relation: agent_id={agent_id}, "
+                f"service_global_name={service_global_name}"
+            )
+        else:
+            logger.info(
+                f"[RELATIONSHIP] Updated Agent-Service relation: agent_id={agent_id}, "
+                f"service_global_name={service_global_name}"
+            )
     
     async def remove_agent_service(
         self,
@@ -183,51 +213,24 @@ class RelationshipManager:
             f"service_global_name={service_global_name}"
         )
         
-        # 获取现有关系
-        relation_data = await self._cache_layer.get_relation(
-            "agent_services",
-            agent_id
-        )
+        removed = await self._store.remove_member("agent_services", agent_id, service_global_name)
         
-        if relation_data is None:
+        if removed is None:
             raise KeyError(
                 f"Agent relation does not exist: agent_id={agent_id}"
             )
-        
-        # 解析关系
-        relation = AgentServiceRelation.from_dict(relation_data)
-        
-        # 查找并移除服务
-        original_count = len(relation.services)
-        relation.services = [
-            service for service in relation.services
-            if service.service_global_name != service_global_name
-        ]
-        
-        if len(relation.services) == original_count:
+        if not removed:
             raise KeyError(
                 f"Service does not exist in Agent relation: agent_id={agent_id}, "
                 f"service_global_name={service_global_name}"
             )
         
-        # 保存更新后的关系
-        if len(relation.services) == 0:
-            # 如果没有服务了，删除整个关系
-            await self._cache_layer.delete_relation("agent_services", agent_id)
-            logger.info(
-                f"[RELATIONSHIP] Deleted empty Agent relation: agent_id={agent_id}"
-            )
-        else:
-            # 保存更新后的关系
-            await self._cache_layer.put_relation(
-                "agent_services",
-                agent_id,
-                relation.to_dict()
-            )
-            logger.info(
-                f"[RELATIONSHIP] Successfully removed Agent-Service relation: "
-                f"agent_id={agent_id}, service_global_name={service_global_name}"
-            )
+        logger.info(
+            f"[RELATIONSHIP] Successfully removed Agent-Service relation: "
+            f"agent_id={agent_id}, service_global_name={service_global_name}"
+        )
+        
+        self._notify_change(agent_id, service_global_name)
     
     async def get_agent_services(
         self,
@@ -254,22 +257,19 @@ class RelationshipManager:
         )
         
         # 获取关系
-        relation_data = await self._cache_layer.get_relation(
-            "agent_services",
-            agent_id
-        )
+        view = await self._store.load("agent_services", agent_id)
         
-        if relation_data is None:
+        if view is None:
             logger.debug(
                 f"[RELATIONSHIP] Agent relation does not exist: agent_id={agent_id}"
             )
             return []
         
-        # 解析关系
-        relation = AgentServiceRelation.from_dict(relation_data)
-        
-        # 转换为字典列表
-        services = [service.to_dict() for service in relation.services]
+        # 解析并转换为字典列表
+        services = [
+            ServiceRelationItem.from_dict(item).to_dict()
+            for item in view.members.values()
+        ]
         
         logger.debug(
             f"[RELATIONSHIP] Retrieved {len(services)} service relations: "
@@ -278,8 +278,55 @@ class RelationshipManager:
         
         return services
     
+    async def get_agent_service(
+        self,
+        agent_id: str,
+        service_global_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        按全局名称获取 Agent 的单个服务关系（indexed 布局下为一次按键读取）
+        
+        Returns:
+            服务关系字典，不存在返回 None
+        """
+        if not agent_id:
+            raise ValueError("Agent ID cannot be empty")
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+        item = await self._store.get_member("agent_services", agent_id, service_global_name)
+        return ServiceRelationItem.from_dict(item).to_dict() if item is not None else None
+    
+    async def has_agent_service(self, agent_id: str, service_global_name: str) -> bool:
+        """判断 Agent 是否拥有指定服务"""
+        return await self.get_agent_service(agent_id, service_global_name) is not None
+    
+    async def get_all_agent_services(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        获取所有 Agent 的服务关系（与存储布局无关）
+        
+        Returns:
+            agent_id -> 服务关系列表
+        """
+        views = await self._store.load_all("agent_services")
+        return {
+            agent_id: [ServiceRelationItem.from_dict(item).to_dict() for item in view.members.values()]
+            for agent_id, view in views.items()
+        }
+    
     # ==================== Service-Tool 关系管理 ====================
     
+    @staticmethod
+    def _service_tools_meta(
+        service_global_name: str,
+        service_original_name: str,
+        source_agent: str
+    ) -> Dict[str, Any]:
+        return {
+            "service_global_name": service_global_name,
+            "service_original_name": service_original_name,
+            "source_agent": source_agent,
+        }
+    
     async def add_service_tool(
         self,
         service_global_name: str,
@@ -328,64 +375,87 @@ class RelationshipManager:
             f"tool_global_name={tool_global_name}"
         )
         
-        # 获取现有关系
-        relation_data = await self._cache_layer.get_relation(
+        created = await self._store.upsert_member(
             "service_tools",
-            service_global_name
+            service_global_name,
+            tool_global_name,
+            lambda existing: ToolRelationItem(
+                tool_global_name=tool_global_name,
+                tool_original_name=tool_original_name
+            ).to_dict(),
+            meta=self._service_tools_meta(service_global_name, service_original_name, source_agent)
         )
         
-        if relation_data is None:
-            # 创建新关系
-            relation = ServiceToolRelation(
-                service_global_name=service_global_name,
-                service_original_name=service_original_name,
-                source_agent=source_agent,
-                tools=[]
+        self._notify_change(source_agent, service_global_name)
+        
+        if created:
+            logger.info(
+                f"[RELATIONSHIP] Successfully added Service-Tool relation: "
+                f"service_global_name={service_global_name}, "
+                f"tool_global_name={tool_global_name}"
             )
         else:
-            # 解析现有关系
-            relation = ServiceToolRelation.from_dict(relation_data)
-        
-        # 检查工具是否已存在（基于全局名称判断）
-        for i, tool in enumerate(relation.tools):
-            if tool.tool_global_name == tool_global_name:
-                # 全局名称相同，认为是同一个关系，更新配置
-                relation.tools[i] = ToolRelationItem(
-                    tool_global_name=tool_global_name,
-                    tool_original_name=tool_original_name
-                )
-                
-                await self._cache_layer.put_relation(
-                    "service_tools",
-                    service_global_name,
-                    relation.to_dict()
-                )
-                
-                logger.info(
-                    f"[RELATIONSHIP] Updated Service-Tool relation: "
-                    f"service_global_name={service_global_name}, "
-                    f"tool_global_name={tool_global_name}"
-                )
-                return
-        
-        # 添加新工具
-        new_tool = ToolRelationItem(
-            tool_global_name=tool_global_name,
-            tool_original_name=tool_original_name
-        )
-        relation.tools.append(new_tool)
+            logger.info(
+                f"[RELATIONSHIP] Updated Service-Tool relation: "
+                f"service_global_name={service_global_name}, "
+                f"tool_global_name={tool_global_name}"
+            )
+    
+    async def add_service_tools(
+        self,
+        service_global_name: str,
+        service_original_name: str,
+        source_agent: str,
+        tools: List[Tuple[str, str]],
+        replace: bool = False
+    ) -> None:
+        """
+        批量添加 Service-Tool 关系（一次读取 + 一次写入）
         
-        # 保存关系
-        await self._cache_layer.put_relation(
+        Args:
+            service_global_name: 服务全局名称
+            service_original_name: 服务原始名称
+            source_agent: 来源 Agent
+            tools: [(tool_global_name, tool_original_name), ...]
+            replace: True 时用 tools 替换整个工具集合；False 时按全局名称合并
+            
+        Raises:
+            ValueError: 如果参数无效
+        """
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+        if not service_original_name:
+            raise ValueError("Service original name cannot be empty")
+        if not source_agent:
+            raise ValueError("Source Agent cannot be empty")
+        for tool_global_name, tool_original_name in tools:
+            if not tool_global_name:
+                raise ValueError("Tool global name cannot be empty")
+            if not tool_original_name:
+                raise ValueError("Tool original name cannot be empty")
+        
+        # 按全局名称合并（同名工具后者覆盖前者），保持原有顺序
+        items: Dict[str, Dict[str, Any]] = {}
+        for tool_global_name, tool_original_name in tools:
+            items[tool_global_name] = ToolRelationItem(
+                tool_global_name=tool_global_name,
+                tool_original_name=tool_original_name
+            ).to_dict()
+        
+        added = await self._store.upsert_members(
             "service_tools",
             service_global_name,
-            relation.to_dict()
+            items,
+            meta=self._service_tools_meta(service_global_name, service_original_name, source_agent),
+            replace=replace
         )
         
+        self._notify_change(source_agent, service_global_name)
+        
         logger.info(
-            f"[RELATIONSHIP] Successfully added Service-Tool relation: "
-            f"service_global_name={service_global_name}, "
-            f"tool_global_name={tool_global_name}"
+            f"[RELATIONSHIP] Bulk set Service-Tool relations: "
+            f"service_global_name={service_global_name}, tools={len(items)}, "
+            f"added={added}, replace={replace}"
         )
     
     async def remove_service_tool(
@@ -416,57 +486,26 @@ class RelationshipManager:
             f"tool_global_name={tool_global_name}"
         )
         
-        # 获取现有关系
-        relation_data = await self._cache_layer.get_relation(
-            "service_tools",
-            service_global_name
-        )
+        removed = await self._store.remove_member("service_tools", service_global_name, tool_global_name)
         
-        if relation_data is None:
+        if removed is None:
             raise KeyError(
                 f"Service relation does not exist: service_global_name={service_global_name}"
             )
-        
-        # 解析关系
-        relation = ServiceToolRelation.from_dict(relation_data)
-        
-        # 查找并移除工具
-        original_count = len(relation.tools)
-        relation.tools = [
-            tool for tool in relation.tools
-            if tool.tool_global_name != tool_global_name
-        ]
-        
-        if len(relation.tools) == original_count:
+        if not removed:
             raise KeyError(
                 f"Tool does not exist in service relation: "
                 f"service_global_name={service_global_name}, "
                 f"tool_global_name={tool_global_name}"
             )
         
-        # 保存更新后的关系
-        if len(relation.tools) == 0:
-            # 如果没有工具了，删除整个关系
-            await self._cache_layer.delete_relation(
-                "service_tools",
-                service_global_name
-            )
-            logger.info(
-                f"[RELATIONSHIP] Deleted empty service relation: "
-                f"service_global_name={service_global_name}"
-            )
-        else:
-            # 保存更新后的关系
-            await self._cache_layer.put_relation(
-                "service_tools",
-                service_global_name,
-                relation.to_dict()
-            )
-            logger.info(
-                f"[RELATIONSHIP] Successfully removed Service-Tool relation: "
-                f"service_global_name={service_global_name}, "
-                f"tool_global_name={tool_global_name}"
-            )
+        logger.info(
+            f"[RELATIONSHIP] Successfully removed Service-Tool relation: "
+            f"service_global_name={service_global_name}, "
+            f"tool_global_name={tool_global_name}"
+        )
+        
+        self._notify_change(None, service_global_name)
     
     async def get_service_tools(
         self,
@@ -497,12 +536,9 @@ class RelationshipManager:
             self._service_tools_logged_once.add(service_global_name)
         
         # 获取关系
-        relation_data = await self._cache_layer.get_relation(
-            "service_tools",
-            service_global_name
-        )
+        view = await self._store.load("service_tools", service_global_name)
         
-        if relation_data is None:
+        if view is None:
             # 首次缺失使用 INFO 提示，之后按次数聚合为 DEBUG，避免刷屏
             missing_count = self._service_relation_missing_counts.get(service_global_name, 0) + 1
             self._service_relation_missing_counts[service_global_name] = missing_count
@@ -518,11 +554,8 @@ class RelationshipManager:
                 )
             return []
         
-        # 解析关系
-        relation = ServiceToolRelation.from_dict(relation_data)
-        
-        # 转换为字典列表
-        tools = [tool.to_dict() for tool in relation.tools]
+        # 解析并转换为字典列表
+        tools = [ToolRelationItem.from_dict(item).to_dict() for item in view.members.values()]
         
         # 仅在工具数量发生变化时输出调试日志，避免重复刷日志
         current_count = len(tools)
@@ -536,6 +569,57 @@ class RelationshipManager:
         
         return tools
     
+    async def get_many_service_tools(
+        self,
+        service_global_names: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        批量获取多个服务的工具关系（单次关系层读取）
+        
+        Args:
+            service_global_names: 服务全局名称列表
+            
+        Returns:
+            service_global_name -> 工具关系列表（不存在时为空列表）
+        """
+        names = list(dict.fromkeys(n for n in service_global_names if n))
+        if not names:
+            return {}
+        
+        views = await self._store.load_many("service_tools", names)
+        
+        service_tools: Dict[str, List[Dict[str, Any]]] = {}
+        for service_global_name, view in zip(names, views):
+            if view is None:
+                service_tools[service_global_name] = []
+                continue
+            service_tools[service_global_name] = [
+                ToolRelationItem.from_dict(item).to_dict() for item in view.members.values()
+            ]
+        return service_tools
+    
+    async def get_service_tool(
+        self,
+        service_global_name: str,
+        tool_global_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        按全局名称获取服务的单个工具关系（indexed 布局下为一次按键读取）
+        
+        Returns:
+            工具关系字典，不存在返回 None
+        """
+        if not service_global_name:
+            raise ValueError("Service global name cannot be empty")
+        if not tool_global_name:
+            raise ValueError("Tool global name cannot be empty")
+        item = await self._store.get_member("service_tools", service_global_name, tool_global_name)
+        return ToolRelationItem.from_dict(item).to_dict() if item is not None else None
+    
+    async def has_service_tool(self, service_global_name: str, tool_global_name: str) -> bool:
+        """判断服务是否包含指定工具"""
+        return await self.get_service_tool(service_global_name, tool_global_name) is not None
+    
     # ==================== 级联删除操作 ====================
     
     async def remove_service_cascade(
@@ -578,10 +662,7 @@ class RelationshipManager:
         
         # 2. 删除 Service-Tool 关系
         try:
-            await self._cache_layer.delete_relation(
-                "service_tools",
-                service_global_name
-            )
+            await self._store.delete("service_tools", service_global_name)
             logger.info(
                 f"[RELATIONSHIP] Deleted Service-Tool relation: "
                 f"service_global_name={service_global_name}"
@@ -591,6 +672,8 @@ class RelationshipManager:
                 f"[RELATIONSHIP] Failed to delete Service-Tool relation: {e}"
             )
         
+        self._notify_change(agent_id, service_global_name)
+        
         logger.info(
             f"[RELATIONSHIP] Cascading delete completed: service_global_name={service_global_name}"
         )
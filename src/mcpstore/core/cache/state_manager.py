@@ -5,9 +5,10 @@
 """
 
 import logging
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .cache_layer_manager import CacheLayerManager
 from .models import ServiceStatus, ToolStatusItem
@@ -34,7 +35,86 @@ class StateManager:
         # 记录最近一次已记录日志的服务健康状态，避免在高频轮询场景下重复刷日志
         # key: service_global_name, value: last_logged_health_status
         self._last_logged_health_status: Dict[str, str] = {}
+        # 工具可用性变更监听器：service_global_name -> None，用于失效派生快照
+        self._change_listeners: List[Callable[[str], None]] = []
+        # 最近一次写入的工具状态指纹，健康检查重复写入相同工具状态时不触发通知
+        self._tools_fingerprints: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        # 按健康状态的二级索引：health_status -> {service_global_name}，每次状态写入/删除时维护，
+        # 供重连调度等按状态查询服务，而不必遍历全部服务
+        self._state_index: Dict[str, Set[str]] = {}
+        self._indexed_states: Dict[str, str] = {}
+        self._state_index_lock = threading.Lock()
+        # 状态迁移监听器：(service_global_name, old_status, new_status) -> None，删除时 new_status 为 None
+        self._transition_listeners: List[Callable[[str, Optional[str], Optional[str]], None]] = []
         logger.debug("[StateManager] State manager initialization completed")
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        注册工具可用性变更监听器
+
+        仅在服务的工具状态集合发生变化（或服务状态被删除）时同步调用。
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def add_transition_listener(
+        self,
+        listener: Callable[[str, Optional[str], Optional[str]], None],
+    ) -> None:
+        """
+        注册服务健康状态迁移监听器
+
+        仅在服务的健康状态发生变化（或服务状态被删除）时同步调用。
+        """
+        if listener not in self._transition_listeners:
+            self._transition_listeners.append(listener)
+
+    def get_services_in_state(self, health_status: str) -> List[str]:
+        """返回当前处于指定健康状态的服务全局名称（基于本进程维护的状态索引）"""
+        with self._state_index_lock:
+            return list(self._state_index.get(health_status, ()))
+
+    def get_indexed_state(self, service_global_name: str) -> Optional[str]:
+        """返回状态索引中记录的服务健康状态（本进程最近一次写入的值）"""
+        return self._indexed_states.get(service_global_name)
+
+    def get_state_index_counts(self) -> Dict[str, int]:
+        with self._state_index_lock:
+            return {state: len(names) for state, names in self._state_index.items() if names}
+
+    def _index_state(self, service_global_name: str, health_status: Optional[str]) -> None:
+        with self._state_index_lock:
+            old = self._indexed_states.get(service_global_name)
+            if old == health_status:
+                return
+            if old is not None:
+                names = self._state_index.get(old)
+                if names is not None:
+                    names.discard(service_global_name)
+            if health_status is None:
+                self._indexed_states.pop(service_global_name, None)
+            else:
+                self._indexed_states[service_global_name] = health_status
+                self._state_index.setdefault(health_status, set()).add(service_global_name)
+        for listener in self._transition_listeners:
+            try:
+                listener(service_global_name, old, health_status)
+            except Exception as e:
+                logger.debug(f"[StateManager] Transition listener failed: {e}")
+
+    def _notify_tools_changed(self, service_global_name: str, tools: Optional[List[ToolStatusItem]]) -> None:
+        if tools is None:
+            self._tools_fingerprints.pop(service_global_name, None)
+        else:
+            fingerprint = tuple((t.tool_original_name, t.status) for t in tools)
+            if self._tools_fingerprints.get(service_global_name) == fingerprint:
+                return
+            self._tools_fingerprints[service_global_name] = fingerprint
+        for listener in self._change_listeners:
+            try:
+                listener(service_global_name)
+            except Exception as e:
+                logger.debug(f"[StateManager] Change listener failed: {e}")
     
     async def update_service_status(
         self,
@@ -113,6 +193,8 @@ class StateManager:
             service_global_name,
             status.to_dict()
         )
+        self._index_state(service_global_name, health_status)
+        self._notify_tools_changed(service_global_name, tools)
         
         logger.debug(
             f"[StateManager] Updated service status: service={service_global_name}, "
@@ -157,6 +239,29 @@ class StateManager:
         
         return status
     
+    async def get_many_service_status(
+        self,
+        service_global_names: List[str]
+    ) -> Dict[str, Optional[ServiceStatus]]:
+        """
+        批量获取服务状态（单次状态层读取）
+        
+        Args:
+            service_global_names: 服务全局名称列表
+            
+        Returns:
+            service_global_name -> 服务状态对象（不存在时为 None）
+        """
+        names = list(dict.fromkeys(n for n in service_global_names if n))
+        if not names:
+            return {}
+        
+        results = await self._cache_layer.get_many_states("service_status", names)
+        return {
+            name: ServiceStatus.from_dict(data) if data is not None else None
+            for name, data in zip(names, results)
+        }
+    
     async def update_tool_status(
         self,
         service_global_name: str,
@@ -212,6 +317,7 @@ class StateManager:
             service_global_name,
             service_status.to_dict()
         )
+        self._notify_tools_changed(service_global_name, service_status.tools)
         
         logger.debug(
             f"[StateManager] Updated tool status: service={service_global_name}, "
@@ -227,6 +333,8 @@ class StateManager:
         """
 
         await self._cache_layer.delete_state("service_status", service_global_name)
+        self._index_state(service_global_name, None)
+        self._notify_tools_changed(service_global_name, None)
         
         logger.debug(
             f"[StateManager] Deleted service status: service={service_global_name}"
@@ -332,6 +440,7 @@ class StateManager:
             service_global_name,
             service_status.to_dict()
         )
+        self._notify_tools_changed(service_global_name, service_status.tools)
         
         logger.debug(
             f"[StateManager] Updated tool status: service={service_global_name}, "
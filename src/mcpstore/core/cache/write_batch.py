@@ -0,0 +1,129 @@
+"""
+写入批处理（Write-behind batching）
+
+在批处理作用域内，CacheLayerManager 的实体/关系/状态写入不会立即落到 pykv，
+而是按 (collection, key) 合并，作用域结束时用 put_many / delete_many 一次性提交。
+
+持久化级别 (durability)：
+- "flush": 作用域退出时等待提交完成，提交失败时抛出异常（默认）
+- "write_behind": 作用域退出时后台提交，不等待；提交完成前其它读取仍能看到待提交数据，
+  提交失败只记录日志
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_FLUSH = "flush"
+DURABILITY_WRITE_BEHIND = "write_behind"
+DURABILITY_LEVELS = (DURABILITY_FLUSH, DURABILITY_WRITE_BEHIND)
+
+# 待提交删除的占位值
+TOMBSTONE = object()
+
+
+@dataclass
+class WriteBatchConfig:
+    """写入批处理配置（features.cache_write_batching）"""
+    enabled: bool = False
+    durability: str = DURABILITY_FLUSH
+    # 作用域内累计的待提交键数量达到上限时立即提交一次
+    max_batch_size: int = 500
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "WriteBatchConfig":
+        if isinstance(data, bool):
+            return cls(enabled=data)
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        config = cls(**known)
+        if config.durability not in DURABILITY_LEVELS:
+            raise ValueError(
+                f"Invalid cache_write_batching.durability: {config.durability}. "
+                f"Valid values: {list(DURABILITY_LEVELS)}"
+            )
+        return config
+
+
+@dataclass
+class WriteBatchStats:
+    batches: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    flushes: int = 0
+    keys_flushed: int = 0
+    flush_errors: int = 0
+
+    @property
+    def coalesce_rate(self) -> float:
+        return self.coalesced / self.writes if self.writes > 0 else 0.0
+
+
+class WriteBatch:
+    """一个批处理作用域内合并后的待提交写入"""
+
+    def __init__(self, durability: str, max_batch_size: int):
+        self.durability = durability
+        self.max_batch_size = max_batch_size
+        # collection -> {key: value | TOMBSTONE}
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.size = 0
+        self.closed = False
+
+    def stage(self, collection: str, key: str, value: Any) -> bool:
+        """暂存写入，返回 True 表示覆盖了同一键的先前写入（被合并）"""
+        entries = self.pending.setdefault(collection, {})
+        coalesced = key in entries
+        entries[key] = value
+        if not coalesced:
+            self.size += 1
+        return coalesced
+
+    def lookup(self, collection: str, key: str) -> Tuple[bool, Any]:
+        entries = self.pending.get(collection)
+        if entries is None or key not in entries:
+            return False, None
+        return True, entries[key]
+
+    def contains(self, collection: str, key: str) -> bool:
+        entries = self.pending.get(collection)
+        return entries is not None and key in entries
+
+    def items(self, collection: str) -> Iterator[Tuple[str, Any]]:
+        return iter(self.pending.get(collection, {}).items())
+
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        pending, self.pending, self.size = self.pending, {}, 0
+        return pending
+
+    def is_full(self) -> bool:
+        return self.max_batch_size > 0 and self.size >= self.max_batch_size
+
+
+def split_ops(pending: Dict[str, Dict[str, Any]]) -> List[Tuple[str, List[str], List[Any], List[str]]]:
+    """按 collection 拆分为 (collection, put_keys, put_values, delete_keys)"""
+    ops = []
+    for collection, entries in pending.items():
+        put_keys: List[str] = []
+        put_values: List[Any] = []
+        delete_keys: List[str] = []
+        for key, value in entries.items():
+            if value is TOMBSTONE:
+                delete_keys.append(key)
+            else:
+                put_keys.append(key)
+                put_values.append(value)
+        ops.append((collection, put_keys, put_values, delete_keys))
+    return ops
+
+
+__all__ = [
+    "DURABILITY_FLUSH",
+    "DURABILITY_WRITE_BEHIND",
+    "WriteBatch",
+    "WriteBatchConfig",
+    "WriteBatchStats",
+]
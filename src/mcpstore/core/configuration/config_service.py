@@ -152,6 +152,9 @@ class ConfigService:
         # 租约
         self._register_key_metadata("health_check.lease_ttl", ConfigKeyType.FLOAT, "Lease TTL (s)", hc.lease_ttl, min_value=1.0, max_value=3600.0, category="health_check")
         self._register_key_metadata("health_check.lease_renew_interval", ConfigKeyType.FLOAT, "Lease renew interval (s)", hc.lease_renew_interval, min_value=0.5, max_value=3600.0, category="health_check")
+        # 调度
+        self._register_key_metadata("health_check.scheduler_workers", ConfigKeyType.INTEGER, "Max concurrent health probes", hc.scheduler_workers, min_value=1, max_value=10000, category="health_check")
+        self._register_key_metadata("health_check.scheduler_jitter", ConfigKeyType.FLOAT, "Health check interval jitter ratio", hc.scheduler_jitter, min_value=0.0, max_value=1.0, category="health_check")
 
         # Content update configuration
         self._register_key_metadata(
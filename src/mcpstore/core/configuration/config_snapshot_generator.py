@@ -140,6 +140,8 @@ class ConfigSnapshotGenerator:
             "health_check.reconnect_hard_timeout": lifecycle_defaults.reconnect_hard_timeout,
             "health_check.lease_ttl": lifecycle_defaults.lease_ttl,
             "health_check.lease_renew_interval": lifecycle_defaults.lease_renew_interval,
+            "health_check.scheduler_workers": lifecycle_defaults.scheduler_workers,
+            "health_check.scheduler_jitter": lifecycle_defaults.scheduler_jitter,
         })
 
         # 内容更新默认值
@@ -3,9 +3,12 @@ MCPStore Agent Statistics Module
 Implementation of Agent statistics functionality
 """
 
+import asyncio
 import logging
 
 from mcpstore.core.models.agent import AgentsSummary, AgentStatistics, AgentServiceSummary
+from mcpstore.core.models.service import ServiceConnectionState
+from mcpstore.core.utils.fan_out import FanOutConfig, fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -44,26 +47,21 @@ class AgentStatisticsMixin:
             total_tools = 0
             
             agent_details = []
-            
-            for agent_id in all_agent_ids:
-                try:
-                    # Get Agent statistics information
-                    logger.info(f" [AGENT_STATS] Starting to get detailed statistics for Agent {agent_id}...")
-                    agent_stats = await self._get_agent_statistics(agent_id)
-                    logger.info(f" [AGENT_STATS] Agent {agent_id} statistics completed: {agent_stats.service_count} services, {agent_stats.tool_count} tools")
-                    
-                    if agent_stats.is_active:
-                        active_agents += 1
-                    
-                    total_services += agent_stats.service_count
-                    total_tools += agent_stats.tool_count
-                    
-                    agent_details.append(agent_stats)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to get statistics for agent {agent_id}: {e}")
+
+            # 各 Agent 的统计互不依赖，按 features.fan_out 并发获取
+            results = await fan_out(
+                all_agent_ids,
+                self._get_agent_statistics,
+                config=self._fan_out_config(),
+                label="agents_summary",
+            )
+            for result in results:
+                agent_id = result.item
+                agent_stats = result.value
+                if not result.ok:
+                    logger.warning(f"Failed to get statistics for agent {agent_id}: {result.error}")
                     # 创建一个错误状态的统计信息
-                    error_stats = AgentStatistics(
+                    agent_stats = AgentStatistics(
                         agent_id=agent_id,
                         service_count=0,
                         tool_count=0,
@@ -74,8 +72,15 @@ class AgentStatisticsMixin:
                         last_activity=None,
                         services=[]
                     )
-                    agent_details.append(error_stats)
-            
+                else:
+                    logger.info(f" [AGENT_STATS] Agent {agent_id} statistics completed: {agent_stats.service_count} services, {agent_stats.tool_count} tools")
+                    if agent_stats.is_active:
+                        active_agents += 1
+                    total_services += agent_stats.service_count
+                    total_tools += agent_stats.tool_count
+
+                agent_details.append(agent_stats)
+
             #  [REFACTOR] 获取Store级别的统计信息
             store_services = await self._store.list_services()
             store_tools = await self._store.list_tools()
@@ -102,6 +107,9 @@ class AgentStatisticsMixin:
                 agents=[]
             )
 
+    def _fan_out_config(self) -> FanOutConfig:
+        return getattr(self._store.orchestrator, "fan_out_config", None) or FanOutConfig()
+
     async def _get_agent_statistics(self, agent_id: str) -> AgentStatistics:
         """
         获取单个Agent的详细统计信息
@@ -113,69 +121,64 @@ class AgentStatisticsMixin:
             AgentStatistics: Agent统计信息
         """
         try:
-            # 获取Agent的所有client - 从 pykv 获取
-            logger.info(f" [AGENT_STATS] Getting all clients for Agent {agent_id}...")
-            client_ids = await self._store.registry.get_agent_clients_async(agent_id)
-            logger.info(f" [AGENT_STATS] Agent {agent_id} client list: {client_ids}")
+            registry = self._store.registry
+            # 获取Agent的服务关系 - 从 pykv 获取
+            agent_services = await registry._relation_manager.get_agent_services(agent_id)
+            logger.info(f" [AGENT_STATS] Agent {agent_id} services: {len(agent_services)}")
+            # Store 视图按全局名称展示，Agent 视图按本地名称展示
+            is_store = agent_id == self._store.client_manager.global_agent_store_id
+
+            def _display_name(relation: dict) -> str:
+                if is_store:
+                    return relation.get("service_global_name") or relation.get("service_original_name")
+                return relation.get("service_original_name") or relation.get("service_global_name")
+
+            async def _service_summary(relation: dict) -> AgentServiceSummary:
+                service_name = _display_name(relation)
+                global_name = relation.get("service_global_name") or service_name
+                service_tools, service_state, service_entity = await asyncio.gather(
+                    registry.get_tools_for_service_async(agent_id, service_name),
+                    registry.get_service_state_async(agent_id, service_name),
+                    registry._cache_service_manager.get_service(global_name),
+                )
+                service_config = (service_entity.config if service_entity is not None else None) or {}
+                return AgentServiceSummary(
+                    service_name=service_name,
+                    service_type="local" if service_config.get("command") else "remote",
+                    status=service_state or ServiceConnectionState.DISCONNECTED,
+                    tool_count=len(service_tools) if service_tools else 0,
+                    client_id=relation.get("client_id")
+                )
 
-            # 统计服务和工具
+            # 统计服务和工具（各服务的读取相互独立，并发执行）
+            results = await fan_out(
+                agent_services,
+                _service_summary,
+                config=self._fan_out_config(),
+                label=f"agent_stats:{agent_id}",
+            )
             services = []
-            total_tools = 0
-            is_active = False
+            for result in results:
+                if result.ok:
+                    services.append(result.value)
+                    continue
+                relation = result.item
+                service_name = _display_name(relation)
+                logger.warning(f"Failed to get service {service_name} stats for agent {agent_id}: {result.error}")
+                # 添加错误状态的服务
+                services.append(AgentServiceSummary(
+                    service_name=service_name,
+                    service_type="unknown",
+                    status=ServiceConnectionState.DISCONNECTED,
+                    tool_count=0,
+                    client_id=relation.get("client_id")
+                ))
+
+            total_tools = sum(s.tool_count for s in services)
+            # 有任一服务未断开即视为活跃
+            is_active = any(s.status != ServiceConnectionState.DISCONNECTED for s in services)
             last_activity = None
-            
-            for client_id in client_ids:
-                try:
-                    # 获取client配置
-                    client_config = self._store.orchestrator.client_manager.get_client_config(client_id)
-                    if not client_config:
-                        continue
-                    
-                    #  [REFACTOR] 简化逻辑：直接检查服务状态来判断client是否活跃
-                    # 不再调用不存在的get_client_status方法
-                    
-                    # 统计服务（新架构：从 client 实体的 services 列表获取服务名称）
-                    services = client_config.get("services", []) if isinstance(client_config, dict) else []
-                    for service_name in services:
-                        try:
-                            #  [REFACTOR] 使用正确的Registry方法获取服务工具（异步）
-                            service_tools = await self._store.registry.get_tools_for_service_async(agent_id, service_name)
-                            tool_count = len(service_tools) if service_tools else 0
-                            total_tools += tool_count
-
-                            #  [REFACTOR] 使用正确的Registry方法获取服务状态（异步）
-                            service_state = await self._store.registry.get_service_state_async(agent_id, service_name)
-
-                            # 检查服务是否活跃（有工具且状态不是DISCONNECTED）
-                            from mcpstore.core.models.service import ServiceConnectionState
-                            if service_state not in [ServiceConnectionState.DISCONNECTED, ServiceConnectionState.DISCONNECTED]:
-                                is_active = True
-
-                            service_summary = AgentServiceSummary(
-                                service_name=service_name,
-                                service_type="local" if service_config.get("command") else "remote",
-                                status=service_state,
-                                tool_count=tool_count,
-                                client_id=client_id
-                            )
-                            services.append(service_summary)
-                            
-                        except Exception as e:
-                            logger.warning(f"Failed to get service {service_name} stats for agent {agent_id}: {e}")
-                            # 添加错误状态的服务
-                            from mcpstore.core.models.service import ServiceConnectionState
-                            error_service = AgentServiceSummary(
-                                service_name=service_name,
-                                service_type="unknown",
-                                status=ServiceConnectionState.DISCONNECTED,
-                                tool_count=0,
-                                client_id=client_id
-                            )
-                            services.append(error_service)
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to process client {client_id} for agent {agent_id}: {e}")
-            
+
             # 统计健康和不健康的服务
             healthy_services = len([s for s in services if s.status in ["healthy", "degraded"]])
             unhealthy_services = len(services) - healthy_services
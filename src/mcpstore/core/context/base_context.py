@@ -83,6 +83,8 @@ class MCPStoreContext(
         # Per-tool overrides (e.g., flags consumed by adapters like LangChain)
         # Keyed by "{service_name}:{tool_name}" -> { flag_name: value }
         self._tool_overrides: Dict[str, Dict[str, Any]] = {}
+        # Adapter tool object caches (see adapters.common.AdapterToolCache), keyed by adapter kind
+        self._adapter_tool_caches: Dict[str, Any] = {}
 
         # Phase 1: internal kernel for read paths (no external API change)
         try:
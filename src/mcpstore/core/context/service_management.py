@@ -3,7 +3,6 @@ MCPStore Service Management Module
 服务管理相关操作的实现
 """
 
-import asyncio
 import datetime
 import logging
 import time
@@ -1522,6 +1521,9 @@ class ServiceManagementMixin:
                 service_name
             )
 
+            # 关闭该服务的池化客户端（含 warm standby 进程）
+            await self._store.orchestrator.connection_pool.invalidate(service_name)
+
             # 2. 单源模式：不再同步到 mcp.json
             logger.info("[SERVICE_DELETE] [STORE] Skip file sync (single-source KV)")
 
@@ -1572,6 +1574,9 @@ class ServiceManagementMixin:
                 global_name
             )
 
+            # 关闭该服务的池化客户端（含 warm standby 进程）
+            await self._store.orchestrator.connection_pool.invalidate(global_name)
+
             # 4. 移除映射关系（仅映射表，不触发关系/状态删除）
             await self._store.registry.remove_agent_service_mapping_async(self._agent_id, local_name)
 
@@ -1747,7 +1752,13 @@ class ServiceManagementMixin:
                 logger.info(f"[WAIT_SERVICE] start mode=target service='{service_name}' client_id='{client_id}' target={target_statuses} timeout={timeout}s")
 
             start_time = time.time()
-            poll_interval = 0.2  # 200ms轮询间隔
+            # 状态写入会通过 registry.service_readiness 唤醒等待；recheck_interval 为跨进程写入的兜底
+            readiness = self._store.registry.service_readiness
+            recheck_interval = 1.0
+            try:
+                status_global_name = await self._store.registry._resolve_global_name_async(status_agent_key, service_name)
+            except Exception:
+                status_global_name = None
             prev_status = None
             last_log = start_time
             last_meta: Dict[str, Any] = {}
@@ -1770,6 +1781,9 @@ class ServiceManagementMixin:
                         "last_error": msg,
                     }, meta=last_meta)
 
+                # 读取前记录版本号，读取期间的状态写入不会被漏掉
+                since_version = readiness.version(status_global_name)
+
                 # 获取当前状态（先读一次缓存，随后在必要时读一次新缓存以防止竞态）
                 try:
 
@@ -1831,8 +1845,10 @@ class ServiceManagementMixin:
                     logger.debug(f"[WAIT_SERVICE] status_error service='{service_name}' error={e}")
                     # 继续轮询
 
-                # 等待下次轮询
-                await asyncio.sleep(poll_interval)
+                # 等待该服务状态变化（或兜底间隔/超时）
+                remaining = timeout - (time.time() - start_time)
+                if remaining > 0:
+                    await readiness.wait_changed(status_global_name, since_version, min(remaining, recheck_interval))
 
         except ValueError as e:
             logger.error(f"[WAIT_SERVICE] param_error error={e}")
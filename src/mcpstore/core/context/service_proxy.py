@@ -199,6 +199,10 @@ class ServiceProxy:
             op_name="service_proxy.list_tools"
         )
 
+    async def list_tools_async(self) -> List[ToolInfo]:
+        """异步列出服务工具。"""
+        return await self._context.list_tools_async(service_name=self._service_name)
+
     def tools_stats(self) -> Dict[str, Any]:
         """
         获取工具统计信息（两个单词方法）
@@ -355,6 +359,19 @@ class ServiceProxy:
         """异步调用当前服务内的工具。"""
         return await self._context.call_tool_async(tool_name, args or {}, return_extracted=return_extracted, **kwargs)
 
+    async def call_resolved_tool_async(
+        self,
+        tool_name: str,
+        service_global_name: str,
+        canonical_tool_name: str,
+        args: Dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Any:
+        """异步调用已解析的工具（跳过名称解析，供 Hub 使用）。"""
+        return await self._context.call_resolved_tool_async(
+            tool_name, service_global_name, canonical_tool_name, args or {}, **kwargs
+        )
+
     # === Hub 暴露能力 ===
 
     def hub_http(self, port: int = 8000, host: str = "0.0.0.0", path: str = "/mcp", *, block: bool = False, show_banner: bool = False, **mcp_kwargs):
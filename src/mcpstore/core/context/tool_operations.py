@@ -11,7 +11,7 @@ Implementation of tool-related operations
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union, Literal
+from typing import Dict, List, Optional, Any, Union, Literal, TYPE_CHECKING
 
 from mcp import types as mcp_types
 
@@ -19,6 +19,9 @@ from mcpstore.core.logic.tool_logic import ToolLogicCore
 from mcpstore.core.models.tool import ToolInfo
 from .types import ContextType
 
+if TYPE_CHECKING:
+    from mcpstore.core.registry.tool_snapshot import ToolListSnapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,15 +160,9 @@ class ToolOperationsMixin:
         """
         列出工具（异步外壳）
         
-        直接从 pykv 读取数据，不使用内存快照。
+        从物化的工具快照读取（见 get_tools_snapshot_async），快照失效时才从 pykv 重建。
         遵循 Functional Core, Imperative Shell 架构。
         
-        数据读取路径：
-        1. 关系层：获取 Agent 的服务列表
-        2. 关系层：获取每个服务的工具列表
-        3. 实体层：批量获取工具实体
-        4. 状态层：获取服务状态（用于可用性过滤）
-        
         Args:
             service_name: 服务名称(可选,None表示所有服务)
             filter: 筛选范围
@@ -175,7 +172,87 @@ class ToolOperationsMixin:
         Returns:
             工具列表
         """
-        logger.info(f"[LIST_TOOLS] start filter={filter} context_type={self._context_type.name}")
+        snapshot = await self.get_tools_snapshot_async()
+        tools = snapshot.all_tools if filter == "all" else snapshot.available_tools
+        if service_name:
+            tools = [t for t in tools if t.service_name == service_name]
+        logger.debug(
+            f"[LIST_TOOLS] filter={filter} view={snapshot.view_key} version={snapshot.version} count={len(tools)}"
+        )
+        return list(tools)
+
+    async def get_tools_snapshot_async(self) -> "ToolListSnapshot":
+        """
+        获取当前视图的工具快照（不可变，可直接共享读取）
+
+        快照在服务连接、状态变化或工具重新同步后失效，下一次读取时重建。
+
+        Returns:
+            ToolListSnapshot: 包含 version、all_tools、available_tools
+        """
+        view_key = self._get_tool_view_key()
+        snapshots = getattr(self._store, "tool_snapshots", None)
+        version = 0
+        generation = None
+        if snapshots is not None:
+            cached = snapshots.get(view_key)
+            if cached is not None:
+                return cached
+            version = snapshots.version(view_key)
+            generation = snapshots.generation
+
+        snapshot, complete = await self._build_tools_snapshot_async(view_key, version)
+        if snapshots is not None and complete:
+            snapshots.put(snapshot, generation)
+        return snapshot
+
+    def get_tools_version(self) -> int:
+        """当前视图工具快照的版本号（无 IO）"""
+        snapshots = getattr(self._store, "tool_snapshots", None)
+        return snapshots.version(self._get_tool_view_key()) if snapshots is not None else 0
+
+    def tools_changed_since(self, version: int) -> bool:
+        """自指定版本以来当前视图的工具列表是否可能发生变化（无 IO）"""
+        snapshots = getattr(self._store, "tool_snapshots", None)
+        if snapshots is None:
+            return True
+        return snapshots.changed_since(self._get_tool_view_key(), version)
+
+    def _get_tool_view_key(self) -> str:
+        if self._context_type == ContextType.STORE:
+            return f"store:{self._store.client_manager.global_agent_store_id}"
+        return f"agent:{self._agent_id}"
+
+    @staticmethod
+    def _make_tools_snapshot(view_key, agent_id, version, all_tools, available_tools, agent_services):
+        from mcpstore.core.registry.tool_snapshot import ToolListSnapshot
+
+        return ToolListSnapshot(
+            view_key=view_key,
+            agent_id=agent_id,
+            version=version,
+            all_tools=tuple(all_tools),
+            available_tools=tuple(available_tools),
+            service_names=frozenset(
+                svc.get("service_global_name") for svc in agent_services
+                if isinstance(svc, dict) and svc.get("service_global_name")
+            ),
+        )
+
+    async def _build_tools_snapshot_async(self, view_key: str, version: int):
+        """
+        从 pykv 读取数据构建工具快照
+
+        数据读取路径：
+        1. 关系层：获取 Agent 的服务列表
+        2. 关系层：获取每个服务的工具列表
+        3. 实体层：批量获取工具实体
+        4. 状态层：获取服务状态（用于可用性过滤）
+
+        Returns:
+            (ToolListSnapshot, complete): complete 为 False 时表示有服务工具未就绪，快照不应缓存
+        """
+        logger.info(f"[LIST_TOOLS] build snapshot view={view_key} context_type={self._context_type.name}")
         
         # 确定 agent_id
         if self._context_type == ContextType.AGENT:
@@ -210,41 +287,77 @@ class ToolOperationsMixin:
         
         if not agent_services:
             logger.info(f"[LIST_TOOLS] no services for agent_id={agent_id}")
-            return []
+            return self._make_tools_snapshot(view_key, agent_id, version, [], [], agent_services), True
         
-        # Step 2: 从关系层获取每个服务的工具列表
+        # Step 2: 批量读取所有服务的工具关系与状态（各一次后端往返）
+        # 仅对工具尚未就绪的服务并发等待，避免 N 次串行往返
         all_tool_global_names: List[str] = []
         service_tool_map: Dict[str, List[str]] = {}  # service_global_name -> [tool_global_names]
-        
+        complete = True
+
+        service_global_names = [
+            svc.get("service_global_name") for svc in agent_services
+            if svc.get("service_global_name")
+        ]
+        service_relations = await relation_manager.get_many_service_tools(service_global_names)
+        service_statuses = await state_manager.get_many_service_status(service_global_names)
+
+        ready_relations: Dict[str, List[dict]] = {}
+        pending_services: List[Dict[str, Any]] = []
         for svc in agent_services:
             service_global_name = svc.get("service_global_name")
             if not service_global_name:
                 continue
-            service_original_name = svc.get("service_original_name") or service_global_name
-
-            try:
-                tool_relations = await self._wait_service_tools_ready(
-                    agent_id=agent_id,
-                    service_global_name=service_global_name,
-                    service_original_name=service_original_name,
-                    relation_manager=relation_manager,
-                    state_manager=state_manager
-                )
-            except RuntimeError as err:
-                logger.warning(
-                    "[LIST_TOOLS] Tool sync not finished, skip service: agent=%s service=%s error=%s",
-                    agent_id,
-                    service_original_name,
-                    err,
+            tool_relations = service_relations.get(service_global_name) or []
+            status = service_statuses.get(service_global_name)
+            if tool_relations or (status and getattr(status, "tools", None)):
+                ready_relations[service_global_name] = tool_relations
+            else:
+                pending_services.append(svc)
+
+        if pending_services:
+            wait_results = await asyncio.gather(
+                *[
+                    self._wait_service_tools_ready(
+                        agent_id=agent_id,
+                        service_global_name=svc.get("service_global_name"),
+                        service_original_name=svc.get("service_original_name") or svc.get("service_global_name"),
+                        relation_manager=relation_manager,
+                        state_manager=state_manager
+                    )
+                    for svc in pending_services
+                ],
+                return_exceptions=True,
+            )
+            for svc, result in zip(pending_services, wait_results):
+                if isinstance(result, RuntimeError):
+                    logger.warning(
+                        "[LIST_TOOLS] Tool sync not finished, skip service: agent=%s service=%s error=%s",
+                        agent_id,
+                        svc.get("service_original_name") or svc.get("service_global_name"),
+                        result,
+                    )
+                    # 跳过当前服务，避免异常导致调用方直接退出；不完整的快照不缓存
+                    complete = False
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                ready_relations[svc.get("service_global_name")] = result
+            # 等待期间状态可能已更新，重新批量读取这些服务的状态
+            service_statuses.update(
+                await state_manager.get_many_service_status(
+                    [svc.get("service_global_name") for svc in pending_services]
                 )
-                # 跳过当前服务，避免异常导致调用方直接退出
+            )
+
+        for service_global_name in service_global_names:
+            if service_global_name not in ready_relations:
                 continue
             tool_names = [
                 tr.get("tool_global_name")
-                for tr in tool_relations
+                for tr in ready_relations[service_global_name]
                 if tr.get("tool_global_name")
             ]
-            
             service_tool_map[service_global_name] = tool_names
             all_tool_global_names.extend(tool_names)
         
@@ -252,7 +365,7 @@ class ToolOperationsMixin:
         
         if not all_tool_global_names:
             logger.info(f"[LIST_TOOLS] no tools for agent_id={agent_id}")
-            return []
+            return self._make_tools_snapshot(view_key, agent_id, version, [], [], agent_services), complete
         
         # Step 3: 从实体层批量获取工具实体
         tool_entities = await tool_entity_manager.get_many_tools(all_tool_global_names)
@@ -316,27 +429,14 @@ class ToolOperationsMixin:
             )
             all_tools.append(tool_info)
         
-        # 按服务名筛选
-        if service_name:
-            all_tools = [t for t in all_tools if t.service_name == service_name]
-        
-        # 如果 filter="all"，直接返回
-        if filter == "all":
-            logger.info(f"[LIST_TOOLS] filter=all count={len(all_tools)}")
-            return all_tools
+        # ==================== 可用工具，从状态层过滤 ====================
         
-        # ==================== filter="available"，从状态层过滤 ====================
-        
-        # Step 4: 从状态层获取服务状态
-        service_status_map: Dict[str, Dict[str, Any]] = {}
-        for svc in agent_services:
-            service_global_name = svc.get("service_global_name")
-            if not service_global_name:
-                continue
-            
-            status = await state_manager.get_service_status(service_global_name)
-            if status:
-                service_status_map[service_global_name] = status.to_dict()
+        # Step 4: 服务状态已在 Step 2 中批量读取
+        service_status_map: Dict[str, Dict[str, Any]] = {
+            name: status.to_dict()
+            for name, status in service_statuses.items()
+            if status
+        }
 
         # 使用纯逻辑核心过滤工具
         filtered_tools: List[ToolInfo] = []
@@ -370,14 +470,15 @@ class ToolOperationsMixin:
                 logger.warning(msg)
         
         logger.info(
-            f"[LIST_TOOLS] filter=available agent_id={agent_id} "
+            f"[LIST_TOOLS] snapshot built agent_id={agent_id} version={version} "
             f"total={len(all_tools)} available={len(filtered_tools)}"
         )
         if unavailable_reasons:
             logger.debug(
                 "[LIST_TOOLS] unavailable details: " + " | ".join(unavailable_reasons)
             )
-        return filtered_tools
+        snapshot = self._make_tools_snapshot(view_key, agent_id, version, all_tools, filtered_tools, agent_services)
+        return snapshot, complete
 
     def get_tools_with_stats(self) -> Dict[str, Any]:
         """
@@ -465,32 +566,33 @@ class ToolOperationsMixin:
         relation_manager,
         state_manager,
         timeout: float = 6.0,
-        interval: float = 0.2
     ) -> List[dict]:
         """
         等待服务工具同步完成（默认等待，失败时抛出“未就绪”错误）
         - 若工具已确认为空（metadata.tools_confirmed_empty=True）则立即返回空列表
         - 若在超时时间内未同步完成，抛出明确的未就绪异常
+
+        由 registry.service_readiness 驱动：仅在该服务的关系/状态写入、CacheManager 完成工具写入
+        或 LifecycleManager 确认无工具后重新检查，而不是按固定间隔轮询 pykv。
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         start_time = loop.time()
-        deadline = start_time + timeout
-        last_status = None
+        readiness = self._store.registry.service_readiness
         attempt = 0
+        last: Dict[str, Any] = {}
 
         logger.info(
-            "[TOOLS_WAIT_START] agent=%s service=%s timeout=%.2f interval=%.2f",
+            "[TOOLS_WAIT_START] agent=%s service=%s timeout=%.2f",
             agent_id,
             service_original_name,
             timeout,
-            interval,
         )
 
-        while True:
+        async def _check() -> Optional[List[dict]]:
+            nonlocal attempt
             attempt += 1
             tool_relations = await relation_manager.get_service_tools(service_global_name)
             status = await state_manager.get_service_status(service_global_name)
-            last_status = status
 
             # 获取元数据判断是否确认空工具
             try:
@@ -499,76 +601,94 @@ class ToolOperationsMixin:
                 metadata = None
 
             tools_confirmed_empty = bool(getattr(metadata, "tools_confirmed_empty", False))
+            last.update(status=status, metadata=metadata, relations=tool_relations, empty=tools_confirmed_empty)
 
-            # 对高频等待日志进行采样：仅首条以及后续每 20 次输出一条 DEBUG，避免循环刷屏
-            if attempt == 1 or attempt % 20 == 0:
-                logger.debug(
-                    "[TOOLS_WAIT] agent=%s service=%s attempt=%s status=%s tools=%s meta_empty=%s",
-                    agent_id,
-                    service_original_name,
-                    attempt,
-                    getattr(status, "health_status", getattr(status, "status", "unknown")),
-                    len(tool_relations) if tool_relations else 0,
-                    tools_confirmed_empty,
-                )
+            logger.debug(
+                "[TOOLS_WAIT] agent=%s service=%s attempt=%s status=%s tools=%s meta_empty=%s",
+                agent_id,
+                service_original_name,
+                attempt,
+                getattr(status, "health_status", getattr(status, "status", "unknown")),
+                len(tool_relations) if tool_relations else 0,
+                tools_confirmed_empty,
+            )
 
             # 已有工具，或明确确认为空
             if tool_relations or tools_confirmed_empty:
-                duration = loop.time() - start_time
                 logger.info(
                     "[TOOLS_WAIT_DONE] agent=%s service=%s attempts=%s duration=%.3f tools=%s meta_empty=%s",
                     agent_id,
                     service_original_name,
                     attempt,
-                    duration,
+                    loop.time() - start_time,
                     len(tool_relations) if tool_relations else 0,
                     tools_confirmed_empty,
                 )
-                return tool_relations
+                return tool_relations or []
 
             # 状态中已有工具列表（防御性）
             if status and getattr(status, "tools", None):
-                duration = loop.time() - start_time
                 logger.info(
                     "[TOOLS_WAIT_DONE] agent=%s service=%s attempts=%s duration=%.3f tools_from_status=%s",
                     agent_id,
                     service_original_name,
                     attempt,
-                    duration,
+                    loop.time() - start_time,
                     len(getattr(status, "tools", []) or []),
                 )
-                return tool_relations
-
-            if loop.time() >= deadline:
-                duration = loop.time() - start_time
-                # 兼容 pydantic v2：优先使用 model_dump，其次 dict，最后 str
-                try:
-                    if hasattr(metadata, "model_dump") and callable(metadata.model_dump):
-                        meta_to_log = metadata.model_dump()
-                    elif hasattr(metadata, "dict") and callable(getattr(metadata, "dict")):
-                        meta_to_log = metadata.dict()
-                    else:
-                        meta_to_log = str(metadata)
-                except Exception:
-                    meta_to_log = str(metadata)
+                return tool_relations or []
 
+            # 连接已失败（熔断/断开）：重连之前不会有工具，不再等到超时
+            health_status = getattr(status, "health_status", None)
+            if health_status in ("circuit_open", "disconnected"):
                 logger.warning(
-                    "[TOOLS_WAIT_TIMEOUT] agent=%s service=%s attempts=%s duration=%.3f status=%s meta=%s relations=%s",
+                    "[TOOLS_WAIT_ABORT] agent=%s service=%s attempts=%s duration=%.3f status=%s",
                     agent_id,
                     service_original_name,
                     attempt,
-                    duration,
-                    getattr(status, "health_status", getattr(status, "status", "unknown")),
-                    meta_to_log,
-                    tool_relations,
+                    loop.time() - start_time,
+                    health_status,
                 )
                 raise RuntimeError(
-                    f"Service has been added but tools have not completed synchronization, please retry later. "
-                    f"service={service_original_name}, agent_id={agent_id}, "
-                    f"state={getattr(status, 'health_status', 'unknown')}, "
-                    f"tools_confirmed_empty={tools_confirmed_empty}"
+                    f"Service connection failed before tools were synchronized. "
+                    f"service={service_original_name}, agent_id={agent_id}, state={health_status}"
                 )
-            await asyncio.sleep(interval)
+            return None
+
+        try:
+            return await readiness.wait_until(service_global_name, _check, timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        status = last.get("status")
+        metadata = last.get("metadata")
+        # 兼容 pydantic v2：优先使用 model_dump，其次 dict，最后 str
+        try:
+            if hasattr(metadata, "model_dump") and callable(metadata.model_dump):
+                meta_to_log = metadata.model_dump()
+            elif hasattr(metadata, "dict") and callable(getattr(metadata, "dict")):
+                meta_to_log = metadata.dict()
+            else:
+                meta_to_log = str(metadata)
+        except Exception:
+            meta_to_log = str(metadata)
+
+        logger.warning(
+            "[TOOLS_WAIT_TIMEOUT] agent=%s service=%s attempts=%s duration=%.3f status=%s meta=%s relations=%s",
+            agent_id,
+            service_original_name,
+            attempt,
+            loop.time() - start_time,
+            getattr(status, "health_status", getattr(status, "status", "unknown")),
+            meta_to_log,
+            last.get("relations"),
+        )
+        raise RuntimeError(
+            f"Service has been added but tools have not completed synchronization, please retry later. "
+            f"service={service_original_name}, agent_id={agent_id}, "
+            f"state={getattr(status, 'health_status', 'unknown')}, "
+            f"tools_confirmed_empty={last.get('empty', False)}"
+        )
 
     async def get_system_stats_async(self) -> Dict[str, Any]:
         """
@@ -752,64 +872,10 @@ class ToolOperationsMixin:
             kwargs.pop('session_id', None)
             return await active_session.use_tool_async(tool_name, args, return_extracted=return_extracted, **kwargs)
 
-        # 获取可用工具列表用于智能解析
-        available_tools = []
+        # 使用预编译的工具解析索引（按 store/agent 视图缓存，关系变更时失效）
         try:
-            if self._context_type == ContextType.STORE:
-                tools = await self._store.list_tools()
-            else:
-                tools = await self._store.list_tools(self._agent_id, agent_mode=True)
-
-            # 构建工具信息，包含显示名称和原始名称
-            for tool in tools:
-                # Agent模式：需要转换服务名称为本地名称
-                if self._context_type == ContextType.AGENT and self._agent_id:
-                    #  透明代理：将全局服务名转换为本地服务名（从缓存源读取）
-                    local_service_name = await self._get_local_service_name_from_global_async(tool.service_global_name)
-                    if local_service_name:
-                        # 构建本地工具名称
-                        local_tool_name = self._convert_tool_name_to_local(
-                            tool.name,
-                            tool.service_global_name,
-                            local_service_name,
-                            getattr(tool, "tool_original_name", None),
-                        )
-                        display_name = local_tool_name
-                        service_name = local_service_name
-                    else:
-                        # 如果无法映射，使用原始名称
-                        display_name = tool.name
-                        service_name = tool.service_original_name
-                else:
-                    display_name = tool.name
-                    service_name = tool.service_original_name
-
-                original_name = getattr(tool, "tool_original_name", None) or self._extract_original_tool_name(display_name, service_name)
-
-                available_tools.append({
-                    "name": display_name,           # 显示名称（Agent模式下使用本地名称）
-                    "original_name": original_name, # 原始名称
-                    "service_name": service_name,   # 服务名称（Agent模式下使用本地名称）
-                    "global_tool_name": tool.name,  # 保存全局工具名称用于实际调用
-                    "global_service_name": tool.service_global_name  # 保存全局服务名称
-                })
-
-            logger.debug(f"Available tools for resolution: {len(available_tools)}")
-        except Exception as e:
-            logger.warning(f"Failed to get available tools for resolution: {e}")
-
-        # 统一使用 PerspectiveResolver 解析工具名与服务名（返回 MCP 规范命名）
-        from mcpstore.utils.perspective_resolver import PerspectiveResolver
-
-        resolver = PerspectiveResolver()
-        try:
-            tool_res = resolver.resolve_tool(
-                self._agent_id or self._store.client_manager.global_agent_store_id,
-                tool_name,
-                available_tools=available_tools,
-                target="canonical",
-                strict=False,  # Do not interrupt directly due to missing metadata, errors are handled by availability check
-            )
+            tool_index = await self._get_tool_resolution_index_async()
+            tool_res = tool_index.resolve(tool_name)
             canonical_tool_name = tool_res.canonical_tool_name
             service_global_name = tool_res.global_service_name
             service_local_name = tool_res.local_service_name
@@ -822,6 +888,69 @@ class ToolOperationsMixin:
                 f"[LLM Hint] Tool name resolution failed: {str(e)}. Please check the tool name or add service prefix, e.g. service_tool."
             )
         
+        return await self._execute_resolved_tool_async(
+            tool_name,
+            canonical_tool_name,
+            service_global_name,
+            service_local_name,
+            args,
+            return_extracted=return_extracted,
+            **kwargs,
+        )
+
+    async def call_resolved_tool_async(
+        self,
+        tool_name: str,
+        service_global_name: str,
+        canonical_tool_name: str,
+        args: Dict[str, Any] = None,
+        *,
+        service_name: Optional[str] = None,
+        return_extracted: bool = False,
+        **kwargs,
+    ) -> Any:
+        """
+        调用已解析的工具（异步），跳过显示名称解析
+
+        供已在注册时完成名称解析的调用方（如 Hub）使用；可用性检查与执行路径与 call_tool_async 一致。
+        会话路由生效时回退到 call_tool_async。
+
+        Args:
+            tool_name: 工具显示名称（用于日志、错误信息与会话回退）
+            service_global_name: 服务全局名称
+            canonical_tool_name: MCP 规范工具名称（无服务前缀）
+            args: 工具参数
+            service_name: 当前视图下的服务名称（Agent 视图为本地名称），默认为服务全局名称
+
+        Returns:
+            Any: 工具执行结果（MCP 规范格式）
+        """
+        if (getattr(self, '_active_session', None) is not None or getattr(self, '_auto_session_enabled', False)) \
+                and 'session_id' not in kwargs:
+            return await self.call_tool_async(tool_name, args, return_extracted=return_extracted, **kwargs)
+
+        return await self._execute_resolved_tool_async(
+            tool_name,
+            canonical_tool_name,
+            service_global_name,
+            service_name or service_global_name,
+            args or {},
+            return_extracted=return_extracted,
+            **kwargs,
+        )
+
+    async def _execute_resolved_tool_async(
+        self,
+        tool_name: str,
+        canonical_tool_name: str,
+        service_global_name: str,
+        service_local_name: str,
+        args: Dict[str, Any],
+        *,
+        return_extracted: bool = False,
+        **kwargs,
+    ) -> Any:
+        """检查工具可用性并构造执行请求（名称已解析）"""
         # 检查工具是否可用
         is_available = await self._is_tool_available_async(
             service_global_name,
@@ -834,7 +963,7 @@ class ToolOperationsMixin:
             # Tool not available, raise exception
             from mcpstore.core.exceptions import ToolNotAvailableError
             
-            original_tool_name = self._extract_original_tool_name(canonical_tool_name, tool_res.local_service_name)
+            original_tool_name = self._extract_original_tool_name(canonical_tool_name, service_local_name)
             agent_id = self._agent_id if self._context_type == ContextType.AGENT else "global_agent_store"
             
             logger.warning(
@@ -844,7 +973,7 @@ class ToolOperationsMixin:
             
             raise ToolNotAvailableError(
                 tool_name=original_tool_name,
-                service_name=tool_res.local_service_name,
+                service_name=service_local_name,
                 agent_id=agent_id
             )
         
@@ -899,6 +1028,82 @@ class ToolOperationsMixin:
             # 默认返回 MCPStore 的 CallToolResult（或等价对象）
             return getattr(response, 'result', None)
 
+    async def _get_tool_resolution_index_async(self):
+        """
+        获取当前上下文视图的工具解析索引（命中缓存时无需读取 pykv）
+
+        Returns:
+            AgentToolIndex: 预编译的解析表
+        """
+        from mcpstore.core.registry.tool_resolution_index import AgentToolIndex
+
+        global_agent_store_id = self._store.client_manager.global_agent_store_id
+        view_key = self._get_tool_view_key()
+
+        resolution_index = getattr(self._store, "tool_resolution_index", None)
+        if resolution_index is not None:
+            cached = resolution_index.get(view_key)
+            if cached is not None:
+                return cached
+            generation = resolution_index.generation
+
+        available_tools = await self._build_tool_resolution_entries_async()
+        tool_index = AgentToolIndex.build(self._agent_id or global_agent_store_id, available_tools)
+        # 空列表不缓存：服务可能仍在初始化
+        if resolution_index is not None and available_tools:
+            resolution_index.put(view_key, tool_index, generation)
+        return tool_index
+
+    async def _build_tool_resolution_entries_async(self) -> List[Dict[str, Any]]:
+        """构建工具解析所需的条目（显示名称、原始名称、服务名称及全局名称）"""
+        # 获取可用工具列表用于智能解析
+        available_tools = []
+        try:
+            if self._context_type == ContextType.STORE:
+                tools = await self._store.list_tools()
+            else:
+                tools = await self._store.list_tools(self._agent_id, agent_mode=True)
+
+            # 构建工具信息，包含显示名称和原始名称
+            for tool in tools:
+                # Agent模式：需要转换服务名称为本地名称
+                if self._context_type == ContextType.AGENT and self._agent_id:
+                    #  透明代理：将全局服务名转换为本地服务名（从缓存源读取）
+                    local_service_name = await self._get_local_service_name_from_global_async(tool.service_global_name)
+                    if local_service_name:
+                        # 构建本地工具名称
+                        local_tool_name = self._convert_tool_name_to_local(
+                            tool.name,
+                            tool.service_global_name,
+                            local_service_name,
+                            getattr(tool, "tool_original_name", None),
+                        )
+                        display_name = local_tool_name
+                        service_name = local_service_name
+                    else:
+                        # 如果无法映射，使用原始名称
+                        display_name = tool.name
+                        service_name = tool.service_original_name
+                else:
+                    display_name = tool.name
+                    service_name = tool.service_original_name
+
+                original_name = getattr(tool, "tool_original_name", None) or self._extract_original_tool_name(display_name, service_name)
+
+                available_tools.append({
+                    "name": display_name,           # 显示名称（Agent模式下使用本地名称）
+                    "original_name": original_name, # 原始名称
+                    "service_name": service_name,   # 服务名称（Agent模式下使用本地名称）
+                    "global_tool_name": tool.name,  # 保存全局工具名称用于实际调用
+                    "global_service_name": tool.service_global_name  # 保存全局服务名称
+                })
+
+            logger.debug(f"Available tools for resolution: {len(available_tools)}")
+        except Exception as e:
+            logger.warning(f"Failed to get available tools for resolution: {e}")
+
+        return available_tools
+
     async def use_tool_async(self, tool_name: str, args: Dict[str, Any] = None, **kwargs) -> Any:
         """
         使用工具（异步版本）- 向后兼容别名
@@ -11,7 +11,7 @@ Responsibilities:
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import List, Callable
+from typing import List, Callable, Tuple
 
 from mcpstore.core.events.event_bus import EventBus
 from mcpstore.core.events.service_events import (
@@ -401,6 +401,23 @@ class CacheManager:
                     event.tools
                 )
 
+                # 写入 resources / templates / prompts 目录（实体层），list_resources 等直接读取
+                if event.catalog is not None:
+                    try:
+                        await self._registry._cache_catalog_manager.put_catalog(
+                            service_global_name,
+                            event.service_name,
+                            event.agent_id,
+                            resources=event.catalog.get("resources"),
+                            resource_templates=event.catalog.get("resource_templates"),
+                            prompts=event.catalog.get("prompts"),
+                        )
+                    except Exception as catalog_err:
+                        logger.warning(f"[CACHE] Failed to store catalog for {event.service_name}: {catalog_err}")
+
+                # 工具与状态均已写入：唤醒等待该服务工具就绪的调用方
+                self._registry.service_readiness.notify(service_global_name)
+
                 # 缓存落盘完成事件（工具与状态已写入）
                 # ServicePersisted 依赖文件持久化已停用，此处无需发布
             
@@ -465,42 +482,46 @@ class CacheManager:
                 f"service_global_name={service_global_name}"
             )
         
-        # 遍历工具列表，创建实体和关系
-        for tool_name, tool_def in tools:
-            # 提取工具原始名称（去除服务前缀），保证用于全局名的基准是 MCP 规范格式（canonical）
-            from mcpstore.core.logic.tool_logic import ToolLogicCore
-            original_tool_name = ToolLogicCore.extract_original_tool_name(
-                tool_name,
-                service_global_name,
-                service_name
-            )
+        # 遍历工具列表创建实体，Service-Tool 关系最后一次性写入（启用写入批处理时实体也合并为批量写入）
+        tool_relations: List[Tuple[str, str]] = []
+        async with self._registry._cache_layer_manager.batch():
+            for tool_name, tool_def in tools:
+                # 提取工具原始名称（去除服务前缀），保证用于全局名的基准是 MCP 规范格式（canonical）
+                from mcpstore.core.logic.tool_logic import ToolLogicCore
+                original_tool_name = ToolLogicCore.extract_original_tool_name(
+                    tool_name,
+                    service_global_name,
+                    service_name
+                )
 
-            # 生成工具全局名称（基于去前缀后的原始名，避免重复前缀）
-            tool_global_name = self._registry._naming.generate_tool_global_name(
-                service_global_name, original_tool_name
-            )
+                # 生成工具全局名称（基于去前缀后的原始名，避免重复前缀）
+                tool_global_name = self._registry._naming.generate_tool_global_name(
+                    service_global_name, original_tool_name
+                )
 
-            logger.debug(
-                f"[CACHE] Creating tool: tool_name={tool_name}, "
-                f"tool_global_name={tool_global_name}, original={original_tool_name}"
-            )
+                logger.debug(
+                    f"[CACHE] Creating tool: tool_name={tool_name}, "
+                    f"tool_global_name={tool_global_name}, original={original_tool_name}"
+                )
 
-            # 1. 创建工具实体（写入实体层）
-            await tool_entity_manager.create_tool(
-                service_global_name=service_global_name,
-                service_original_name=service_name,
-                source_agent=agent_id,
-                tool_original_name=original_tool_name,
-                tool_def=tool_def
-            )
+                # 1. 创建工具实体（写入实体层）
+                await tool_entity_manager.create_tool(
+                    service_global_name=service_global_name,
+                    service_original_name=service_name,
+                    source_agent=agent_id,
+                    tool_original_name=original_tool_name,
+                    tool_def=tool_def
+                )
+                
+                tool_relations.append((tool_global_name, original_tool_name))
             
-            # 2. 创建 Service-Tool 关系（写入关系层）
-            await relation_manager.add_service_tool(
+            # 2. 以服务返回的工具集合替换 Service-Tool 关系（写入关系层，一次读改写）
+            await relation_manager.add_service_tools(
                 service_global_name=service_global_name,
                 service_original_name=service_name,
                 source_agent=agent_id,
-                tool_global_name=tool_global_name,
-                tool_original_name=original_tool_name
+                tools=tool_relations,
+                replace=True
             )
         
         logger.info(
@@ -17,6 +17,7 @@ from mcpstore.core.events.service_events import (
     ServiceInitialized, ServiceConnectionRequested,
     ServiceConnected, ServiceConnectionFailed
 )
+from mcpstore.core.utils.mcp_client_helpers import fetch_service_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -103,12 +104,12 @@ class ConnectionManager:
             # Determine service type
             if "command" in event.service_config:
                 # Local service
-                session, tools = await self._connect_local_service(
+                session, tools, catalog = await self._connect_local_service(
                     event.service_name, event.service_config, event.timeout
                 )
             else:
                 # Remote service
-                session, tools = await self._connect_remote_service(
+                session, tools, catalog = await self._connect_remote_service(
                     event.service_name, event.service_config, event.timeout
                 )
 
@@ -125,7 +126,8 @@ class ConnectionManager:
                 service_name=event.service_name,
                 session=session,
                 tools=tools,
-                connection_time=connection_time
+                connection_time=connection_time,
+                catalog=catalog
             )
             # 按调用方指定异步派发；如需一致性由上层等待 Ready/工具事件
             await self._event_bus.publish(connected_event, wait=False)
@@ -215,7 +217,7 @@ class ConnectionManager:
         service_name: str,
         service_config: Dict[str, Any],
         timeout: float
-    ) -> Tuple[Any, List[Tuple[str, Dict[str, Any]]]]:
+    ) -> Tuple[Any, List[Tuple[str, Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
         """Connect to local service"""
         from mcpstore.mcp import Client
 
@@ -246,14 +248,15 @@ class ConnectionManager:
                     len(processed_tools),
                     [name for name, _ in processed_tools],
                 )
-                return client, processed_tools
+                catalog = await fetch_service_catalog(client, service_name)
+                return client, processed_tools, catalog
 
     async def _connect_remote_service(
         self,
         service_name: str,
         service_config: Dict[str, Any],
         timeout: float
-    ) -> Tuple[Any, List[Tuple[str, Dict[str, Any]]]]:
+    ) -> Tuple[Any, List[Tuple[str, Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
         """Connect to remote service"""
         from mcpstore.mcp import Client
 
@@ -284,7 +287,8 @@ class ConnectionManager:
                     len(processed_tools),
                     [name for name, _ in processed_tools],
                 )
-                return client, processed_tools
+                catalog = await fetch_service_catalog(client, service_name)
+                return client, processed_tools, catalog
 
     def _process_tools(
         self,
@@ -4,6 +4,10 @@
 - 分探针：Startup/Readiness/Liveness，调度节流按状态决定
 - 滑窗/退避/半开/硬超时：此版本先提供基础探针与事件发布，滑窗与退避将由后续迭代补充
 - 事件：发布 HealthCheckCompleted，供 LifecycleManager 处理状态迁移
+- 探测连接：优先复用连接池/会话中已连接的客户端 ping，没有存活连接时才建立临时探测连接；
+  真实工具调用的被动反馈已证明服务存活时跳过本轮探测
+- 集中调度：每个被监控服务的下一次截止时间（周期/冷却/硬超时/租约）由 HealthCheckScheduler 统一管理，
+  探测在有界工作协程池中执行并带抖动错峰
 """
 
 import asyncio
@@ -12,9 +16,12 @@ import os
 import socket
 import time
 from collections import deque
+from dataclasses import dataclass
 from typing import Dict, Tuple, Optional, Deque, Any
 
 from mcpstore.config.config_dataclasses import ServiceLifecycleConfig
+from mcpstore.core.cache.naming_service import NamingService
+from mcpstore.core.domain.health_scheduler import HealthCheckScheduler
 from mcpstore.core.eventlog.event_models import domain_event_to_record
 from mcpstore.core.events.event_bus import EventBus
 from mcpstore.core.events.service_events import (
@@ -30,6 +37,21 @@ from mcpstore.core.utils.mcp_client_helpers import temp_client_for_service
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class HealthProbeStats:
+    """健康探测统计"""
+    pooled_pings: int = 0
+    session_pings: int = 0
+    probe_pings: int = 0
+    live_ping_failures: int = 0
+    skipped_by_traffic: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        total = self.pooled_pings + self.session_pings + self.probe_pings
+        return (self.pooled_pings + self.session_pings) / total if total > 0 else 0.0
+
+
 class HealthMonitor:
     """
     健康检查管理器（基础版）
@@ -112,6 +134,21 @@ class HealthMonitor:
         self._readiness_failures: Dict[Tuple[str, str], int] = {}
         # 硬超时标记：key -> deadline_ts
         self._hard_timeouts: Dict[Tuple[str, str], float] = {}
+        # 被动反馈：service_name -> 最近一次真实调用成功的时间
+        self._last_passive_success: Dict[str, float] = {}
+        # 可复用的已连接客户端来源（见 set_client_sources）
+        self._connection_pool = None
+        self._session_manager = None
+        self._probe_stats = HealthProbeStats()
+        # 最近一次调度判定时的服务状态（用于计算下一次截止时间）
+        self._last_states: Dict[Tuple[str, str], Optional[ServiceConnectionState]] = {}
+        # 集中调度器：持有所有服务的下一次截止时间，探测并发受工作协程数量限制
+        self._scheduler = HealthCheckScheduler(
+            self._run_scheduled_check,
+            workers=getattr(lifecycle_config, "scheduler_workers", 64),
+            jitter=getattr(lifecycle_config, "scheduler_jitter", 0.1),
+            retry_delay=self._liveness_interval,
+        )
 
         # 订阅事件
         self._event_bus.subscribe(ServiceConnected, self._on_service_connected, priority=30)
@@ -124,6 +161,32 @@ class HealthMonitor:
             self._warning_ping_timeout,
         )
 
+    def set_client_sources(self, connection_pool=None, session_manager=None) -> None:
+        """
+        设置健康检查可复用的已连接客户端来源
+
+        Args:
+            connection_pool: ConnectionPoolManager（非会话模式工具调用的长连接池）
+            session_manager: agents.SessionManager（会话模式的持久客户端）
+        """
+        self._connection_pool = connection_pool
+        self._session_manager = session_manager
+
+    def get_probe_stats(self) -> Dict[str, Any]:
+        stats = self._probe_stats
+        return {
+            "pooled_pings": stats.pooled_pings,
+            "session_pings": stats.session_pings,
+            "probe_pings": stats.probe_pings,
+            "live_ping_failures": stats.live_ping_failures,
+            "skipped_by_traffic": stats.skipped_by_traffic,
+            "reuse_rate": stats.reuse_rate,
+        }
+
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """调度统计：被监控服务数、待执行/执行中数量、调度延迟直方图"""
+        return self._scheduler.get_stats()
+
     @staticmethod
     def _default_owner(role: str) -> str:
         try:
@@ -156,15 +219,25 @@ class HealthMonitor:
             self._lease_acquired = True
             self._lease_task = asyncio.create_task(self._renew_lease_loop())
         self._is_running = True
+        await self._scheduler.start()
         logger.info("HealthMonitor started")
 
     async def stop(self):
         self._is_running = False
-        for task in self._health_check_tasks.values():
-            if not task.done():
+        await self._scheduler.stop()
+        # 调度器触发的检查运行在 AOB 循环中，只等待当前循环内的任务
+        loop = asyncio.get_running_loop()
+        local_tasks = []
+        for task in list(self._health_check_tasks.values()):
+            if task.done():
+                continue
+            if task.get_loop() is loop:
                 task.cancel()
-        if self._health_check_tasks:
-            await asyncio.gather(*self._health_check_tasks.values(), return_exceptions=True)
+                local_tasks.append(task)
+            elif not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+        if local_tasks:
+            await asyncio.gather(*local_tasks, return_exceptions=True)
         self._health_check_tasks.clear()
         if self._lease_task and not self._lease_task.done():
             self._lease_task.cancel()
@@ -248,12 +321,14 @@ class HealthMonitor:
         terminal_states = {ServiceConnectionState.DISCONNECTED.value, ServiceConnectionState.DISCONNECTED}
         if event.new_state in terminal_states:
             task_key = (event.agent_id, event.service_name)
+            self._scheduler.unwatch(task_key)
             if task_key in self._health_check_tasks:
                 task = self._health_check_tasks.pop(task_key)
                 if not task.done():
                     task.cancel()
                 logger.info(f"[HEALTH] Stopped health check for terminated service: {event.service_name}")
             self._reset_half_open_stats(task_key)
+            self._last_passive_success.pop(self._traffic_key(event.agent_id, event.service_name), None)
 
     async def maybe_schedule_health_check(
         self,
@@ -266,10 +341,87 @@ class HealthMonitor:
             return False
 
         key = (agent_id, service_name)
+        # 纳入集中调度（首次调度时间在一个周期内随机错开）
+        self._scheduler.watch(key, self._liveness_interval)
         existing = self._health_check_tasks.get(key)
         if existing and not existing.done() and not force:
             return False
 
+        if not await self._should_check(agent_id, service_name, current_state, force=force):
+            return False
+        task = asyncio.create_task(self._execute_health_check(agent_id, service_name))
+        self._health_check_tasks[key] = task
+        task.add_done_callback(lambda _: self._health_check_tasks.pop(key, None))
+        # 刚执行过检查，周期截止时间从现在起重新计算
+        self._scheduler.schedule(key, self._next_due(key))
+        return True
+
+    def unwatch_service(self, agent_id: str, service_name: str) -> None:
+        """停止监控已移除的服务：取消进行中的检查并移出调度"""
+        key = (agent_id, service_name)
+        self._scheduler.unwatch(key)
+        task = self._health_check_tasks.pop(key, None)
+        if task and not task.done():
+            task.cancel()
+        self._last_states.pop(key, None)
+
+    async def _run_scheduled_check(self, key: Tuple[str, str]) -> Optional[float]:
+        """调度器到期回调：在工作协程内执行检查，返回下一次截止时间"""
+        if not self._is_running:
+            return None
+        agent_id, service_name = key
+        existing = self._health_check_tasks.get(key)
+        if existing and not existing.done():
+            # 事件/读取触发的检查仍在进行，按周期顺延
+            return self._next_due(key)
+        if await self._should_check(agent_id, service_name, None, scheduled=True):
+            task = asyncio.create_task(self._execute_health_check(agent_id, service_name))
+            self._health_check_tasks[key] = task
+            task.add_done_callback(lambda _: self._health_check_tasks.pop(key, None))
+            await asyncio.wait({task})
+        if not self._scheduler.is_watched(key):
+            return None
+        return self._next_due(key)
+
+    def _next_due(self, key: Tuple[str, str]) -> float:
+        """下一次截止时间：周期（带抖动）或冷却结束，取与硬超时/租约到期中最早的一个"""
+        now = time.time()
+        state = self._last_states.get(key)
+        interval = self._liveness_interval
+        if state in (ServiceConnectionState.DEGRADED, ServiceConnectionState.CIRCUIT_OPEN, ServiceConnectionState.HALF_OPEN):
+            interval = max(self._liveness_interval, 1.0)
+        due = self._last_check_time.get(key, now) + self._scheduler.jittered(interval)
+        cooldown = self._cooldowns.get(key)
+        if cooldown:
+            next_retry = cooldown.get("next_retry")
+            if next_retry and next_retry > now:
+                due = next_retry
+            hard_deadline = cooldown.get("hard_deadline")
+            if hard_deadline and hard_deadline > now:
+                due = min(due, hard_deadline)
+        lease_deadline = self._leases.get(key)
+        if lease_deadline and lease_deadline > now:
+            due = min(due, lease_deadline)
+        if due <= now:
+            # 本轮被冷却/租约等条件跳过且未更新检查时间：按一个周期顺延，避免空转
+            due = now + self._scheduler.jittered(interval)
+        return due
+
+    async def _should_check(
+        self,
+        agent_id: str,
+        service_name: str,
+        current_state: Optional[ServiceConnectionState | str],
+        *,
+        force: bool = False,
+        scheduled: bool = False,
+    ) -> bool:
+        """
+        判定本轮是否执行探测（冷却/硬超时/租约/节流/被动反馈）
+
+        scheduled=True 时由调度器按截止时间触发，不再做周期节流判断。
+        """
+        key = (agent_id, service_name)
         state = current_state
         if isinstance(state, str):
             try:
@@ -282,6 +434,7 @@ class HealthMonitor:
                 state = await self._registry.get_service_state_async(self._global_agent_store_id, global_name)
             except Exception:
                 state = None
+        self._last_states[key] = state
 
         now = time.time()
         cooldown = self._cooldowns.get(key)
@@ -329,13 +482,19 @@ class HealthMonitor:
         if cooldown and state == ServiceConnectionState.CIRCUIT_OPEN:
             state = ServiceConnectionState.HALF_OPEN
 
-        if not force and (now - last) < interval:
+        if not force and not scheduled and (now - last) < interval:
+            return False
+
+        # 被动反馈：最近的真实调用已证明服务存活，跳过本轮探测
+        if not force and state == ServiceConnectionState.HEALTHY and self._proven_by_traffic(agent_id, service_name, now):
+            self._last_check_time[key] = now
+            if key in self._leases:
+                self._renew_lease(key)
+            self._probe_stats.skipped_by_traffic += 1
+            logger.debug(f"[HEALTH] Skip liveness ping, recent traffic succeeded: {service_name}")
             return False
 
         self._last_check_time[key] = now
-        task = asyncio.create_task(self._execute_health_check(agent_id, service_name))
-        self._health_check_tasks[key] = task
-        task.add_done_callback(lambda _: self._health_check_tasks.pop(key, None))
         return True
 
     async def _execute_health_check(self, agent_id: str, service_name: str, wait: bool = False):
@@ -344,6 +503,7 @@ class HealthMonitor:
             global_name = await self._to_global_name_async(agent_id, service_name)
             if not await self._registry.has_service_async(self._global_agent_store_id, global_name):
                 logger.info(f"[HEALTH] Skip check for removed service: {service_name}")
+                self._scheduler.unwatch((agent_id, service_name))
                 return
 
             service_entity = await self._registry._cache_service_manager.get_service(global_name)
@@ -366,8 +526,7 @@ class HealthMonitor:
 
             try:
                 async with asyncio.timeout(effective_timeout):
-                    async with temp_client_for_service(global_name, service_config, timeout=effective_timeout) as client:
-                        await client.ping()
+                    await self._ping_service(global_name, service_config, effective_timeout)
                 response_time = time.time() - start_time
                 suggested, metrics = self._update_window_and_suggest(agent_id, service_name, True, response_time, current_state)
                 self._reset_cooldown((agent_id, service_name))
@@ -409,6 +568,69 @@ class HealthMonitor:
         except Exception as e:
             logger.error(f"[HEALTH] Execute health check error: {service_name} - {e}", exc_info=True)
 
+    async def _ping_service(self, global_name: str, service_config: dict, timeout: float) -> None:
+        """优先通过已连接的客户端 ping；没有存活连接（或其 ping 失败）时才建立临时探测连接"""
+        if await self._ping_live_client(global_name, timeout):
+            return
+        self._probe_stats.probe_pings += 1
+        async with temp_client_for_service(global_name, service_config, timeout=timeout) as client:
+            await client.ping()
+
+    async def _ping_live_client(self, global_name: str, timeout: float) -> bool:
+        pool = self._connection_pool
+        if pool is not None:
+            try:
+                result = await pool.ping(global_name, timeout)
+            except Exception as e:
+                logger.debug(f"[HEALTH] Pooled ping error: {global_name} - {e}")
+                result = False
+            if result:
+                self._probe_stats.pooled_pings += 1
+                return True
+            if result is False:
+                self._probe_stats.live_ping_failures += 1
+
+        for client in self._live_session_clients(global_name):
+            try:
+                await asyncio.wait_for(client.ping(), timeout=timeout)
+            except Exception as e:
+                self._probe_stats.live_ping_failures += 1
+                logger.debug(f"[HEALTH] Session client ping failed: {global_name} - {e}")
+                continue
+            self._probe_stats.session_pings += 1
+            return True
+        return False
+
+    def _live_session_clients(self, global_name: str):
+        """会话中已连接、且会话任务运行在当前事件循环上的客户端"""
+        manager = self._session_manager
+        if manager is None:
+            return
+        sessions = list(getattr(manager, "sessions", {}).values())
+        for named in list(getattr(manager, "named_sessions", {}).values()):
+            sessions.extend(named.values())
+        loop = asyncio.get_running_loop()
+        for session in sessions:
+            client = getattr(session, "services", {}).get(global_name)
+            if client is None:
+                continue
+            try:
+                task = client._session_state.session_task
+                if client.is_connected() and task is not None and not task.done() and task.get_loop() is loop:
+                    yield client
+            except Exception:
+                continue
+
+    def _traffic_key(self, agent_id: str, service_name: str) -> str:
+        """被动反馈按服务全局名记录：调用链上报全局名，健康检查键中 Agent 服务为本地名"""
+        if not agent_id or agent_id == self._global_agent_store_id or NamingService.AGENT_SEPARATOR in service_name:
+            return service_name
+        return NamingService.generate_service_global_name(service_name, agent_id)
+
+    def _proven_by_traffic(self, agent_id: str, service_name: str, now: float) -> bool:
+        last_success = self._last_passive_success.get(self._traffic_key(agent_id, service_name))
+        return last_success is not None and (now - last_success) < self._liveness_interval
+
     async def _publish_health_check_success(
         self,
         agent_id: str,
@@ -598,6 +820,14 @@ class HealthMonitor:
     # 被动反馈入口：供调用链将真实调用结果写入窗口
     def record_passive_feedback(self, agent_id: str, service_name: str, success: bool, response_time: Optional[float]) -> None:
         self._update_window_and_suggest(agent_id, service_name, success, response_time, None)
+        traffic_key = self._traffic_key(agent_id, service_name)
+        if success:
+            # 成功的真实调用同样证明存活：续约已有租约，并允许跳过下一轮 liveness ping
+            self._last_passive_success[traffic_key] = time.time()
+            for key in [k for k in self._leases if self._traffic_key(*k) == traffic_key]:
+                self._renew_lease(key)
+        else:
+            self._last_passive_success.pop(traffic_key, None)
 
     def _reset_half_open_stats(self, key: Tuple[str, str]) -> None:
         self._half_open_stats.pop(key, None)
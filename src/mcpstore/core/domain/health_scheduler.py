@@ -0,0 +1,235 @@
+"""
+健康检查集中调度器
+
+所有被监控服务的下一次截止时间（liveness 周期、退避冷却结束、硬超时、租约到期）
+统一放在一个最小堆中，由单个调度协程按截止时间出队，交给固定数量的工作协程执行，
+而不是每个服务各自由读取/事件被动触发。
+
+- 首次纳入调度时在一个周期内随机错开相位，周期性截止时间带 ±jitter 抖动，
+  避免成千上万个服务在同一时刻集中 ping
+- 工作协程数量即探测并发上限
+- 统计调度延迟（实际开始执行时间 - 截止时间）
+- 调度协程与工作协程运行在 AOB 事件循环中：同步 API 初始化时所在的临时事件循环会被关闭，
+  而连接池中的长连接客户端也位于 AOB 循环
+"""
+
+import asyncio
+import heapq
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from mcpstore.core.bridge import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+ServiceKey = Tuple[str, str]
+
+
+@dataclass
+class HealthSchedulerStats:
+    fired: int = 0
+    # 截止时间到达时同一服务的上一轮仍在执行，顺延
+    overlapped: int = 0
+    errors: int = 0
+    lag: LatencyRecorder = field(default_factory=LatencyRecorder)
+
+
+class HealthCheckScheduler:
+    """
+    基于最小堆的健康检查调度器
+
+    Args:
+        run: 执行到期服务的协程函数 run(key) -> 下一次截止时间（time.time() 时间戳），
+             返回 None 表示不再调度
+        workers: 工作协程数量（探测并发上限）
+        jitter: 周期抖动比例
+        retry_delay: run 抛出异常后的重试间隔（秒）
+    """
+
+    def __init__(
+        self,
+        run: Callable[[ServiceKey], Awaitable[Optional[float]]],
+        *,
+        workers: int = 64,
+        jitter: float = 0.1,
+        retry_delay: float = 10.0,
+    ):
+        self._run = run
+        self._workers_count = max(1, int(workers))
+        self._jitter = max(0.0, float(jitter))
+        self._retry_delay = max(0.0, float(retry_delay))
+        # (due, seq, key)；重新调度时旧条目通过 seq 惰性失效
+        self._heap: List[Tuple[float, int, ServiceKey]] = []
+        self._entries: Dict[ServiceKey, Tuple[float, int]] = {}
+        self._watched: Set[ServiceKey] = set()
+        self._running_keys: Set[ServiceKey] = set()
+        self._seq = 0
+        # 堆可能被其他线程（调用方事件循环）中的 watch/schedule 修改
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._handle = None
+        self._stats = HealthSchedulerStats()
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    def jittered(self, interval: float) -> float:
+        if self._jitter <= 0:
+            return interval
+        return max(0.0, interval * (1.0 + random.uniform(-self._jitter, self._jitter)))
+
+    def is_watched(self, key: ServiceKey) -> bool:
+        return key in self._watched
+
+    def watch(self, key: ServiceKey, interval: float) -> None:
+        """纳入调度；首次截止时间在一个周期内随机分布"""
+        with self._lock:
+            if key in self._watched:
+                return
+            self._watched.add(key)
+        self.schedule(key, time.time() + random.uniform(0.0, max(interval, 0.0)))
+
+    def unwatch(self, key: ServiceKey) -> None:
+        with self._lock:
+            self._watched.discard(key)
+            self._entries.pop(key, None)
+
+    def schedule(self, key: ServiceKey, due: float) -> None:
+        """设置（或替换）服务的下一次截止时间"""
+        with self._lock:
+            if key not in self._watched:
+                return
+            self._seq += 1
+            self._entries[key] = (due, self._seq)
+            heapq.heappush(self._heap, (due, self._seq, key))
+            earliest = self._heap[0][1] == self._seq
+        if earliest:
+            self._notify()
+
+    async def start(self) -> None:
+        if self._handle is not None:
+            return
+        from mcpstore.core.bridge import get_async_bridge  # 延迟导入，避免循环
+        self._handle = get_async_bridge().create_background_task(self._main(), op_name="health_scheduler")
+
+    async def stop(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.cancel()
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._ready = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"HealthScheduler:worker:{i}")
+            for i in range(self._workers_count)
+        ]
+        logger.info(
+            f"[HEALTH] Scheduler started: workers={self._workers_count}, jitter={self._jitter}, watched={len(self._watched)}"
+        )
+        try:
+            await self._drive()
+        finally:
+            tasks, self._tasks = self._tasks, []
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop = None
+            self._wake = None
+            self._ready = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._entries.clear()
+            self._watched.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._stats
+        return {
+            "watched": len(self._watched),
+            "scheduled": len(self._entries),
+            "ready": self._ready.qsize() if self._ready is not None else 0,
+            "running": len(self._running_keys),
+            "workers": self._workers_count,
+            "fired": stats.fired,
+            "overlapped": stats.overlapped,
+            "errors": stats.errors,
+            "lag": stats.lag.snapshot(),
+        }
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _drive(self) -> None:
+        wake, ready = self._wake, self._ready
+        while True:
+            now = time.time()
+            with self._lock:
+                while self._heap:
+                    due, seq, key = self._heap[0]
+                    current = self._entries.get(key)
+                    if current is None or current[1] != seq:
+                        heapq.heappop(self._heap)
+                        continue
+                    if due > now:
+                        break
+                    heapq.heappop(self._heap)
+                    del self._entries[key]
+                    ready.put_nowait((key, due))
+                timeout = (self._heap[0][0] - now) if self._heap else None
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self) -> None:
+        ready = self._ready
+        while True:
+            key, due = await ready.get()
+            if key in self._running_keys:
+                self._stats.overlapped += 1
+                continue
+            self._stats.fired += 1
+            self._stats.lag.observe(max(0.0, time.time() - due) * 1000.0)
+            self._running_keys.add(key)
+            next_due: Optional[float] = None
+            try:
+                next_due = await self._run(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats.errors += 1
+                next_due = time.time() + self.jittered(self._retry_delay)
+                logger.error(f"[HEALTH] Scheduled check failed: {key[1]} - {e}")
+            finally:
+                self._running_keys.discard(key)
+            # 执行期间被重新调度（例如事件触发）时保留新的截止时间
+            if next_due is not None and key not in self._entries:
+                self.schedule(key, next_due)
+
+
+__all__ = [
+    "HealthCheckScheduler",
+    "HealthSchedulerStats",
+]
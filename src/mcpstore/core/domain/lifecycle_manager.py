@@ -900,6 +900,8 @@ class LifecycleManager:
             if attempts >= self._max_tool_resync_attempts:
                 metadata.tools_confirmed_empty = True
                 await self._set_service_metadata_async(agent_id, service_name, metadata)
+                # 确认无工具：等待工具就绪的调用方可立即返回空列表
+                self._registry.service_readiness.notify(global_name)
                 logger.info(
                     f"[LIFECYCLE] Skip tool resync for {service_name}, attempts={attempts} reach limit"
                 )
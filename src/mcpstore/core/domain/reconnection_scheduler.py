@@ -6,17 +6,24 @@
 2. 检查是否到达重连时间
 3. 发布 ReconnectionRequested 事件
 4. 管理重连延迟策略（指数退避）
+
+扫描不再遍历全部服务：StateManager 在每次状态迁移时维护按状态的二级索引并通知调度器，
+进入 CIRCUIT_OPEN 的服务按下次重连时间放入最小堆，每次扫描只处理已到期的服务，
+扫描开销与服务总数无关。启动时做一次全量对账，覆盖进程重启前已处于 CIRCUIT_OPEN 的服务。
 """
 
 import asyncio
+import heapq
 import logging
 import os
 import socket
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Set, Tuple
 
 from mcpstore.config.config_dataclasses import ServiceLifecycleConfig
+from mcpstore.core.cache.naming_service import NamingService
 from mcpstore.core.eventlog.event_models import domain_event_to_record
 from mcpstore.core.events.event_bus import EventBus
 from mcpstore.core.events.service_events import (
@@ -27,6 +34,8 @@ from mcpstore.core.models.service import ServiceConnectionState
 
 logger = logging.getLogger(__name__)
 
+ServiceKey = Tuple[str, str]
+
 
 class ReconnectionScheduler:
     """
@@ -64,7 +73,7 @@ class ReconnectionScheduler:
         self._lease_ttl = lease_ttl
         self._lease_owner = lease_owner or self._default_owner("reconnect_scheduler")
         self._lease_key = "lease:reconnect_scheduler"
-        self._lease_task: Optional[asyncio.Task] = None
+        self._lease_task = None
         self._lease_acquired = False
         # 从统一配置读取重连相关参数
         self._base_delay = lifecycle_config.backoff_base
@@ -75,11 +84,25 @@ class ReconnectionScheduler:
         
         # 调度器状态
         self._is_running = False
-        self._scheduler_task: Optional[asyncio.Task] = None
-        
+        self._scheduler_task = None
+
+        # 到期队列：(next_retry_ts, seq, key)；重新调度时旧条目通过 seq 惰性失效
+        self._due_heap: List[Tuple[float, int, ServiceKey]] = []
+        self._due_entries: Dict[ServiceKey, Tuple[float, int]] = {}
+        self._due_seq = 0
+        # 刚进入 CIRCUIT_OPEN、尚未读取下次重连时间的服务（由状态迁移监听器写入）
+        self._pending_keys: Set[ServiceKey] = set()
+        # 事件处理器与状态迁移监听器可能运行在不同的事件循环线程中
+        self._due_lock = threading.Lock()
+        self._scans = 0
+        self._last_scan_checked = 0
+
         # 订阅事件
         self._event_bus.subscribe(ServiceStateChanged, self._on_state_changed, priority=20)
         self._event_bus.subscribe(ServiceConnectionFailed, self._on_connection_failed, priority=50)
+        state_manager = getattr(registry, "_cache_state_manager", None)
+        if state_manager is not None and hasattr(state_manager, "add_transition_listener"):
+            state_manager.add_transition_listener(self._on_state_transition)
         
         logger.info(f"ReconnectionScheduler initialized (scan_interval={scan_interval}s)")
 
@@ -114,10 +137,14 @@ class ReconnectionScheduler:
                 logger.warning("[RECONNECT] Lease is held by another node, skip starting scheduler")
                 return
             self._lease_acquired = True
-            self._lease_task = asyncio.create_task(self._renew_lease_loop())
 
+        # 调度循环与租约续期运行在 AOB 事件循环中：同步 API 初始化时所在的临时事件循环会被关闭
+        from mcpstore.core.bridge import get_async_bridge  # 延迟导入，避免循环
+        bridge = get_async_bridge()
         self._is_running = True
-        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+        if self._lease_acquired:
+            self._lease_task = bridge.create_background_task(self._renew_lease_loop(), op_name="reconnect_lease")
+        self._scheduler_task = bridge.create_background_task(self._scheduler_loop(), op_name="reconnect_scheduler")
         logger.info("ReconnectionScheduler started")
     
     async def stop(self):
@@ -125,18 +152,12 @@ class ReconnectionScheduler:
         self._is_running = False
         
         # 取消调度任务
-        if self._scheduler_task and not self._scheduler_task.done():
-            self._scheduler_task.cancel()
-            try:
-                await self._scheduler_task
-            except asyncio.CancelledError:
-                pass
-        if self._lease_task and not self._lease_task.done():
-            self._lease_task.cancel()
-            try:
-                await self._lease_task
-            except Exception:
-                pass
+        scheduler_task, self._scheduler_task = self._scheduler_task, None
+        if scheduler_task and not scheduler_task.done():
+            scheduler_task.cancel()
+        lease_task, self._lease_task = self._lease_task, None
+        if lease_task and not lease_task.done():
+            lease_task.cancel()
         if self._lease_enabled and self._event_store and self._lease_acquired:
             try:
                 await self._event_store.release_lease(
@@ -208,6 +229,7 @@ class ReconnectionScheduler:
         logger.debug("[RECONNECT] Scheduler loop started")
         
         try:
+            await self._bootstrap_due_queue()
             while self._is_running:
                 # 扫描需要重连的服务
                 await self._scan_reconnection_services()
@@ -222,14 +244,16 @@ class ReconnectionScheduler:
     
     async def _scan_reconnection_services(self):
         """
-        扫描所有 CIRCUIT_OPEN 状态的服务
+        扫描重连时间已到期的 CIRCUIT_OPEN 服务
 
         严格按照Functional Core, Imperative Shell原则：
-        1. 调用纯同步核心生成扫描计划
-        2. 纯异步执行缓存访问和事件发布
-        3. 避免直接访问内存字典
+        1. 读取新进入 CIRCUIT_OPEN 的服务的下次重连时间，放入到期队列
+        2. 调用纯同步核心从到期队列生成扫描计划
+        3. 纯异步执行缓存访问和事件发布
         """
         try:
+            await self._resolve_pending_services()
+
             # 1. 调用纯同步核心生成扫描计划
             scan_plan = self._generate_scan_plan()
             self._log_scan_summary(len(scan_plan["services_to_check"]))
@@ -254,17 +278,30 @@ class ReconnectionScheduler:
         """
         纯同步核心：生成重连扫描计划
 
-        不涉及任何IO操作，只生成操作计划
+        不涉及任何IO操作，只从到期队列中取出重连时间已到的服务
 
         Returns:
             包含需要检查的服务列表的字典
         """
         current_time = datetime.now()
+        now = current_time.timestamp()
         services_to_check = []
 
-        # 通过事件系统获取所有服务，避免直接访问内存字典
-        # 这里暂时使用简化的实现，后续可以通过事件获取服务列表
+        with self._due_lock:
+            while self._due_heap:
+                due, seq, key = self._due_heap[0]
+                current = self._due_entries.get(key)
+                if current is None or current[1] != seq:
+                    heapq.heappop(self._due_heap)
+                    continue
+                if due > now:
+                    break
+                heapq.heappop(self._due_heap)
+                del self._due_entries[key]
+                services_to_check.append({"agent_id": key[0], "service_name": key[1]})
 
+        self._scans += 1
+        self._last_scan_checked = len(services_to_check)
         return {
             "scan_time": current_time,
             "services_to_check": services_to_check,
@@ -281,13 +318,10 @@ class ReconnectionScheduler:
         current_time = scan_plan["scan_time"]
         services_to_check = scan_plan["services_to_check"]
 
-        if not services_to_check:
-            # 没有需要检查的服务，从缓存层获取所有服务并检查状态
-            services_to_check = await self._get_all_services_from_cache()
-
         for service_info in services_to_check:
             agent_id = service_info["agent_id"]
             service_name = service_info["service_name"]
+            key = (agent_id, service_name)
 
             try:
                 # 从缓存层获取服务状态
@@ -302,36 +336,145 @@ class ReconnectionScheduler:
                 if not metadata:
                     continue
 
-                # 检查是否到达重连时间
-                if await self._should_retry_connection(metadata, current_time):
-                    retry_count = await self._get_retry_count(metadata)
-
-                    # 检查是否超过最大重试次数
-                    if retry_count >= self._max_retries:
-                        logger.warning(
-                            f"[RECONNECT] Max retries reached: {service_name} (retries={retry_count})"
-                        )
-                        # 转换到 DISCONNECTED 状态
-                        await self._transition_to_unreachable(agent_id, service_name)
-                        continue
-
-                    # 发布重连请求事件
-                    logger.info(
-                        f"[RECONNECT] Triggering reconnection: {service_name} "
-                        f"(retry={retry_count + 1}/{self._max_retries})"
-                    )
+                # 检查是否到达重连时间（其他节点可能已推迟了重连时间）
+                if not await self._should_retry_connection(metadata, current_time):
+                    if not self._schedule_due_from_metadata(key, metadata):
+                        with self._due_lock:
+                            self._pending_keys.add(key)
+                    continue
 
-                    await self._publish_reconnection_requested(
-                        agent_id, service_name, retry_count
+                retry_count = await self._get_retry_count(metadata)
+
+                # 检查是否超过最大重试次数
+                if retry_count >= self._max_retries:
+                    logger.warning(
+                        f"[RECONNECT] Max retries reached: {service_name} (retries={retry_count})"
                     )
+                    # 转换到 DISCONNECTED 状态
+                    await self._transition_to_unreachable(agent_id, service_name)
+                    continue
 
-                    # 更新元数据中的重试计数
-                    metadata.reconnect_attempts = retry_count + 1
-                    await self._set_service_metadata_in_cache(agent_id, service_name, metadata)
+                # 发布重连请求事件
+                logger.info(
+                    f"[RECONNECT] Triggering reconnection: {service_name} "
+                    f"(retry={retry_count + 1}/{self._max_retries})"
+                )
+
+                await self._publish_reconnection_requested(
+                    agent_id, service_name, retry_count
+                )
+
+                # 更新元数据中的重试计数
+                metadata.reconnect_attempts = retry_count + 1
+                await self._set_service_metadata_in_cache(agent_id, service_name, metadata)
+
+                # 兜底：重连结果事件（失败/状态变化）通常会重新调度；若一直没有结果，按退避时间再次检查
+                self._schedule_due(
+                    key, time.time() + self._calculate_reconnect_delay(retry_count + 1)
+                )
 
             except Exception as e:
                 logger.error(f"[RECONNECT] [ERROR] Failed to process service {service_name}: {e}", exc_info=True)
 
+    # ==================== 到期队列 ====================
+
+    def _schedule_due(self, key: ServiceKey, due: float) -> None:
+        """设置（或替换）服务的下次重连检查时间"""
+        with self._due_lock:
+            self._due_seq += 1
+            self._due_entries[key] = (due, self._due_seq)
+            heapq.heappush(self._due_heap, (due, self._due_seq, key))
+
+    def _schedule_due_from_metadata(self, key: ServiceKey, metadata) -> bool:
+        next_retry_time = getattr(metadata, "next_retry_time", None)
+        if next_retry_time is None:
+            return False
+        if isinstance(next_retry_time, datetime):
+            next_retry_time = next_retry_time.timestamp()
+        self._schedule_due(key, float(next_retry_time))
+        return True
+
+    def _unschedule_due(self, key: ServiceKey) -> None:
+        with self._due_lock:
+            self._due_entries.pop(key, None)
+            self._pending_keys.discard(key)
+
+    def _on_state_transition(self, service_global_name: str, old_state: Optional[str], new_state: Optional[str]) -> None:
+        """StateManager 状态迁移监听器（同步调用，只登记，不做 IO）"""
+        circuit_open = ServiceConnectionState.CIRCUIT_OPEN.value
+        if new_state != circuit_open and old_state != circuit_open:
+            return
+        try:
+            service_name, agent_id = NamingService.parse_service_global_name(service_global_name)
+        except ValueError:
+            return
+        key = (agent_id, service_name)
+        if new_state == circuit_open:
+            with self._due_lock:
+                if key not in self._due_entries:
+                    self._pending_keys.add(key)
+        else:
+            self._unschedule_due(key)
+
+    async def _resolve_pending_services(self) -> None:
+        """读取新进入 CIRCUIT_OPEN 的服务的下次重连时间，放入到期队列"""
+        with self._due_lock:
+            pending = [key for key in self._pending_keys if key not in self._due_entries]
+            self._pending_keys.clear()
+        unresolved = []
+        for key in pending:
+            metadata = await self._get_service_metadata_from_cache(*key)
+            if not metadata or not self._schedule_due_from_metadata(key, metadata):
+                unresolved.append(key)
+        if not unresolved:
+            return
+        # 重连时间尚未写入（通常随后由 _schedule_reconnection 放入队列），仍处于 CIRCUIT_OPEN 的下次扫描再读取
+        state_manager = getattr(self._registry, "_cache_state_manager", None)
+        circuit_open = ServiceConnectionState.CIRCUIT_OPEN.value
+        with self._due_lock:
+            for agent_id, service_name in unresolved:
+                key = (agent_id, service_name)
+                if key in self._due_entries:
+                    continue
+                global_name = NamingService.generate_service_global_name(service_name, agent_id)
+                if state_manager is None or state_manager.get_indexed_state(global_name) == circuit_open:
+                    self._pending_keys.add(key)
+
+    async def _bootstrap_due_queue(self) -> None:
+        """
+        启动时一次性全量对账：找出已处于 CIRCUIT_OPEN 的服务（例如进程重启前熔断的服务），
+        之后到期队列只由状态迁移和重连调度维护
+        """
+        try:
+            services = await self._get_all_services_from_cache()
+            if not services:
+                return
+            state_manager = getattr(self._registry, "_cache_state_manager", None)
+            names = [svc["service_global_name"] for svc in services]
+            statuses = await state_manager.get_many_service_status(names) if state_manager else {}
+            circuit_open = ServiceConnectionState.CIRCUIT_OPEN.value
+            found = 0
+            with self._due_lock:
+                for svc in services:
+                    status = statuses.get(svc["service_global_name"])
+                    if status is not None and status.health_status == circuit_open:
+                        self._pending_keys.add((svc["agent_id"], svc["service_name"]))
+                        found += 1
+            logger.debug(f"[RECONNECT] Bootstrap scanned {len(services)} services, circuit_open={found}")
+        except Exception as e:
+            logger.error(f"[RECONNECT] [ERROR] Bootstrap due queue failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._due_lock:
+            next_due = self._due_heap[0][0] if self._due_heap else None
+            return {
+                "scheduled": len(self._due_entries),
+                "pending": len(self._pending_keys),
+                "scans": self._scans,
+                "last_scan_checked": self._last_scan_checked,
+                "next_due_in": max(0.0, next_due - time.time()) if next_due is not None else None,
+            }
+
     # ==================== 缓存层访问辅助方法 ====================
 
     async def _get_all_services_from_cache(self) -> List[Dict[str, str]]:
@@ -362,7 +505,8 @@ class ReconnectionScheduler:
 
                 services.append({
                     "agent_id": agent_id,
-                    "service_name": service_name
+                    "service_name": service_name,
+                    "service_global_name": entity_key,
                 })
 
             return services
@@ -385,7 +529,9 @@ class ReconnectionScheduler:
         try:
             state_data = await self._registry.get_service_state_async(agent_id, service_name)
 
-            if hasattr(state_data, 'health_status'):
+            if isinstance(state_data, ServiceConnectionState):
+                return state_data
+            elif hasattr(state_data, 'health_status'):
                 return ServiceConnectionState(state_data.health_status)
             elif isinstance(state_data, dict):
                 health_status = state_data.get("health_status", "disconnected")
@@ -528,6 +674,7 @@ class ReconnectionScheduler:
                 metadata.next_retry_time = None
                 await self._registry.set_service_metadata_async(event.agent_id, event.service_name, metadata)
                 logger.info(f"[RECONNECT] Service recovered, resetting retry count: {event.service_name}")
+            self._unschedule_due((event.agent_id, event.service_name))
 
         # 如果服务进入 CIRCUIT_OPEN 状态，调度重连
         elif event.new_state == "CIRCUIT_OPEN":
@@ -558,6 +705,7 @@ class ReconnectionScheduler:
         # 更新元数据
         metadata.next_retry_time = next_retry_time
         await self._registry.set_service_metadata_async(agent_id, service_name, metadata)
+        self._schedule_due((agent_id, service_name), next_retry_time.timestamp())
         
         logger.info(
             f"[RECONNECT] Scheduled reconnection: {service_name} "
@@ -0,0 +1,157 @@
+"""
+事件通知：事件日志追加后唤醒等待中的 EventSyncer。
+
+- EventNotifier: 进程内通知（内存后端），等待方可处于任意事件循环
+- RedisEventNotifier: 在进程内通知的基础上通过 Redis pub/sub 广播，跨进程唤醒
+
+通知只负责唤醒，不携带事件本身；消费者被唤醒后仍从 EventStore 拉取，
+因此丢失通知最多退化为按 poll_interval 的兜底轮询。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EventNotifier:
+    """进程内事件通知（版本号 + 等待者集合，跨事件循环安全）。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def notify(self) -> None:
+        """递增版本号并唤醒所有等待者。"""
+        with self._lock:
+            self._version += 1
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                continue
+
+    async def publish(self, event_id: str) -> None:
+        """事件追加后调用。"""
+        self.notify()
+
+    async def wait(self, since_version: int, timeout: Optional[float]) -> bool:
+        """
+        等待版本号超过 since_version，返回 True 表示被通知唤醒，False 表示超时。
+
+        调用方在拉取前记录 version，拉取后再 wait(version)，避免拉取期间的追加被漏掉。
+        """
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self._version > since_version:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._version > since_version
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class RedisEventNotifier(EventNotifier):
+    """通过 Redis pub/sub 广播追加通知，其他进程的 EventSyncer 可立即唤醒。"""
+
+    def __init__(self, client, channel: str):
+        super().__init__()
+        self._client = client
+        self._channel = channel
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, event_id: str) -> None:
+        self.notify()
+        try:
+            await self._client.publish(self._channel, str(event_id))
+        except Exception as e:
+            logger.debug(f"[EVENT_NOTIFY] publish failed (consumers fall back to polling): {e}")
+
+    async def start(self) -> None:
+        """在当前事件循环（与 Redis 客户端相同的循环）中启动订阅。"""
+        if self._listener and not self._listener.done():
+            return
+        self._listener = asyncio.create_task(self._listen(), name="EventNotifier:redis")
+
+    async def close(self) -> None:
+        if self._listener and not self._listener.done():
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        backoff = 0.5
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._client.pubsub()
+                await pubsub.subscribe(self._channel)
+                logger.debug(f"[EVENT_NOTIFY] subscribed channel={self._channel}")
+                backoff = 0.5
+                async for message in pubsub.listen():
+                    if message and message.get("type") == "message":
+                        self.notify()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[EVENT_NOTIFY] subscription error, retry in {backoff:.1f}s: {e}")
+                # 订阅中断期间的追加可能未被通知，唤醒一次让消费者补拉
+                self.notify()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+            finally:
+                if pubsub is not None:
+                    close = getattr(pubsub, "aclose", None) or getattr(pubsub, "close", None)
+                    try:
+                        if close is not None:
+                            await close()
+                    except Exception:
+                        pass
+
+
+def create_event_notifier(kv_store, namespace: str) -> EventNotifier:
+    """按 KV 后端选择通知实现：RedisStore 使用 pub/sub，其余使用进程内通知。"""
+    try:
+        from key_value.aio.stores.redis import RedisStore
+        if isinstance(kv_store, RedisStore):
+            # py-key-value 未公开 client，与健康检查一致访问私有属性
+            client = getattr(kv_store, "_client", None)
+            if client is not None and hasattr(client, "pubsub"):
+                return RedisEventNotifier(client, f"{namespace}:events:notify")
+    except Exception:
+        pass
+    return EventNotifier()
+
+
+__all__ = [
+    "EventNotifier",
+    "RedisEventNotifier",
+    "create_event_notifier",
+]
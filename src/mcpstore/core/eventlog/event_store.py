@@ -1,20 +1,50 @@
 """
 事件存储层：基于共享 KVStore 的事件日志实现。
 
-- 使用 collection 分片：queue / offset / dedup / lease
+- 使用 collection 分片：segment / segments / head / offset / dedup / lease
 - 事件按时间序递增 id（time_ns 字符串），便于顺序消费
+- 追加式分段日志：事件按 id 的时间段写入各自的段集合（{ns}:events:seg:{n}），
+  段内键为 {writer}:{seq:020d}（写入方在该段内的序号）；段目录记录各写入方在每段的事件数，
+  每个写入方在 head 集合中维护自己的最新 id 与当前段计数。
+  拉取 "offset 之后的事件" 时先比较各写入方的 head（没有新事件时不读取任何事件键），
+  再按段目录与 head 的计数直接构造键区间 get_many，不对事件集合做 keys 扫描
+  （KV 后端的 keys() 有分页上限，单段事件数不受其约束）
+- 高水位裁剪以段为单位：写入方切换到新段时检查总量，整段删除已被所有消费者确认的最旧段，
+  并清理最新段已被裁剪的写入方 head（每个 EventStore 实例都有独立的写入方 id）
+- 旧版单集合队列（{ns}:events:queue）中的事件在首次访问时一次性迁移到分段日志
+- 追加后发布通知（Redis pub/sub 或进程内通知），EventSyncer 可立即唤醒而不必等待下一轮轮询
 """
 
 from __future__ import annotations
 
 import logging
 import time
-from typing import Dict, List, Optional, Any
+import uuid
+from typing import Dict, List, Optional, Any, Tuple
 
 from mcpstore.core.eventlog.event_models import EventRecord
+from mcpstore.core.eventlog.event_notifier import EventNotifier, create_event_notifier
 
 logger = logging.getLogger(__name__)
 
+_LEGACY_WRITER = "legacy"
+
+
+def _segment_entry_key(segment: int, writer_id: str) -> str:
+    return f"{segment:020d}:{writer_id}"
+
+
+def _event_key(writer_id: str, seq: int) -> str:
+    return f"{writer_id}:{seq:020d}"
+
+
+def _parse_segment_entry_key(key: str) -> Optional[Tuple[int, str]]:
+    segment, _, writer_id = key.partition(":")
+    try:
+        return int(segment), writer_id
+    except Exception:
+        return None
+
 
 class EventStore:
     """事件存储抽象，封装 KV 操作与桥接。"""
@@ -26,17 +56,33 @@ class EventStore:
         *,
         max_queue_length: int = 1_000_000,
         dedup_ttl_seconds: float = 86400.0,
+        segment_seconds: float = 60.0,
     ):
         self._kv_store = kv_store
         self._namespace = namespace
         self._max_queue_length = max_queue_length
         self._dedup_ttl_seconds = dedup_ttl_seconds
+        # 段跨度（纳秒）：裁剪的粒度
+        self._segment_span_ns = max(1, int(segment_seconds * 1_000_000_000))
 
-        self._queue_collection = f"{namespace}:events:queue"
+        self._legacy_queue_collection = f"{namespace}:events:queue"
+        self._segment_prefix = f"{namespace}:events:seg"
+        self._segments_collection = f"{namespace}:events:segments"
+        self._head_collection = f"{namespace}:events:head"
         self._offset_collection = f"{namespace}:events:offset"
         self._dedup_collection = f"{namespace}:events:dedup"
         self._lease_collection = f"{namespace}:events:lease"
 
+        # 本写入方状态：当前段、段内计数、最新 id
+        self._writer_id = f"w{uuid.uuid4().hex[:12]}"
+        self._current_segment: Optional[int] = None
+        self._current_count = 0
+        self._last_id = 0
+        self._legacy_checked = False
+
+        # 追加通知：唤醒本进程及（Redis 后端下）其他进程的 EventSyncer
+        self._notifier: EventNotifier = create_event_notifier(kv_store, namespace)
+
         try:
             from mcpstore.core.bridge import get_async_bridge, get_bridge_executor  # 延迟导入，避免循环
             self._bridge = get_async_bridge()
@@ -51,24 +97,66 @@ class EventStore:
             return await coro
         return await self._bridge_executor.execute(coro, op_name=op_name)
 
+    @property
+    def notifier(self) -> EventNotifier:
+        return self._notifier
+
+    async def start_notifier(self) -> None:
+        """启动跨进程通知订阅（需在 KV 客户端所在的事件循环中运行）。"""
+        await self._await_in_bridge(self._notifier.start(), op_name="event_store.notifier.start")
+
+    async def close_notifier(self) -> None:
+        await self._await_in_bridge(self._notifier.close(), op_name="event_store.notifier.close")
+
     def _generate_event_id(self) -> str:
-        """使用 time_ns 生成递增的字符串 id。"""
-        return str(time.time_ns())
+        """使用 time_ns 生成严格递增的字符串 id。"""
+        event_id = max(time.time_ns(), self._last_id + 1)
+        self._last_id = event_id
+        return str(event_id)
+
+    def _segment_of(self, event_id: int) -> int:
+        return event_id // self._segment_span_ns
+
+    def _segment_collection(self, segment: int) -> str:
+        return f"{self._segment_prefix}:{segment}"
 
     async def append_event(self, record: EventRecord) -> EventRecord:
-        """写入事件队列并返回带 id 的记录。"""
+        """写入事件日志并返回带 id 的记录。"""
+        await self._ensure_legacy_migrated()
         event_id = self._generate_event_id()
         data = record.to_dict()
         data["id"] = event_id
         logger.debug(f"[EVENT_STORE] append_event id={event_id} type={record.type}")
 
+        segment = self._segment_of(int(event_id))
+        rolled = segment != self._current_segment
+        if rolled:
+            await self._open_segment(segment)
+
         await self._await_in_bridge(
-            self._kv_store.put(event_id, data, collection=self._queue_collection),
+            self._kv_store.put(
+                _event_key(self._writer_id, self._current_count), data,
+                collection=self._segment_collection(segment),
+            ),
             op_name="event_store.append_event",
         )
+        self._current_count += 1
+        # head 在事件写入之后更新：读到 head 的消费者一定能读到对应事件
+        await self._await_in_bridge(
+            self._kv_store.put(
+                self._writer_id,
+                {"last_id": event_id, "segment": segment, "count": self._current_count, "updated_at": time.time()},
+                collection=self._head_collection,
+            ),
+            op_name="event_store.append_event.head",
+        )
+        try:
+            await self._await_in_bridge(self._notifier.publish(event_id), op_name="event_store.notify")
+        except Exception as notify_error:
+            logger.debug(f"[EVENT_STORE] notify failed (ignored): {notify_error}")
 
-        # 高水位裁剪（极少触发）
-        if self._max_queue_length > 0:
+        # 高水位裁剪：只在切换段时检查（整段删除）
+        if rolled and self._max_queue_length > 0:
             try:
                 await self._maybe_trim_queue()
             except Exception as trim_error:
@@ -78,44 +166,217 @@ class EventStore:
 
     async def fetch_events(self, last_id: Optional[str], limit: int = 100) -> List[EventRecord]:
         """按 id 顺序获取大于 last_id 的事件。"""
+        await self._ensure_legacy_migrated()
         last_numeric = int(last_id) if last_id else None
 
-        def _filter_and_sort(keys: List[str]) -> List[str]:
-            numeric_keys = []
-            for key in keys:
-                try:
-                    num = int(key)
-                except Exception:
+        # 各写入方的最新 id 都不超过 last_id 时没有新事件
+        heads = await self._load_heads()
+        newest = max((h["last_id"] for h in heads.values()), default=None)
+        if newest is None or (last_numeric is not None and newest <= last_numeric):
+            return []
+
+        start_segment = self._segment_of(last_numeric) if last_numeric is not None else None
+        counts = self._segment_counts(await self._load_segment_entries(), heads)
+
+        events: List[EventRecord] = []
+        for segment in sorted(counts):
+            if start_segment is not None and segment < start_segment:
+                continue
+            remaining = limit - len(events)
+            if remaining <= 0:
+                break
+            collection = self._segment_collection(segment)
+            batch: List[EventRecord] = []
+            for writer_id, count in counts[segment].items():
+                # 段内序号与 id 同序：只有 offset 所在段需要定位起点，之后的段从 0 开始
+                first = 0
+                if segment == start_segment:
+                    first = await self._first_seq_after(collection, writer_id, count, last_numeric)
+                stop = min(count, first + remaining)
+                if first >= stop:
                     continue
-                if last_numeric is None or num > last_numeric:
-                    numeric_keys.append(num)
-            numeric_keys.sort()
-            return [str(k) for k in numeric_keys[:limit]]
+                results = await self._await_in_bridge(
+                    self._kv_store.get_many(
+                        [_event_key(writer_id, seq) for seq in range(first, stop)], collection=collection
+                    ),
+                    op_name="event_store.fetch_events.get_many",
+                )
+                for item in results:
+                    if item is None:
+                        continue
+                    try:
+                        record = EventRecord.from_dict(item)
+                    except Exception as parse_error:
+                        logger.warning(f"[EVENT_STORE] skip invalid event: {parse_error}")
+                        continue
+                    if last_numeric is None or int(record.id) > last_numeric:
+                        batch.append(record)
+            # 多个写入方在同一段内按 id 归并
+            batch.sort(key=lambda record: int(record.id))
+            events.extend(batch[:remaining])
+        return events
+
+    async def _first_seq_after(self, collection: str, writer_id: str, count: int, last_numeric: int) -> int:
+        """二分查找写入方在段内第一个 id 大于 last_numeric 的序号（无则返回 count）。"""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            item = await self._await_in_bridge(
+                self._kv_store.get(_event_key(writer_id, mid), collection=collection),
+                op_name="event_store.fetch_events.seek",
+            )
+            try:
+                event_id = int(item.get("id")) if item else None
+            except Exception:
+                event_id = None
+            if event_id is not None and event_id > last_numeric:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    @staticmethod
+    def _segment_counts(
+        entries: Dict[str, Dict[str, Any]],
+        heads: Dict[str, Dict[str, Any]],
+    ) -> Dict[int, Dict[str, int]]:
+        """段 -> {写入方: 事件数}；写入方当前段的计数以 head 为准（段目录只在切换段时写入最终计数）。"""
+        counts: Dict[int, Dict[str, int]] = {}
+        for key, entry in entries.items():
+            parsed = _parse_segment_entry_key(key)
+            if parsed is None:
+                continue
+            segment, writer_id = parsed
+            count = int(entry.get("count", 0))
+            head = heads.get(writer_id)
+            if head is not None and head["segment"] == segment:
+                count = max(count, head["count"])
+            counts.setdefault(segment, {})[writer_id] = count
+        return counts
 
+    async def _open_segment(self, segment: int) -> None:
+        """切换到新段：记录上一段的最终计数，并在段目录登记新段。"""
+        previous = self._current_segment
+        if previous is not None:
+            # 上一段时间跨度结束后可能已被（任一进程）整段裁剪：目录项已删除时不再写回，
+            # 否则会复活一个指向空段的过期计数
+            existing = await self._await_in_bridge(
+                self._kv_store.get(_segment_entry_key(previous, self._writer_id), collection=self._segments_collection),
+                op_name="event_store.segment_entry.get",
+            )
+            if existing is not None:
+                await self._put_segment_entry(previous, self._writer_id, self._current_count, closed=True)
+            else:
+                logger.debug(f"[EVENT_STORE] previous segment {previous} already trimmed, skip closing entry")
+        await self._put_segment_entry(segment, self._writer_id, 0, closed=False)
+        self._current_segment = segment
+        self._current_count = 0
+
+    async def _put_segment_entry(self, segment: int, writer_id: str, count: int, *, closed: bool) -> None:
+        await self._await_in_bridge(
+            self._kv_store.put(
+                _segment_entry_key(segment, writer_id),
+                {"segment": segment, "writer": writer_id, "count": count, "closed": closed},
+                collection=self._segments_collection,
+            ),
+            op_name="event_store.segment_entry",
+        )
+
+    async def _load_segment_entries(self) -> Dict[str, Dict[str, Any]]:
         keys = await self._await_in_bridge(
-            self._kv_store.keys(collection=self._queue_collection),
-            op_name="event_store.fetch_events.keys",
+            self._kv_store.keys(collection=self._segments_collection),
+            op_name="event_store.segments.keys",
         )
         if not keys:
-            return []
-
-        target_keys = _filter_and_sort(keys)
-        if not target_keys:
-            return []
+            return {}
+        values = await self._await_in_bridge(
+            self._kv_store.get_many(list(keys), collection=self._segments_collection),
+            op_name="event_store.segments.get_many",
+        )
+        return {key: value for key, value in zip(keys, values) if value}
 
-        results = await self._await_in_bridge(
-            self._kv_store.get_many(target_keys, collection=self._queue_collection),
-            op_name="event_store.fetch_events.get_many",
+    async def _load_heads(self) -> Dict[str, Dict[str, Any]]:
+        keys = await self._await_in_bridge(
+            self._kv_store.keys(collection=self._head_collection),
+            op_name="event_store.head.keys",
         )
-        events: List[EventRecord] = []
-        for item in results:
-            if item is None:
+        if not keys:
+            return {}
+        values = await self._await_in_bridge(
+            self._kv_store.get_many(list(keys), collection=self._head_collection),
+            op_name="event_store.head.get_many",
+        )
+        heads: Dict[str, Dict[str, Any]] = {}
+        for key, value in zip(keys, values):
+            if not value:
                 continue
             try:
-                events.append(EventRecord.from_dict(item))
-            except Exception as parse_error:
-                logger.warning(f"[EVENT_STORE] skip invalid event: {parse_error}")
-        return events
+                heads[key] = {
+                    "last_id": int(value.get("last_id")),
+                    "segment": int(value.get("segment")),
+                    "count": int(value.get("count", 0)),
+                }
+            except Exception:
+                continue
+        return heads
+
+    async def _ensure_legacy_migrated(self) -> None:
+        """把旧版单集合队列中的事件一次性迁移到分段日志。"""
+        if self._legacy_checked:
+            return
+        self._legacy_checked = True
+        try:
+            keys = await self._await_in_bridge(
+                self._kv_store.keys(collection=self._legacy_queue_collection),
+                op_name="event_store.legacy.keys",
+            )
+        except Exception as e:
+            logger.debug(f"[EVENT_STORE] legacy queue check failed: {e}")
+            return
+        numeric_keys = []
+        for key in keys or []:
+            try:
+                numeric_keys.append(int(key))
+            except Exception:
+                continue
+        if not numeric_keys:
+            return
+        numeric_keys.sort()
+        legacy_keys = [str(k) for k in numeric_keys]
+        values = await self._await_in_bridge(
+            self._kv_store.get_many(legacy_keys, collection=self._legacy_queue_collection),
+            op_name="event_store.legacy.get_many",
+        )
+        by_segment: Dict[int, Tuple[List[str], List[Any]]] = {}
+        for key, value in zip(legacy_keys, values):
+            if value is None:
+                continue
+            seg_keys, seg_values = by_segment.setdefault(self._segment_of(int(key)), ([], []))
+            seg_keys.append(_event_key(_LEGACY_WRITER, len(seg_keys)))
+            seg_values.append(value)
+        for segment, (seg_keys, seg_values) in by_segment.items():
+            await self._put_segment_entry(segment, _LEGACY_WRITER, len(seg_keys), closed=True)
+            await self._await_in_bridge(
+                self._kv_store.put_many(seg_keys, seg_values, collection=self._segment_collection(segment)),
+                op_name="event_store.legacy.put_many",
+            )
+        newest = numeric_keys[-1]
+        self._last_id = max(self._last_id, newest)
+        await self._await_in_bridge(
+            self._kv_store.put(
+                _LEGACY_WRITER,
+                {"last_id": str(newest), "segment": self._segment_of(newest), "count": 0, "updated_at": time.time()},
+                collection=self._head_collection,
+            ),
+            op_name="event_store.legacy.head",
+        )
+        await self._await_in_bridge(
+            self._kv_store.delete_many(legacy_keys, collection=self._legacy_queue_collection),
+            op_name="event_store.legacy.delete_many",
+        )
+        logger.info(
+            f"[EVENT_STORE] migrated legacy event queue: events={len(legacy_keys)} segments={len(by_segment)}"
+        )
 
     async def get_offset(self, consumer_id: str) -> Optional[str]:
         """获取消费者已提交的最后 id。"""
@@ -239,40 +500,97 @@ class EventStore:
             return None
 
     async def _maybe_trim_queue(self) -> None:
-        """高水位裁剪，保留最近 max_queue_length 条。"""
-        keys = await self._await_in_bridge(
-            self._kv_store.keys(collection=self._queue_collection),
-            op_name="event_store.trim.keys",
-        )
-        if not keys:
+        """高水位裁剪：总事件数超过 max_queue_length 时，整段删除最旧的已消费段。"""
+        entries = await self._load_segment_entries()
+        if not entries:
             return
+        heads = await self._load_heads()
 
-        numeric_keys = []
-        for key in keys:
-            try:
-                numeric_keys.append(int(key))
-            except Exception:
-                continue
-        if len(numeric_keys) <= self._max_queue_length:
+        writer_counts = self._segment_counts(entries, heads)
+        counts = {segment: sum(writers.values()) for segment, writers in writer_counts.items()}
+
+        total = sum(counts.values())
+        if total <= self._max_queue_length:
             return
-        numeric_keys.sort()
-        # 基于最小 offset 限制裁剪范围，避免删除未消费事件
+
+        # 基于最小 offset 限制裁剪范围，避免删除未消费事件；时间上尚未结束的段仍可能被写入，不裁剪
         min_offset = await self._get_min_offset()
-        excess = len(numeric_keys) - self._max_queue_length
-        candidates = numeric_keys[:excess]
-        if min_offset is not None:
-            candidates = [k for k in candidates if k < min_offset]
-        if not candidates:
+        now_ns = time.time_ns()
+        trim_segments: List[int] = []
+        for segment in sorted(counts):
+            if total <= self._max_queue_length:
+                break
+            segment_end = (segment + 1) * self._segment_span_ns - 1
+            if segment_end >= now_ns:
+                break
+            if min_offset is not None and segment_end >= min_offset:
+                break
+            trim_segments.append(segment)
+            total -= counts[segment]
+        if not trim_segments:
             return
-        trim_keys = [str(k) for k in candidates]
+
         logger.warning(
-            f"[EVENT_STORE] trimming queue: total={len(numeric_keys)} keep={self._max_queue_length} trim={len(trim_keys)} min_offset={min_offset}"
+            f"[EVENT_STORE] truncating event log: segments={len(trim_segments)} keep={self._max_queue_length} min_offset={min_offset}"
         )
-        for key in trim_keys:
+        dropped = set()
+        for segment in trim_segments:
             try:
+                await self._drop_segment(segment, writer_counts[segment])
                 await self._await_in_bridge(
-                    self._kv_store.delete(key, collection=self._queue_collection),
-                    op_name="event_store.trim.delete",
+                    self._kv_store.delete_many(
+                        [_segment_entry_key(segment, writer_id) for writer_id in writer_counts[segment]],
+                        collection=self._segments_collection,
+                    ),
+                    op_name="event_store.trim.delete_entries",
                 )
+                dropped.add(segment)
             except Exception as delete_error:
-                logger.warning(f"[EVENT_STORE] failed to delete trimmed key {key}: {delete_error}")
+                logger.warning(f"[EVENT_STORE] failed to truncate segment {segment}: {delete_error}")
+        if dropped:
+            await self._prune_heads(heads, min(set(counts) - dropped, default=None))
+
+    async def _prune_heads(self, heads: Dict[str, Dict[str, Any]], oldest_segment: Optional[int]) -> None:
+        """删除最新段早于现存最旧段的写入方 head（其事件已全部裁剪，写入方重新写入时会重建 head）。"""
+        def _is_stale(head: Optional[Dict[str, Any]]) -> bool:
+            try:
+                return bool(head) and (oldest_segment is None or int(head["segment"]) < oldest_segment)
+            except Exception:
+                return False
+
+        stale = [writer_id for writer_id, head in heads.items() if _is_stale(head)]
+        if not stale:
+            return
+        try:
+            # 删除前重读：写入方可能刚切换到新段并更新了 head
+            current = await self._await_in_bridge(
+                self._kv_store.get_many(stale, collection=self._head_collection),
+                op_name="event_store.trim.recheck_heads",
+            )
+            stale = [writer_id for writer_id, head in zip(stale, current) if _is_stale(head)]
+            if not stale:
+                return
+            await self._await_in_bridge(
+                self._kv_store.delete_many(stale, collection=self._head_collection),
+                op_name="event_store.trim.delete_heads",
+            )
+            logger.debug(f"[EVENT_STORE] pruned writer heads: {len(stale)}")
+        except Exception as delete_error:
+            logger.warning(f"[EVENT_STORE] failed to prune writer heads: {delete_error}")
+
+    async def _drop_segment(self, segment: int, writer_counts: Dict[str, int]) -> None:
+        collection = self._segment_collection(segment)
+        destroy_collection = getattr(self._kv_store, "destroy_collection", None)
+        if destroy_collection is not None:
+            await self._await_in_bridge(destroy_collection(collection=collection), op_name="event_store.trim.destroy")
+            return
+        keys = [
+            _event_key(writer_id, seq)
+            for writer_id, count in writer_counts.items()
+            for seq in range(count)
+        ]
+        if keys:
+            await self._await_in_bridge(
+                self._kv_store.delete_many(keys, collection=collection),
+                op_name="event_store.trim.delete",
+            )
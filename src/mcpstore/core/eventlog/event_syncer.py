@@ -1,5 +1,10 @@
 """
 事件同步器：从共享事件队列拉取事件并投递到本地 EventBus。
+
+- 推送唤醒：EventStore 追加事件后发布通知，同步器在等待中被立即唤醒；
+  poll_interval 仅作为丢失通知时的兜底轮询间隔（push=False 时退回固定间隔轮询）
+- 消费位点缓存在本地（同步器是该 consumer_id 位点的唯一提交者），
+  按 offset_commit_interval / offset_commit_batch 批量提交，停止时刷新
 """
 
 from __future__ import annotations
@@ -69,6 +74,9 @@ class EventSyncer:
         dedup_enabled: bool = True,
         event_mapping: Optional[Dict[str, Type[DomainEvent]]] = None,
         lease_key: str = "lease:event_syncer",
+        push: bool = True,
+        offset_commit_interval: float = 1.0,
+        offset_commit_batch: int = 100,
     ):
         self._event_store = event_store
         self._event_bus = event_bus
@@ -80,6 +88,16 @@ class EventSyncer:
         self._dedup_enabled = dedup_enabled
         self._event_mapping = event_mapping or DEFAULT_EVENT_MAPPING
         self._lease_key = lease_key
+        self._push = push
+        self._offset_commit_interval = offset_commit_interval
+        self._offset_commit_batch = max(1, offset_commit_batch)
+
+        # 本地位点缓存：_offset 为已处理的最后 id，_committed_offset 为已落盘的 id
+        self._offset: Optional[str] = None
+        self._offset_loaded = False
+        self._committed_offset: Optional[str] = None
+        self._uncommitted = 0
+        self._last_commit_time = 0.0
 
         self._running = False
         self._task: Optional[asyncio.Task] = None
@@ -91,7 +109,12 @@ class EventSyncer:
         if self._running:
             return
         self._running = True
-        logger.info(f"[EVENT_SYNCER] start consumer={self._consumer_id}")
+        logger.info(f"[EVENT_SYNCER] start consumer={self._consumer_id} push={self._push}")
+        if self._push:
+            try:
+                await self._event_store.start_notifier()
+            except Exception as e:
+                logger.warning(f"[EVENT_SYNCER] notifier start failed, falling back to polling: {e}")
         self._task = asyncio.create_task(self._run_loop())
 
     async def stop(self):
@@ -102,6 +125,15 @@ class EventSyncer:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        try:
+            await self._flush_offset()
+        except Exception as e:
+            logger.warning(f"[EVENT_SYNCER] final offset commit failed: {e}")
+        if self._push:
+            try:
+                await self._event_store.close_notifier()
+            except Exception:
+                pass
         await self._release_lease()
         logger.info(f"[EVENT_SYNCER] stop consumer={self._consumer_id}")
 
@@ -113,14 +145,31 @@ class EventSyncer:
                     await asyncio.sleep(self._poll_interval)
                     continue
 
-                await self._poll_once()
+                # 拉取前记录通知版本，拉取期间的追加会让随后的等待立即返回
+                version = self._event_store.notifier.version
+                fetched = await self._poll_once()
+                if fetched >= self._batch_size:
+                    # 满批说明可能还有积压，立即继续拉取
+                    continue
+                await self._wait_for_events(version)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"[EVENT_SYNCER] loop error: {e}", exc_info=True)
                 await asyncio.sleep(self._poll_interval)
-            else:
-                await asyncio.sleep(self._poll_interval)
+
+    async def _wait_for_events(self, since_version: int) -> None:
+        """等待新事件通知（最长 poll_interval），期间到期的位点一并提交。"""
+        if not self._push:
+            await asyncio.sleep(self._poll_interval)
+            await self._maybe_commit_offset()
+            return
+        timeout = self._poll_interval
+        if self._uncommitted:
+            timeout = min(timeout, max(0.0, self._offset_commit_interval - (time.time() - self._last_commit_time)))
+        woke = await self._event_store.notifier.wait(since_version, timeout)
+        if not woke:
+            await self._maybe_commit_offset()
 
     async def _ensure_lease(self) -> bool:
         if not self._enable_lease:
@@ -161,11 +210,40 @@ class EventSyncer:
         except Exception:
             pass
 
-    async def _poll_once(self):
-        last_id = await self._event_store.get_offset(self._consumer_id)
+    async def _load_offset(self) -> Optional[str]:
+        if not self._offset_loaded:
+            self._offset = await self._event_store.get_offset(self._consumer_id)
+            self._committed_offset = self._offset
+            self._offset_loaded = True
+            self._last_commit_time = time.time()
+        return self._offset
+
+    async def _maybe_commit_offset(self) -> None:
+        if not self._uncommitted:
+            return
+        if (
+            self._uncommitted >= self._offset_commit_batch
+            or time.time() - self._last_commit_time >= self._offset_commit_interval
+        ):
+            await self._flush_offset()
+
+    async def _flush_offset(self) -> None:
+        """把本地位点提交到 EventStore。"""
+        if not self._offset or self._offset == self._committed_offset:
+            self._uncommitted = 0
+            return
+        offset = self._offset
+        await self._event_store.commit_offset(self._consumer_id, offset)
+        self._committed_offset = offset
+        self._uncommitted = 0
+        self._last_commit_time = time.time()
+
+    async def _poll_once(self) -> int:
+        """拉取并投递一批事件，返回拉取到的事件数。"""
+        last_id = await self._load_offset()
         events = await self._event_store.fetch_events(last_id, limit=self._batch_size)
         if not events:
-            return
+            return 0
 
         last_processed = None
         for record in events:
@@ -190,7 +268,12 @@ class EventSyncer:
             last_processed = record.id
 
         if last_processed:
-            await self._event_store.commit_offset(self._consumer_id, last_processed)
+            # 后台循环与 consume_once_now 可能交错执行，位点只前进不后退
+            if self._offset is None or int(last_processed) > int(self._offset):
+                self._offset = last_processed
+            self._uncommitted += len(events)
+            await self._maybe_commit_offset()
+        return len(events)
 
     async def consume_once_now(self) -> Optional[str]:
         """
@@ -202,12 +285,13 @@ class EventSyncer:
             try:
                 lease_ok = await self._ensure_lease()
                 if not lease_ok:
-                    return await self._event_store.get_offset(self._consumer_id)
+                    return await self._load_offset()
                 await self._poll_once()
-                return await self._event_store.get_offset(self._consumer_id)
+                await self._flush_offset()
+                return self._offset
             except Exception as e:
                 logger.error(f"[EVENT_SYNCER] consume_once_now error: {e}", exc_info=True)
-                return await self._event_store.get_offset(self._consumer_id)
+                return self._offset if self._offset_loaded else await self._event_store.get_offset(self._consumer_id)
 
     async def _is_duplicate(self, record) -> bool:
         entry = await self._event_store.get_dedup_entry(record.dedup_key)  # type: ignore[arg-type]
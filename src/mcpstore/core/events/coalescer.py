@@ -0,0 +1,175 @@
+"""
+事件合并器 - 高频状态事件的时间窗口合并（可选）
+
+服务抖动时，健康检查、被动反馈和重连扫描会对同一 (agent_id, service_name) 每秒发布多次
+ServiceStateChanged / HealthCheckCompleted 等事件。启用后：
+- 某个合并键窗口外的第一个事件立即派发，并开启一个窗口
+- 窗口内的后续事件只保留最新的一个，窗口结束时派发它（并开启下一个窗口）
+- 被覆盖的事件计入 collapsed
+
+因此孤立事件没有额外延迟，持续抖动时每个合并键每个窗口最多派发一个事件。
+只合并 wait=False 的事件；同一合并键的 wait=True 事件会直接派发，并取代窗口内暂存的旧事件。
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from .dispatcher import default_coalesce_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CoalesceConfig:
+    """事件合并配置（features.event_coalescing）"""
+    enabled: bool = False
+    window_ms: float = 200.0
+    # 参与合并的事件类型名
+    event_types: List[str] = field(default_factory=lambda: ["ServiceStateChanged", "HealthCheckCompleted"])
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "CoalesceConfig":
+        if isinstance(data, bool):
+            return cls(enabled=data)
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        config = cls(**known)
+        if config.window_ms <= 0:
+            raise ValueError(f"Invalid event_coalescing.window_ms: {config.window_ms}. Must be > 0")
+        config.event_types = list(config.event_types or [])
+        return config
+
+
+@dataclass
+class CoalesceStats:
+    received: int = 0
+    emitted: int = 0
+    collapsed: int = 0
+
+    @property
+    def collapse_rate(self) -> float:
+        return self.collapsed / self.received if self.received > 0 else 0.0
+
+
+class _Window:
+    __slots__ = ("pending", "handle")
+
+    def __init__(self, handle: asyncio.TimerHandle):
+        self.pending: Any = None
+        self.handle = handle
+
+
+class EventCoalescer:
+    """
+    按 (事件类型, agent_id, service_name) 在时间窗口内合并事件
+
+    Args:
+        deliver: 派发被保留事件的协程函数（EventBus 的非等待派发路径）
+        config: 合并配置
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Any], Awaitable[None]],
+        config: Optional[CoalesceConfig] = None,
+        key_func: Callable[[Any], Hashable] = default_coalesce_key,
+    ):
+        self._deliver = deliver
+        self._key_func = key_func
+        self._config = config or CoalesceConfig()
+        self._types = set(self._config.event_types)
+        # (loop, key) -> 窗口；窗口定时器属于对应事件循环
+        self._windows: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Window] = {}
+        self._stats: Dict[str, CoalesceStats] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    @property
+    def config(self) -> CoalesceConfig:
+        return self._config
+
+    def configure(self, config: Optional[CoalesceConfig]) -> None:
+        self._config = config or CoalesceConfig()
+        self._types = set(self._config.event_types)
+
+    def offer(self, event: Any) -> bool:
+        """
+        登记事件，返回 True 表示事件已被暂存（窗口结束时由合并器派发），调用方不应再派发
+        """
+        name = type(event).__name__
+        if name not in self._types:
+            return False
+        stats = self._stats.setdefault(name, CoalesceStats())
+        stats.received += 1
+        loop = asyncio.get_running_loop()
+        key = (loop, self._key_func(event))
+        window = self._windows.get(key)
+        if window is None:
+            self._open_window(loop, key)
+            stats.emitted += 1
+            return False
+        if window.pending is not None:
+            stats.collapsed += 1
+        window.pending = event
+        return True
+
+    def supersede(self, event: Any) -> None:
+        """直接派发的事件取代窗口内暂存的同键事件，避免旧事件在其之后被派发"""
+        name = type(event).__name__
+        if name not in self._types:
+            return
+        window = self._windows.get((asyncio.get_running_loop(), self._key_func(event)))
+        if window is not None and window.pending is not None:
+            window.pending = None
+            self._stats.setdefault(name, CoalesceStats()).collapsed += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "received": stats.received,
+                "emitted": stats.emitted,
+                "collapsed": stats.collapsed,
+                "collapse_rate": stats.collapse_rate,
+                "pending": sum(
+                    1 for w in list(self._windows.values())
+                    if w.pending is not None and type(w.pending).__name__ == name
+                ),
+            }
+            for name, stats in self._stats.items()
+        }
+
+    def _open_window(self, loop: asyncio.AbstractEventLoop, key: Tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        handle = loop.call_later(self._config.window_ms / 1000.0, self._close_window, key)
+        self._windows[key] = _Window(handle)
+
+    def _close_window(self, key: Tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        window = self._windows.pop(key, None)
+        if window is None or window.pending is None:
+            return
+        event = window.pending
+        loop = key[0]
+        # 持续抖动时继续开窗，保证每个窗口最多派发一次保留事件
+        self._open_window(loop, key)
+        self._stats.setdefault(type(event).__name__, CoalesceStats()).emitted += 1
+        task = loop.create_task(self._deliver_safely(event))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _deliver_safely(self, event: Any) -> None:
+        try:
+            await self._deliver(event)
+        except Exception as e:
+            logger.error(f"[BUS] coalesced event delivery failed for {type(event).__name__}: {e}")
+
+
+__all__ = [
+    "CoalesceConfig",
+    "CoalesceStats",
+    "EventCoalescer",
+]
@@ -0,0 +1,353 @@
+"""
+事件分发器 - EventBus 异步派发（wait=False）的有界队列与工作协程池
+
+每个事件类型一个有界队列和固定数量的工作协程，队列满时按溢出策略处理：
+- "block": publish 等待队列出现空位（背压）。在分发工作协程内部发布时不等待，
+  允许队列暂时超出容量，避免 handler 发布同类事件时互相等待造成自锁
+- "drop_oldest": 丢弃队首最旧的任务
+- "coalesce": 队列中已有同一合并键、同一 handler 的任务时用新事件替换它，否则丢弃最旧的任务
+
+workers <= 0 表示不限并发：每个任务单独起一个协程（不排队，也不适用溢出策略）。
+处理函数内部完成整次连接 / 重连 / 健康检查的事件类型默认如此（见 UNBOUNDED_EVENTS），
+否则少数慢服务或死服务会占满工作协程，拖住其它服务的启动；可通过 per_event 显式设置上限。
+
+EventBus 可能同时在 AOB 事件循环和调用方事件循环中使用，队列与工作协程按事件循环分别创建，
+统计按事件类型汇总。
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+from mcpstore.core.bridge import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_COALESCE = "coalesce"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE)
+
+# 处理函数执行服务 I/O（连接、重连、健康检查、引导）的事件类型：默认不限并发
+UNBOUNDED_EVENTS = (
+    "ServiceAddRequested",
+    "ServiceBootstrapRequested",
+    "ServiceConnectionRequested",
+    "ReconnectionRequested",
+    "ServiceRestartRequested",
+    "HealthCheckRequested",
+)
+
+# 当前协程是否运行在分发工作协程内（用于 block 策略的自锁保护）
+_in_dispatch_worker: ContextVar[bool] = ContextVar("event_dispatch_worker", default=False)
+
+
+def _validate_overflow(overflow: str) -> str:
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Invalid event_dispatch overflow policy: {overflow}. Valid values: {list(OVERFLOW_POLICIES)}"
+        )
+    return overflow
+
+
+def default_coalesce_key(event: Any) -> Hashable:
+    """默认合并键：(事件类型, agent_id, service_name)"""
+    return (type(event).__name__, getattr(event, "agent_id", None), getattr(event, "service_name", None))
+
+
+@dataclass
+class EventTypeDispatchConfig:
+    # <= 0：不限并发，每个任务一个协程
+    workers: int
+    queue_size: int
+    overflow: str
+
+    @property
+    def unbounded(self) -> bool:
+        return self.workers <= 0
+
+
+@dataclass
+class DispatchConfig:
+    """异步事件分发配置（features.event_dispatch）"""
+    enabled: bool = True
+    # 每个 (事件循环, 事件类型) 常驻的工作协程数；UNBOUNDED_EVENTS 默认不限并发，
+    # 其它需要更高并发的事件用 per_event 单独调大
+    workers_per_type: int = 4
+    queue_size: int = 10000
+    overflow: str = OVERFLOW_BLOCK
+    # 按事件类型名覆盖：{"ServiceStateChanged": {"workers": 4, "queue_size": 500, "overflow": "coalesce"}}；
+    # workers <= 0 表示不限并发
+    per_event: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "DispatchConfig":
+        if isinstance(data, bool):
+            return cls(enabled=data)
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        config = cls(**known)
+        _validate_overflow(config.overflow)
+        for override in (config.per_event or {}).values():
+            if isinstance(override, dict) and "overflow" in override:
+                _validate_overflow(override["overflow"])
+        return config
+
+    def for_event(self, event_name: str) -> EventTypeDispatchConfig:
+        override = (self.per_event or {}).get(event_name)
+        if override is None:
+            override = {"workers": 0} if event_name in UNBOUNDED_EVENTS else {}
+        return EventTypeDispatchConfig(
+            workers=max(0, int(override.get("workers", self.workers_per_type))),
+            queue_size=max(1, int(override.get("queue_size", self.queue_size))),
+            overflow=override.get("overflow", self.overflow),
+        )
+
+
+@dataclass
+class DispatchStats:
+    enqueued: int = 0
+    dispatched: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    blocked: int = 0
+    overflow_bypassed: int = 0
+    max_depth: int = 0
+    handler_latency: LatencyRecorder = field(default_factory=LatencyRecorder)
+    queue_wait: LatencyRecorder = field(default_factory=LatencyRecorder)
+
+
+class _Job:
+    __slots__ = ("subscription", "event", "key", "enqueued_at")
+
+    def __init__(self, subscription: Any, event: Any, key: Hashable):
+        self.subscription = subscription
+        self.event = event
+        self.key = key
+        self.enqueued_at = time.perf_counter()
+
+
+class _EventQueue:
+    """单个事件循环内某个事件类型的有界队列 + 工作协程"""
+
+    def __init__(self, config: EventTypeDispatchConfig, stats: DispatchStats):
+        self.config = config
+        self.stats = stats
+        self.items: Deque[_Job] = deque()
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+        self.workers: Set[asyncio.Task] = set()
+
+    async def put(self, job: _Job) -> None:
+        stats = self.stats
+        async with self.not_empty:
+            if len(self.items) >= self.config.queue_size:
+                policy = self.config.overflow
+                if policy == OVERFLOW_BLOCK:
+                    if _in_dispatch_worker.get():
+                        stats.overflow_bypassed += 1
+                    else:
+                        stats.blocked += 1
+                        await self.not_full.wait_for(lambda: len(self.items) < self.config.queue_size)
+                elif policy == OVERFLOW_COALESCE and self._replace_pending(job):
+                    stats.coalesced += 1
+                    return
+                else:
+                    self.items.popleft()
+                    stats.dropped += 1
+            self.items.append(job)
+            stats.enqueued += 1
+            stats.max_depth = max(stats.max_depth, len(self.items))
+            self.not_empty.notify()
+
+    async def get(self) -> _Job:
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: bool(self.items))
+            job = self.items.popleft()
+            self.not_full.notify()
+            return job
+
+    def _replace_pending(self, job: _Job) -> bool:
+        for i in range(len(self.items) - 1, -1, -1):
+            pending = self.items[i]
+            if pending.key == job.key and pending.subscription is job.subscription:
+                job.enqueued_at = pending.enqueued_at
+                self.items[i] = job
+                return True
+        return False
+
+
+class EventDispatcher:
+    """
+    EventBus 的异步派发器
+
+    Args:
+        handle: 执行单个 handler 的协程函数 handle(handler, event)（EventBus._handle_event_safely）
+        config: 分发配置
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[Callable, Any], Awaitable[None]],
+        config: Optional[DispatchConfig] = None,
+        key_func: Callable[[Any], Hashable] = default_coalesce_key,
+    ):
+        self._handle = handle
+        self._config = config or DispatchConfig()
+        self._key_func = key_func
+        # (loop, event_type) -> 队列；按循环隔离
+        self._queues: Dict[Tuple[asyncio.AbstractEventLoop, type], _EventQueue] = {}
+        self._stats: Dict[str, DispatchStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    @property
+    def config(self) -> DispatchConfig:
+        return self._config
+
+    def configure(self, config: Optional[DispatchConfig]) -> None:
+        """更新配置；已创建的队列沿用旧配置，新的事件循环/事件类型使用新配置"""
+        self._config = config or DispatchConfig()
+
+    async def submit(self, subscription: Any, event: Any) -> None:
+        """把 (handler, event) 放入对应事件类型的队列"""
+        queue = self._get_queue(type(event))
+        job = _Job(subscription, event, self._key_func(event))
+        if queue.config.unbounded:
+            queue.stats.enqueued += 1
+            task = asyncio.get_running_loop().create_task(
+                self._run_unbounded(queue, job), name=f"EventBus:{type(event).__name__}"
+            )
+            queue.workers.add(task)
+            task.add_done_callback(queue.workers.discard)
+            return
+        await queue.put(job)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        depth: Dict[str, int] = {}
+        workers: Dict[str, int] = {}
+        for (_, event_type), queue in list(self._queues.items()):
+            name = event_type.__name__
+            depth[name] = depth.get(name, 0) + len(queue.items)
+            workers[name] = workers.get(name, 0) + len(queue.workers)
+        result: Dict[str, Dict[str, Any]] = {}
+        for name, stats in self._stats.items():
+            result[name] = {
+                "depth": depth.get(name, 0),
+                "max_depth": stats.max_depth,
+                "workers": workers.get(name, 0),
+                "enqueued": stats.enqueued,
+                "dispatched": stats.dispatched,
+                "dropped": stats.dropped,
+                "coalesced": stats.coalesced,
+                "blocked": stats.blocked,
+                "overflow_bypassed": stats.overflow_bypassed,
+                "handler_latency": stats.handler_latency.snapshot(),
+                "queue_wait": stats.queue_wait.snapshot(),
+            }
+        return result
+
+    def _get_queue(self, event_type: type) -> _EventQueue:
+        loop = asyncio.get_running_loop()
+        key = (loop, event_type)
+        queue = self._queues.get(key)
+        if queue is None:
+            self._purge_closed_loops()
+            name = event_type.__name__
+            stats = self._stats.setdefault(name, DispatchStats())
+            queue = _EventQueue(self._config.for_event(name), stats)
+            self._queues[key] = queue
+            for i in range(queue.config.workers):
+                task = loop.create_task(self._worker(queue), name=f"EventBus:{name}:{i}")
+                queue.workers.add(task)
+                task.add_done_callback(queue.workers.discard)
+            logger.debug(
+                f"[BUS] dispatcher started for {name}: workers={queue.config.workers or 'unbounded'}, "
+                f"queue_size={queue.config.queue_size}, overflow={queue.config.overflow}"
+            )
+        return queue
+
+    async def close(self) -> None:
+        """
+        停止所有工作协程并丢弃未处理的任务
+
+        当前事件循环上的工作协程会被取消并等待结束；其它仍在运行的事件循环上的
+        工作协程通过 call_soon_threadsafe 取消。关闭后再次 submit 会重新创建队列。
+        """
+        queues, self._queues = self._queues, {}
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        local: list = []
+        dropped = 0
+        for (loop, _), queue in queues.items():
+            dropped += len(queue.items)
+            queue.items.clear()
+            for task in list(queue.workers):
+                if loop is current:
+                    task.cancel()
+                    local.append(task)
+                elif not loop.is_closed() and loop.is_running():
+                    loop.call_soon_threadsafe(task.cancel)
+        if local:
+            await asyncio.gather(*local, return_exceptions=True)
+        logger.debug(f"[BUS] dispatcher closed: queues={len(queues)}, dropped_jobs={dropped}")
+
+    def _purge_closed_loops(self) -> None:
+        for key in [k for k in self._queues if k[0].is_closed()]:
+            self._queues.pop(key, None)
+
+    async def _worker(self, queue: _EventQueue) -> None:
+        _in_dispatch_worker.set(True)
+        while True:
+            try:
+                job = await queue.get()
+            except asyncio.CancelledError:
+                return
+            if not await self._run_job(queue, job):
+                return
+
+    async def _run_unbounded(self, queue: _EventQueue, job: _Job) -> None:
+        _in_dispatch_worker.set(True)
+        await self._run_job(queue, job)
+
+    async def _run_job(self, queue: _EventQueue, job: _Job) -> bool:
+        """执行单个任务；被取消时返回 False"""
+        stats = queue.stats
+        started = time.perf_counter()
+        stats.queue_wait.observe((started - job.enqueued_at) * 1000.0)
+        # handler 在独立任务中执行：_handle 会吞掉 CancelledError，
+        # 通过 asyncio.wait 等待可保证工作协程自身仍能被取消（事件循环关闭时）
+        handler_task = asyncio.ensure_future(self._handle(job.subscription.handler, job.event))
+        try:
+            await asyncio.wait({handler_task})
+        except asyncio.CancelledError:
+            handler_task.cancel()
+            return False
+        finally:
+            stats.handler_latency.observe((time.perf_counter() - started) * 1000.0)
+            stats.dispatched += 1
+        if not handler_task.cancelled() and handler_task.exception() is not None:
+            # _handle 已做错误隔离，这里仅兜底
+            logger.error(f"[BUS] dispatcher worker error: {handler_task.exception()}")
+        return True
+
+
+__all__ = [
+    "OVERFLOW_BLOCK",
+    "OVERFLOW_DROP_OLDEST",
+    "OVERFLOW_COALESCE",
+    "UNBOUNDED_EVENTS",
+    "DispatchConfig",
+    "EventDispatcher",
+    "default_coalesce_key",
+]
@@ -6,15 +6,20 @@
 - 优先级处理
 - 事件过滤
 - 错误隔离（一个handler失败不影响其他）
-- 事件历史记录（可选）
+- 事件历史记录（可选，环形缓冲）
+- 有界异步派发：wait=False 的事件按事件类型进入有界队列，由固定数量的工作协程处理（见 dispatcher）
+- 高频事件合并（可选）：时间窗口内同一服务的同类事件只派发最新的一个（见 coalescer）
 """
 
 import asyncio
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Dict, List, Type, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Set, Type, Optional, Tuple
+
+from .coalescer import CoalesceConfig, EventCoalescer
+from .dispatcher import DispatchConfig, EventDispatcher
 
 from .service_events import (
     DomainEvent,
@@ -47,13 +52,25 @@ class EventBus:
     4. 事件历史记录（可选）
     """
 
-    def __init__(self, enable_history: bool = False, history_size: int = 1000, handler_timeout: Optional[float] = None):
+    def __init__(
+        self,
+        enable_history: bool = False,
+        history_size: int = 1000,
+        handler_timeout: Optional[float] = None,
+        dispatch_config: Optional[DispatchConfig] = None,
+        coalesce_config: Optional[CoalesceConfig] = None,
+    ):
         self._subscribers: Dict[Type[DomainEvent], List[EventSubscription]] = defaultdict(list)
         self._enable_history = enable_history
-        self._history: List[Tuple[datetime, DomainEvent]] = []
+        self._history: Deque[Tuple[datetime, DomainEvent]] = deque(maxlen=history_size)
         self._history_size = history_size
-        self._lock = asyncio.Lock()
         self._handler_timeout = handler_timeout
+        # wait=False 的异步派发：有界队列 + 工作协程池；关闭时退回为每个 handler 创建任务
+        self._dispatcher = EventDispatcher(self._handle_event_safely, dispatch_config)
+        # 高频事件的时间窗口合并（默认关闭）
+        self._coalescer = EventCoalescer(self._deliver_coalesced, coalesce_config)
+        # 未启用分发器时创建的后台任务（保留引用，避免被垃圾回收）
+        self._background_tasks: Set[asyncio.Task] = set()
 
         logger.info(f"EventBus initialized id={hex(id(self))}")
         # 关键事件白名单：这些事件将被强制以同步方式派发（wait=True）
@@ -64,6 +81,28 @@ class EventBus:
             ServiceAddRequested,
         )
 
+    def configure_dispatch(self, config: Optional[DispatchConfig]) -> None:
+        """配置异步派发（features.event_dispatch）"""
+        self._dispatcher.configure(config)
+        logger.debug(f"[BUS {hex(id(self))}] dispatch configured: {self._dispatcher.config}")
+
+    def get_dispatch_stats(self) -> Dict[str, Dict[str, Any]]:
+        """按事件类型返回队列深度、丢弃/合并/阻塞计数及 handler 延迟直方图"""
+        return self._dispatcher.get_stats()
+
+    async def close(self) -> None:
+        """停止异步派发的工作协程（store 关闭时调用）"""
+        await self._dispatcher.close()
+
+    def configure_coalescing(self, config: Optional[CoalesceConfig]) -> None:
+        """配置高频事件合并（features.event_coalescing）"""
+        self._coalescer.configure(config)
+        logger.debug(f"[BUS {hex(id(self))}] coalescing configured: {self._coalescer.config}")
+
+    def get_coalesce_stats(self) -> Dict[str, Dict[str, Any]]:
+        """按事件类型返回收到/派发/被合并的事件数"""
+        return self._coalescer.get_stats()
+
     def subscribe(
         self,
         event_type: Type[DomainEvent],
@@ -132,13 +171,25 @@ class EventBus:
             wait = True
         logger.debug(f"[BUS {hex(id(self))}] Publishing event: {event.__class__.__name__} (id={event.event_id}) wait={wait}")
 
-        # 记录历史
+        # 记录历史（deque(maxlen) 自动淘汰最旧记录）
         if self._enable_history:
-            async with self._lock:
-                self._history.append((datetime.now(), event))
-                if len(self._history) > self._history_size:
-                    self._history.pop(0)
+            self._history.append((datetime.now(), event))
+
+        # 高频事件合并：窗口内的事件暂存，窗口结束时只派发最新的一个
+        if self._coalescer.enabled:
+            if wait:
+                self._coalescer.supersede(event)
+            elif self._coalescer.offer(event):
+                logger.debug(f"[BUS {hex(id(self))}] {event.__class__.__name__} held for coalescing (id={event.event_id})")
+                return
+
+        await self._dispatch(event, wait)
+
+    async def _deliver_coalesced(self, event: DomainEvent):
+        """派发合并窗口结束时保留的事件"""
+        await self._dispatch(event, False)
 
+    async def _dispatch(self, event: DomainEvent, wait: bool):
         # 获取订阅者
         subscribers = self._subscribers.get(type(event), [])
         # Diagnostics: subscriber details
@@ -159,12 +210,20 @@ class EventBus:
                 if subscription.filter_func and not subscription.filter_func(event):
                     continue
                 await self._handle_event_safely(subscription.handler, event)
+        elif self._dispatcher.enabled:
+            # 异步执行：进入事件类型的有界队列，由工作协程处理（队列满时按溢出策略背压/丢弃/合并）
+            for subscription in subscribers:
+                if subscription.filter_func and not subscription.filter_func(event):
+                    continue
+                await self._dispatcher.submit(subscription, event)
         else:
             # 异步后台执行（fire-and-forget）
             for subscription in subscribers:
                 if subscription.filter_func and not subscription.filter_func(event):
                     continue
-                asyncio.create_task(self._handle_event_safely(subscription.handler, event))
+                task = asyncio.create_task(self._handle_event_safely(subscription.handler, event))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
 
     async def _handle_event_safely(self, handler: Callable, event: DomainEvent):
         """
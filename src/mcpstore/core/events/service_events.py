@@ -133,6 +133,8 @@ class ServiceConnected(DomainEvent):
     session: Any = None  # MCP Client session
     tools: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
     connection_time: float = 0.0
+    # resources / resource_templates / prompts 目录（None 表示连接时未采集）
+    catalog: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
 
 @dataclass(frozen=True)
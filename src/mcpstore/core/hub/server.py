@@ -4,17 +4,19 @@ Hub MCP 服务器模块 - 将 store/agent/service 对象暴露为标准 MCP 服
 """
 
 import asyncio
+import functools
 import keyword
 import logging
 import threading
 from contextlib import suppress
-from typing import Union, Optional, Literal, Any, Callable, TYPE_CHECKING
+from typing import Union, Optional, Literal, Any, Callable, List, TYPE_CHECKING
 
 from .exceptions import (
     ServerAlreadyRunningError,
     ServerNotRunningError,
     PortBindingError,
 )
+from .tool_sync import HubSessionTracker, HubToolSync
 from .types import HubMCPConfig, HubMCPStatus
 
 if TYPE_CHECKING:
@@ -50,6 +52,9 @@ class HubMCPServer:
         port: Optional[int] = None,
         host: str = "0.0.0.0",
         path: str = "/mcp",
+        *,
+        tool_sync: bool = True,
+        tool_sync_debounce: float = 0.5,
         **mcp_kwargs
     ):
         """
@@ -61,6 +66,8 @@ class HubMCPServer:
             port: 端口号（仅 http/sse），None 为自动分配
             host: 监听地址（仅 http/sse），默认 "0.0.0.0"
             path: 端点路径（仅 http），默认 "/mcp"
+            tool_sync: 是否在运行期间跟随服务工具变化增量更新工具并通知客户端，默认 True
+            tool_sync_debounce: 工具变化的去抖时间（秒）
             **mcp_kwargs: 传递给底层 MCP 服务器（当前由 MCPKit 提供）的其他参数（如 auth）
             
         Example:
@@ -85,6 +92,8 @@ class HubMCPServer:
             port=port,
             host=host,
             path=path,
+            tool_sync=tool_sync,
+            tool_sync_debounce=tool_sync_debounce,
             mcp_kwargs=mcp_kwargs
         )
         
@@ -102,11 +111,24 @@ class HubMCPServer:
             f"port={port or 'auto-assign'}"
         )
         
+        # 工具集增量同步：记录已注册工具，跟随服务工具变化更新并通知客户端
+        self._session_tracker = HubSessionTracker()
+        self._tool_sync = HubToolSync(
+            list_tools=self._list_tools_async,
+            register=self._register_tool,
+            unregister=self._unregister_tool,
+            sessions=self._session_tracker,
+            debounce=self._config.tool_sync_debounce,
+        )
+        self._snapshot_listener: Optional[Callable] = None
+        self._tool_snapshots = None
+
         # 创建底层 MCP 服务器
         self._create_mcp_server()
 
         # 注册工具
         self._register_tools()
+        self._attach_tool_sync()
 
         # 初始化完成，设置为停止状态
         self._status = HubMCPStatus.STOPPED
@@ -171,6 +193,7 @@ class HubMCPServer:
                 name=server_name,
                 **self._config.mcp_kwargs
             )
+            self._mcpkit.add_middleware(self._session_tracker)
             
             logger.info(f"[HubMCPServer] [SUCCESS] MCP server created successfully: {server_name}")
             
@@ -186,57 +209,17 @@ class HubMCPServer:
         注册所有工具到 MCP 服务器
         
         从暴露对象获取工具列表，为每个工具创建代理函数，
-        然后使用底层实现的 @tool 装饰器注册。
+        然后使用底层实现的 @tool 装饰器注册。已注册工具的指纹由 HubToolSync 记录，
+        之后的工具变化按差异增量应用。
         """
         try:
             # 获取工具列表
             tools = self._exposed_object.list_tools()
             
             logger.info(f"[HubMCPServer] [REGISTER] Starting to register tools, total {len(tools)}")
-            
-            # 为每个工具创建代理函数并注册
-            registered_count = 0
-            failed_count = 0
-            
-            for tool_info in tools:
-                try:
-                    # 创建代理工具
-                    proxy_tool = self._create_proxy_tool(tool_info)
-
-                    annotations = None
-                    schema = getattr(tool_info, "inputSchema", None)
-                    if schema and isinstance(schema, dict):
-                        annotations = {"arguments": schema}
-
-                    meta = {
-                        "service_name": getattr(tool_info, "service_name", None),
-                        "service_global_name": getattr(tool_info, "service_global_name", None),
-                        "client_id": getattr(tool_info, "client_id", None),
-                    }
-
-                    description = tool_info.description or f"Tool: {tool_info.name}"
-                    decorator_kwargs = {
-                        "name": tool_info.name,
-                        "description": description,
-                        "meta": {k: v for k, v in meta.items() if v is not None},
-                    }
-                    if annotations:
-                        decorator_kwargs["annotations"] = annotations
-
-                    decorator = self._mcpkit.mcp.tool(**decorator_kwargs)
-                    decorator(proxy_tool)
-
-                    registered_count += 1
-                    logger.debug(f"[HubMCPServer] [SUCCESS] Tool registered successfully: {tool_info.name}")
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.warning(
-                        f"[HubMCPServer] [WARN] Tool registration failed: {tool_info.name}, "
-                        f"error: {e}"
-                    )
-                    # 单个工具注册失败不影响其他工具
-                    continue
+
+            registered_count, _, _ = self._tool_sync.apply(tools)
+            failed_count = len(tools) - registered_count
             
             logger.info(
                 f"[HubMCPServer] [COMPLETE] Tool registration completed - "
@@ -246,13 +229,93 @@ class HubMCPServer:
         except Exception as e:
             logger.error(f"[HubMCPServer] [ERROR] Tool registration failed: {e}")
             raise
+
+    def _register_tool(self, tool_info: 'ToolInfo') -> bool:
+        """为单个工具创建代理函数并注册，失败时返回 False（不影响其他工具）"""
+        try:
+            # 创建代理工具
+            proxy_tool = self._create_proxy_tool(tool_info)
+
+            annotations = None
+            schema = getattr(tool_info, "inputSchema", None)
+            if schema and isinstance(schema, dict):
+                annotations = {"arguments": schema}
+
+            meta = {
+                "service_name": getattr(tool_info, "service_name", None),
+                "service_global_name": getattr(tool_info, "service_global_name", None),
+                "client_id": getattr(tool_info, "client_id", None),
+            }
+
+            description = tool_info.description or f"Tool: {tool_info.name}"
+            decorator_kwargs = {
+                "name": tool_info.name,
+                "description": description,
+                "meta": {k: v for k, v in meta.items() if v is not None},
+            }
+            if annotations:
+                decorator_kwargs["annotations"] = annotations
+
+            decorator = self._mcpkit.tool(**decorator_kwargs)
+            decorator(proxy_tool)
+
+            logger.debug(f"[HubMCPServer] [SUCCESS] Tool registered successfully: {tool_info.name}")
+            return True
+
+        except Exception as e:
+            logger.warning(
+                f"[HubMCPServer] [WARN] Tool registration failed: {tool_info.name}, "
+                f"error: {e}"
+            )
+            return False
+
+    def _unregister_tool(self, name: str) -> None:
+        self._mcpkit.remove_tool(name)
+        logger.debug(f"[HubMCPServer] [SYNC] Tool removed: {name}")
+
+    def _tool_view_context(self) -> Optional['MCPStoreContext']:
+        """暴露对象所属的上下文（ServiceProxy 取其内部上下文）"""
+        if hasattr(self._exposed_object, "_get_tool_view_key"):
+            return self._exposed_object
+        return getattr(self._exposed_object, "_context", None)
+
+    def _attach_tool_sync(self) -> None:
+        """准备暴露视图的快照监听器；仅在服务器运行期间注册到 store（见 _run_server）"""
+        if not self._config.tool_sync:
+            return
+        try:
+            context = self._tool_view_context()
+            snapshots = getattr(getattr(context, "_store", None), "tool_snapshots", None)
+            if context is None or snapshots is None:
+                logger.debug("[HubMCPServer] [SYNC] Tool snapshots unavailable, live tool sync disabled")
+                return
+            self._snapshot_listener = self._tool_sync.on_views_changed(context._get_tool_view_key())
+            self._tool_snapshots = snapshots
+        except Exception as e:
+            logger.warning(f"[HubMCPServer] [WARN] Failed to attach live tool sync: {e}")
+
+    async def _list_tools_async(self) -> List['ToolInfo']:
+        """在 AOB 事件循环中读取暴露对象的当前工具列表"""
+        from mcpstore.core.bridge import get_async_bridge  # 延迟导入，避免循环
+        future = get_async_bridge().submit(
+            self._exposed_object.list_tools_async(),
+            op_name="hub.list_tools",
+        )
+        return await asyncio.wrap_future(future)
+
+    def get_tool_sync_stats(self) -> dict[str, Any]:
+        """工具集同步统计"""
+        stats = self._tool_sync.get_stats()
+        stats["enabled"] = self._snapshot_listener is not None
+        return stats
     
     def _create_proxy_tool(self, tool_info: 'ToolInfo') -> Callable:
         """
         创建代理工具函数
         
-        为指定的工具创建一个异步代理函数，该函数会将调用转发到
-        原始对象的 call_tool_async 方法。
+        为指定的工具创建一个异步代理函数。注册时已知工具的 (service_global_name, 规范名称)，
+        代理函数直接携带该目标调用 call_resolved_tool_async，跳过每次调用的显示名称解析；
+        缺少解析信息时回退到 call_tool_async。参数由 MCP 服务器按函数签名校验一次。
         
         Args:
             tool_info: 工具信息对象
@@ -281,16 +344,15 @@ class HubMCPServer:
         params_signature = ", ".join(params_code)
         body_lines = ["    arguments = {}"]
         body_lines.extend(arg_lines)
-        body_lines.append("    return await __call_tool(tool_name=__tool_name, args=arguments)")
+        body_lines.append("    return await __call_tool(args=arguments)")
 
         function_code = "async def handler({signature}):\n{body}\n".format(
             signature=params_signature,
-            body="\n".join(body_lines) if body_lines else "    return await __call_tool(tool_name=__tool_name, args={})",
+            body="\n".join(body_lines),
         )
 
         namespace = {
-            "__call_tool": self._exposed_object.call_tool_async,
-            "__tool_name": tool_info.name,
+            "__call_tool": self._resolve_call_target(tool_info),
         }
 
         try:
@@ -305,6 +367,26 @@ class HubMCPServer:
 
         return proxy_tool
 
+    def _resolve_call_target(self, tool_info: 'ToolInfo') -> Callable:
+        """
+        生成工具的直连调用目标
+
+        Returns:
+            Callable: 只需传入 args 的协程函数
+        """
+        service_global_name = getattr(tool_info, "service_global_name", None)
+        canonical_tool_name = getattr(tool_info, "tool_original_name", None)
+        call_resolved = getattr(self._exposed_object, "call_resolved_tool_async", None)
+        if call_resolved is not None and service_global_name and canonical_tool_name:
+            return functools.partial(
+                call_resolved,
+                tool_info.name,
+                service_global_name,
+                canonical_tool_name,
+                service_name=getattr(tool_info, "service_name", None),
+            )
+        return functools.partial(self._exposed_object.call_tool_async, tool_name=tool_info.name)
+
     def _sanitize_param_name(self, name: str) -> str:
         if not isinstance(name, str):
             raise ValueError(f"Illegal parameter name: {name}")
@@ -385,8 +467,15 @@ class HubMCPServer:
             raise ServerAlreadyRunningError("Hub MCP server is already running")
 
         self._status = HubMCPStatus.RUNNING
+        sync_task = None
+        if self._snapshot_listener is not None:
+            # ToolSnapshotManager 是 store 级共享的，监听器只在运行期间挂载，退出时摘除
+            self._tool_snapshots.add_listener(self._snapshot_listener)
+            sync_task = asyncio.create_task(self._tool_sync.run(), name="HubMCPServer:tool_sync")
+            # 构造到启动期间工具可能已变化，启动后对账一次
+            self._tool_sync.mark_dirty()
         try:
-            await self._mcpkit.mcp.run_async(
+            await self._mcpkit.run_async(
                 transport=self._config.transport,
                 show_banner=show_banner,
                 **self._get_transport_kwargs(),
@@ -406,6 +495,13 @@ class HubMCPServer:
             raise
         else:
             self._status = HubMCPStatus.STOPPED
+        finally:
+            if self._snapshot_listener is not None:
+                self._tool_snapshots.remove_listener(self._snapshot_listener)
+            if sync_task is not None:
+                sync_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await sync_task
 
     async def start_async(self, show_banner: bool = False) -> asyncio.Task:
         """在当前事件循环中以后台任务形式启动服务器。"""
@@ -474,10 +570,12 @@ class HubMCPServer:
         """停止后台运行的服务器。"""
         if self._loop and self._server_task:
             self._status = HubMCPStatus.STOPPING
-            future = asyncio.run_coroutine_threadsafe(self._cancel_task(), self._loop)
-            future.result(timeout)
-            if self._background_thread:
-                self._background_thread.join(timeout)
+            # 直接取消并等待后台线程退出：run_until_complete 在服务器任务结束后即关闭循环，
+            # 投递到该循环的等待协程可能永远得不到执行
+            thread = self._background_thread
+            self._loop.call_soon_threadsafe(self._server_task.cancel)
+            if thread:
+                thread.join(timeout)
             self._status = HubMCPStatus.STOPPED
             return
 
@@ -486,13 +584,6 @@ class HubMCPServer:
 
         raise ServerNotRunningError("Hub MCP server is not running")
 
-    async def _cancel_task(self) -> None:
-        if self._server_task:
-            self._server_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._server_task
-            self._server_task = None
-
     def restart(self, *, block: bool = False, show_banner: bool = False) -> "HubMCPServer":
         """重新启动服务器。"""
         if self.is_running:
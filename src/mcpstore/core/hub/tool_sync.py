@@ -0,0 +1,230 @@
+"""
+Hub Tool Sync Module
+Hub 工具集实时同步模块 - 运行中的 Hub 跟随服务工具变化增量更新工具注册表
+
+HubMCPServer 构造时按 list_tools() 注册一次工具。服务重连、工具重新同步或服务增删后，
+ToolSnapshotManager 会递增对应视图的版本号；HubToolSync 监听该视图的变更，去抖后重新读取
+工具列表，与已注册工具的指纹做差异比较，只对新增 / 删除 / 变更的工具调用底层 MCP 服务器的
+add / remove，再向已连接的客户端会话发送 notifications/tools/list_changed。
+无需 restart()（restart 会断开所有客户端连接），也不会重新注册整个工具集。
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from mcpstore.mcp.server.middleware import Middleware, MiddlewareContext
+
+if TYPE_CHECKING:
+    from mcpstore.core.models.tool import ToolInfo
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HubToolSyncStats:
+    syncs: int = 0
+    added: int = 0
+    removed: int = 0
+    updated: int = 0
+    notified: int = 0
+    errors: int = 0
+
+
+class HubSessionTracker(Middleware):
+    """记录发起过请求的客户端会话（弱引用），用于广播 list_changed 通知"""
+
+    def __init__(self):
+        self._sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    async def on_request(self, context: MiddlewareContext, call_next):
+        mcp_context = context.mcpstore_context
+        if mcp_context is not None and mcp_context.request_context is not None:
+            self._sessions.add(mcp_context.session)
+        return await call_next(context)
+
+    @property
+    def sessions(self) -> List[Any]:
+        return list(self._sessions)
+
+    def discard(self, session: Any) -> None:
+        self._sessions.discard(session)
+
+
+class HubToolSync:
+    """
+    Hub 工具注册表的增量同步器
+
+    Args:
+        list_tools: 读取当前工具列表的协程函数
+        register: 注册单个工具（返回是否成功）
+        unregister: 按名称移除单个工具
+        sessions: 客户端会话记录
+        debounce: 变更去抖时间（秒），同一批状态变化只触发一次同步
+    """
+
+    def __init__(
+        self,
+        list_tools: Callable[[], Awaitable[List['ToolInfo']]],
+        register: Callable[['ToolInfo'], bool],
+        unregister: Callable[[str], None],
+        sessions: HubSessionTracker,
+        *,
+        debounce: float = 0.5,
+    ):
+        self._list_tools = list_tools
+        self._register = register
+        self._unregister = unregister
+        self._sessions = sessions
+        self._debounce = max(0.0, float(debounce))
+        # 已注册工具：名称 -> 指纹
+        self._registered: Dict[str, Tuple] = {}
+        self._lock = threading.Lock()
+        self._pending = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stats = HubToolSyncStats()
+
+    @staticmethod
+    def fingerprint(tool_info: 'ToolInfo') -> Tuple:
+        schema = getattr(tool_info, "inputSchema", None) or {}
+        return (
+            tool_info.description,
+            json.dumps(schema, sort_keys=True, default=str),
+            getattr(tool_info, "service_global_name", None),
+            getattr(tool_info, "tool_original_name", None),
+            getattr(tool_info, "service_name", None),
+        )
+
+    def apply(self, tools: Iterable['ToolInfo']) -> Tuple[int, int, int]:
+        """
+        将工具列表与已注册工具做差异比较并增量应用
+
+        Returns:
+            (新增数, 删除数, 变更数)
+        """
+        desired = {tool.name: tool for tool in tools}
+        added = removed = updated = 0
+        for name in [n for n in self._registered if n not in desired]:
+            if self._safe_unregister(name):
+                removed += 1
+            self._registered.pop(name, None)
+        for name, tool in desired.items():
+            fingerprint = self.fingerprint(tool)
+            current = self._registered.get(name)
+            if current == fingerprint:
+                continue
+            if current is not None:
+                self._safe_unregister(name)
+                self._registered.pop(name, None)
+            if self._register(tool):
+                self._registered[name] = fingerprint
+                if current is None:
+                    added += 1
+                else:
+                    updated += 1
+        stats = self._stats
+        stats.added += added
+        stats.removed += removed
+        stats.updated += updated
+        return added, removed, updated
+
+    def mark_dirty(self) -> None:
+        """请求一次同步（可从任意线程调用）"""
+        with self._lock:
+            self._pending = True
+            loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            pass
+
+    def on_views_changed(self, view_key: str) -> Callable[[Iterable[str]], None]:
+        """生成 ToolSnapshotManager 监听器：仅在 Hub 暴露的视图变更时请求同步"""
+        def _listener(view_keys: Iterable[str]) -> None:
+            if view_key in view_keys:
+                self.mark_dirty()
+        return _listener
+
+    async def run(self) -> None:
+        """在 Hub 服务器所在的事件循环中运行同步循环"""
+        wake = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._wake = wake
+            if self._pending:
+                wake.set()
+        try:
+            while True:
+                await wake.wait()
+                if self._debounce:
+                    await asyncio.sleep(self._debounce)
+                wake.clear()
+                with self._lock:
+                    self._pending = False
+                await self.sync_once()
+        finally:
+            with self._lock:
+                self._loop = None
+                self._wake = None
+
+    async def sync_once(self) -> Tuple[int, int, int]:
+        try:
+            tools = await self._list_tools()
+        except Exception as e:
+            self._stats.errors += 1
+            logger.warning(f"[HubMCPServer] [SYNC] Failed to read tool list: {e}")
+            return 0, 0, 0
+        self._stats.syncs += 1
+        changes = self.apply(tools)
+        if any(changes):
+            logger.info(
+                f"[HubMCPServer] [SYNC] Tool set updated - added: {changes[0]}, "
+                f"removed: {changes[1]}, updated: {changes[2]}"
+            )
+            await self._notify_sessions()
+        return changes
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._stats
+        return {
+            "registered": len(self._registered),
+            "sessions": len(self._sessions.sessions),
+            "syncs": stats.syncs,
+            "added": stats.added,
+            "removed": stats.removed,
+            "updated": stats.updated,
+            "notified": stats.notified,
+            "errors": stats.errors,
+        }
+
+    def _safe_unregister(self, name: str) -> bool:
+        try:
+            self._unregister(name)
+            return True
+        except Exception as e:
+            logger.debug(f"[HubMCPServer] [SYNC] Remove tool failed: {name} - {e}")
+            return False
+
+    async def _notify_sessions(self) -> None:
+        for session in self._sessions.sessions:
+            try:
+                await session.send_tool_list_changed()
+                self._stats.notified += 1
+            except Exception as e:
+                # 会话已断开
+                self._sessions.discard(session)
+                logger.debug(f"[HubMCPServer] [SYNC] Drop session after notify failure: {e}")
+
+
+__all__ = [
+    "HubSessionTracker",
+    "HubToolSync",
+    "HubToolSyncStats",
+]
@@ -35,6 +35,8 @@ class HubMCPConfig:
         port: 端口号（仅 http/sse），None 为自动分配
         host: 监听地址（仅 http/sse），默认 "0.0.0.0"
         path: 端点路径（仅 http），默认 "/mcp"
+        tool_sync: 运行期间是否跟随服务工具变化增量更新工具并通知客户端
+        tool_sync_debounce: 工具变化的去抖时间（秒）
         mcp_kwargs: 透传给底层 MCP 服务器（当前由 MCPKit 实现）的其他参数
     """
     
@@ -42,6 +44,8 @@ class HubMCPConfig:
     port: Optional[int] = None
     host: str = "0.0.0.0"
     path: str = "/mcp"
+    tool_sync: bool = True
+    tool_sync_debounce: float = 0.5
     mcp_kwargs: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -296,6 +296,12 @@ class ServiceContainer:
         if self._reconnection_enabled:
             await self._reconnection_scheduler.stop()
 
+        # 停止事件派发工作协程
+        try:
+            await self._event_bus.close()
+        except Exception as e:
+            logger.debug(f"Close event bus dispatcher failed: {e}")
+
         logger.info("ServiceContainer components stopped")
 
     def attach_event_syncer(self, event_syncer):
@@ -3,14 +3,19 @@ MCPOrchestrator Base Module
 Orchestrator core base module - contains infrastructure and lifecycle management
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 
 from mcpstore.config.json_config import MCPConfig
 from mcpstore.core.agents.session_manager import SessionManager
 from mcpstore.core.integration.local_service_adapter import get_local_service_manager
+from mcpstore.core.performance import ConnectionPoolManager, PoolConfig, ResourceCacheConfig, ResourceContentCache
 from mcpstore.core.registry import ServiceRegistry
+from mcpstore.core.cache.catalog_manager import CatalogConfig
+from mcpstore.core.registry.resource_index import ResourceIndex
+from mcpstore.core.utils.fan_out import FanOutConfig
 from mcpstore.core.store.client_manager import ClientManager
 from mcpstore.mcp import Client
 # Import mixin classes
@@ -101,6 +106,54 @@ class MCPOrchestrator(
         # 会话管理器
         self.session_manager = SessionManager()
 
+        # 非会话模式工具调用的长连接客户端池（features.client_pool）
+        features_config = config.get("features", {}) if isinstance(config.get("features"), dict) else {}
+        self.connection_pool = ConnectionPoolManager(PoolConfig.from_dict(features_config.get("client_pool")))
+
+        # 资源 / 提示词路由索引：按 Agent 视图缓存 URI / 模板 / 提示词名 -> 服务，目录或关系变更时失效
+        self.resource_index = ResourceIndex(self.client_manager.global_agent_store_id)
+        self.resource_index.attach(
+            relation_manager=getattr(self.registry, "_relation_manager", None),
+            catalog_manager=getattr(self.registry, "_cache_catalog_manager", None),
+        )
+        # 池化客户端收到 resources/prompts list_changed 通知时后台刷新目录；
+        # 收不到通知的服务按 features.catalog 的有效期在读取目录时刷新
+        self._catalog_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._catalog_refresh_dirty: Set[str] = set()
+        self.catalog_config = CatalogConfig.from_dict(features_config.get("catalog"))
+        self._catalog_refresh_attempts: Dict[str, float] = {}
+        self.connection_pool.add_notification_listener(self._on_pool_notification)
+
+        # 资源内容缓存（features.resource_cache）：按 (服务, URI) 缓存 read_resource 结果，
+        # 支持 resources/subscribe 的服务按更新通知失效，其余按 TTL 过期
+        self.resource_cache = ResourceContentCache(
+            ResourceCacheConfig.from_dict(features_config.get("resource_cache"))
+        )
+        self.resource_cache.attach(getattr(self.registry, "_cache_catalog_manager", None))
+
+        # 多服务聚合操作（同步、目录补齐、统计）的并发扇出上限（features.fan_out）
+        self.fan_out_config = FanOutConfig.from_dict(features_config.get("fan_out"))
+
+        # 工具调用前的存在性校验优先使用 pykv 中的工具关系（features.cached_tool_check）
+        self._cached_tool_check = bool(features_config.get("cached_tool_check", True))
+        self._tool_check_stats: Dict[str, int] = {
+            "remote_list_tools_calls": 0,
+            "remote_list_tools_saved": 0,
+        }
+
+        # pykv 写入批处理（features.cache_write_batching），默认关闭
+        cache_layer = getattr(self.registry, "_cache_layer_manager", None)
+        if cache_layer is not None:
+            from mcpstore.core.cache.write_batch import WriteBatchConfig
+            cache_layer.configure_write_batching(
+                WriteBatchConfig.from_dict(features_config.get("cache_write_batching"))
+            )
+
+        # 关系存储布局（features.relation_layout: "document" | "indexed"），默认 document
+        relation_manager = getattr(self.registry, "_relation_manager", None)
+        if relation_manager is not None:
+            relation_manager.configure_layout(features_config.get("relation_layout"))
+
         # 本地服务管理器
         self.local_service_manager = get_local_service_manager()
 
@@ -240,6 +293,16 @@ class MCPOrchestrator(
                 await self.sync_manager.stop()
                 self.sync_manager = None
 
+            # 停止目录刷新任务并关闭池化的 MCP 客户端
+            for task in list(self._catalog_refresh_tasks.values()):
+                task.cancel()
+            await self.connection_pool.close_all()
+
+            # 等待后台批量写入落盘
+            cache_layer = getattr(self.registry, "_cache_layer_manager", None)
+            if cache_layer is not None:
+                await cache_layer.drain_writes()
+
             # 🆕 事件驱动架构：停止 ServiceContainer
             if self.container:
                 logger.info("Stopping ServiceContainer components...")
@@ -255,6 +318,18 @@ class MCPOrchestrator(
         """关闭编排器并清理资源"""
         logger.info("Shutting down MCP Orchestrator...")
 
+        try:
+            await self.connection_pool.close_all()
+        except Exception as e:
+            logger.error(f"Error closing pooled clients: {e}")
+
+        try:
+            cache_layer = getattr(self.registry, "_cache_layer_manager", None)
+            if cache_layer is not None:
+                await cache_layer.drain_writes()
+        except Exception as e:
+            logger.error(f"Error draining cache write batches: {e}")
+
         # 🆕 事件驱动架构：停止 ServiceContainer
         try:
             if self.container:
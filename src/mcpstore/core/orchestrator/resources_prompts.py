@@ -6,9 +6,13 @@ Resources/Prompts模块 - 包含 MCP 的 Resources 和 Prompts 功能支持
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from mcpstore.core.utils.mcp_client_helpers import temp_client_for_service
+from mcp import types as mcp_types
+
+from mcpstore.core.registry.resource_index import AgentResourceIndex
+from mcpstore.core.utils.fan_out import fan_out, service_transport
+from mcpstore.core.utils.mcp_client_helpers import fetch_service_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +98,215 @@ class ResourcesPromptsMixin:
                 "details": {"error": "ToolsUpdateMonitor not available"}
             }
 
+    # === 资源 / 提示词目录 ===
+    # 目录在服务连接时写入 pykv（ServiceCatalogManager），收到 list_changed 通知或超过有效期后刷新；
+    # 列表直接读取目录，读取资源 / 获取提示词按 URI / 名称索引路由到所属服务的池化客户端
+
+    def _catalog_agent_id(self, client_id: Optional[str]) -> str:
+        return client_id or self.client_manager.global_agent_store_id
+
+    async def _get_resource_index_async(self, agent_id: str) -> AgentResourceIndex:
+        """
+        获取 Agent 视图的资源路由索引（命中缓存时无需读取 pykv）
+
+        目录缺失的服务（如目录功能上线前已连接）会远程补齐一次并写回 pykv。
+        """
+        cached = self.resource_index.get(agent_id)
+        if cached is not None:
+            self._refresh_stale_catalogs(cached)
+            return cached
+        generation = self.resource_index.generation
+
+        is_store = agent_id == self.client_manager.global_agent_store_id
+        agent_services = await self.registry._relation_manager.get_agent_services(agent_id)
+        services: List[Tuple[str, str]] = []
+        for svc in agent_services:
+            global_name = svc.get("service_global_name")
+            if not global_name:
+                continue
+            display_name = global_name if is_store else (svc.get("service_original_name") or global_name)
+            services.append((display_name, global_name))
+
+        catalogs = await self.registry._cache_catalog_manager.get_catalogs([g for _, g in services])
+        missing = [g for _, g in services if catalogs.get(g) is None]
+        if missing:
+            entities = await self.registry._cache_service_manager.get_many_services(missing)
+            transports = {
+                g: service_transport(e.config if e is not None else None)
+                for g, e in zip(missing, entities)
+            }
+            results = await fan_out(
+                missing,
+                self._refresh_service_catalog_async,
+                config=self.fan_out_config,
+                group=transports.get,
+                label=f"catalog_fill:{agent_id}",
+            )
+            for result in results:
+                if not result.ok:
+                    logger.warning(f"[CATALOG] Failed to load catalog for {result.item}: {result.error!r}")
+                    continue
+                catalogs[result.item] = result.value
+
+        index = AgentResourceIndex.build(
+            agent_id, [(d, g, catalogs.get(g)) for d, g in services]
+        )
+        # 有服务目录不可用时不缓存，下次调用重试补齐
+        if index.complete:
+            self.resource_index.put(agent_id, index, generation)
+        self._refresh_stale_catalogs(index)
+        return index
+
+    def _refresh_stale_catalogs(self, index: AgentResourceIndex) -> None:
+        """
+        后台刷新已过期的目录，本次调用仍使用现有目录
+
+        list_changed 通知只会出现在存活的池化客户端上：没有这样的客户端时按 catalog.ttl 刷新，
+        有时按 catalog.subscribed_ttl 兜底。刷新失败的服务同样等待一个有效期后再重试。
+        """
+        now = time.time()
+        for display_name, catalog in index.catalogs.items():
+            global_name = index.services.get(display_name)
+            if catalog is None or global_name is None or global_name in self._catalog_refresh_tasks:
+                continue
+            checked = max(catalog.updated_time, self._catalog_refresh_attempts.get(global_name, 0.0))
+            subscribed = self.connection_pool.has_live_client(global_name)
+            if self.catalog_config.is_stale(checked, subscribed, now):
+                logger.debug(f"[CATALOG] Catalog of {global_name} expired (subscribed={subscribed}), refreshing")
+                self._catalog_refresh_attempts[global_name] = now
+                self._schedule_catalog_refresh(global_name)
+
+    async def _resolve_catalog_service_async(
+        self,
+        index: AgentResourceIndex,
+        agent_id: str,
+        service_name: str
+    ) -> Optional[Tuple[str, str]]:
+        """将用户传入的服务名（本地名或全局名）解析为 (显示名, 全局名)"""
+        global_name = index.services.get(service_name)
+        if global_name is not None:
+            return service_name, global_name
+        global_name = await self.registry._resolve_global_name_async(agent_id, service_name)
+        if not global_name:
+            return None
+        for display_name, candidate in index.services.items():
+            if candidate == global_name:
+                return display_name, global_name
+        return service_name, global_name
+
+    async def _with_service_client(self, service_global_name: str, call):
+        """从连接池取出服务的长连接客户端执行 call(client)"""
+        service_entity = await self.registry._cache_service_manager.get_service(service_global_name)
+        if service_entity is None or not service_entity.config:
+            raise RuntimeError(f"Service configuration not found in pykv: {service_global_name}")
+        normalized_config = self._normalize_service_config(service_entity.config)
+        async with self.connection_pool.acquire(service_global_name, normalized_config) as client:
+            return await call(client)
+
+    async def _refresh_service_catalog_async(self, service_global_name: str, client: Any = None):
+        """
+        远程重新获取服务目录并写入 pykv
+
+        Args:
+            client: 优先使用的已连接客户端（发出 list_changed 通知的池化客户端），否则从连接池取出
+        """
+        service_entity = await self.registry._cache_service_manager.get_service(service_global_name)
+        if service_entity is None:
+            return None
+        if client is not None and client.is_connected():
+            catalog = await fetch_service_catalog(client, service_global_name)
+        else:
+            catalog = await self._with_service_client(
+                service_global_name,
+                lambda pooled: fetch_service_catalog(pooled, service_global_name),
+            )
+        self._catalog_refresh_attempts.pop(service_global_name, None)
+        logger.info(
+            f"[CATALOG] Refreshed catalog for {service_global_name}: "
+            f"resources={len(catalog['resources'])}, templates={len(catalog['resource_templates'])}, "
+            f"prompts={len(catalog['prompts'])}"
+        )
+        return await self.registry._cache_catalog_manager.put_catalog(
+            service_global_name,
+            service_entity.service_original_name,
+            service_entity.source_agent,
+            **catalog,
+        )
+
+    def _on_pool_notification(self, service_global_name: str, notification: Any, client: Any = None) -> None:
+        """连接池客户端收到服务端通知：资源更新时失效内容缓存，resources / prompts 列表变化时刷新目录"""
+        if isinstance(notification, mcp_types.ResourceUpdatedNotification):
+            self.resource_cache.invalidate(service_global_name, str(notification.params.uri))
+            return
+        if isinstance(notification, (mcp_types.ResourceListChangedNotification, mcp_types.PromptListChangedNotification)):
+            logger.debug(f"[CATALOG] {notification.method} from {service_global_name}")
+            self._schedule_catalog_refresh(service_global_name, client)
+
+    def _schedule_catalog_refresh(self, service_global_name: str, client: Any = None) -> None:
+        # 通知在客户端接收循环中回调，不能在此等待该客户端的请求，交给后台任务执行
+        if service_global_name in self._catalog_refresh_tasks:
+            self._catalog_refresh_dirty.add(service_global_name)
+            return
+        task = asyncio.get_running_loop().create_task(self._run_catalog_refresh(service_global_name, client))
+        self._catalog_refresh_tasks[service_global_name] = task
+
+    async def _run_catalog_refresh(self, service_global_name: str, client: Any = None) -> None:
+        try:
+            while True:
+                self._catalog_refresh_dirty.discard(service_global_name)
+                try:
+                    await self._refresh_service_catalog_async(service_global_name, client)
+                except Exception as e:
+                    logger.warning(f"[CATALOG] Failed to refresh catalog for {service_global_name}: {e}")
+                # 刷新期间又收到通知：再刷新一次，避免漏掉变化
+                if service_global_name not in self._catalog_refresh_dirty:
+                    break
+        finally:
+            self._catalog_refresh_tasks.pop(service_global_name, None)
+
+    async def _list_catalog_section_async(
+        self,
+        section: str,
+        service_name: Optional[str],
+        client_id: Optional[str]
+    ) -> Dict[str, Any]:
+        agent_id = self._catalog_agent_id(client_id)
+        index = await self._get_resource_index_async(agent_id)
+
+        if service_name:
+            ref = await self._resolve_catalog_service_async(index, agent_id, service_name)
+            if ref is None:
+                return {
+                    "success": False,
+                    "error": f"Service '{service_name}' not found or not configured",
+                    "data": [],
+                    "service_name": service_name,
+                    "timestamp": self._get_timestamp()
+                }
+            catalog = index.catalogs.get(ref[0])
+            if catalog is None:
+                catalog = await self._refresh_service_catalog_async(ref[1])
+            items = list(getattr(catalog, section, None) or [])
+            return {
+                "success": True,
+                "data": items,
+                "service_name": service_name,
+                "timestamp": self._get_timestamp(),
+                "count": len(items)
+            }
+
+        all_items = {
+            display_name: list(getattr(catalog, section, None) or [])
+            for display_name, catalog in index.catalogs.items()
+        }
+        return {
+            "success": True,
+            "data": all_items,
+            "timestamp": self._get_timestamp(),
+            "total_count": sum(len(items) for items in all_items.values()),
+            "services_count": len(all_items)
+        }
+
     # === Resources操作支持 ===
 
     def list_resources(
@@ -119,7 +332,7 @@ class ResourcesPromptsMixin:
         client_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        列出可用的资源（异步版本）
+        列出可用的资源（异步版本，读取 pykv 中的服务目录）
 
         Args:
             service_name: 特定服务名（可选）
@@ -129,58 +342,7 @@ class ResourcesPromptsMixin:
             Dict: 包含资源列表的响应
         """
         try:
-            if not client_id:
-                client_id = self.client_manager.global_agent_store_id
-
-            if service_name:
-                # 获取特定服务的资源
-                # 从Registry获取当前活跃会话
-                service_config = await self.registry.get_service_config_from_cache_async(client_id, service_name)
-                if not service_config:
-                    return {
-                        "success": False,
-                        "error": f"Service '{service_name}' not found or not configured",
-                        "data": [],
-                        "service_name": service_name,
-                        "timestamp": self._get_timestamp()
-                    }
-
-                async with temp_client_for_service(service_name, service_config) as client:
-                    resources = await client.list_resources()
-                return {
-                    "success": True,
-                    "data": [self._safe_model_dump(resource) for resource in resources],
-                    "service_name": service_name,
-                    "timestamp": self._get_timestamp(),
-                    "count": len(resources)
-                }
-            else:
-                # 获取所有服务的资源
-                all_resources = {}
-                services = self.registry.get_services(client_id)
-
-                for sname in services:
-                    try:
-                        s_config = await self.registry.get_service_config_from_cache_async(client_id, sname)
-                        if not s_config:
-                            all_resources[sname] = []
-                            continue
-                        async with temp_client_for_service(sname, s_config) as client:
-                            resources = await client.list_resources()
-                            all_resources[sname] = [self._safe_model_dump(resource) for resource in resources]
-                    except Exception as e:
-                        logger.warning(f"Failed to get resources from service {sname}: {e}")
-                        all_resources[sname] = []
-
-                total_count = sum(len(resources) for resources in all_resources.values())
-                return {
-                    "success": True,
-                    "data": all_resources,
-                    "timestamp": self._get_timestamp(),
-                    "total_count": total_count,
-                    "services_count": len(all_resources)
-                }
-
+            return await self._list_catalog_section_async("resources", service_name, client_id)
         except Exception as e:
             logger.error(f"Error listing resources: {e}")
             return {
@@ -213,7 +375,7 @@ class ResourcesPromptsMixin:
         client_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        列出可用的资源模板（异步版本）
+        列出可用的资源模板（异步版本，读取 pykv 中的服务目录）
 
         Args:
             service_name: 特定服务名（可选）
@@ -223,64 +385,14 @@ class ResourcesPromptsMixin:
             Dict: 包含资源模板列表的响应
         """
         try:
-            if not client_id:
-                client_id = self.client_manager.global_agent_store_id
-
-            if service_name:
-                # 获取特定服务的资源模板（使用临时client）
-                service_config = await self.registry.get_service_config_from_cache_async(client_id, service_name)
-                if not service_config:
-                    return {
-                        "success": False,
-                        "error": f"Service '{service_name}' not found or not configured",
-                        "data": [],
-                        "service_name": service_name,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    }
-
-                async with temp_client_for_service(service_name, service_config) as client:
-                    templates = await client.list_resource_templates()
-                return {
-                    "success": True,
-                    "data": [self._safe_model_dump(template) for template in templates],
-                    "service_name": service_name,
-                    "timestamp": self._get_timestamp(),
-                    "count": len(templates)
-                }
-            else:
-                # 获取所有服务的资源模板
-                all_templates = {}
-                services = self.registry.get_services(client_id)
-
-                for sname in services:
-                    try:
-                        s_config = await self.registry.get_service_config_from_cache_async(client_id, sname)
-                        if not s_config:
-                            all_templates[sname] = []
-                            continue
-                        async with temp_client_for_service(sname, s_config) as client:
-                            templates = await client.list_resource_templates()
-                            all_templates[sname] = [template.model_dump() for template in templates]
-                    except Exception as e:
-                        logger.warning(f"Failed to get resource templates from service {sname}: {e}")
-                        all_templates[sname] = []
-
-                total_count = sum(len(templates) for templates in all_templates.values())
-                return {
-                    "success": True,
-                    "data": all_templates,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "total_count": total_count,
-                    "services_count": len(all_templates)
-                }
-
+            return await self._list_catalog_section_async("resource_templates", service_name, client_id)
         except Exception as e:
             logger.error(f"Error listing resource templates: {e}")
             return {
                 "success": False,
                 "error": str(e),
                 "data": [],
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": self._get_timestamp()
             }
 
     def read_resource(
@@ -311,6 +423,9 @@ class ResourcesPromptsMixin:
         """
         读取资源内容（异步版本）
 
+        未指定服务时按 URI / URI 模板索引定位所属服务；内容经资源内容缓存读取
+        （features.resource_cache），响应中 cached 标记是否命中。
+
         Args:
             uri: 资源URI
             service_name: 特定服务名（可选）
@@ -330,66 +445,47 @@ class ResourcesPromptsMixin:
             }
 
         try:
-            if not client_id:
-                client_id = self.client_manager.global_agent_store_id
+            agent_id = self._catalog_agent_id(client_id)
+            index = await self._get_resource_index_async(agent_id)
 
             if service_name:
-                # 从特定服务读取资源（使用临时client）
-                service_config = await self.registry.get_service_config_from_cache_async(client_id, service_name)
-                if not service_config:
+                ref = await self._resolve_catalog_service_async(index, agent_id, service_name)
+                if ref is None:
                     return {
                         "success": False,
                         "error": f"Service '{service_name}' not found or not configured",
                         "data": None,
                         "uri": uri,
                         "service_name": service_name,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                        "timestamp": self._get_timestamp()
                     }
-
-                async with temp_client_for_service(service_name, service_config) as client:
-                    content = await client.read_resource(uri)
-                return {
-                    "success": True,
-                    "data": [self._safe_model_dump(item) for item in content],
-                    "uri": uri,
-                    "service_name": service_name,
-                    "timestamp": self._get_timestamp(),
-                    "content_count": len(content)
-                }
             else:
                 # TODO: 权限控制 - 后续考虑添加资源访问权限验证
-                # TODO: 缓存策略 - 后续考虑添加资源内容缓存
-
-                # 尝试从所有服务读取资源（找到第一个匹配的）
-                services = self.registry.get_services(client_id)
-                last_error = None
-
-                for sname in services:
-                    try:
-                        s_config = await self.registry.get_service_config_from_cache_async(client_id, sname)
-                        if not s_config:
-                            continue
-                        async with temp_client_for_service(sname, s_config) as client:
-                            content = await client.read_resource(uri)
-                            return {
-                                "success": True,
-                                "data": [item.model_dump() for item in content],
-                                "uri": uri,
-                                "service_name": sname,
-                                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                                "content_count": len(content)
-                            }
-                    except Exception as e:
-                        last_error = e
-                        continue
+                ref = index.resolve_resource(uri)
+                if ref is None:
+                    return {
+                        "success": False,
+                        "error": f"Resource '{uri}' not found in any service",
+                        "data": None,
+                        "uri": uri,
+                        "timestamp": self._get_timestamp()
+                    }
 
-                return {
-                    "success": False,
-                    "error": f"Resource '{uri}' not found in any service. Last error: {last_error}",
-                    "data": None,
-                    "uri": uri,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                }
+            data = self.resource_cache.get(ref[1], uri)
+            cached = data is not None
+            if not cached:
+                data = await self._with_service_client(
+                    ref[1], lambda client: self._read_resource_remote(client, ref[1], uri)
+                )
+            return {
+                "success": True,
+                "data": data,
+                "uri": uri,
+                "service_name": service_name or ref[0],
+                "timestamp": self._get_timestamp(),
+                "content_count": len(data),
+                "cached": cached
+            }
 
         except Exception as e:
             logger.error(f"Error reading resource {uri}: {e}")
@@ -398,9 +494,38 @@ class ResourcesPromptsMixin:
                 "error": str(e),
                 "data": None,
                 "uri": uri,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": self._get_timestamp()
             }
 
+    async def _read_resource_remote(self, client: Any, service_global_name: str, uri: str) -> List[Dict[str, Any]]:
+        """远程读取资源并写入内容缓存（服务支持时先订阅更新通知）"""
+        cache = self.resource_cache
+        version = cache.version(service_global_name)
+        subscriber = None
+        if cache.enabled and cache.config.subscribe and self._supports_resource_subscribe(client):
+            if not cache.subscribed(service_global_name, uri, client):
+                try:
+                    await client.session.subscribe_resource(uri)
+                    cache.mark_subscribed(service_global_name, uri, client)
+                except Exception as e:
+                    logger.debug(f"[RESOURCE_CACHE] subscribe failed service={service_global_name} uri={uri}: {e}")
+            if cache.subscribed(service_global_name, uri, client):
+                subscriber = client
+        content = await client.read_resource(uri)
+        data = [self._safe_model_dump(item) for item in content]
+        cache.put(service_global_name, uri, data, version, subscriber=subscriber)
+        return data
+
+    @staticmethod
+    def _supports_resource_subscribe(client: Any) -> bool:
+        capabilities = getattr(getattr(client, "initialize_result", None), "capabilities", None)
+        resources = getattr(capabilities, "resources", None)
+        return bool(getattr(resources, "subscribe", False))
+
+    def get_resource_cache_stats(self) -> Dict[str, Any]:
+        """资源内容缓存统计：命中 / 未命中次数与字节数"""
+        return self.resource_cache.get_stats()
+
     # === Prompts操作支持 ===
 
     def list_prompts(
@@ -426,7 +551,7 @@ class ResourcesPromptsMixin:
         client_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        列出可用的提示词（异步版本）
+        列出可用的提示词（异步版本，读取 pykv 中的服务目录）
 
         Args:
             service_name: 特定服务名（可选）
@@ -436,64 +561,14 @@ class ResourcesPromptsMixin:
             Dict: 包含提示词列表的响应
         """
         try:
-            if not client_id:
-                client_id = self.client_manager.global_agent_store_id
-
-            if service_name:
-                # 获取特定服务的提示词
-                service_config = await self.registry.get_service_config_from_cache_async(client_id, service_name)
-                if not service_config:
-                    return {
-                        "success": False,
-                        "error": f"Service '{service_name}' not found or not configured",
-                        "data": [],
-                        "service_name": service_name,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    }
-
-                async with temp_client_for_service(service_name, service_config) as client:
-                    prompts = await client.list_prompts()
-                return {
-                    "success": True,
-                    "data": [prompt.model_dump() for prompt in prompts],
-                    "service_name": service_name,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "count": len(prompts)
-                }
-            else:
-                # 获取所有服务的提示词
-                all_prompts = {}
-                services = self.registry.get_services(client_id)
-
-                for sname in services:
-                    try:
-                        s_config = await self.registry.get_service_config_from_cache_async(client_id, sname)
-                        if not s_config:
-                            all_prompts[sname] = []
-                            continue
-                        async with temp_client_for_service(sname, s_config) as client:
-                            prompts = await client.list_prompts()
-                            all_prompts[sname] = [prompt.model_dump() for prompt in prompts]
-                    except Exception as e:
-                        logger.warning(f"Failed to get prompts from service {sname}: {e}")
-                        all_prompts[sname] = []
-
-                total_count = sum(len(prompts) for prompts in all_prompts.values())
-                return {
-                    "success": True,
-                    "data": all_prompts,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "total_count": total_count,
-                    "services_count": len(all_prompts)
-                }
-
+            return await self._list_catalog_section_async("prompts", service_name, client_id)
         except Exception as e:
             logger.error(f"Error listing prompts: {e}")
             return {
                 "success": False,
                 "error": str(e),
                 "data": [],
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": self._get_timestamp()
             }
 
     def get_prompt(
@@ -527,6 +602,8 @@ class ResourcesPromptsMixin:
         """
         获取提示词内容（异步版本）
 
+        未指定服务时按提示词名称索引定位所属服务。
+
         Args:
             name: 提示词名称
             arguments: 提示词参数（可选）
@@ -536,73 +613,47 @@ class ResourcesPromptsMixin:
         Returns:
             Dict: 包含提示词内容的响应
         """
-        try:
-            if not client_id:
-                client_id = self.client_manager.global_agent_store_id
+        if arguments is None:
+            arguments = {}
 
-            if arguments is None:
-                arguments = {}
+        try:
+            agent_id = self._catalog_agent_id(client_id)
+            index = await self._get_resource_index_async(agent_id)
 
             if service_name:
-                # 从特定服务获取提示词（使用临时client）
-                service_config = await self.registry.get_service_config_from_cache_async(client_id, service_name)
-                if not service_config:
+                ref = await self._resolve_catalog_service_async(index, agent_id, service_name)
+                if ref is None:
                     return {
                         "success": False,
                         "error": f"Service '{service_name}' not found or not configured",
                         "data": None,
                         "name": name,
                         "service_name": service_name,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                        "timestamp": self._get_timestamp()
                     }
-
-                async with temp_client_for_service(service_name, service_config) as client:
-                    result = await client.get_prompt(name, arguments)
-                return {
-                    "success": True,
-                    "data": result.model_dump(),
-                    "name": name,
-                    "arguments": arguments,
-                    "service_name": service_name,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "message_count": len(result.messages)
-                }
             else:
                 # TODO: 权限控制 - 后续考虑添加提示词访问权限验证
-                # TODO: 缓存策略 - 后续考虑添加提示词内容缓存
-
-                # 尝试从所有服务获取提示词（找到第一个匹配的）
-                services = self.registry.get_services(client_id)
-                last_error = None
-
-                for sname in services:
-                    try:
-                        s_config = await self.registry.get_service_config_from_cache_async(client_id, sname)
-                        if not s_config:
-                            continue
-                        async with temp_client_for_service(sname, s_config) as client:
-                            result = await client.get_prompt(name, arguments)
-                            return {
-                                "success": True,
-                                "data": result.model_dump(),
-                                "name": name,
-                                "arguments": arguments,
-                                "service_name": sname,
-                                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                                "message_count": len(result.messages)
-                            }
-                    except Exception as e:
-                        last_error = e
-                        continue
+                ref = index.resolve_prompt(name)
+                if ref is None:
+                    return {
+                        "success": False,
+                        "error": f"Prompt '{name}' not found in any service",
+                        "data": None,
+                        "name": name,
+                        "arguments": arguments,
+                        "timestamp": self._get_timestamp()
+                    }
 
-                return {
-                    "success": False,
-                    "error": f"Prompt '{name}' not found in any service. Last error: {last_error}",
-                    "data": None,
-                    "name": name,
-                    "arguments": arguments,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                }
+            result = await self._with_service_client(ref[1], lambda client: client.get_prompt(name, arguments))
+            return {
+                "success": True,
+                "data": result.model_dump(),
+                "name": name,
+                "arguments": arguments,
+                "service_name": service_name or ref[0],
+                "timestamp": self._get_timestamp(),
+                "message_count": len(result.messages)
+            }
 
         except Exception as e:
             logger.error(f"Error getting prompt {name}: {e}")
@@ -612,5 +663,5 @@ class ResourcesPromptsMixin:
                 "data": None,
                 "name": name,
                 "arguments": arguments,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": self._get_timestamp()
             }
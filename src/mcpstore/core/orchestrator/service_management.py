@@ -166,11 +166,8 @@ class ServiceManagementMixin:
                 try:
                     if self.container:
                         hm = getattr(self.container, 'health_monitor', None)
-                        if hm and hasattr(hm, '_health_check_tasks'):
-                            task_key = (agent_key, service_name)
-                            task = hm._health_check_tasks.pop(task_key, None)
-                            if task and not task.done():
-                                task.cancel()
+                        if hm and hasattr(hm, 'unwatch_service'):
+                            hm.unwatch_service(agent_key, service_name)
                             logger.debug(f"[HEALTH] Unwatched removed service: {service_name} (agent={agent_key})")
                 except Exception as e:
                     logger.debug(f"[HEALTH] Unwatch removed service failed: {e}")
@@ -197,6 +194,9 @@ class ServiceManagementMixin:
                     service_global_name = service_name
                 
                 if service_global_name:
+                    # 关闭该服务的池化客户端
+                    await self.connection_pool.invalidate(service_global_name)
+
                     # 使用新的状态管理器删除服务状态
                     state_manager = self.registry._cache_state_manager
                     await state_manager.delete_service_status(service_global_name)
@@ -300,6 +300,17 @@ class ServiceManagementMixin:
             self.registry.set_service_metadata(agent_key, service_name, metadata)
             logger.debug(f" [RESTART_SERVICE] Reset metadata for '{service_name}'")
 
+            # Drop pooled clients so the next call reconnects to the restarted service
+            try:
+                if agent_key != self.client_manager.global_agent_store_id:
+                    pool_service_name = await self.registry.get_global_name_from_agent_service_async(agent_key, service_name)
+                else:
+                    pool_service_name = service_name
+                if pool_service_name:
+                    await self.connection_pool.invalidate(pool_service_name)
+            except Exception as e:
+                logger.debug(f" [RESTART_SERVICE] Pooled client invalidation failed: {e}")
+
             # Event-driven architecture: directly publish ServiceInitialized, let ConnectionManager handle connection
             try:
                 from mcpstore.core.events.service_events import ServiceInitialized
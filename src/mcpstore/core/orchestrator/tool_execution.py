@@ -117,35 +117,35 @@ class ToolExecutionMixin:
             
             logger.debug(f"[TOOL_EXECUTION] Getting service config from pykv entity layer: {service_name}")
 
-            # 标准化配置并创建 MCP 客户端
+            # 标准化配置，从连接池取出（或新建）长连接 MCP 客户端
             normalized_config = self._normalize_service_config(service_config)
-            client = Client({"mcpServers": {service_name: normalized_config}})
 
-            async with client:
-                # 验证工具存在
-                tools = await client.list_tools()
-
-                # 调试日志：验证工具存在
-                logger.debug(f"[MCP_DEBUG] lookup tool='{tool_name}'")
-                logger.debug(f"[MCP_DEBUG] service='{service_name}' tools:")
-                for i, tool in enumerate(tools):
-                    logger.debug(f"   {i+1}. {tool.name}")
-
-                if not any(t.name == tool_name for t in tools):
-                    available = [t.name for t in tools]
-                    suggestions = available[:3]
-                    logger.info(
-                        "[MCP_DEBUG] tool not found: tool='%s' service='%s' available=%s suggestions=%s",
-                        tool_name,
-                        service_name,
-                        available,
-                        suggestions,
-                    )
-                    raise ToolNotFoundException(
-                        tool_name,
-                        service_name,
-                        details={"suggestions": suggestions},
-                    )
+            async with self.connection_pool.acquire(service_name, normalized_config) as client:
+                # 验证工具存在：优先使用 pykv 关系层中的工具列表，缓存未命中时才远程 list_tools
+                if not await self._tool_known_in_cache(service_name, tool_name):
+                    tools = await self._remote_list_tools(client)
+
+                    # 调试日志：验证工具存在
+                    logger.debug(f"[MCP_DEBUG] lookup tool='{tool_name}'")
+                    logger.debug(f"[MCP_DEBUG] service='{service_name}' tools:")
+                    for i, tool in enumerate(tools):
+                        logger.debug(f"   {i+1}. {tool.name}")
+
+                    if not any(t.name == tool_name for t in tools):
+                        available = [t.name for t in tools]
+                        suggestions = available[:3]
+                        logger.info(
+                            "[MCP_DEBUG] tool not found: tool='%s' service='%s' available=%s suggestions=%s",
+                            tool_name,
+                            service_name,
+                            available,
+                            suggestions,
+                        )
+                        raise ToolNotFoundException(
+                            tool_name,
+                            service_name,
+                            details={"suggestions": suggestions},
+                        )
 
                 # 使用 MCP 规范执行器执行工具（标准 canonical 名称）
                 result = await executor.execute_tool(
@@ -274,25 +274,26 @@ class ToolExecutionMixin:
             except Exception as e:
                 logger.warning(f"[SESSION_EXECUTION] Client reconnect check failed: {e}")
 
-            # 验证工具存在
-            t_list0 = _t.perf_counter()
-            tools = await client.list_tools()
-            t_list1 = _t.perf_counter()
-            logger.debug(f"[TIMING] client.list_tools(): {(t_list1 - t_list0):.3f}s")
-
-            if not any(t.name == tool_name for t in tools):
-                available_tools = [t.name for t in tools]
-                suggestions = available_tools[:3]
-                msg = (
-                    f"Tool '{tool_name}' not found in service '{service_name}'. "
-                    f"Available: {available_tools}. Suggestions: {suggestions}"
-                )
-                logger.info(msg)
-                raise ToolNotFoundException(
-                    tool_name,
-                    service_name,
-                    details={"suggestions": suggestions},
-                )
+            # 验证工具存在（缓存未命中时才远程 list_tools）
+            if not await self._tool_known_in_cache(service_name, tool_name):
+                t_list0 = _t.perf_counter()
+                tools = await self._remote_list_tools(client)
+                t_list1 = _t.perf_counter()
+                logger.debug(f"[TIMING] client.list_tools(): {(t_list1 - t_list0):.3f}s")
+
+                if not any(t.name == tool_name for t in tools):
+                    available_tools = [t.name for t in tools]
+                    suggestions = available_tools[:3]
+                    msg = (
+                        f"Tool '{tool_name}' not found in service '{service_name}'. "
+                        f"Available: {available_tools}. Suggestions: {suggestions}"
+                    )
+                    logger.info(msg)
+                    raise ToolNotFoundException(
+                        tool_name,
+                        service_name,
+                        details={"suggestions": suggestions},
+                    )
 
             # 使用 MCP 规范执行器执行工具（不进入 async with，保持连接）
             t_exec0 = _t.perf_counter()
@@ -320,6 +321,36 @@ class ToolExecutionMixin:
                 raise
             raise Exception(f"Session tool execution failed: {str(e)}")
 
+    async def _tool_known_in_cache(self, service_name: str, tool_name: str) -> bool:
+        """
+        使用 pykv 关系层中已同步的工具列表判断工具是否存在
+
+        仅在命中时返回 True；未命中（或缓存不可用）时返回 False，由调用方回退到远程 list_tools。
+        """
+        if not self._cached_tool_check:
+            return False
+        try:
+            tool_relations = await self.registry._relation_manager.get_service_tools(service_name)
+        except Exception as e:
+            logger.debug(f"[TOOL_CHECK] cached lookup failed service='{service_name}': {e}")
+            return False
+        if any(item.get("tool_original_name") == tool_name for item in tool_relations):
+            self._tool_check_stats["remote_list_tools_saved"] += 1
+            return True
+        return False
+
+    async def _remote_list_tools(self, client):
+        """远程 list_tools（缓存未命中时的回退路径）"""
+        self._tool_check_stats["remote_list_tools_calls"] += 1
+        return await client.list_tools()
+
+    def get_tool_check_stats(self) -> Dict[str, Any]:
+        """工具存在性校验统计：远程 list_tools 次数与被缓存节省的次数"""
+        return {
+            "enabled": self._cached_tool_check,
+            **self._tool_check_stats,
+        }
+
     async def _create_persistent_client(self, session, service_name: str):
         """
         创建持久的 MCP Client 并缓存到会话中
@@ -357,12 +388,17 @@ class ToolExecutionMixin:
             # 标准化配置
             normalized_config = self._normalize_service_config(service_config)
             
-            # Create MCP Client (utilize its reentrant feature)
-            client = Client({"mcpServers": {service_name: normalized_config}})
-            
-            # Start persistent connection (correct usage of MCP Client)
-            # 注意：我们调用_connect()而不是使用async with，这样连接会保持活跃
-            await client._connect()
+            # 优先使用连接池中预热好的 standby 客户端（features.client_pool.warm_*），避免冷启动
+            client = await self.connection_pool.take(service_name, normalized_config)
+            if client is None:
+                # Create MCP Client (utilize its reentrant feature)
+                client = Client({"mcpServers": {service_name: normalized_config}})
+
+                # Start persistent connection (correct usage of MCP Client)
+                # 注意：我们调用_connect()而不是使用async with，这样连接会保持活跃
+                await client._connect()
+            else:
+                logger.debug(f"[SESSION_EXECUTION] Using warm standby client for service '{service_name}'")
             
             # 缓存到会话中
             session.add_service(service_name, client)
@@ -374,6 +410,19 @@ class ToolExecutionMixin:
             logger.error(f"[SESSION_EXECUTION] Failed to create persistent client for service '{service_name}': {e}")
             raise
 
+    async def prewarm_service_clients_async(self, service_global_name: str) -> bool:
+        """
+        为启用 warm standby 的服务在后台预启动客户端（服务连接成功后调用）
+
+        Returns:
+            bool: 服务是否配置了 standby（未配置时不做任何事）
+        """
+        service_entity = await self.registry._cache_service_manager.get_service(service_global_name)
+        if service_entity is None or not service_entity.config:
+            return False
+        normalized_config = self._normalize_service_config(service_entity.config)
+        return await self.connection_pool.prewarm(service_global_name, normalized_config)
+
 # 这些方法已移除 - 使用MCP Client的内置连接管理
 
     async def cleanup(self):
@@ -2,25 +2,10 @@ from collections import defaultdict
 from typing import Dict, Any
 
 from .cache import LRUCache
+from .connection_pool import ConnectionPoolManager, PoolConfig
 from .discovery_cache import ServiceDiscoveryCache
 from .prefetch import PrefetchManager
-
-
-class ConnectionPoolManager:
-    """Simple connection pool skeleton (service-name keyed)."""
-
-    def __init__(self, max_connections: int = 50):
-        self.max_connections = max_connections
-        # Lazy-initialized per-service pools and counters
-        self._pools: Dict[str, Any] = {}
-        self._connection_counts: Dict[str, int] = defaultdict(int)
-
-    # Placeholders for future concrete implementations
-    async def get_connection(self, service_name: str):  # pragma: no cover - behavior depends on adapters
-        return None
-
-    async def return_connection(self, service_name: str, connection: Any):  # pragma: no cover
-        return None
+from .resource_cache import ResourceCacheConfig, ResourceContentCache
 
 
 class PerformanceOptimizer:
@@ -51,7 +36,7 @@ class PerformanceOptimizer:
                 "hit_rate": service_cache_stats.hit_rate,
                 "entries": service_cache_stats.entry_count,
             },
-            "connection_pools": dict(self.connection_pool._connection_counts),
+            "connection_pools": self.connection_pool.get_stats(),
             "tool_metrics": {
                 tool: {
                     "avg_execution_time": sum(m["execution_time"] for m in metrics) / len(metrics),
@@ -78,6 +63,9 @@ __all__ = [
     "ServiceDiscoveryCache",
     "PrefetchManager",
     "ConnectionPoolManager",
+    "PoolConfig",
+    "ResourceContentCache",
+    "ResourceCacheConfig",
     "PerformanceOptimizer",
     "get_performance_optimizer",
 ]
@@ -0,0 +1,603 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolConfig:
+    """Per-service client pool settings."""
+    enabled: bool = True
+    min_idle: int = 0
+    max_idle: int = 2
+    idle_timeout: float = 300.0
+    # Ping an idle client before handing it out only if it sat idle this long
+    validate_after_idle: float = 30.0
+    validate_timeout: float = 5.0
+    sweep_interval: float = 30.0
+    close_timeout: float = 5.0
+    # Warm standby (opt-in): connected, never-used clients kept ready per stdio
+    # service so cold starts (interpreter / npx / uvx resolution) happen ahead
+    # of demand; refilled in the background after every handout
+    warm_standby: int = 0
+    # Per-service standby counts (service global name -> K); override
+    # warm_standby and apply to any transport
+    warm_services: Dict[str, int] = field(default_factory=dict)
+    # Retire a client after this many checkouts / seconds since spawn (0: never)
+    max_uses: int = 0
+    max_lifetime: float = 0.0
+    spawn_timeout: float = 60.0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "PoolConfig":
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    spawns: int = 0
+    spawn_failures: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    validation_failures: int = 0
+    discarded: int = 0
+    notifications: int = 0
+    warm_spawns: int = 0
+    standby_hits: int = 0
+    handoffs: int = 0
+    retired: int = 0
+    spawn_seconds_total: float = 0.0
+    spawn_seconds_max: float = 0.0
+    spawn_seconds_last: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    @property
+    def spawn_seconds_avg(self) -> float:
+        return self.spawn_seconds_total / self.spawns if self.spawns > 0 else 0.0
+
+
+@dataclass
+class PooledClient:
+    client: Any
+    key: Tuple[str, str]
+    loop: Optional[asyncio.AbstractEventLoop]
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    # Last successful ping (health checks ping idle clients without using them)
+    last_validated: float = 0.0
+    uses: int = 0
+    # Spawned ahead of demand by the warm standby refill
+    warm: bool = False
+    spawn_seconds: float = 0.0
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """Stable hash of a normalized service config."""
+    payload = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _default_client_factory(service_name: str, config: Dict[str, Any], message_handler: Any = None):
+    from mcpstore.mcp import Client
+    return Client({"mcpServers": {service_name: config}}, message_handler=message_handler)
+
+
+class _PoolMessageHandler:
+    """Forwards server notifications of a pooled client to the pool's listeners.
+
+    Keeps the client's default task-notification handling by delegating to it.
+    """
+
+    def __init__(self, pool: "ConnectionPoolManager", service_name: str):
+        self._pool = pool
+        self._service_name = service_name
+        self._inner: Any = None
+        self._client_ref: Optional[weakref.ref] = None
+
+    def bind(self, client: Any) -> None:
+        from mcpstore.mcp.client.tasks import TaskNotificationHandler
+        self._inner = TaskNotificationHandler(client)
+        self._client_ref = weakref.ref(client)
+
+    async def __call__(self, message: Any) -> None:
+        if self._inner is not None:
+            await self._inner.dispatch(message)
+        from mcp import types as mcp_types
+        if isinstance(message, mcp_types.ServerNotification):
+            client = self._client_ref() if self._client_ref is not None else None
+            self._pool._dispatch_notification(self._service_name, message.root, client)
+
+
+class ConnectionPoolManager:
+    """Pool of long-lived MCP clients keyed by (service global name, config hash).
+
+    Clients are handed out through ``acquire()`` and returned automatically.
+    A config change for a service invalidates every client built from the old
+    config; idle clients beyond ``max_idle`` or older than ``idle_timeout``
+    are closed (keeping at least ``min_idle`` per key).
+
+    Pooled clients stay connected between uses, so server notifications
+    (``*/list_changed`` etc.) arriving on them are passed to listeners
+    registered with ``add_notification_listener()``. Clients from a custom
+    ``client_factory`` are not hooked.
+
+    Services with a warm standby target (``warm_standby`` for stdio services,
+    ``warm_services`` per service) keep that many never-used clients in the
+    idle list. ``acquire()`` prefers reused clients and falls back to a
+    standby one; ``take()`` hands a standby client out of the pool for good
+    (session-bound clients must not inherit another caller's process state).
+    Every handout, retirement or failed client schedules a background refill.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PoolConfig] = None,
+        client_factory: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+    ):
+        self.config = config or PoolConfig()
+        self._client_factory = client_factory or _default_client_factory
+        self._idle: Dict[Tuple[str, str], List[PooledClient]] = defaultdict(list)
+        self._in_use: Dict[Tuple[str, str], int] = defaultdict(int)
+        # service global name -> config hash currently in effect
+        self._current_hash: Dict[str, str] = {}
+        self._stats = PoolStats()
+        self._last_sweep = time.monotonic()
+        self._notification_listeners: List[Callable[[str, Any, Any], None]] = []
+        # key -> service config used to refill the warm standby
+        self._warm_configs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._refill_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def add_notification_listener(self, listener: Callable[[str, Any, Any], None]) -> None:
+        """Register ``listener(service_name, notification, client)`` for server notifications.
+
+        ``client`` is the pooled client that received the notification (for
+        stdio services, the process whose state changed). Listeners run inside
+        the client's receive loop: they must not await requests on that client
+        and should hand real work off to a task.
+        """
+        if listener not in self._notification_listeners:
+            self._notification_listeners.append(listener)
+
+    def standby_target(self, service_name: str, service_config: Dict[str, Any]) -> int:
+        """Number of warm standby clients to keep for a service (0: disabled)."""
+        if not self.config.enabled:
+            return 0
+        if service_name in self.config.warm_services:
+            return max(0, int(self.config.warm_services[service_name] or 0))
+        if self.config.warm_standby and (service_config or {}).get("command"):
+            return max(0, int(self.config.warm_standby))
+        return 0
+
+    async def prewarm(self, service_name: str, service_config: Dict[str, Any]) -> bool:
+        """Start filling the warm standby of a service in the background.
+
+        Returns False when the service has no standby target.
+        """
+        key = (service_name, config_fingerprint(service_config))
+        await self._invalidate_stale(service_name, key[1])
+        return self._schedule_refill(key, service_config)
+
+    async def take(self, service_name: str, service_config: Dict[str, Any]) -> Optional[Any]:
+        """Hand a never-used standby client out of the pool (caller owns and closes it).
+
+        Returns None when no standby client is ready, so the caller connects
+        its own client as before.
+        """
+        key = (service_name, config_fingerprint(service_config))
+        await self._invalidate_stale(service_name, key[1])
+        idle = self._idle.get(key)
+        loop = asyncio.get_running_loop()
+        entry = None
+        if idle:
+            for candidate in list(idle):
+                if candidate.uses or candidate.loop is not loop:
+                    continue
+                idle.remove(candidate)
+                if self._is_alive(candidate.client) and not self._should_retire(candidate, time.monotonic()):
+                    entry = candidate
+                    break
+                await self._discard(candidate)
+        self._schedule_refill(key, service_config)
+        if entry is None:
+            return None
+        self._stats.standby_hits += 1
+        self._stats.handoffs += 1
+        return entry.client
+
+    @asynccontextmanager
+    async def acquire(self, service_name: str, service_config: Dict[str, Any]):
+        """Check out a connected client for ``service_name``; returned on exit."""
+        key = (service_name, config_fingerprint(service_config))
+        await self._invalidate_stale(service_name, key[1])
+        await self._maybe_sweep()
+
+        entry = await self._checkout_idle(key)
+        if entry is None:
+            self._stats.misses += 1
+            entry = await self._spawn(key, service_config)
+        else:
+            self._stats.hits += 1
+            if entry.uses == 0 and entry.warm:
+                self._stats.standby_hits += 1
+        self._schedule_refill(key, service_config)
+
+        self._in_use[key] += 1
+        try:
+            yield entry.client
+        finally:
+            self._in_use[key] -= 1
+            if self._in_use[key] <= 0:
+                self._in_use.pop(key, None)
+            await self._release(entry)
+
+    async def ping(self, service_name: str, timeout: float) -> Optional[bool]:
+        """Ping an idle client of ``service_name`` in place, without checking it out.
+
+        Returns None when no live idle client exists on the running loop, so the
+        caller can fall back to a probe connection. A client that fails the ping
+        is dropped from the pool.
+        """
+        config_hash = self._current_hash.get(service_name)
+        if config_hash is None:
+            return None
+        key = (service_name, config_hash)
+        loop = asyncio.get_running_loop()
+        entry = next(
+            (e for e in reversed(self._idle.get(key, [])) if e.loop is loop and self._is_alive(e.client)),
+            None,
+        )
+        if entry is None:
+            return None
+
+        try:
+            ok = bool(await asyncio.wait_for(entry.client.ping(), timeout=timeout))
+        except Exception as e:
+            logger.debug(f"[CLIENT_POOL] health ping failed service={service_name}: {e}")
+            ok = False
+        if ok:
+            entry.last_validated = time.monotonic()
+            return True
+
+        self._stats.validation_failures += 1
+        idle = self._idle.get(key)
+        if idle and entry in idle:
+            idle.remove(entry)
+            await self._discard(entry)
+        self._schedule_refill(key)
+        return False
+
+    async def invalidate(self, service_name: str) -> int:
+        """Close all idle clients of a service (e.g. after removal or restart)."""
+        self._current_hash.pop(service_name, None)
+        self._stop_refill([k for k in self._warm_configs if k[0] == service_name])
+        keys = [k for k in self._idle if k[0] == service_name]
+        closed = 0
+        for key in keys:
+            for entry in self._idle.pop(key, []):
+                await self._close_entry(entry)
+                closed += 1
+        if closed:
+            self._stats.invalidations += closed
+            logger.debug(f"[CLIENT_POOL] invalidated {closed} idle client(s) of service={service_name}")
+        return closed
+
+    async def close_all(self) -> None:
+        """Close every idle client; clients in use are closed when released."""
+        self._current_hash.clear()
+        self._stop_refill(list(self._warm_configs))
+        idle, self._idle = self._idle, defaultdict(list)
+        for entries in idle.values():
+            for entry in entries:
+                await self._close_entry(entry)
+
+    def has_live_client(self, service_name: str) -> bool:
+        """True when a connected pooled client of the service's current config exists.
+
+        Such a client forwards the server's ``*/list_changed`` notifications to
+        the listeners; clients from a custom ``client_factory`` do not count.
+        """
+        if self._client_factory is not _default_client_factory:
+            return False
+        config_hash = self._current_hash.get(service_name)
+        if config_hash is None:
+            return False
+        key = (service_name, config_hash)
+        if self._in_use.get(key):
+            return True
+        return any(self._is_alive(entry.client) for entry in self._idle.get(key, ()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        s = self._stats
+        return {
+            "enabled": self.config.enabled,
+            "hits": s.hits,
+            "misses": s.misses,
+            "spawns": s.spawns,
+            "spawn_failures": s.spawn_failures,
+            "evictions": s.evictions,
+            "invalidations": s.invalidations,
+            "validation_failures": s.validation_failures,
+            "discarded": s.discarded,
+            "notifications": s.notifications,
+            "hit_rate": s.hit_rate,
+            "warm_spawns": s.warm_spawns,
+            "standby_hits": s.standby_hits,
+            "handoffs": s.handoffs,
+            "retired": s.retired,
+            "spawn_latency": {
+                "count": s.spawns,
+                "avg": s.spawn_seconds_avg,
+                "max": s.spawn_seconds_max,
+                "last": s.spawn_seconds_last,
+            },
+            "idle": {f"{k[0]}#{k[1]}": len(v) for k, v in self._idle.items() if v},
+            "standby": {
+                f"{k[0]}#{k[1]}": sum(1 for e in v if e.uses == 0)
+                for k, v in self._idle.items() if k in self._warm_configs
+            },
+            "in_use": {f"{k[0]}#{k[1]}": n for k, n in self._in_use.items() if n},
+        }
+
+    # ---- internals ----
+
+    async def _invalidate_stale(self, service_name: str, config_hash: str) -> None:
+        previous = self._current_hash.get(service_name)
+        if previous == config_hash:
+            return
+        if previous is not None:
+            logger.info(f"[CLIENT_POOL] config changed for service={service_name}, dropping old clients")
+            await self.invalidate(service_name)
+        self._current_hash[service_name] = config_hash
+
+    async def _checkout_idle(self, key: Tuple[str, str]) -> Optional[PooledClient]:
+        idle = self._idle.get(key)
+        loop = asyncio.get_running_loop()
+        while idle:
+            # LIFO: the most recently used client is the most likely to be healthy
+            entry = idle.pop()
+            if entry.loop is not loop or not self._is_alive(entry.client):
+                await self._discard(entry)
+                continue
+            if self._should_retire(entry, time.monotonic()):
+                await self._retire(entry)
+                continue
+            idle_for = time.monotonic() - max(entry.last_used, entry.last_validated)
+            if idle_for >= self.config.validate_after_idle and not await self._validate(entry):
+                self._stats.validation_failures += 1
+                await self._discard(entry)
+                continue
+            return entry
+        return None
+
+    def _dispatch_notification(self, service_name: str, notification: Any, client: Any = None) -> None:
+        self._stats.notifications += 1
+        for listener in self._notification_listeners:
+            try:
+                listener(service_name, notification, client)
+            except Exception as e:
+                logger.debug(f"[CLIENT_POOL] notification listener failed service={service_name}: {e}")
+
+    async def _spawn(self, key: Tuple[str, str], service_config: Dict[str, Any]) -> PooledClient:
+        if self._client_factory is _default_client_factory:
+            handler = _PoolMessageHandler(self, key[0])
+            client = _default_client_factory(key[0], service_config, message_handler=handler)
+            handler.bind(client)
+        else:
+            client = self._client_factory(key[0], service_config)
+        t0 = time.perf_counter()
+        try:
+            await client._connect()
+        except BaseException:
+            self._stats.spawn_failures += 1
+            raise
+        elapsed = time.perf_counter() - t0
+        self._stats.spawns += 1
+        self._stats.spawn_seconds_total += elapsed
+        self._stats.spawn_seconds_last = elapsed
+        self._stats.spawn_seconds_max = max(self._stats.spawn_seconds_max, elapsed)
+        logger.debug(f"[CLIENT_POOL] spawned client service={key[0]} in {elapsed:.3f}s")
+        return PooledClient(client=client, key=key, loop=asyncio.get_running_loop(), spawn_seconds=elapsed)
+
+    async def _release(self, entry: PooledClient) -> None:
+        entry.last_used = time.monotonic()
+        entry.uses += 1
+        key = entry.key
+        if self._should_retire(entry, entry.last_used):
+            await self._retire(entry)
+            return
+        # max_idle bounds reused clients; standby clients are bounded by their target
+        reused = sum(1 for e in self._idle[key] if e.uses)
+        if (
+            not self.config.enabled
+            or self._current_hash.get(key[0]) != key[1]
+            or not self._is_alive(entry.client)
+            or reused >= self.config.max_idle
+        ):
+            await self._discard(entry)
+            return
+        self._idle[key].append(entry)
+
+    async def _validate(self, entry: PooledClient) -> bool:
+        try:
+            return bool(await asyncio.wait_for(entry.client.ping(), timeout=self.config.validate_timeout))
+        except Exception as e:
+            logger.debug(f"[CLIENT_POOL] validation ping failed service={entry.key[0]}: {e}")
+            return False
+
+    async def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.config.sweep_interval:
+            return
+        self._last_sweep = now
+        for key in list(self._idle.keys()):
+            entries = self._idle[key]
+            retired = [e for e in entries if self._should_retire(e, now)]
+            entries = [e for e in entries if e not in retired]
+            for entry in retired:
+                await self._retire(entry)
+            # Standby clients are kept until they are used or reach max_lifetime
+            standby = [e for e in entries if e.uses == 0 and key in self._warm_configs]
+            entries = [e for e in entries if e not in standby]
+            keep = [e for e in entries if now - e.last_used < self.config.idle_timeout]
+            expired = [e for e in entries if now - e.last_used >= self.config.idle_timeout]
+            # Honour min_idle: keep the freshest expired clients if needed
+            shortfall = max(0, self.config.min_idle - len(keep))
+            if shortfall:
+                expired.sort(key=lambda e: e.last_used)
+                keep = expired[len(expired) - shortfall:] + keep
+                expired = expired[:len(expired) - shortfall]
+            if keep or standby:
+                keep.sort(key=lambda e: e.last_used)
+                # Standby first: LIFO checkout prefers reused clients
+                self._idle[key] = standby + keep
+            else:
+                self._idle.pop(key, None)
+            for entry in expired:
+                self._stats.evictions += 1
+                await self._close_entry(entry)
+            if retired:
+                self._schedule_refill(key)
+
+    def _should_retire(self, entry: PooledClient, now: float) -> bool:
+        if self.config.max_uses and entry.uses >= self.config.max_uses:
+            return True
+        if self.config.max_lifetime and now - entry.created_at >= self.config.max_lifetime:
+            return True
+        return False
+
+    async def _retire(self, entry: PooledClient) -> None:
+        self._stats.retired += 1
+        logger.debug(
+            f"[CLIENT_POOL] retiring client service={entry.key[0]} uses={entry.uses} "
+            f"age={(time.monotonic() - entry.created_at):.1f}s"
+        )
+        # Closing a stdio process takes a while; keep it off the caller's path
+        task = asyncio.get_running_loop().create_task(self._close_entry(entry))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        self._schedule_refill(entry.key)
+
+    def _schedule_refill(self, key: Tuple[str, str], service_config: Optional[Dict[str, Any]] = None) -> bool:
+        """Start a background refill of the warm standby for ``key`` if it has a target."""
+        if service_config is not None:
+            if self.standby_target(key[0], service_config) <= 0:
+                self._warm_configs.pop(key, None)
+                return False
+            self._warm_configs[key] = service_config
+        service_config = self._warm_configs.get(key)
+        if service_config is None:
+            return False
+        task = self._refill_tasks.get(key)
+        if task is not None and not task.done():
+            return True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._refill_tasks[key] = loop.create_task(self._refill(key, service_config))
+        return True
+
+    async def _refill(self, key: Tuple[str, str], service_config: Dict[str, Any]) -> None:
+        loop = asyncio.get_running_loop()
+        target = self.standby_target(key[0], service_config)
+        failures = 0
+        while self._current_hash.get(key[0]) == key[1] and key in self._warm_configs:
+            ready = sum(
+                1 for e in self._idle.get(key, [])
+                if e.uses == 0 and e.loop is loop and self._is_alive(e.client)
+            )
+            if ready >= target:
+                return
+            try:
+                entry = await asyncio.wait_for(self._spawn(key, service_config), timeout=self.config.spawn_timeout)
+            except Exception as e:
+                failures += 1
+                logger.warning(f"[CLIENT_POOL] warm spawn failed service={key[0]} attempt={failures}: {e}")
+                if failures >= 3:
+                    return
+                await asyncio.sleep(min(30.0, 2.0 ** failures))
+                continue
+            failures = 0
+            entry.warm = True
+            self._stats.warm_spawns += 1
+            if self._current_hash.get(key[0]) != key[1] or key not in self._warm_configs:
+                await self._discard(entry)
+                return
+            # Standby entries sit at the front; LIFO checkout prefers reused clients
+            self._idle[key].insert(0, entry)
+            logger.debug(f"[CLIENT_POOL] warm standby ready service={key[0]} ({ready + 1}/{target})")
+
+    def _stop_refill(self, keys: List[Tuple[str, str]]) -> None:
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for key in keys:
+            self._warm_configs.pop(key, None)
+            task = self._refill_tasks.pop(key, None)
+            if task is None or task.done():
+                continue
+            task_loop = task.get_loop()
+            if task_loop is current:
+                task.cancel()
+            elif task_loop.is_running():
+                task_loop.call_soon_threadsafe(task.cancel)
+
+    async def _discard(self, entry: PooledClient) -> None:
+        self._stats.discarded += 1
+        await self._close_entry(entry)
+
+    async def _close_entry(self, entry: PooledClient) -> None:
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        try:
+            if entry.loop is None or entry.loop is current:
+                await asyncio.wait_for(entry.client.close(), timeout=self.config.close_timeout)
+            elif entry.loop.is_running():
+                # The session task lives on the loop that created it
+                asyncio.run_coroutine_threadsafe(entry.client.close(), entry.loop)
+        except Exception as e:
+            logger.debug(f"[CLIENT_POOL] error closing client service={entry.key[0]}: {e}")
+
+    @staticmethod
+    def _is_alive(client: Any) -> bool:
+        try:
+            if not client.is_connected():
+                return False
+            task = client._session_state.session_task
+            return task is not None and not task.done()
+        except Exception:
+            return False
+
+
+__all__ = [
+    "PoolConfig",
+    "PoolStats",
+    "PooledClient",
+    "ConnectionPoolManager",
+    "config_fingerprint",
+]
@@ -0,0 +1,270 @@
+"""
+Resource Content Cache - size-bounded LRU of read_resource results
+
+read_resource used to round-trip to the server on every call, even for
+resources that rarely change. ResourceContentCache keeps the returned
+contents per (service global name, uri) in an LRU bounded by total content
+size. Entries are invalidated by resources/updated notifications on
+subscribed URIs, by the service's catalog changes (reconnect,
+list_changed, removal), or they expire by TTL. A read that started before an
+invalidation of its service is not stored.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ResourceKey = Tuple[str, str]
+
+
+@dataclass
+class ResourceCacheConfig:
+    """Resource content cache settings (features.resource_cache)."""
+    enabled: bool = True
+    # Total budget for cached content, counted in text / base64 characters
+    max_bytes: int = 64 * 1024 * 1024
+    # Larger resources are passed through without caching
+    max_entry_bytes: int = 8 * 1024 * 1024
+    # Lifetime of entries without a live resources/subscribe subscription
+    ttl: float = 30.0
+    # Upper bound for subscribed entries, in case an update notification is lost
+    subscribed_ttl: float = 600.0
+    # Subscribe to resources/updated for cached URIs when the server supports it
+    subscribe: bool = True
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ResourceCacheConfig":
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+@dataclass
+class ResourceCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    skipped_large: int = 0
+    expired: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    stale_puts: int = 0
+    subscriptions: int = 0
+    bytes_served: int = 0
+    bytes_fetched: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+@dataclass
+class _Entry:
+    contents: Tuple[Dict[str, Any], ...]
+    size: int
+    stored_at: float
+    # Pooled client holding the resources/subscribe subscription (None: TTL only)
+    subscriber: Optional[weakref.ref] = None
+
+
+def content_size(contents: List[Dict[str, Any]]) -> int:
+    """Size of dumped resource contents: text length plus base64 blob length."""
+    size = 0
+    for item in contents:
+        text = item.get("text")
+        if isinstance(text, str):
+            size += len(text)
+        blob = item.get("blob")
+        if isinstance(blob, str):
+            size += len(blob)
+    return size
+
+
+class ResourceContentCache:
+    """LRU cache of read_resource contents keyed by (service global name, uri).
+
+    Entries are bounded by total content size. Contents are kept as the dumped
+    dicts returned to callers; base64 blobs stay the strings received from the
+    server and are shared by every hit instead of being decoded / re-encoded.
+
+    Freshness:
+    - servers advertising ``resources.subscribe`` get a subscription per cached
+      URI on the pooled client; ``notifications/resources/updated`` drops the
+      entry. The entry lives up to ``subscribed_ttl`` while that client is
+      still connected.
+    - other servers (or when the subscribing client is gone) fall back to ``ttl``.
+    - a catalog change of the service (reconnect, list_changed, removal)
+      drops every entry of that service.
+    """
+
+    def __init__(self, config: Optional[ResourceCacheConfig] = None):
+        self.config = config or ResourceCacheConfig()
+        self._entries: "OrderedDict[ResourceKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        # Bumped on every invalidation of a service; puts that began earlier are dropped
+        self._versions: Dict[str, int] = {}
+        # (service, uri) -> client the subscription was issued on
+        self._subscriptions: Dict[ResourceKey, weakref.ref] = {}
+        self._lock = threading.Lock()
+        self._stats = ResourceCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def version(self, service_name: str) -> int:
+        return self._versions.get(service_name, 0)
+
+    def get(self, service_name: str, uri: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached contents (shallow copies) or None on miss / expiry."""
+        if not self.config.enabled:
+            return None
+        key = (service_name, uri)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                self._remove(key)
+                self._stats.expired += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            self._stats.bytes_served += entry.size
+        return [dict(item) for item in entry.contents]
+
+    def put(
+        self,
+        service_name: str,
+        uri: str,
+        contents: List[Dict[str, Any]],
+        version: int,
+        subscriber: Any = None,
+    ) -> bool:
+        """
+        Store contents read under ``version`` (from ``version()`` before the read).
+
+        Returns:
+            False when the service was invalidated meanwhile or the content is too large
+        """
+        size = content_size(contents)
+        self._stats.bytes_fetched += size
+        if not self.config.enabled:
+            return False
+        if size > self.config.max_entry_bytes or size > self.config.max_bytes:
+            self._stats.skipped_large += 1
+            return False
+        key = (service_name, uri)
+        entry = _Entry(
+            contents=tuple(contents),
+            size=size,
+            stored_at=time.monotonic(),
+            subscriber=weakref.ref(subscriber) if subscriber is not None else None,
+        )
+        with self._lock:
+            if self._versions.get(service_name, 0) != version:
+                self._stats.stale_puts += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            self._stats.stores += 1
+            while self._bytes > self.config.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats.evictions += 1
+        return True
+
+    def subscribed(self, service_name: str, uri: str, client: Any) -> bool:
+        """True when ``client`` already holds a subscription for the URI."""
+        ref = self._subscriptions.get((service_name, uri))
+        return ref is not None and ref() is client
+
+    def mark_subscribed(self, service_name: str, uri: str, client: Any) -> None:
+        self._subscriptions[(service_name, uri)] = weakref.ref(client)
+        self._stats.subscriptions += 1
+
+    def invalidate(self, service_name: str, uri: Optional[str] = None) -> int:
+        """Drop one URI (or every URI when None) of a service."""
+        with self._lock:
+            self._versions[service_name] = self._versions.get(service_name, 0) + 1
+            if uri is not None:
+                keys = [(service_name, uri)] if (service_name, uri) in self._entries else []
+            else:
+                keys = [k for k in self._entries if k[0] == service_name]
+                for key in [k for k in self._subscriptions if k[0] == service_name]:
+                    del self._subscriptions[key]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+        if keys:
+            logger.debug(f"[RESOURCE_CACHE] invalidated service={service_name} uri={uri} entries={len(keys)}")
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            for service_name in {k[0] for k in self._entries}:
+                self._versions[service_name] = self._versions.get(service_name, 0) + 1
+            self._entries.clear()
+            self._subscriptions.clear()
+            self._bytes = 0
+
+    def attach(self, catalog_manager=None) -> None:
+        """Drop a service's entries whenever its catalog is rewritten or deleted."""
+        if catalog_manager is not None:
+            catalog_manager.add_change_listener(lambda service_name: self.invalidate(service_name))
+
+    def get_stats(self) -> Dict[str, Any]:
+        s = self._stats
+        return {
+            "enabled": self.config.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.config.max_bytes,
+            "hits": s.hits,
+            "misses": s.misses,
+            "hit_rate": s.hit_rate,
+            "stores": s.stores,
+            "skipped_large": s.skipped_large,
+            "expired": s.expired,
+            "evictions": s.evictions,
+            "invalidations": s.invalidations,
+            "stale_puts": s.stale_puts,
+            "subscriptions": s.subscriptions,
+            "bytes_served": s.bytes_served,
+            "bytes_fetched": s.bytes_fetched,
+        }
+
+    # ---- internals ----
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        ttl = self.config.ttl
+        if entry.subscriber is not None:
+            # Subscription only holds while its client stays connected
+            client = entry.subscriber()
+            if client is not None and client.is_connected():
+                ttl = self.config.subscribed_ttl
+        return now - entry.stored_at >= ttl
+
+    def _remove(self, key: ResourceKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+__all__ = [
+    "ResourceCacheConfig",
+    "ResourceCacheStats",
+    "ResourceContentCache",
+]
@@ -229,12 +229,15 @@ class ServiceRegistry:
         # 这些管理器直接操作 pykv，是数据的唯一真相源
         from mcpstore.core.cache.service_entity_manager import ServiceEntityManager
         from mcpstore.core.cache.tool_entity_manager import ToolEntityManager
+        from mcpstore.core.cache.catalog_manager import ServiceCatalogManager
         from mcpstore.core.cache.state_manager import StateManager as CacheStateManager
         from mcpstore.core.cache.relationship_manager import RelationshipManager
 
         # 缓存层实体管理器（用于直接操作 pykv）
         self._cache_service_manager = ServiceEntityManager(cache_layer_manager, naming_service)
         self._cache_tool_manager = ToolEntityManager(cache_layer_manager, naming_service)
+        # 服务目录（resources / templates / prompts），连接时写入，list_changed 时刷新
+        self._cache_catalog_manager = ServiceCatalogManager(cache_layer_manager)
         self._cache_state_manager = CacheStateManager(cache_layer_manager)
         self._state_manager = self._cache_state_manager
         self._cache_layer_manager = cache_layer_manager
@@ -242,6 +245,11 @@ class ServiceRegistry:
         # 创建关系管理器（使用 CacheLayerManager）
         self._relation_manager = RelationshipManager(cache_layer_manager)
         self._logger.debug("Cache layer manager initialization successful")
+
+        # 服务就绪通知：等待工具同步/状态收敛的调用方按服务版本号等待，而不是轮询 pykv
+        from mcpstore.core.registry.service_readiness import ServiceReadiness
+        self.service_readiness = ServiceReadiness()
+        self.service_readiness.attach(self._relation_manager, self._cache_state_manager)
         
         # 映射管理器已禁用
 
@@ -277,6 +285,7 @@ class ServiceRegistry:
         from mcpstore.core.cache.cache_layer_manager import CacheLayerManager
         from mcpstore.core.cache.service_entity_manager import ServiceEntityManager
         from mcpstore.core.cache.tool_entity_manager import ToolEntityManager
+        from mcpstore.core.cache.catalog_manager import ServiceCatalogManager
         from mcpstore.core.cache.state_manager import StateManager as CacheStateManager
         from mcpstore.core.cache.relationship_manager import RelationshipManager
         from mcpstore.core.registry.core_registry.session_manager import SessionManager
@@ -285,15 +294,35 @@ class ServiceRegistry:
         self._namespace = ns
         self._cache_layer = CacheLayerManager(kv_store, ns)
         self._cache_layer_manager = self._cache_layer
+        if old_cache_layer is not None:
+            self._cache_layer.configure_write_batching(old_cache_layer.write_batch_config)
+            await old_cache_layer.drain_writes()
 
         # 保持同一命名服务实例
         naming_service = self._naming or self._create_naming_service()
 
         self._cache_service_manager = ServiceEntityManager(self._cache_layer, naming_service)
         self._cache_tool_manager = ToolEntityManager(self._cache_layer, naming_service)
+        old_catalog_manager = getattr(self, "_cache_catalog_manager", None)
+        self._cache_catalog_manager = ServiceCatalogManager(self._cache_layer)
+        old_state_manager = getattr(self, "_cache_state_manager", None)
+        old_relation_manager = getattr(self, "_relation_manager", None)
         self._cache_state_manager = CacheStateManager(self._cache_layer)
         self._state_manager = self._cache_state_manager
-        self._relation_manager = RelationshipManager(self._cache_layer)
+        self._relation_manager = RelationshipManager(
+            self._cache_layer,
+            layout=getattr(old_relation_manager, "layout", None)
+        )
+
+        # 保留派生缓存（工具解析索引/工具快照/资源索引/就绪通知/重连调度）注册的变更监听器
+        for listener in getattr(old_state_manager, "_change_listeners", []):
+            self._cache_state_manager.add_change_listener(listener)
+        for listener in getattr(old_state_manager, "_transition_listeners", []):
+            self._cache_state_manager.add_transition_listener(listener)
+        for listener in getattr(old_relation_manager, "_change_listeners", []):
+            self._relation_manager.add_change_listener(listener)
+        for listener in getattr(old_catalog_manager, "_change_listeners", []):
+            self._cache_catalog_manager.add_change_listener(listener)
 
         # 会话管理器依赖新的 cache_layer
         self._session_manager = SessionManager(self._cache_layer, naming_service, ns)
@@ -302,30 +331,33 @@ class ServiceRegistry:
         # 尝试迁移旧缓存中的实体/关系/状态，避免切换后需要重新添加服务
         try:
             if old_cache_layer:
-                migrate_entities = 0
-                migrate_relations = 0
-                migrate_states = 0
-
-                entity_types = ["services", "tools", "agents", "store", "clients"]
-                for et in entity_types:
-                    data = await old_cache_layer.get_all_entities_async(et)
-                    for k, v in (data or {}).items():
-                        await self._cache_layer_manager.put_entity(et, k, v)
-                        migrate_entities += 1
-
-                relation_types = ["agent_services", "service_tools"]
-                for rt in relation_types:
-                    data = await old_cache_layer.get_all_relations_async(rt)
-                    for k, v in (data or {}).items():
-                        await self._cache_layer_manager.put_relation(rt, k, v)
-                        migrate_relations += 1
-
-                state_types = ["service_status", "service_metadata"]
-                for st in state_types:
-                    data = await old_cache_layer.get_all_states_async(st)
-                    for k, v in (data or {}).items():
-                        await self._cache_layer_manager.put_state(st, k, v)
-                        migrate_states += 1
+                async with self._cache_layer_manager.batch(durability="flush"):
+                    migrate_entities = 0
+                    migrate_relations = 0
+                    migrate_states = 0
+
+                    entity_types = ["services", "tools", "service_catalogs", "agents", "store", "clients"]
+                    for et in entity_types:
+                        data = await old_cache_layer.get_all_entities_async(et)
+                        for k, v in (data or {}).items():
+                            await self._cache_layer_manager.put_entity(et, k, v)
+                            migrate_entities += 1
+
+                    # 按原样复制两种关系布局的全部集合（document / indexed）
+                    from mcpstore.core.cache.relation_store import relation_collections
+                    relation_types = relation_collections("agent_services") + relation_collections("service_tools")
+                    for rt in relation_types:
+                        data = await old_cache_layer.get_all_relations_async(rt)
+                        for k, v in (data or {}).items():
+                            await self._cache_layer_manager.put_relation(rt, k, v)
+                            migrate_relations += 1
+
+                    state_types = ["service_status", "service_metadata"]
+                    for st in state_types:
+                        data = await old_cache_layer.get_all_states_async(st)
+                        for k, v in (data or {}).items():
+                            await self._cache_layer_manager.put_state(st, k, v)
+                            migrate_states += 1
 
                 self._logger.info(
                     "[SWITCH_BACKEND] Migrated cache data to new backend: "
@@ -721,6 +753,7 @@ class ServiceRegistry:
         )
 
         tools_status = []
+        tool_relations = []
         for tool in tools:
             if isinstance(tool, tuple) and len(tool) == 2:
                 tool_name, tool_def = tool
@@ -745,19 +778,21 @@ class ServiceRegistry:
                 tool_original_name=original_tool_name,
                 tool_def=tool_def
             )
-            await self._relation_manager.add_service_tool(
-                service_global_name=service_global_name,
-                service_original_name=name,
-                source_agent=agent_id,
-                tool_global_name=tool_global_name,
-                tool_original_name=original_tool_name
-            )
+            tool_relations.append((tool_global_name, original_tool_name))
             tools_status.append({
                 "tool_global_name": tool_global_name,
                 "tool_original_name": original_tool_name,
                 "status": "available"
             })
 
+        if tool_relations:
+            await self._relation_manager.add_service_tools(
+                service_global_name=service_global_name,
+                service_original_name=name,
+                source_agent=agent_id,
+                tools=tool_relations
+            )
+
         if state is None:
             from mcpstore.core.models.service import ServiceConnectionState
             state = ServiceConnectionState.STARTUP
@@ -814,7 +849,8 @@ class ServiceRegistry:
 
         await self._relation_manager.remove_service_cascade(agent_id, global_name)
         await self._cache_layer_manager.delete_entity("services", global_name)
-        await self._cache_layer_manager.delete_state("service_status", global_name)
+        await self._cache_catalog_manager.delete_catalog(global_name)
+        await self._cache_state_manager.delete_service_status(global_name)
         await self._cache_layer_manager.delete_state("service_metadata", global_name)
 
         for tool in tool_relations:
@@ -1915,7 +1951,7 @@ class ServiceRegistry:
         global_name = await self._resolve_global_name_async(agent_id, service_name)
         if not global_name:
             return False
-        await self._cache_layer_manager.delete_state("service_status", global_name)
+        await self._cache_state_manager.delete_service_status(global_name)
         self._cache_state_snapshot(agent_id, service_name, None)
         return True
 
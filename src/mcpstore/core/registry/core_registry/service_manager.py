@@ -822,6 +822,7 @@ class ServiceManager(ServiceManagerInterface):
         try:
             self._logger.info(f"[ADD_TOOLS] Starting to add tools to service: agent={agent_id}, service={service_name}, tools_count={len(tools)}")
             service_global_name = self._naming.generate_service_global_name(service_name, agent_id)
+            tool_relations = []
 
             for tool_name, tool_def in tools:
                 # 生成工具全局名称
@@ -841,19 +842,19 @@ class ServiceManager(ServiceManagerInterface):
                         f"create_tool:{tool_name}"
                     )
 
-                # 创建服务-工具关系
-                # 方法签名：add_service_tool(service_global_name, service_original_name, source_agent, tool_global_name, tool_original_name)
-                if self._relation_manager:
-                    self._sync_operation(
-                        self._relation_manager.add_service_tool(
-                            service_global_name=service_global_name,
-                            service_original_name=service_name,
-                            source_agent=agent_id,
-                            tool_global_name=tool_global_name,
-                            tool_original_name=tool_name
-                        ),
-                        f"add_service_tool:{service_global_name}:{tool_global_name}"
-                    )
+                tool_relations.append((tool_global_name, tool_name))
+
+            # 创建服务-工具关系（批量，一次读改写）
+            if self._relation_manager and tool_relations:
+                self._sync_operation(
+                    self._relation_manager.add_service_tools(
+                        service_global_name=service_global_name,
+                        service_original_name=service_name,
+                        source_agent=agent_id,
+                        tools=tool_relations
+                    ),
+                    f"add_service_tools:{service_global_name}"
+                )
 
         except Exception as e:
             self._logger.error(f"Failed to add tools to service {agent_id}:{service_name}: {e}")
@@ -876,6 +877,7 @@ class ServiceManager(ServiceManagerInterface):
         try:
             self._logger.info(f"[ADD_TOOLS_ASYNC] Starting to add tools to service asynchronously: agent={agent_id}, service={service_name}, tools_count={len(tools)}")
             service_global_name = self._naming.generate_service_global_name(service_name, agent_id)
+            tool_relations = []
 
             for tool_name, tool_def in tools:
                 # 生成工具全局名称
@@ -891,15 +893,16 @@ class ServiceManager(ServiceManagerInterface):
                         tool_def=tool_def
                     )
 
-                # 创建服务-工具关系（异步）
-                if self._relation_manager:
-                    await self._relation_manager.add_service_tool(
-                        service_global_name=service_global_name,
-                        service_original_name=service_name,
-                        source_agent=agent_id,
-                        tool_global_name=tool_global_name,
-                        tool_original_name=tool_name
-                    )
+                tool_relations.append((tool_global_name, tool_name))
+
+            # 创建服务-工具关系（异步，批量一次读改写）
+            if self._relation_manager and tool_relations:
+                await self._relation_manager.add_service_tools(
+                    service_global_name=service_global_name,
+                    service_original_name=service_name,
+                    source_agent=agent_id,
+                    tools=tool_relations
+                )
 
         except Exception as e:
             self._logger.error(f"Failed to add tools to service asynchronously {agent_id}:{service_name}: {e}")
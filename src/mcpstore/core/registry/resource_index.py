@@ -0,0 +1,207 @@
+"""
+Resource Index - per-agent URI / URI-template / prompt name routing
+
+Built once per agent view from the service catalogs stored in pykv and kept
+until a service of that view is added/removed or its catalog is refreshed, so
+read_resource / get_prompt without a service name go straight to the owning
+service instead of trying every service in turn.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EXPRESSION = re.compile(r'\{([^{}]*)\}')
+
+# (display service name, service global name)
+ServiceRef = Tuple[str, str]
+
+
+def compile_uri_template(template: str) -> Pattern:
+    """
+    Compile an RFC 6570 URI template into a full-match regex.
+
+    Simple expressions match one path segment; reserved ("+", "#") expansions
+    match anything; path / label / query operators match an optional suffix.
+    """
+    parts: List[str] = []
+    last = 0
+    for match in _EXPRESSION.finditer(template):
+        parts.append(re.escape(template[last:match.start()]))
+        expression = match.group(1)
+        operator = expression[:1]
+        if operator in ("+", "#"):
+            parts.append(r'.*')
+        elif operator in ("?", "&"):
+            parts.append(r'(?:[?&][^#]*)?')
+        elif operator == "/":
+            parts.append(r'(?:/[^?#]*)?')
+        elif operator == ".":
+            parts.append(r'(?:\.[^/?#]*)?')
+        elif operator == ";":
+            parts.append(r'(?:;[^/?#]*)?')
+        else:
+            parts.append(r'[^/?#]+')
+        last = match.end()
+    parts.append(re.escape(template[last:]))
+    return re.compile(''.join(parts) + r'\Z')
+
+
+@dataclass
+class AgentResourceIndex:
+    """Routing tables for one agent view (immutable once built)."""
+    agent_id: str
+    # display service name -> service global name
+    services: Dict[str, str] = field(default_factory=dict)
+    exact_uris: Dict[str, ServiceRef] = field(default_factory=dict)
+    # (compiled template, uriTemplate, service); most specific (longest literal prefix) first
+    templates: List[Tuple[Pattern, str, ServiceRef]] = field(default_factory=list)
+    prompts: Dict[str, ServiceRef] = field(default_factory=dict)
+    # display name -> catalog (ServiceCatalogEntity or None when unavailable)
+    catalogs: Dict[str, Any] = field(default_factory=dict)
+    # Global service names covered by this index (for invalidation)
+    service_names: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, agent_id: str, entries: List[Tuple[str, str, Any]]) -> "AgentResourceIndex":
+        """
+        Args:
+            entries: [(display service name, service global name, catalog or None), ...]
+        """
+        index = cls(agent_id=agent_id)
+        templates: List[Tuple[int, Pattern, str, ServiceRef]] = []
+        for display_name, global_name, catalog in entries:
+            index.services[display_name] = global_name
+            index.catalogs[display_name] = catalog
+            index.service_names.add(global_name)
+            if catalog is None:
+                continue
+            ref = (display_name, global_name)
+            for resource in catalog.resources:
+                uri = resource.get("uri")
+                if uri:
+                    index.exact_uris.setdefault(str(uri), ref)
+            for template in catalog.resource_templates:
+                uri_template = template.get("uriTemplate")
+                if not uri_template:
+                    continue
+                try:
+                    pattern = compile_uri_template(uri_template)
+                except re.error as e:
+                    logger.debug(f"[RESOURCE_INDEX] skip template {uri_template} of {global_name}: {e}")
+                    continue
+                prefix = _EXPRESSION.split(uri_template, 1)[0]
+                templates.append((len(prefix), pattern, uri_template, ref))
+            for prompt in catalog.prompts:
+                name = prompt.get("name")
+                if name:
+                    index.prompts.setdefault(name, ref)
+        templates.sort(key=lambda item: item[0], reverse=True)
+        index.templates = [(pattern, uri_template, ref) for _, pattern, uri_template, ref in templates]
+        return index
+
+    def resolve_resource(self, uri: str) -> Optional[ServiceRef]:
+        """Find the service owning a resource URI (exact URI first, then templates)."""
+        ref = self.exact_uris.get(uri)
+        if ref is not None:
+            return ref
+        for pattern, _, ref in self.templates:
+            if pattern.match(uri):
+                return ref
+        return None
+
+    def resolve_prompt(self, name: str) -> Optional[ServiceRef]:
+        return self.prompts.get(name)
+
+    @property
+    def complete(self) -> bool:
+        """True when every service of the view had a stored catalog."""
+        return all(catalog is not None for catalog in self.catalogs.values())
+
+
+class ResourceIndex:
+    """
+    Store-wide cache of AgentResourceIndex keyed by agent id.
+
+    Invalidation is incremental: a catalog or relation change for a service
+    drops the views containing it, plus the owning agent's and the store's view.
+    """
+
+    def __init__(self, global_agent_store_id: str = "global_agent_store"):
+        self._global_agent_store_id = global_agent_store_id
+        self._indexes: Dict[str, AgentResourceIndex] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._builds = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[AgentResourceIndex]:
+        index = self._indexes.get(key)
+        if index is not None:
+            self._hits += 1
+        return index
+
+    def put(self, key: str, index: AgentResourceIndex, generation: int) -> bool:
+        """Store a freshly built index unless an invalidation happened while building."""
+        with self._lock:
+            self._builds += 1
+            if generation != self._generation:
+                logger.debug(f"[RESOURCE_INDEX] discard stale build key={key}")
+                return False
+            self._indexes[key] = index
+            return True
+
+    def invalidate_service(self, agent_id: Optional[str], service_name: Optional[str]) -> None:
+        """Drop agent views touched by a service change."""
+        with self._lock:
+            self._generation += 1
+            agents = {agent_id, self._global_agent_store_id} if agent_id else set()
+            stale = [
+                key for key, index in self._indexes.items()
+                if index.agent_id in agents or (service_name and service_name in index.service_names)
+            ]
+            for key in stale:
+                del self._indexes[key]
+            self._invalidations += len(stale)
+        logger.debug(f"[RESOURCE_INDEX] invalidated agent={agent_id} service={service_name}")
+
+    def invalidate_catalog(self, service_global_name: str) -> None:
+        self.invalidate_service(None, service_global_name)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._indexes)
+            self._indexes.clear()
+
+    def attach(self, relation_manager=None, catalog_manager=None) -> None:
+        """Subscribe to relation writes and catalog writes."""
+        if relation_manager is not None:
+            relation_manager.add_change_listener(self.invalidate_service)
+        if catalog_manager is not None:
+            catalog_manager.add_change_listener(self.invalidate_catalog)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "views": len(self._indexes),
+            "hits": self._hits,
+            "builds": self._builds,
+            "invalidations": self._invalidations,
+            "generation": self._generation,
+        }
+
+
+__all__ = [
+    "AgentResourceIndex",
+    "ResourceIndex",
+    "compile_uri_template",
+]
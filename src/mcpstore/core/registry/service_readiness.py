@@ -0,0 +1,162 @@
+"""
+Service Readiness - event-driven waits for tool sync and state convergence
+
+Waiters used to poll relations, status and metadata every 100-200ms until a
+service had tools or left STARTUP. ServiceReadiness keeps a version counter
+per service global name (unique per agent/service pair); relation and state
+writes, CacheManager (tools written) and LifecycleManager (tools confirmed
+empty) bump it. A waiter records the version, runs its check, and only
+re-runs the check after the version moved, so a waiting list_tools costs one
+set of reads per actual change instead of one per poll tick.
+
+Writes made by other processes do not reach local listeners, so waits also
+re-check at a slow fallback interval.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Version = Tuple[int, int]
+
+
+class ServiceReadiness:
+    """
+    Per-service condition registry (safe across threads and event loops).
+
+    Waiters keyed by None are woken by every notification.
+    """
+
+    def __init__(self, recheck_interval: float = 1.0):
+        self._recheck_interval = recheck_interval
+        self._lock = threading.Lock()
+        # Bumped by notify(None): invalidates every service at once
+        self._epoch = 0
+        self._total = 0
+        self._versions: Dict[str, int] = {}
+        self._waiters: Dict[Optional[str], Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._notifications = 0
+        self._waits = 0
+        self._checks = 0
+        self._timeouts = 0
+
+    def version(self, service_global_name: Optional[str]) -> Version:
+        with self._lock:
+            return self._version_locked(service_global_name)
+
+    def _version_locked(self, service_global_name: Optional[str]) -> Version:
+        if service_global_name is None:
+            return self._epoch, self._total
+        return self._epoch, self._versions.get(service_global_name, 0)
+
+    def notify(self, service_global_name: Optional[str] = None) -> None:
+        """Mark a service (None: every service) as changed and wake its waiters."""
+        with self._lock:
+            self._notifications += 1
+            self._total += 1
+            if service_global_name is None:
+                self._epoch += 1
+                waiters = [w for group in self._waiters.values() for w in group]
+            else:
+                self._versions[service_global_name] = self._versions.get(service_global_name, 0) + 1
+                waiters = list(self._waiters.get(service_global_name, ()))
+                waiters.extend(self._waiters.get(None, ()))
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                continue
+
+    async def wait_changed(
+        self,
+        service_global_name: Optional[str],
+        since: Version,
+        timeout: Optional[float],
+    ) -> bool:
+        """Wait until the version differs from `since`; False on timeout."""
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self._version_locked(service_global_name) != since:
+                return True
+            self._waiters.setdefault(service_global_name, set()).add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self.version(service_global_name) != since
+        finally:
+            with self._lock:
+                group = self._waiters.get(service_global_name)
+                if group is not None:
+                    group.discard(waiter)
+                    if not group:
+                        del self._waiters[service_global_name]
+
+    async def wait_until(
+        self,
+        service_global_name: Optional[str],
+        check: Callable[[], Awaitable[Any]],
+        timeout: float,
+        *,
+        recheck_interval: Optional[float] = None,
+    ) -> Any:
+        """
+        Run `check` until it returns something other than None.
+
+        `check` runs once up front, then again after each notification for the
+        service (or after `recheck_interval` without one).
+
+        Raises:
+            asyncio.TimeoutError: the check did not pass within `timeout`
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        interval = self._recheck_interval if recheck_interval is None else recheck_interval
+        self._waits += 1
+        while True:
+            since = self.version(service_global_name)
+            self._checks += 1
+            result = await check()
+            if result is not None:
+                return result
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._timeouts += 1
+                raise asyncio.TimeoutError(f"service not ready: {service_global_name}")
+            await self.wait_changed(
+                service_global_name, since, min(remaining, interval) if interval else remaining
+            )
+
+    def attach(self, relation_manager=None, state_manager=None) -> None:
+        """Subscribe to local relation/tool-state writes and health state transitions."""
+        if relation_manager is not None:
+            relation_manager.add_change_listener(lambda agent_id, service_name: self.notify(service_name))
+        if state_manager is not None:
+            state_manager.add_change_listener(self.notify)
+            add_transition = getattr(state_manager, "add_transition_listener", None)
+            if add_transition is not None:
+                add_transition(lambda service_name, old, new: self.notify(service_name))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waiting = sum(len(group) for group in self._waiters.values())
+            tracked = len(self._versions)
+        return {
+            "tracked": tracked,
+            "waiting": waiting,
+            "notifications": self._notifications,
+            "waits": self._waits,
+            "checks": self._checks,
+            "timeouts": self._timeouts,
+        }
+
+
+__all__ = [
+    "ServiceReadiness",
+]
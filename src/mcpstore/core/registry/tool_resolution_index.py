@@ -0,0 +1,241 @@
+"""
+Tool Resolution Index - precompiled per-agent tool name lookup
+
+Builds the mapping tables used by ToolNameResolver once per agent view and keeps
+them until a service is added/removed or its tool list changes, so resolving a
+user-supplied tool name in call_tool is a dictionary lookup without pykv reads.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .tool_resolver import ToolNameResolver
+
+logger = logging.getLogger(__name__)
+
+_FUZZY_CLEAN = re.compile(r'[^a-zA-Z0-9]')
+
+
+def _clean(text: str) -> str:
+    return _FUZZY_CLEAN.sub('', text.lower())
+
+
+@dataclass
+class AgentToolIndex:
+    """Resolution tables for one agent view (immutable once built)."""
+    agent_id: str
+    available_tools: List[Dict[str, Any]]
+    exact_matches: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    service_tool_matches: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    no_prefix_matches: Dict[str, List[Tuple[str, str, str]]] = field(default_factory=dict)
+    # (service_name, original_name, display_name, display_clean, original_clean)
+    fuzzy_candidates: List[Tuple[str, str, str, str, str]] = field(default_factory=list)
+    # (service_name, original_name) -> available_tools entry
+    entries: Dict[Tuple[str, str], Dict[str, Any]] = field(default_factory=dict)
+    # Global and local service names covered by this index (for invalidation)
+    service_names: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, agent_id: str, available_tools: List[Dict[str, Any]]) -> "AgentToolIndex":
+        mappings = ToolNameResolver()._build_smart_tool_mappings(available_tools)
+        index = cls(
+            agent_id=agent_id,
+            available_tools=available_tools,
+            exact_matches=mappings["exact_matches"],
+            no_prefix_matches=mappings["no_prefix_matches"],
+        )
+        for service_name, original_name, display_name, _ in mappings["fuzzy_candidates"]:
+            index.fuzzy_candidates.append(
+                (service_name, original_name, display_name, _clean(display_name), _clean(original_name))
+            )
+        for tool in available_tools:
+            service_name = tool.get("service_name", "")
+            original_name = tool.get("original_name", "")
+            if not service_name or not original_name:
+                continue
+            key = (service_name, original_name)
+            index.entries.setdefault(key, tool)
+            index.service_tool_matches.setdefault(f"{service_name}_{original_name}", key)
+            global_service_name = tool.get("global_service_name")
+            if global_service_name:
+                index.service_tool_matches.setdefault(f"{global_service_name}_{original_name}", key)
+                index.service_names.add(global_service_name)
+            index.service_names.add(service_name)
+        return index
+
+    def resolve(self, user_input: str):
+        """
+        Resolve a user-supplied tool name, mirroring PerspectiveResolver.resolve_tool.
+
+        Returns:
+            perspective_resolver.ToolResolution
+
+        Raises:
+            ValueError: when the tool cannot be resolved
+        """
+        from mcpstore.core.cache.naming_service import NamingService
+        from mcpstore.utils.perspective_resolver import ToolResolution
+
+        if not user_input or not isinstance(user_input, str):
+            raise ValueError("Tool name cannot be empty")
+        if not self.available_tools:
+            raise ValueError("available_tools cannot be empty, must provide tool list for resolution")
+        user_input = user_input.strip()
+
+        match = self._match(user_input)
+        if match is None:
+            suggestions = self._suggestions(user_input)
+            if suggestions:
+                raise ValueError(f"Tool '{user_input}' not found. Did you mean: {', '.join(suggestions[:3])}?")
+            raise ValueError(f"Tool '{user_input}' not found and no similar suggestions available")
+
+        (service_local, canonical_name), method = match
+        entry = self.entries.get((service_local, canonical_name))
+        service_global = (entry or {}).get("global_service_name") or service_local
+        global_tool_name = (entry or {}).get("global_tool_name") or NamingService.generate_tool_global_name(
+            service_global, canonical_name
+        )
+        return ToolResolution(
+            agent_id=self.agent_id,
+            local_service_name=service_local,
+            global_service_name=service_global,
+            local_tool_name=f"{service_local}_{canonical_name}",
+            global_tool_name=global_tool_name,
+            canonical_tool_name=canonical_name,
+            resolution_method=method,
+            original_input=user_input,
+        )
+
+    def _match(self, user_input: str) -> Optional[Tuple[Tuple[str, str], str]]:
+        if user_input in self.exact_matches:
+            return self.exact_matches[user_input], "exact_match"
+        if user_input in self.service_tool_matches:
+            return self.service_tool_matches[user_input], "prefix_match"
+        candidates = self.no_prefix_matches.get(user_input)
+        if candidates:
+            service_name, original_name, _ = candidates[0]
+            method = "no_prefix_match" if len(candidates) == 1 else "no_prefix_match_single_server"
+            return (service_name, original_name), method
+
+        user_clean = _clean(user_input)
+        fuzzy: List[Tuple[str, str]] = []
+        for service_name, original_name, _, display_clean, original_clean in self.fuzzy_candidates:
+            if self._is_fuzzy_match(user_clean, display_clean) or self._is_fuzzy_match(user_clean, original_clean):
+                fuzzy.append((service_name, original_name))
+        if len(fuzzy) == 1:
+            return fuzzy[0], "fuzzy_match"
+        return None
+
+    @staticmethod
+    def _is_fuzzy_match(user_clean: str, target_clean: str) -> bool:
+        if user_clean in target_clean or target_clean in user_clean:
+            return True
+        return len(user_clean) >= 3 and (
+            target_clean.startswith(user_clean) or user_clean.startswith(target_clean)
+        )
+
+    def _suggestions(self, user_input: str) -> List[str]:
+        user_clean = _clean(user_input)
+        scored = []
+        for _, _, display_name, display_clean, original_clean in self.fuzzy_candidates:
+            score = 0.0
+            for target in (display_clean, original_clean):
+                if user_clean == target:
+                    score = max(score, 1.0)
+                elif user_clean in target:
+                    score = max(score, 0.8)
+                elif target.startswith(user_clean) or user_clean.startswith(target):
+                    score = max(score, 0.6)
+            if score > 0:
+                scored.append((score, display_name))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [name for score, name in scored[:5] if score > 0.3]
+
+
+class ToolResolutionIndex:
+    """
+    Store-wide cache of AgentToolIndex keyed by view ("store:<id>" / "agent:<id>").
+
+    Invalidation is incremental: a change to a service drops only the views
+    that contain that service, plus the owning agent's and the store's view.
+    """
+
+    def __init__(self, global_agent_store_id: str = "global_agent_store"):
+        self._global_agent_store_id = global_agent_store_id
+        self._indexes: Dict[str, AgentToolIndex] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._builds = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[AgentToolIndex]:
+        index = self._indexes.get(key)
+        if index is not None:
+            self._hits += 1
+        return index
+
+    def put(self, key: str, index: AgentToolIndex, generation: int) -> bool:
+        """Store a freshly built index unless an invalidation happened while building."""
+        with self._lock:
+            self._builds += 1
+            if generation != self._generation:
+                logger.debug(f"[TOOL_INDEX] discard stale build key={key}")
+                return False
+            self._indexes[key] = index
+            return True
+
+    def invalidate_service(self, agent_id: Optional[str], service_name: Optional[str]) -> None:
+        """Drop agent views touched by a service change."""
+        with self._lock:
+            self._generation += 1
+            agents = {agent_id, self._global_agent_store_id} if agent_id else set()
+            stale = [
+                key for key, index in self._indexes.items()
+                if index.agent_id in agents or (service_name and service_name in index.service_names)
+            ]
+            for key in stale:
+                del self._indexes[key]
+            self._invalidations += len(stale)
+        logger.debug(f"[TOOL_INDEX] invalidated agent={agent_id} service={service_name}")
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._indexes)
+            self._indexes.clear()
+
+    def attach(self, relation_manager=None, event_bus=None) -> None:
+        """Subscribe to relation writes (local) and tool sync events (cross-process)."""
+        if relation_manager is not None:
+            relation_manager.add_change_listener(self.invalidate_service)
+        if event_bus is not None:
+            from mcpstore.core.events.service_events import ServiceCached, ToolSyncCompleted
+
+            async def _on_service_change(event):
+                self.invalidate_service(getattr(event, "agent_id", None), getattr(event, "service_name", None))
+
+            event_bus.subscribe(ServiceCached, _on_service_change, priority=95)
+            event_bus.subscribe(ToolSyncCompleted, _on_service_change, priority=95)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "views": len(self._indexes),
+            "hits": self._hits,
+            "builds": self._builds,
+            "invalidations": self._invalidations,
+            "generation": self._generation,
+        }
+
+
+__all__ = [
+    "AgentToolIndex",
+    "ToolResolutionIndex",
+]
@@ -0,0 +1,170 @@
+"""
+Tool List Snapshot - materialized, versioned ToolInfo lists per agent view
+
+list_tools_async used to walk relations, entities and states in pykv on every
+call. The snapshot manager keeps the result per view ("store:<id>" /
+"agent:<id>") and only drops it when services connect, change state or resync
+their tools. Readers get the immutable snapshot without locking or copying and
+can use the version number to ask whether anything changed since they looked.
+"""
+
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ToolListSnapshot:
+    """Immutable tool list for one agent view."""
+    view_key: str
+    agent_id: str
+    version: int
+    all_tools: Tuple[Any, ...]
+    available_tools: Tuple[Any, ...]
+    # Global service names covered by this snapshot (for invalidation)
+    service_names: FrozenSet[str]
+
+
+class ToolSnapshotManager:
+    """
+    Store-wide cache of ToolListSnapshot keyed by view.
+
+    Versions come from one monotonically increasing counter: a view gets a new
+    version whenever it is invalidated, and a snapshot carries the version that
+    was current when its build started. A build that raced with an
+    invalidation is returned to its caller but not stored.
+
+    Invalidations by service name only know the views that already have a
+    snapshot, so every invalidation also bumps a store-wide generation: a build
+    started before any invalidation (including one for a view that was never
+    stored) is rejected as well.
+    """
+
+    def __init__(self, global_agent_store_id: str = "global_agent_store"):
+        self._global_agent_store_id = global_agent_store_id
+        self._snapshots: Dict[str, ToolListSnapshot] = {}
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._builds = 0
+        self._invalidations = 0
+        # View change listeners: callback(view_keys), called after every invalidation
+        self._listeners: List[Callable[[FrozenSet[str]], None]] = []
+
+    # ---- read side (lock-free) ----
+
+    def get(self, view_key: str) -> Optional[ToolListSnapshot]:
+        snapshot = self._snapshots.get(view_key)
+        if snapshot is not None:
+            self._hits += 1
+        return snapshot
+
+    @property
+    def generation(self) -> int:
+        """Store-wide invalidation counter; capture it before building a snapshot."""
+        return self._generation
+
+    def version(self, view_key: str) -> int:
+        """Current version of a view (0 if it was never invalidated)."""
+        return self._versions.get(view_key, 0)
+
+    def changed_since(self, view_key: str, version: int) -> bool:
+        return self.version(view_key) != version
+
+    # ---- write side ----
+
+    def put(self, snapshot: ToolListSnapshot, generation: Optional[int] = None) -> bool:
+        """Store a freshly built snapshot unless its view (or, given generation, anything) was invalidated meanwhile."""
+        with self._lock:
+            self._builds += 1
+            if self._versions.get(snapshot.view_key, 0) != snapshot.version or (
+                generation is not None and generation != self._generation
+            ):
+                logger.debug(f"[TOOL_SNAPSHOT] discard stale build view={snapshot.view_key}")
+                return False
+            self._snapshots[snapshot.view_key] = snapshot
+            return True
+
+    def invalidate_service(self, agent_id: Optional[str], service_name: Optional[str]) -> None:
+        """Bump every view touched by a service change and drop its snapshot."""
+        with self._lock:
+            keys = {
+                key for key, snapshot in self._snapshots.items()
+                if service_name and service_name in snapshot.service_names
+            }
+            if agent_id:
+                keys.add(f"agent:{agent_id}")
+                keys.add(f"agent:{self._global_agent_store_id}")
+                keys.add(f"store:{self._global_agent_store_id}")
+            self._bump(keys)
+        logger.debug(f"[TOOL_SNAPSHOT] invalidated agent={agent_id} service={service_name}")
+        self._notify(keys)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            keys = set(self._snapshots) | set(self._versions)
+            self._bump(keys)
+        self._notify(keys)
+
+    def add_listener(self, listener: Callable[[FrozenSet[str]], None]) -> None:
+        """Register a callback invoked with the invalidated view keys (synchronously, any thread)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[FrozenSet[str]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, keys) -> None:
+        if not keys or not self._listeners:
+            return
+        frozen = frozenset(keys)
+        for listener in list(self._listeners):
+            try:
+                listener(frozen)
+            except Exception as e:
+                logger.debug(f"[TOOL_SNAPSHOT] listener failed: {e}")
+
+    def _bump(self, keys) -> None:
+        self._generation += 1
+        for key in keys:
+            self._versions[key] = next(self._counter)
+            if self._snapshots.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def attach(self, relation_manager=None, state_manager=None, event_bus=None) -> None:
+        """Subscribe to local relation/state writes and to service lifecycle events."""
+        if relation_manager is not None:
+            relation_manager.add_change_listener(self.invalidate_service)
+        if state_manager is not None:
+            state_manager.add_change_listener(lambda service_name: self.invalidate_service(None, service_name))
+        if event_bus is not None:
+            from mcpstore.core.events.service_events import (
+                ServiceConnected, ServiceStateChanged, ToolSyncCompleted
+            )
+
+            async def _on_service_change(event):
+                self.invalidate_service(getattr(event, "agent_id", None), getattr(event, "service_name", None))
+
+            for event_type in (ServiceConnected, ServiceStateChanged, ToolSyncCompleted):
+                event_bus.subscribe(event_type, _on_service_change, priority=95)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "views": len(self._snapshots),
+            "hits": self._hits,
+            "builds": self._builds,
+            "invalidations": self._invalidations,
+        }
+
+
+__all__ = [
+    "ToolListSnapshot",
+    "ToolSnapshotManager",
+]
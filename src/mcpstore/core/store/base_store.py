@@ -104,9 +104,77 @@ class BaseMCPStore:
             event_lease_ttl=event_lease_ttl,
         )
 
+        # 异步事件派发：按事件类型的有界队列与工作协程池（features.event_dispatch）
+        # 高频事件合并：时间窗口内同一服务的同类事件只派发最新的一个（features.event_coalescing）
+        try:
+            from mcpstore.core.events.dispatcher import DispatchConfig
+            from mcpstore.core.events.coalescer import CoalesceConfig
+            features = (getattr(self.orchestrator, "config", None) or {}).get("features", {}) or {}
+            if "event_dispatch" in features:
+                self.container.event_bus.configure_dispatch(
+                    DispatchConfig.from_dict(features.get("event_dispatch"))
+                )
+            if "event_coalescing" in features:
+                self.container.event_bus.configure_coalescing(
+                    CoalesceConfig.from_dict(features.get("event_coalescing"))
+                )
+        except Exception as e:
+            logger.debug(f"Configure event dispatch failed: {e}")
+
         # ToolSetManager 已废弃，工具可用性统一使用 StateManager
         # 工具状态存储在状态层: default:state:service_status
 
+        # 工具名解析索引：按 store/agent 视图缓存 call_tool 的解析表，关系变更时增量失效
+        from mcpstore.core.registry.tool_resolution_index import ToolResolutionIndex
+        self.tool_resolution_index = ToolResolutionIndex(self.client_manager.global_agent_store_id)
+        try:
+            self.tool_resolution_index.attach(
+                relation_manager=getattr(self.registry, "_relation_manager", None),
+                event_bus=self.container.event_bus,
+            )
+        except Exception as e:
+            logger.debug(f"Attach tool resolution index failed: {e}")
+
+        # 物化工具快照：list_tools 按视图读取版本化快照，服务连接/状态变化/工具重同步时失效
+        from mcpstore.core.registry.tool_snapshot import ToolSnapshotManager
+        self.tool_snapshots = ToolSnapshotManager(self.client_manager.global_agent_store_id)
+        try:
+            self.tool_snapshots.attach(
+                relation_manager=getattr(self.registry, "_relation_manager", None),
+                state_manager=getattr(self.registry, "_cache_state_manager", None),
+                event_bus=self.container.event_bus,
+            )
+        except Exception as e:
+            logger.debug(f"Attach tool snapshot manager failed: {e}")
+
+        # 健康检查优先复用连接池/会话中已连接的客户端，而不是每次 ping 都新建临时客户端
+        try:
+            self.container.health_monitor.set_client_sources(
+                connection_pool=getattr(self.orchestrator, "connection_pool", None),
+                session_manager=self.session_manager,
+            )
+        except Exception as e:
+            logger.debug(f"Attach health check client sources failed: {e}")
+
+        # stdio 服务 warm standby：服务连接成功后在后台预启动进程（features.client_pool.warm_*）
+        try:
+            pool = getattr(self.orchestrator, "connection_pool", None)
+            if pool is not None and (pool.config.warm_standby or pool.config.warm_services):
+                from mcpstore.core.events.service_events import ServiceConnected
+
+                async def _prewarm_on_connected(event):
+                    global_name = self.registry._naming.generate_service_global_name(
+                        event.service_name, event.agent_id
+                    )
+                    try:
+                        await self.orchestrator.prewarm_service_clients_async(global_name)
+                    except Exception as e:
+                        logger.debug(f"Prewarm service clients failed for {global_name}: {e}")
+
+                self.container.event_bus.subscribe(ServiceConnected, _prewarm_on_connected, priority=5)
+        except Exception as e:
+            logger.debug(f"Attach warm standby prewarm failed: {e}")
+
         # [UNIFIED] Point orchestrator.lifecycle_manager to container's lifecycle_manager
         try:
             self.orchestrator.lifecycle_manager = self.container.lifecycle_manager
@@ -212,6 +280,15 @@ class BaseMCPStore:
             except Exception as e:
                 logger.warning(f"Error stopping health check task: {e}")
         
+        # Stop EventBus dispatch workers (they would otherwise live until their loop closes)
+        container = getattr(self, "container", None)
+        if container is not None:
+            try:
+                await container.event_bus.close()
+                logger.debug("EventBus dispatcher closed")
+            except Exception as e:
+                logger.warning(f"Error closing EventBus dispatcher: {e}")
+
         # Close system-created Redis client (but not user-provided)
         system_redis_client = getattr(self, "_system_created_redis_client", None)
         if system_redis_client:
@@ -76,6 +76,15 @@ class ConfigManagementMixin:
         parsed_config = self._parse_cache_config(cache_config, MemoryConfig, RedisConfig)
         new_kv_store = await create_kv_store_async(parsed_config, test_connection=True)
         await self.registry.switch_backend(new_kv_store)
+        # 后端已切换，丢弃基于旧后端构建的派生缓存
+        derived_caches = (
+            getattr(self, "tool_resolution_index", None),
+            getattr(self, "tool_snapshots", None),
+            getattr(getattr(self, "orchestrator", None), "resource_index", None),
+        )
+        for derived in derived_caches:
+            if derived is not None:
+                derived.invalidate_all()
 
     def _parse_cache_config(
         self,
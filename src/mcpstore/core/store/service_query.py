@@ -80,6 +80,12 @@ class ServiceQueryMixin:
                 logger.info("Cache is empty, you may need to add services first")
                 return []
 
+            # 批量读取所有服务状态（单次状态层往返）
+            cache_state_manager = getattr(self.registry, '_cache_state_manager', None)
+            service_statuses = {}
+            if cache_state_manager is not None:
+                service_statuses = await cache_state_manager.get_many_service_status(list(services.keys()))
+
             for service_global_name, service_data in services.items():
                 # 处理 ManagedEntry 对象
                 if hasattr(service_data, 'value'):
@@ -128,11 +134,9 @@ class ServiceQueryMixin:
                 if complete_info.get("config") is None:
                     complete_info["config"] = {}
 
-                # 从 pykv 缓存层直接获取服务状态（唯一真相数据源）
-                # 使用 cache/state_manager.py 的 get_service_status 方法
-                cache_state_manager = getattr(self.registry, '_cache_state_manager', None)
+                # 从 pykv 缓存层直接获取服务状态（唯一真相数据源，已在循环前批量读取）
                 if cache_state_manager is not None:
-                    status_data = await cache_state_manager.get_service_status(service_global_name)
+                    status_data = service_statuses.get(service_global_name)
                     if status_data is not None:
                         if hasattr(status_data, 'health_status'):
                             state = status_data.health_status
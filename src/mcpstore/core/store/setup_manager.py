@@ -183,10 +183,14 @@ class StoreSetupManager:
         event_log_enabled = True
         event_max_queue_length = int(event_features.get("max_queue_length", 1_000_000))
         event_dedup_ttl = float(event_features.get("dedup_ttl_seconds", 86400.0))
+        event_segment_seconds = float(event_features.get("segment_seconds", 60.0))
         event_batch_size = int(event_features.get("batch_size", 100))
         event_poll_interval = float(event_features.get("poll_interval", 1.0))
         event_lease_ttl = float(event_features.get("lease_ttl", 30.0))
         event_consumer_id = event_features.get("consumer_id")
+        event_push = bool(event_features.get("push", True))
+        event_offset_commit_interval = float(event_features.get("offset_commit_interval", 1.0))
+        event_offset_commit_batch = int(event_features.get("offset_commit_batch", 100))
 
         # Detect data source strategy based on cache type and explicit only_db toggle
         strategy = detect_strategy(cache, resolved_mcp_path, only_db=only_db)
@@ -246,6 +250,7 @@ class StoreSetupManager:
                     namespace=namespace,
                     max_queue_length=event_max_queue_length,
                     dedup_ttl_seconds=event_dedup_ttl,
+                    segment_seconds=event_segment_seconds,
                 )
                 logger.info(f"EventStore initialized: namespace={namespace}")
             except Exception as e:
@@ -381,6 +386,9 @@ class StoreSetupManager:
                     lease_ttl=event_lease_ttl,
                     enable_lease=True,
                     dedup_enabled=True,
+                    push=event_push,
+                    offset_commit_interval=event_offset_commit_interval,
+                    offset_commit_batch=event_offset_commit_batch,
                 )
                 store.container.attach_event_syncer(event_syncer)
                 logger.info("EventSyncer attached to container")
@@ -449,13 +457,20 @@ class StoreSetupManager:
                     logger.warning("[CACHE_SEED] cache_layer_manager not available; skip backfill.")
                     return
                 services = await cache_layer.get_all_entities_async("services")
-                relations = await cache_layer.get_all_relations_async("agent_services")
+                relation_manager = getattr(registry, "_relation_manager", None)
+                if relation_manager is not None:
+                    agent_services = await relation_manager.get_all_agent_services()
+                else:
+                    agent_services = {
+                        agent_id: rel.get("services", []) if isinstance(rel, dict) else []
+                        for agent_id, rel in (await cache_layer.get_all_relations_async("agent_services")).items()
+                    }
 
                 # Build service_global_name -> client_id mapping
                 client_by_service: dict[str, str] = {}
                 agent_by_service: dict[str, str] = {}
-                for agent_id, rel in relations.items():
-                    for svc in rel.get("services", []) if isinstance(rel, dict) else []:
+                for agent_id, agent_service_list in agent_services.items():
+                    for svc in agent_service_list:
                         sg = svc.get("service_global_name")
                         cid = svc.get("client_id")
                         if sg:
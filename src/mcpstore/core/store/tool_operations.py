@@ -208,15 +208,18 @@ class ToolOperationsMixin:
             self.logger.debug(f"[STORE.LIST_TOOLS] no services for agent_id={agent_id}")
             return []
         
-        # Step 2: 从关系层获取每个服务的工具列表
+        # Step 2: 从关系层批量获取所有服务的工具列表（单次往返）
         all_tool_global_names: List[str] = []
+        service_relations = await relation_manager.get_many_service_tools(
+            [svc.get("service_global_name") for svc in agent_services if svc.get("service_global_name")]
+        )
         
         for svc in agent_services:
             service_global_name = svc.get("service_global_name")
             if not service_global_name:
                 continue
             
-            tool_relations = await relation_manager.get_service_tools(service_global_name)
+            tool_relations = service_relations.get(service_global_name, [])
             for tr in tool_relations:
                 tool_global_name = tr.get("tool_global_name")
                 if tool_global_name:
@@ -23,6 +23,7 @@ from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 from mcpstore.core.bridge import get_async_bridge
+from mcpstore.core.utils.fan_out import FanOutConfig, fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -286,61 +287,60 @@ class UnifiedMCPSyncManager:
                     results["failed"].append(f"remove:{service_name}:{e}")
             
             # 2. 添加/更新服务（改进逻辑：只处理真正需要变更的服务）
+            # 每个服务只写自己的 client / service 实体，按 features.fan_out 并发执行；
+            # 移除会修改同一 Agent 的关系文档，保持上面的顺序执行
             services_to_register = {}
 
-            # 处理新增服务
-            for service_name in to_add:
-                try:
-                    success = await self._add_service_to_cache_mapping(
-                        agent_id=global_agent_store_id,
-                        service_name=service_name,
-                        service_config=target_services[service_name]
-                    )
+            async def _add(service_name: str):
+                success = await self._add_service_to_cache_mapping(
+                    agent_id=global_agent_store_id,
+                    service_name=service_name,
+                    service_config=target_services[service_name]
+                )
+                return "added" if success else None
 
-                    if success:
-                        services_to_register[service_name] = target_services[service_name]
-                        results["added"].append(service_name)
-                        logger.debug(f"Added new service to cache: {service_name}")
-                    else:
-                        results["failed"].append(f"add:{service_name}")
+            async def _update(service_name: str):
+                current_config = current_services.get(service_name, {})
+                target_config = target_services[service_name]
 
-                except Exception as e:
-                    logger.error(f"Failed to add service {service_name}: {e}")
-                    results["failed"].append(f"add:{service_name}:{e}")
+                if not self._service_config_changed(current_config, target_config):
+                    logger.debug(f"Service {service_name} config unchanged, skipping update")
+                    return "unchanged"
 
-            # 处理更新服务（只有配置真正变化时才更新）
-            for service_name in to_update:
+                success = await self._add_service_to_cache_mapping(
+                    agent_id=global_agent_store_id,
+                    service_name=service_name,
+                    service_config=target_config
+                )
+                if not success:
+                    return None
                 try:
-                    current_config = current_services.get(service_name, {})
-                    target_config = target_services[service_name]
-
-                    if not self._service_config_changed(current_config, target_config):
-                        logger.debug(f"Service {service_name} config unchanged, skipping update")
-                        continue
-
-                    success = await self._add_service_to_cache_mapping(
-                        agent_id=global_agent_store_id,
-                        service_name=service_name,
-                        service_config=target_config
-                    )
-
-                    if success:
-                        try:
-                            await self.orchestrator.registry.update_service_config_async(service_name, target_config)
-                        except Exception as upd_err:
-                            logger.error(f"Failed to update service entity config for {service_name}: {upd_err}")
-                            results["failed"].append(f"update:{service_name}:config_write")
-                            continue
-
-                        services_to_register[service_name] = target_config
-                        results["updated"].append(service_name)
-                        logger.debug(f"Updated service in cache: {service_name}")
-                    else:
-                        results["failed"].append(f"update:{service_name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to update service {service_name}: {e}")
-                    results["failed"].append(f"update:{service_name}:{e}")
+                    await self.orchestrator.registry.update_service_config_async(service_name, target_config)
+                except Exception as upd_err:
+                    logger.error(f"Failed to update service entity config for {service_name}: {upd_err}")
+                    return "config_write"
+                return "updated"
+
+            plan = [("add", name) for name in to_add] + [("update", name) for name in to_update]
+            outcomes = await fan_out(
+                plan,
+                lambda item: _add(item[1]) if item[0] == "add" else _update(item[1]),
+                config=self._fan_out_config(),
+                label="sync_global_agent_store",
+            )
+            for outcome in outcomes:
+                action, service_name = outcome.item
+                if not outcome.ok:
+                    logger.error(f"Failed to {action} service {service_name}: {outcome.error}")
+                    results["failed"].append(f"{action}:{service_name}:{outcome.error}")
+                elif outcome.value is None:
+                    results["failed"].append(f"{action}:{service_name}")
+                elif outcome.value == "config_write":
+                    results["failed"].append(f"update:{service_name}:config_write")
+                elif outcome.value in ("added", "updated"):
+                    services_to_register[service_name] = target_services[service_name]
+                    results[outcome.value].append(service_name)
+                    logger.debug(f"{outcome.value.capitalize()} service in cache: {service_name}")
 
             # 3. 批量注册到Registry（只注册真正需要注册的服务）
             if services_to_register:
@@ -452,38 +452,49 @@ class UnifiedMCPSyncManager:
             skipped_count = 0
             event_bus = getattr(getattr(self.orchestrator, "container", None), "_event_bus", None) or getattr(self.orchestrator, "event_bus", None)
 
-            for service_name, config in services_to_register.items():
+            async def _register(service_name: str) -> bool:
                 if await self.orchestrator.registry.has_service_async(agent_id, service_name):
-                    skipped_count += 1
-                    continue
-                try:
-                    if not event_bus:
-                        raise RuntimeError("EventBus unavailable for bootstrap registration")
-
-                    from mcpstore.core.events.service_events import ServiceBootstrapRequested
-                    from mcpstore.core.utils.id_generator import ClientIDGenerator
-
-                    client_id = ClientIDGenerator.generate_deterministic_id(
-                        agent_id=agent_id,
-                        service_name=service_name,
-                        service_config=config,
-                        global_agent_store_id=getattr(self.orchestrator.client_manager, "global_agent_store_id", "global_agent_store")
-                    )
-
-                    bootstrap_event = ServiceBootstrapRequested(
-                        agent_id=agent_id,
-                        service_name=service_name,
-                        service_config=config,
-                        client_id=client_id,
-                        global_name=service_name,
-                        origin_agent_id=agent_id,
-                        origin_local_name=service_name,
-                        source="sync_mcpjson"
-                    )
-                    await event_bus.publish(bootstrap_event, wait=False)
+                    return False
+                if not event_bus:
+                    raise RuntimeError("EventBus unavailable for bootstrap registration")
+
+                from mcpstore.core.events.service_events import ServiceBootstrapRequested
+                from mcpstore.core.utils.id_generator import ClientIDGenerator
+
+                config = services_to_register[service_name]
+                client_id = ClientIDGenerator.generate_deterministic_id(
+                    agent_id=agent_id,
+                    service_name=service_name,
+                    service_config=config,
+                    global_agent_store_id=getattr(self.orchestrator.client_manager, "global_agent_store_id", "global_agent_store")
+                )
+
+                bootstrap_event = ServiceBootstrapRequested(
+                    agent_id=agent_id,
+                    service_name=service_name,
+                    service_config=config,
+                    client_id=client_id,
+                    global_name=service_name,
+                    origin_agent_id=agent_id,
+                    origin_local_name=service_name,
+                    source="sync_mcpjson"
+                )
+                await event_bus.publish(bootstrap_event, wait=False)
+                return True
+
+            outcomes = await fan_out(
+                list(services_to_register),
+                _register,
+                config=self._fan_out_config(),
+                label=f"batch_register:{agent_id}",
+            )
+            for outcome in outcomes:
+                if not outcome.ok:
+                    logger.error(f"Failed to register service {outcome.item}: {outcome.error}")
+                elif outcome.value:
                     registered_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to register service {service_name}: {e}")
+                else:
+                    skipped_count += 1
 
             logger.info(f"Batch registration completed (bootstrap path): {registered_count} registered, {skipped_count} skipped")
 
@@ -614,6 +625,10 @@ class UnifiedMCPSyncManager:
             logger.error(f"Error finding existing client_id for service {service_name}: {e}")
             return None
 
+    def _fan_out_config(self) -> FanOutConfig:
+        """多服务同步的并发上限（orchestrator.fan_out_config，缺省时使用默认值）"""
+        return getattr(self.orchestrator, "fan_out_config", None) or FanOutConfig()
+
     def _service_config_changed(self, current_config: Dict[str, Any], target_config: Dict[str, Any]) -> bool:
         """
         检查服务配置是否发生变化
@@ -0,0 +1,187 @@
+"""
+Bounded structured fan-out for per-service / per-agent operations.
+
+Aggregate operations (sync from mcp.json, catalog loading, agent statistics)
+used to await one service after another, so wall time was the sum of all
+services. fan_out() runs them concurrently under a global cap plus optional
+per-group caps (e.g. stdio services spawn processes and get a lower cap),
+applies a per-item timeout, and always returns one result per item, so a slow
+or failing service only affects its own entry.
+
+Structured: fan_out() returns only after every child task has finished; if the
+caller is cancelled (shutdown), the children are cancelled and awaited before
+the cancellation propagates.
+
+fan_out_as_completed() is the underlying primitive: it yields each result as
+soon as its item finishes (batched adapter tool calls are built on it).
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class FanOutConfig:
+    """Fan-out limits (features.fan_out)."""
+    max_concurrency: int = 16
+    # group name -> cap, e.g. {"stdio": 4}; groups not listed only use the global cap
+    group_limits: Dict[str, int] = field(default_factory=lambda: {"stdio": 4})
+    # Cap for groups not listed in group_limits (None: they only use the global cap)
+    default_group_limit: Optional[int] = None
+    # Per-item timeout in seconds (None: no timeout)
+    timeout: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "FanOutConfig":
+        if not isinstance(data, dict):
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+@dataclass
+class FanOutResult(Generic[T, R]):
+    item: T
+    # Position of the item in the input
+    index: int = 0
+    value: Optional[R] = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def service_transport(service_config: Optional[Dict[str, Any]]) -> str:
+    """Transport group of a service config: "stdio" for local commands, else the remote transport."""
+    config = service_config or {}
+    if config.get("command"):
+        return "stdio"
+    return str(config.get("transport") or "http")
+
+
+async def fan_out_as_completed(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    *,
+    config: Optional[FanOutConfig] = None,
+    group: Optional[Callable[[T], Optional[Hashable]]] = None,
+    label: str = "fan_out",
+) -> AsyncIterator[FanOutResult[T, R]]:
+    """
+    Run ``worker(item)`` for every item concurrently, yielding results in completion order.
+
+    Takes the same arguments as ``fan_out()``. Each result carries the input
+    position of its item in ``index``. Worker exceptions and timeouts are
+    captured in the result instead of being raised.
+
+    Leaving the iteration early (break / aclose) or cancelling the consumer
+    cancels and awaits the unfinished items.
+    """
+    items = list(items)
+    if not items:
+        return
+    config = config or FanOutConfig()
+    global_gate = asyncio.Semaphore(max(1, int(config.max_concurrency)))
+    group_gates: Dict[Hashable, asyncio.Semaphore] = {}
+
+    def _group_gate(item: T):
+        name = group(item) if group is not None else None
+        limit = config.group_limits.get(name, config.default_group_limit) if name is not None else None
+        if not limit:
+            return nullcontext()
+        gate = group_gates.get(name)
+        if gate is None:
+            gate = group_gates[name] = asyncio.Semaphore(max(1, int(limit)))
+        return gate
+
+    async def _run(index: int, item: T) -> FanOutResult[T, R]:
+        result: FanOutResult[T, R] = FanOutResult(item=item, index=index)
+        # Group slot first, then a global slot: waiting on a busy group holds no global slot
+        async with _group_gate(item):
+            async with global_gate:
+                started = time.perf_counter()
+                try:
+                    if config.timeout:
+                        result.value = await asyncio.wait_for(worker(item), timeout=config.timeout)
+                    else:
+                        result.value = await worker(item)
+                except asyncio.TimeoutError as e:
+                    result.error = e
+                    result.timed_out = True
+                except Exception as e:
+                    result.error = e
+                result.elapsed = time.perf_counter() - started
+        return result
+
+    started = time.perf_counter()
+    failed = 0
+    tasks = [asyncio.ensure_future(_run(i, item)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if not result.ok:
+                failed += 1
+            yield result
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    logger.debug(
+        f"[FAN_OUT] {label}: items={len(items)} failed={failed} "
+        f"elapsed={(time.perf_counter() - started):.3f}s"
+    )
+
+
+async def fan_out(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    *,
+    config: Optional[FanOutConfig] = None,
+    group: Optional[Callable[[T], Optional[Hashable]]] = None,
+    label: str = "fan_out",
+) -> List[FanOutResult[T, R]]:
+    """
+    Run ``worker(item)`` for every item concurrently and collect partial results.
+
+    Args:
+        items: work items (service names, agent ids, ...)
+        worker: coroutine function processing one item
+        config: global / per-group caps and per-item timeout
+        group: maps an item to its concurrency group (see ``service_transport``)
+        label: name used in logs
+
+    Returns:
+        One FanOutResult per item, in input order. Worker exceptions and
+        timeouts are captured in the result instead of being raised.
+
+    Raises:
+        asyncio.CancelledError: the caller was cancelled (children are cancelled first)
+    """
+    items = list(items)
+    results: List[Optional[FanOutResult[T, R]]] = [None] * len(items)
+    async for result in fan_out_as_completed(items, worker, config=config, group=group, label=label):
+        results[result.index] = result
+    return results  # type: ignore[return-value]
+
+
+__all__ = [
+    "FanOutConfig",
+    "FanOutResult",
+    "fan_out",
+    "fan_out_as_completed",
+    "service_transport",
+]
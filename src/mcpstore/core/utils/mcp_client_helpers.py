@@ -5,12 +5,23 @@ These helpers centralize config processing and ensure proper lifecycle (async wi
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict
+from typing import Any, AsyncIterator, Dict, List
 
 from mcpstore.core.configuration.config_processor import ConfigProcessor
 from mcpstore.mcp import Client
 
+logger = logging.getLogger(__name__)
+
+# 目录分区 -> (服务端能力字段, Client 方法名)
+CATALOG_SECTIONS = {
+    "resources": ("resources", "list_resources"),
+    "resource_templates": ("resources", "list_resource_templates"),
+    "prompts": ("prompts", "list_prompts"),
+}
+
 
 @asynccontextmanager
 async def temp_client_for_service(service_name: str, service_config: Dict, timeout: float | None = None) -> AsyncIterator[Client]:
@@ -37,3 +48,28 @@ async def temp_client_for_service(service_name: str, service_config: Dict, timeo
             await client.close()
         except Exception:
             pass
+
+
+async def fetch_service_catalog(client: Client, service_name: str = "") -> Dict[str, List[Dict[str, Any]]]:
+    """List resources, resource templates and prompts of a connected client concurrently.
+
+    - Sections whose capability the server did not advertise are returned empty without a request
+    - A failing section is logged and returned empty; the other sections are kept
+    - Items are dumped in JSON mode so the result can be stored in pykv as-is
+    """
+    capabilities = getattr(getattr(client, "initialize_result", None), "capabilities", None)
+
+    async def _section(capability: str, method: str) -> List[Dict[str, Any]]:
+        if capabilities is not None and getattr(capabilities, capability, None) is None:
+            return []
+        try:
+            items = await getattr(client, method)()
+        except Exception as e:
+            logger.debug(f"[CATALOG] {method} failed for {service_name}: {e}")
+            return []
+        return [item.model_dump(mode="json") for item in items]
+
+    results = await asyncio.gather(
+        *(_section(capability, method) for capability, method in CATALOG_SECTIONS.values())
+    )
+    return dict(zip(CATALOG_SECTIONS.keys(), results))